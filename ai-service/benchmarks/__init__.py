@@ -0,0 +1,15 @@
+"""
+오프라인 엔드투엔드 벤치마크 / 부하 테스트 (외부 서비스는 모두 로컬 가짜, DB는 일회성 Postgres)
+
+    python scripts/benchmark_e2e.py --output report.json
+    python scripts/benchmark_loadtest.py --ramp 1,2,4,8 --budget budget.json
+"""
+from benchmarks.fakes import ExternalCalls, FakeLatency
+from benchmarks.environment import OfflineEnvironment
+from benchmarks.harness import FLOWS, compare_reports, percentile, run_benchmark
+from benchmarks.loadtest import SCRIPTS, LoadBudget, evaluate_budget, find_saturation, run_loadtest
+
+__all__ = [
+    "ExternalCalls", "FakeLatency", "OfflineEnvironment", "FLOWS", "compare_reports", "percentile", "run_benchmark",
+    "SCRIPTS", "LoadBudget", "evaluate_budget", "find_saturation", "run_loadtest",
+]
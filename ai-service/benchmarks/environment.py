@@ -0,0 +1,220 @@
+"""
+오프라인 벤치마크 환경 - 외부 서비스를 모두 로컬 가짜로 바꿔 끼움
+
+앱 모듈을 import하기 전에 install()해야 import 시점에 읽는 환경 변수(DB_TYPE, BACKEND_URL 등)가
+가짜 서비스를 가리킵니다. 이미 import된 모듈은 알려진 전역 값과 SDK 심볼을 직접 교체하고
+uninstall()에서 모두 되돌립니다.
+"""
+import os
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from benchmarks.database import PostgresInstance
+from benchmarks.fakes import (
+    BenchLLMBackend, ExternalCalls, FakeLatency, FakePineconeIndex, FakeSupabaseClient,
+    FakeSupabaseStore, FakeWeb, blocked_browser, build_catalog, counting_connect, fake_create_client,
+    fake_pinecone_class, fakeredis_classes,
+)
+
+INDEX_NAME = "dreampath"
+BACKEND_URL = "http://backend.bench"
+
+_MISSING = object()
+
+
+class OfflineEnvironment:
+    """OpenAI / Pinecone / Supabase / Redis / 채용 사이트 / Serper / 백엔드 API를 가짜로 교체"""
+
+    def __init__(self, latency: Optional[FakeLatency] = None, postgres: Optional[PostgresInstance] = None,
+                 catalog: Optional[Dict[str, Any]] = None):
+        self.latency = latency or FakeLatency()
+        self.postgres = postgres
+        self.calls = ExternalCalls()
+        self.catalog = catalog or build_catalog()
+        self.pinecone_index = FakePineconeIndex(self.catalog["vectors"], self.calls, self.latency.pinecone)
+        self.supabase = FakeSupabaseStore(self.catalog["tables"], self.calls, self.latency.supabase)
+        self.web = FakeWeb(self.calls, self.latency.http, backend_host="backend.bench")
+        self.redis_mode = "memory"
+        self._saved_env: Dict[str, Optional[str]] = {}
+        self._patches: List[Tuple[Any, str, Any]] = []
+        self._registry_snapshot: Optional[Dict[str, tuple]] = None
+        self._installed = False
+
+    # ------------------------------------------------------------------
+    # 환경 변수
+    # ------------------------------------------------------------------
+
+    def environ(self) -> Dict[str, str]:
+        env = {
+            "OPENAI_API_KEY": "sk-bench",
+            "LLM_GATEWAY_BACKEND": "fake",
+            "PINECONE_API_KEY": "pc-bench",
+            "PINECONE_INDEX_NAME": INDEX_NAME,
+            "PINECONE_INDEX": INDEX_NAME,
+            "SUPABASE_URL": "http://supabase.bench",
+            "SUPABASE_SERVICE_KEY": "supabase-bench",
+            "SERPER_API_KEY": "serper-bench",
+            "BACKEND_URL": BACKEND_URL,
+            "REDIS_HOST": "127.0.0.1",
+            "REDIS_PORT": "1",  # fakeredis가 없으면 즉시 연결 거부 → 서비스별 메모리 폴백
+            "SCHEDULER_ENABLED": "false",
+        }
+        if self.postgres is not None:
+            env.update(self.postgres.env())
+        else:
+            # DB 없이 실행하는 흐름은 연결 거부를 빠르게 받고 각자의 폴백 경로를 탐
+            env.update({"DB_TYPE": "postgres", "DB_HOST": "127.0.0.1", "DB_PORT": "1", "DB_SSLMODE": "disable"})
+        return env
+
+    def _set_env(self, key: str, value: str):
+        self._saved_env.setdefault(key, os.environ.get(key))
+        os.environ[key] = value
+
+    # ------------------------------------------------------------------
+    # 심볼 교체
+    # ------------------------------------------------------------------
+
+    def patch(self, target: Any, name: str, value: Any):
+        """target.name 교체 (uninstall에서 역순으로 복원)"""
+        self._patches.append((target, name, getattr(target, name, _MISSING)))
+        setattr(target, name, value)
+
+    def _patch_module(self, module_name: str, values: Dict[str, Any]):
+        """이미 import된 모듈의 전역 값 교체 (import 전이면 환경 변수로 충분)"""
+        module = sys.modules.get(module_name)
+        if module is None:
+            return
+        for name, value in values.items():
+            self.patch(module, name, value)
+
+    def _patch_references(self, original: Any, replacement: Any, name: str):
+        """
+        `from x import name`으로 원본을 들고 있는 모듈 전역을 모두 교체
+        (이전 환경이 설치된 동안 import된 모듈은 그 환경의 가짜를 들고 있으므로 함께 교체)
+        """
+        for module in list(sys.modules.values()):
+            try:
+                value = getattr(module, name, None)
+                found = value is original or getattr(value, "bench_fake", False)
+            except Exception:
+                continue
+            if found:
+                self.patch(module, name, replacement)
+
+    def _install_sdks(self):
+        import pinecone
+        import supabase
+
+        fake_pinecone = fake_pinecone_class(self.pinecone_index, INDEX_NAME)
+        self._patch_references(pinecone.Pinecone, fake_pinecone, "Pinecone")
+
+        self._patch_references(supabase.create_client, fake_create_client(FakeSupabaseClient(self.supabase)),
+                               "create_client")
+
+        try:
+            from selenium import webdriver
+            self.patch(webdriver, "Chrome", blocked_browser(self.calls))
+        except ImportError:
+            pass
+
+        import psycopg2
+        self.patch(psycopg2, "connect", counting_connect(psycopg2.connect, self.calls))
+
+        classes = fakeredis_classes(self.calls)
+        if classes is not None:
+            import redis
+            import redis.asyncio
+            self.patch(redis, "Redis", classes[0])
+            self.patch(redis.asyncio, "Redis", classes[1])
+            self.redis_mode = "fakeredis"
+
+    def _install_llm(self):
+        from services.common import llm_gateway
+        from services.common.llm_clients import close_llm_clients
+
+        backend = BenchLLMBackend(self.calls, self.latency)
+        self.patch(llm_gateway, "_gateway", llm_gateway.LLMGateway(backend=backend))
+        close_llm_clients()
+
+    def _install_module_globals(self):
+        """import 시점에 환경 변수를 읽어 둔 모듈의 값 / 캐시된 클라이언트 교체"""
+        import psycopg2
+        from psycopg2.extras import RealDictCursor
+
+        self._patch_module("services.database_service", {
+            "DB_TYPE": "postgres", "USE_POSTGRES": True, "psycopg2": psycopg2, "RealDictCursor": RealDictCursor,
+        })
+        self._patch_module("services.vector.pinecone_client", {
+            "PINECONE_API_KEY": "pc-bench", "PINECONE_INDEX_NAME": INDEX_NAME, "_index": None, "_initialized": False,
+        })
+        self._patch_module("services.agents.career_tools", {"BACKEND_URL": BACKEND_URL})
+        self._patch_module("services.common.llm_gateway", {"LLM_GATEWAY_BACKEND": "fake"})
+
+    def _reset_service_registry(self):
+        """지연 서비스가 가짜 클라이언트로 다시 생성되도록 초기화 (uninstall에서 원래 상태 복원)"""
+        from services.service_registry import STATUS_PENDING, get_service_registry
+
+        registry = get_service_registry()
+        self._registry_snapshot = {}
+        for name, entry in registry._entries.items():
+            self._registry_snapshot[name] = (entry.instance, entry.status, entry.error, entry.init_seconds)
+            entry.instance, entry.status, entry.error = None, STATUS_PENDING, None
+
+    def _restore_service_registry(self):
+        from services.service_registry import STATUS_PENDING, get_service_registry
+
+        for name, entry in get_service_registry()._entries.items():
+            saved = self._registry_snapshot.get(name)
+            if saved is None:
+                entry.instance, entry.status, entry.error, entry.init_seconds = None, STATUS_PENDING, None, None
+            else:
+                entry.instance, entry.status, entry.error, entry.init_seconds = saved
+        self._registry_snapshot = None
+
+    # ------------------------------------------------------------------
+    # 수명 주기
+    # ------------------------------------------------------------------
+
+    def install(self) -> "OfflineEnvironment":
+        if self._installed:
+            return self
+        for key, value in self.environ().items():
+            self._set_env(key, value)
+        if "LOG_LEVEL" not in os.environ:
+            self._set_env("LOG_LEVEL", "WARNING")
+
+        self._install_sdks()
+        self._install_module_globals()
+        self._install_llm()
+        self._reset_service_registry()
+        self.web.install()
+        self._installed = True
+        return self
+
+    def uninstall(self):
+        if not self._installed:
+            return
+        from services.common.llm_clients import close_llm_clients
+
+        self.web.uninstall()
+        self._restore_service_registry()
+        close_llm_clients()
+        for target, name, original in reversed(self._patches):
+            if original is _MISSING:
+                delattr(target, name)
+            else:
+                setattr(target, name, original)
+        self._patches.clear()
+        for key, value in self._saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        self._saved_env.clear()
+        self._installed = False
+
+    def __enter__(self) -> "OfflineEnvironment":
+        return self.install()
+
+    def __exit__(self, *exc):
+        self.uninstall()
@@ -0,0 +1,667 @@
+"""
+벤치마크용 로컬 가짜 외부 서비스
+
+- OpenAI: 게이트웨이 가짜 백엔드(FakeLLMBackend)에 경로별 지연 시간과 호출 기록 추가
+- Pinecone / Supabase: SDK 클라이언트 자리에 들어가는 메모리 카탈로그
+- 채용 사이트 / Serper / 백엔드 API: httpx 트랜스포트를 가로채 녹화된 fixture로 응답
+- Redis: fakeredis(Lua 지원 시) 공유 서버, Postgres: 커서 실행 수만 기록
+
+모든 가짜 호출은 ExternalCalls에 종류별로 집계되어 요청당 외부 호출 수 계산에 쓰입니다.
+"""
+import asyncio
+import json
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+
+from services.common.llm_gateway import FakeLLMBackend
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+# 가짜 카탈로그 / 시드 데이터에 쓰는 직업명 (fixture 채용공고와 동일)
+JOB_ROLES = [
+    "백엔드 개발자", "프론트엔드 개발자", "데이터 분석가", "UX 디자이너", "프로덕트 매니저",
+    "간호사", "초등학교 교사", "회계사", "마케터", "기계공학 엔지니어",
+]
+MAJOR_NAMES = [
+    "컴퓨터공학과", "소프트웨어학과", "통계학과", "시각디자인학과", "경영학과",
+    "간호학과", "초등교육과", "회계학과", "광고홍보학과", "기계공학과",
+]
+
+
+def load_fixture(name: str) -> str:
+    return (FIXTURES_DIR / name).read_text(encoding="utf-8")
+
+
+class ExternalCalls:
+    """외부 호출 종류별 누적 카운터 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Counter = Counter()
+
+    def record(self, kind: str, count: int = 1):
+        with self._lock:
+            self._counts[kind] += count
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    @staticmethod
+    def diff(after: Dict[str, int], before: Dict[str, int]) -> Dict[str, int]:
+        return {kind: after[kind] - before.get(kind, 0)
+                for kind in sorted(after) if after[kind] - before.get(kind, 0)}
+
+
+@dataclass
+class FakeLatency:
+    """가짜 외부 서비스 응답 지연 (초)"""
+    llm: float = 0.8
+    embedding: float = 0.15
+    pinecone: float = 0.05
+    supabase: float = 0.03
+    http: float = 0.2
+
+    def scaled(self, factor: float) -> "FakeLatency":
+        return FakeLatency(**{f.name: getattr(self, f.name) * factor for f in fields(self)})
+
+
+# =========================================
+# OpenAI
+# =========================================
+
+COUNSELING_REPLY = (
+    "말씀해 주셔서 고마워요. 지금 느끼는 고민은 진로를 진지하게 생각하고 있다는 뜻이에요. "
+    "요즘 가장 즐겁게 했던 일을 하나 떠올려 보면, 어떤 점이 좋았나요?"
+)
+KEYWORD_REPLY = "개발자, 백엔드, 서버, 데이터, 분석, 디자이너, 마케팅, 엔지니어"
+
+
+def _sample_from_schema(schema: Dict[str, Any], defs: Dict[str, Any]) -> Any:
+    """JSON 스키마를 만족하는 최소 예시 값 (structured output 응답용)"""
+    if "$ref" in schema:
+        return _sample_from_schema(defs.get(schema["$ref"].rsplit("/", 1)[-1], {}), defs)
+    for key in ("anyOf", "oneOf"):
+        if key in schema:
+            options = [s for s in schema[key] if s.get("type") != "null"] or schema[key]
+            return _sample_from_schema(options[0], defs)
+    if "enum" in schema:
+        return schema["enum"][0]
+    kind = schema.get("type")
+    if isinstance(kind, list):
+        kind = next((k for k in kind if k != "null"), "null")
+    if kind == "object" or "properties" in schema:
+        return {name: _sample_from_schema(prop, defs) for name, prop in (schema.get("properties") or {}).items()}
+    if kind == "array":
+        return []
+    if kind == "integer":
+        return 50
+    if kind == "number":
+        return 0.5
+    if kind == "boolean":
+        return False
+    if kind == "null":
+        return None
+    return "샘플"
+
+
+def _agent_decision(prompt: str) -> Dict[str, Any]:
+    """ReAct reason_node 응답 - 첫 스텝에만 메시지 성격에 맞는 도구 선택"""
+    if "현재 스텝: 1/" not in prompt:
+        return {"thought": "충분한 정보를 모았습니다.", "action": "FINISH", "action_input": {}}
+    if "멘토" in prompt or "현직자" in prompt:
+        return {"thought": "현직자 상담을 원합니다.", "action": "search_mentoring_sessions",
+                "action_input": {"career_interest": "백엔드 개발자"}}
+    if "로드맵" in prompt or "공부" in prompt:
+        return {"thought": "학습 경로가 필요합니다.", "action": "get_learning_path",
+                "action_input": {"career": "백엔드 개발자"}}
+    return {"thought": "구체적인 정보 요청입니다.", "action": "web_search",
+            "action_input": {"query": "백엔드 개발자 연봉 전망"}}
+
+
+def bench_responder(body: Dict[str, Any]) -> str:
+    """요청 형태에 맞는 가짜 응답 (JSON 스키마 / 에이전트 결정 / 키워드 / 상담 문장)"""
+    messages = body.get("messages") or [{}]
+    last = str(messages[-1].get("content") or "")
+    prompt = " ".join(str(m.get("content") or "") for m in messages)
+
+    response_format = body.get("response_format") or {}
+    if response_format.get("type") == "json_schema":
+        schema = (response_format.get("json_schema") or {}).get("schema") or {}
+        return json.dumps(_sample_from_schema(schema, schema.get("$defs") or {}), ensure_ascii=False)
+    if "다음 행동을 결정하세요" in last:
+        return json.dumps(_agent_decision(last), ensure_ascii=False)
+    if response_format or "JSON" in prompt or "json" in prompt:
+        return "{}"
+    if "쉼표로 구분" in prompt:
+        return KEYWORD_REPLY
+    return COUNSELING_REPLY
+
+
+class BenchLLMBackend(FakeLLMBackend):
+    """chat / embeddings 경로별 지연 시간 + 외부 호출 기록"""
+
+    def __init__(self, calls: ExternalCalls, latency: FakeLatency, responder: Optional[Callable] = None):
+        super().__init__(latency=0.0, responder=responder or bench_responder)
+        self.calls = calls
+        self.chat_latency = latency.llm
+        self.embedding_latency = latency.embedding
+
+    def _begin(self, request: httpx.Request) -> float:
+        if request.url.path.endswith("/embeddings"):
+            self.calls.record("openai.embeddings")
+            return self.embedding_latency
+        self.calls.record("openai.chat")
+        return self.chat_latency
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        delay = self._begin(request)
+        if delay:
+            time.sleep(delay)
+        return self._respond(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        delay = self._begin(request)
+        if delay:
+            await asyncio.sleep(delay)
+        return self._respond(request)
+
+
+# =========================================
+# Pinecone / Supabase 카탈로그
+# =========================================
+
+class _Record(dict):
+    """속성 접근이 되는 dict (Pinecone SDK 응답 객체 대역, 없는 속성은 AttributeError)"""
+
+    def __getattr__(self, item):
+        try:
+            return self[item]
+        except KeyError:
+            raise AttributeError(item) from None
+
+
+def build_catalog(jobs: int = 60, majors: int = 40) -> Dict[str, Any]:
+    """Pinecone 벡터 메타데이터와 Supabase job_details / major_details 행을 같은 ID로 생성"""
+    vectors, job_rows, major_rows = [], [], []
+    for i in range(1, jobs + 1):
+        name = JOB_ROLES[i % len(JOB_ROLES)] + ("" if i <= len(JOB_ROLES) else f" {i // len(JOB_ROLES)}")
+        vectors.append({"id": f"job_{i}", "metadata": {
+            "type": "job", "original_id": str(i), "jobName": name,
+            "summary": f"{name}는 관련 분야의 문제를 분석하고 해결하는 직업입니다.",
+        }})
+        job_rows.append({"job_id": i, "raw_data": {"baseInfo": {
+            "job_nm": name, "wage": "4,000만원", "wlb": "보통", "aptit_name": "분석력", "rel_job_nm": name,
+        }}})
+    for i in range(1, majors + 1):
+        name = MAJOR_NAMES[i % len(MAJOR_NAMES)]
+        vectors.append({"id": f"major_{i}", "metadata": {
+            "type": "major", "original_id": str(i), "majorName": name, "deptName": name,
+            "summary": f"{name}에서는 전공 기초와 실무 역량을 함께 배웁니다.",
+        }})
+        major_rows.append({"major_id": i, "major_name": name, "summary": f"{name} 소개"})
+    return {"vectors": vectors, "tables": {"job_details": job_rows, "major_details": major_rows}}
+
+
+def _matches_filter(metadata: Dict[str, Any], flt: Optional[Dict[str, Any]]) -> bool:
+    for key, cond in (flt or {}).items():
+        if key.startswith("$"):
+            continue
+        value = metadata.get(key)
+        if isinstance(cond, dict):
+            if "$eq" in cond and value != cond["$eq"]:
+                return False
+            if "$in" in cond and value not in cond["$in"]:
+                return False
+            if "$ne" in cond and value == cond["$ne"]:
+                return False
+        elif value != cond:
+            return False
+    return True
+
+
+class FakePineconeIndex:
+    """Pinecone Index 대역 - 필터에 맞는 벡터를 고정 순서 / 내림차순 점수로 반환"""
+
+    def __init__(self, vectors: List[Dict[str, Any]], calls: ExternalCalls, latency: float):
+        self._vectors = {v["id"]: dict(v) for v in vectors}
+        self._lock = threading.Lock()
+        self.calls = calls
+        self.latency = latency
+
+    def _call(self, op: str):
+        self.calls.record("pinecone")
+        if self.latency:
+            time.sleep(self.latency)
+
+    def query(self, vector=None, top_k: int = 10, filter=None, include_metadata: bool = True,
+              namespace: Optional[str] = None, **kwargs):
+        self._call("query")
+        with self._lock:
+            candidates = [v for v in self._vectors.values() if _matches_filter(v.get("metadata") or {}, filter)]
+        matches = [
+            _Record(id=v["id"], score=round(0.95 - i * 0.01, 4),
+                    metadata=dict(v.get("metadata") or {}) if include_metadata else None)
+            for i, v in enumerate(candidates[:top_k])
+        ]
+        return _Record(matches=matches, namespace=namespace or "")
+
+    def upsert(self, vectors=None, namespace: Optional[str] = None, **kwargs):
+        self._call("upsert")
+        with self._lock:
+            for v in vectors or []:
+                item = v if isinstance(v, dict) else {"id": v[0], "values": v[1], "metadata": v[2] if len(v) > 2 else {}}
+                self._vectors[item["id"]] = dict(item)
+        return _Record(upserted_count=len(vectors or []))
+
+    def fetch(self, ids=None, namespace: Optional[str] = None, **kwargs):
+        self._call("fetch")
+        with self._lock:
+            found = {i: _Record(self._vectors[i]) for i in ids or [] if i in self._vectors}
+        return _Record(vectors=found, namespace=namespace or "")
+
+    def delete(self, ids=None, namespace: Optional[str] = None, **kwargs):
+        self._call("delete")
+        with self._lock:
+            for i in ids or []:
+                self._vectors.pop(i, None)
+        return {}
+
+    def describe_index_stats(self, **kwargs):
+        self._call("describe_index_stats")
+        return _Record(dimension=3072, total_vector_count=len(self._vectors), namespaces={})
+
+
+def fake_pinecone_class(index: FakePineconeIndex, index_name: str):
+    """pinecone.Pinecone 자리에 넣을 클래스 (모든 인덱스 이름이 같은 가짜 인덱스를 가리킴)"""
+
+    class FakePinecone:
+        def __init__(self, api_key: Optional[str] = None, **kwargs):
+            self.api_key = api_key
+
+        def Index(self, name: Optional[str] = None, host: Optional[str] = None, **kwargs):
+            return index
+
+        def list_indexes(self):
+            return [_Record(name=index_name)]
+
+    FakePinecone.bench_fake = True
+    return FakePinecone
+
+
+def fake_create_client(client: "FakeSupabaseClient"):
+    """supabase.create_client 자리에 넣을 함수 (URL / 키와 무관하게 같은 가짜 클라이언트)"""
+
+    def create_client(url: str, key: str, *args, **kwargs):
+        return client
+
+    create_client.bench_fake = True
+    return create_client
+
+
+class FakeSupabaseStore:
+    """테이블 이름 → 행 목록"""
+
+    def __init__(self, tables: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+                 calls: Optional[ExternalCalls] = None, latency: float = 0.0):
+        self.tables = {name: [dict(row) for row in rows] for name, rows in (tables or {}).items()}
+        self.calls = calls or ExternalCalls()
+        self.latency = latency
+        self.lock = threading.Lock()
+
+
+class _SupabaseResponse:
+    def __init__(self, data: List[Dict[str, Any]], count: Optional[int] = None):
+        self.data = data
+        self.count = count
+
+
+class FakeSupabaseQuery:
+    """supabase-py 쿼리 빌더 대역 (execute 한 번 = 외부 호출 한 번)"""
+
+    def __init__(self, store: FakeSupabaseStore, table: str):
+        self.store = store
+        self.table_name = table
+        self._filters: List[Callable[[Dict[str, Any]], bool]] = []
+        self._columns: Optional[List[str]] = None
+        self._count = False
+        self._head = False
+        self._limit: Optional[int] = None
+        self._offset = 0
+        self._order: Optional[tuple] = None
+        self._action = "select"
+        self._payload: Any = None
+
+    # ----- 조회 -----
+
+    def select(self, columns: str = "*", count: Optional[str] = None, head: bool = False):
+        self._columns = None if columns.strip() == "*" else [c.strip() for c in columns.split(",")]
+        self._count = bool(count)
+        self._head = head
+        return self
+
+    def eq(self, column, value):
+        self._filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def neq(self, column, value):
+        self._filters.append(lambda row: row.get(column) != value)
+        return self
+
+    def in_(self, column, values):
+        allowed = set(values)
+        self._filters.append(lambda row: row.get(column) in allowed)
+        return self
+
+    def ilike(self, column, pattern):
+        regex = re.compile("^" + re.escape(pattern).replace("%", ".*") + "$", re.IGNORECASE | re.DOTALL)
+        self._filters.append(lambda row: bool(regex.match(str(row.get(column) or ""))))
+        return self
+
+    def gte(self, column, value):
+        self._filters.append(lambda row: row.get(column) is not None and row.get(column) >= value)
+        return self
+
+    def lte(self, column, value):
+        self._filters.append(lambda row: row.get(column) is not None and row.get(column) <= value)
+        return self
+
+    def limit(self, count: int):
+        self._limit = count
+        return self
+
+    def range(self, start: int, end: int):
+        self._offset, self._limit = start, end - start + 1
+        return self
+
+    def order(self, column: str, desc: bool = False, **kwargs):
+        self._order = (column, desc)
+        return self
+
+    # ----- 변경 -----
+
+    def insert(self, payload, **kwargs):
+        self._action, self._payload = "insert", payload
+        return self
+
+    def upsert(self, payload, **kwargs):
+        self._action, self._payload = "upsert", payload
+        return self
+
+    def update(self, payload):
+        self._action, self._payload = "update", payload
+        return self
+
+    def delete(self):
+        self._action = "delete"
+        return self
+
+    # ----- 실행 -----
+
+    def _matches(self, row: Dict[str, Any]) -> bool:
+        return all(check(row) for check in self._filters)
+
+    def execute(self) -> _SupabaseResponse:
+        store = self.store
+        store.calls.record("supabase")
+        if store.latency:
+            time.sleep(store.latency)
+
+        with store.lock:
+            rows = store.tables.setdefault(self.table_name, [])
+            if self._action in ("insert", "upsert"):
+                new_rows = self._payload if isinstance(self._payload, list) else [self._payload]
+                rows.extend(dict(row) for row in new_rows)
+                return _SupabaseResponse([dict(row) for row in new_rows])
+            if self._action == "update":
+                updated = [row for row in rows if self._matches(row)]
+                for row in updated:
+                    row.update(self._payload)
+                return _SupabaseResponse([dict(row) for row in updated])
+            if self._action == "delete":
+                removed = [row for row in rows if self._matches(row)]
+                store.tables[self.table_name] = [row for row in rows if not self._matches(row)]
+                return _SupabaseResponse(removed)
+
+            selected = [row for row in rows if self._matches(row)]
+
+        if self._order:
+            column, desc = self._order
+            selected.sort(key=lambda row: (row.get(column) is None, row.get(column)), reverse=desc)
+        total = len(selected)
+        end = None if self._limit is None else self._offset + self._limit
+        selected = selected[self._offset:end]
+        if self._columns:
+            selected = [{c: row.get(c) for c in self._columns} for row in selected]
+        else:
+            selected = [dict(row) for row in selected]
+        return _SupabaseResponse([] if self._head else selected, total if self._count else None)
+
+
+class FakeSupabaseClient:
+    def __init__(self, store: FakeSupabaseStore):
+        self.store = store
+
+    def table(self, name: str) -> FakeSupabaseQuery:
+        return FakeSupabaseQuery(self.store, name)
+
+    from_ = table
+
+
+# =========================================
+# 채용 사이트 / Serper / 백엔드 API (httpx)
+# =========================================
+
+class FakeWeb:
+    """
+    httpx 기본 트랜스포트(HTTPTransport / AsyncHTTPTransport)를 가로채 호스트별 fixture로 응답
+    목록 페이지는 첫 페이지만 공고를 돌려주고 이후 페이지는 비워 크롤러 페이지네이션을 끝냄
+    """
+
+    def __init__(self, calls: ExternalCalls, latency: float = 0.0, backend_host: str = "backend.bench"):
+        self.calls = calls
+        self.latency = latency
+        self.backend_hosts = {backend_host, "localhost"}
+        self._fixtures: Dict[str, str] = {}
+        self._originals: Optional[tuple] = None
+
+    def _fixture(self, name: str) -> str:
+        if name not in self._fixtures:
+            self._fixtures[name] = load_fixture(name)
+        return self._fixtures[name]
+
+    def _page(self, name: str, job_id: str = "") -> str:
+        return self._fixture(name).replace("{{id}}", job_id)
+
+    def route(self, request: httpx.Request) -> tuple:
+        """(호출 종류, 응답) - 목록 / 상세 / 회사 페이지를 URL 패턴으로 구분"""
+        url = urlparse(str(request.url))
+        host, path = url.hostname or "", url.path
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+        def html(body: str, status: int = 200) -> httpx.Response:
+            return httpx.Response(status, text=body, headers={"content-type": "text/html; charset=utf-8"})
+
+        def as_json(body: Any, status: int = 200) -> httpx.Response:
+            return httpx.Response(status, json=body)
+
+        if host.endswith("wanted.co.kr"):
+            if path.rstrip("/") == "/api/v4/jobs":
+                if int(query.get("offset", 0)) == 0:
+                    return "site.wanted", httpx.Response(200, text=self._fixture("wanted_jobs.json"),
+                                                         headers={"content-type": "application/json"})
+                return "site.wanted", as_json({"data": []})
+            match = re.match(r"^/api/v4/(jobs|companies)/(\d+)", path)
+            if match:
+                name = "wanted_job_detail.json" if match.group(1) == "jobs" else "wanted_company.json"
+                return "site.wanted", httpx.Response(200, text=self._page(name, match.group(2)),
+                                                     headers={"content-type": "application/json"})
+            return "site.wanted", html(self._fixture("company.html"))
+
+        if host.endswith("jobkorea.co.kr"):
+            if path.lower().startswith("/recruit/joblist"):
+                page = int(query.get("Page_No", 1))
+                body = self._fixture("jobkorea_list.html") if page == 1 else "<html><body></body></html>"
+                return "site.jobkorea", html(body)
+            match = re.search(r"/GI_Read/(\d+)", path)
+            if match:
+                return "site.jobkorea", html(self._page("jobkorea_detail.html", match.group(1)))
+            return "site.jobkorea", html(self._fixture("company.html"))
+
+        if host.endswith("saramin.co.kr"):
+            if path.startswith("/zf_user/jobs/list/domestic"):
+                page = int(query.get("page", 1))
+                body = self._fixture("saramin_list.html") if page == 1 else "<html><body></body></html>"
+                return "site.saramin", html(body)
+            if re.match(r"^/zf_user/jobs/(relay/|recruit/)?view", path):
+                return "site.saramin", html(self._page("saramin_detail.html", query.get("rec_idx", "0")))
+            return "site.saramin", html(self._fixture("company.html"))
+
+        if host == "google.serper.dev":
+            return "serper", httpx.Response(200, text=self._fixture("serper_search.json"),
+                                            headers={"content-type": "application/json"})
+
+        if host in self.backend_hosts:
+            if "mentoring-sessions/available" in path:
+                return "backend", as_json([])
+            return "backend", as_json({"message": "not found"}, status=404)
+
+        # 목록에 없는 호스트는 실제 네트워크로 나가지 않고 503 (보고서에 unmocked로 표시)
+        return f"unmocked:{host}", as_json({"error": "unmocked host"}, status=503)
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        kind, response = self.route(request)
+        self.calls.record(kind)
+        request.read()
+        return httpx.Response(response.status_code, headers=response.headers,
+                              content=response.content, request=request)
+
+    def install(self):
+        if self._originals is not None:
+            return
+        web = self
+        self._originals = (httpx.HTTPTransport.handle_request, httpx.AsyncHTTPTransport.handle_async_request)
+
+        def handle_request(transport, request):
+            if web.latency:
+                time.sleep(web.latency)
+            return web._handle(request)
+
+        async def handle_async_request(transport, request):
+            if web.latency:
+                await asyncio.sleep(web.latency)
+            return web._handle(request)
+
+        httpx.HTTPTransport.handle_request = handle_request
+        httpx.AsyncHTTPTransport.handle_async_request = handle_async_request
+
+    def uninstall(self):
+        if self._originals is None:
+            return
+        httpx.HTTPTransport.handle_request, httpx.AsyncHTTPTransport.handle_async_request = self._originals
+        self._originals = None
+
+
+def blocked_browser(calls: ExternalCalls):
+    """selenium.webdriver.Chrome 대역 - 헤드리스 브라우저 실행 대신 기록 후 실패"""
+
+    def chrome(*args, **kwargs):
+        calls.record("browser")
+        raise RuntimeError("벤치마크 환경에서는 브라우저를 띄우지 않습니다")
+
+    return chrome
+
+
+# =========================================
+# Postgres / Redis 호출 집계
+# =========================================
+
+def counting_connect(connect: Callable, calls: ExternalCalls) -> Callable:
+    """psycopg2.connect 래퍼 - 새 연결 수와 커서 execute 수(왕복 수)를 기록"""
+    from psycopg2.extensions import cursor as base_cursor
+
+    cursor_classes: Dict[type, type] = {}
+
+    def cursor_class(factory: type) -> type:
+        if factory not in cursor_classes:
+            class CountingCursor(factory):
+                def execute(self, query, vars=None):
+                    calls.record("postgres")
+                    return super().execute(query, vars)
+
+                def executemany(self, query, vars_list):
+                    calls.record("postgres")
+                    return super().executemany(query, vars_list)
+
+            cursor_classes[factory] = CountingCursor
+        return cursor_classes[factory]
+
+    def connect_wrapper(*args, **kwargs):
+        calls.record("postgres.connect")
+        kwargs["cursor_factory"] = cursor_class(kwargs.get("cursor_factory") or base_cursor)
+        return connect(*args, **kwargs)
+
+    return connect_wrapper
+
+
+def fakeredis_classes(calls: ExternalCalls) -> Optional[tuple]:
+    """
+    명령 수를 기록하는 (동기, 비동기) fakeredis 클래스 - 모든 인스턴스가 한 서버를 공유
+    fakeredis가 없거나 Lua(lupa)를 못 쓰면 None (서비스별 메모리 폴백 사용)
+    """
+    try:
+        import fakeredis
+        server = fakeredis.FakeServer()
+        probe = fakeredis.FakeRedis(server=server)
+        probe.eval("return 1", 0)
+    except Exception:
+        return None
+
+    def _counted_pipeline(pipe, is_async: bool):
+        original = pipe.execute
+        if is_async:
+            async def execute(*args, **kwargs):
+                calls.record("redis")
+                return await original(*args, **kwargs)
+        else:
+            def execute(*args, **kwargs):
+                calls.record("redis")
+                return original(*args, **kwargs)
+        pipe.execute = execute
+        return pipe
+
+    class CountingFakeRedis(fakeredis.FakeRedis):
+        def __init__(self, *args, **kwargs):
+            kwargs.pop("connection_pool", None)
+            kwargs["server"] = server
+            super().__init__(*args, **kwargs)
+
+        def execute_command(self, *args, **kwargs):
+            calls.record("redis")
+            return super().execute_command(*args, **kwargs)
+
+        def pipeline(self, *args, **kwargs):
+            return _counted_pipeline(super().pipeline(*args, **kwargs), is_async=False)
+
+    class CountingFakeAsyncRedis(fakeredis.FakeAsyncRedis):
+        def __init__(self, *args, **kwargs):
+            kwargs.pop("connection_pool", None)
+            kwargs["server"] = server
+            super().__init__(*args, **kwargs)
+
+        async def execute_command(self, *args, **kwargs):
+            calls.record("redis")
+            return await super().execute_command(*args, **kwargs)
+
+        def pipeline(self, *args, **kwargs):
+            return _counted_pipeline(super().pipeline(*args, **kwargs), is_async=True)
+
+    return CountingFakeRedis, CountingFakeAsyncRedis
@@ -0,0 +1,11 @@
+-- 크롤러 저장(save_job_listings) 시 사용하는 job_listings 추가 컬럼
+-- DatabaseService._ensure_table_exists 가 만든 job_listings 에 적용
+
+ALTER TABLE job_listings ADD COLUMN IF NOT EXISTS tech_stack TEXT;
+ALTER TABLE job_listings ADD COLUMN IF NOT EXISTS required_skills TEXT;
+ALTER TABLE job_listings ADD COLUMN IF NOT EXISTS applicant_count INTEGER DEFAULT 0;
+ALTER TABLE job_listings ADD COLUMN IF NOT EXISTS preferred_majors TEXT;
+ALTER TABLE job_listings ADD COLUMN IF NOT EXISTS deadline TEXT;
+ALTER TABLE job_listings ADD COLUMN IF NOT EXISTS work_location TEXT;
+ALTER TABLE job_listings ADD COLUMN IF NOT EXISTS salary TEXT;
+ALTER TABLE job_listings ADD COLUMN IF NOT EXISTS core_competencies TEXT;
@@ -0,0 +1,65 @@
+-- 벤치마크용 PostgreSQL 스키마 - 백엔드(Spring)가 소유한 테이블 중 AI 서비스가 조회하는 것만 정의
+-- DatabaseService._ensure_table_exists 보다 먼저 적용 (career_analyses 가 career_sessions 를 참조)
+-- job_listings / company_info / job_details / career_analyses / job_recommendations 는 DatabaseService 가 생성
+
+CREATE TABLE IF NOT EXISTS users (
+    user_id BIGSERIAL PRIMARY KEY,
+    name VARCHAR(100),
+    email VARCHAR(255),
+    is_active BOOLEAN NOT NULL DEFAULT TRUE,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS profile_analysis (
+    id BIGSERIAL PRIMARY KEY,
+    user_id BIGINT NOT NULL,
+    personality TEXT,
+    "values" TEXT,
+    interests TEXT,
+    strengths TEXT,
+    goals TEXT,
+    mbti VARCHAR(10),
+    summary TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_profile_analysis_user_id ON profile_analysis (user_id);
+
+CREATE TABLE IF NOT EXISTS career_sessions (
+    id BIGSERIAL PRIMARY KEY,
+    session_id VARCHAR(255) UNIQUE,
+    user_id BIGINT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS chatbot_sessions (
+    id VARCHAR(36) PRIMARY KEY,
+    cb_user_id BIGINT,
+    conversation_title VARCHAR(255),
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS chatbot_messages (
+    id BIGSERIAL PRIMARY KEY,
+    cb_session_id VARCHAR(36) NOT NULL,
+    cb_user_id BIGINT,
+    role VARCHAR(20) NOT NULL,
+    message TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_chatbot_messages_session ON chatbot_messages (cb_session_id, created_at);
+
+CREATE TABLE IF NOT EXISTS faq (
+    id BIGSERIAL PRIMARY KEY,
+    question TEXT NOT NULL,
+    answer TEXT,
+    category VARCHAR(100),
+    user_type VARCHAR(20) DEFAULT 'guest',
+    answer_type VARCHAR(20) DEFAULT 'static',
+    function_name VARCHAR(100),
+    function_description TEXT,
+    keywords TEXT[],
+    priority INTEGER DEFAULT 0,
+    is_active BOOLEAN NOT NULL DEFAULT TRUE,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
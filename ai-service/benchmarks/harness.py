@@ -0,0 +1,347 @@
+"""
+오프라인 엔드투엔드 벤치마크 실행기
+
+OfflineEnvironment 위에서 실제 FastAPI 앱(ASGI, lifespan 없이 - 스케줄러 미기동)과 파이프라인을 호출하고
+흐름별 p50/p95 지연 시간, 처리량, 요청당 외부 호출 수를 JSON 보고서로 남깁니다.
+같은 설정으로 만든 보고서끼리 compare_reports()로 회귀를 판정합니다.
+"""
+import asyncio
+import contextlib
+import math
+import os
+import platform
+import subprocess
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+from benchmarks.database import PostgresUnavailable, disposable_postgres, seed_database
+from benchmarks.environment import OfflineEnvironment
+from benchmarks.fakes import ExternalCalls, FakeLatency
+
+REPORT_VERSION = 1
+ERROR_SAMPLE_SIZE = 3
+
+CHAT_MESSAGES = [
+    "요즘 진로 때문에 고민이 많아요.",
+    "백엔드 개발자 연봉이랑 전망이 궁금해요.",
+    "무언가를 직접 만드는 게 좋은데 어떤 일이 맞을지 모르겠어요.",
+    "현직자 멘토랑 얘기해보고 싶어요.",
+    "좀 걱정돼요.",
+    "데이터 분석가가 되려면 뭐부터 공부해야 해?",
+]
+ASSISTANT_MESSAGES = [
+    "내 추천 직업 보여줘",
+    "채용 공고 추천해줘",
+    "요즘 어떤 준비를 하면 좋을까?",
+]
+PIPELINE_PROFILE = {
+    "summary": "무언가를 직접 만들어 사람들이 쓰는 걸 보는 것을 좋아하고 분석적인 학생",
+    "goals": ["백엔드 개발자", "데이터 분석가"],
+    "values": ["성장", "안정"],
+    "personality": {"openness": 70, "conscientiousness": 65},
+    "strengths": ["분석력", "끈기"],
+    "risks": ["마감 불안"],
+}
+
+
+@dataclass
+class Flow:
+    """벤치마크 흐름 - run(ctx, i)는 i번째 요청을 보내고 실패 시 예외"""
+    name: str
+    description: str
+    run: Callable[["BenchContext", int], Awaitable[None]]
+    needs_db: bool = False
+    concurrent: bool = True
+    max_requests: Optional[int] = None
+    # 요청이 모두 끝난 뒤 백그라운드 작업을 기다림 (외부 호출 수에는 포함, 지연 시간에는 제외)
+    settle: Optional[Callable[["BenchContext"], Awaitable[None]]] = None
+
+
+class BenchContext:
+    def __init__(self, env: OfflineEnvironment, users: int):
+        self.env = env
+        self.users = max(1, users)
+        self.client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> "BenchContext":
+        from main import app
+        self.client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=300)
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.client.aclose()
+
+    def user_id(self, i: int) -> int:
+        return 1 + i % self.users
+
+    async def request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        response = await self.client.request(method, path, **kwargs)
+        if response.status_code >= 400:
+            raise RuntimeError(f"{method} {path} → {response.status_code}: {response.text[:200]}")
+        return response
+
+
+# =========================================
+# 흐름
+# =========================================
+
+async def _chat(ctx: BenchContext, i: int):
+    history = [
+        {"role": "user", "content": CHAT_MESSAGES[(i + k) % len(CHAT_MESSAGES)]} if k % 2 == 0
+        else {"role": "assistant", "content": "그렇군요. 조금 더 이야기해 줄래요?"}
+        for k in range(4)
+    ]
+    await ctx.request("POST", "/api/chat", json={
+        "sessionId": f"bench-chat-{i % 10}",
+        "userMessage": CHAT_MESSAGES[i % len(CHAT_MESSAGES)],
+        "currentStage": "PRESENT",
+        "conversationHistory": history,
+        "userId": ctx.user_id(i),
+    })
+
+
+async def _wait_agent_executor(ctx: BenchContext, timeout: float = 120.0):
+    """백그라운드 에이전트 태스크가 모두 끝날 때까지 대기"""
+    from services import agent_executor
+
+    deadline = time.monotonic() + timeout
+    while agent_executor._agent_executor is not None and time.monotonic() < deadline:
+        stats = agent_executor._agent_executor.stats()
+        if stats["running"] == 0 and stats["queue_depth"] == 0:
+            return
+        await asyncio.sleep(0.05)
+
+
+async def _assistant_chat(ctx: BenchContext, i: int):
+    await ctx.request("POST", "/api/assistant/chat", json={
+        "userId": ctx.user_id(i),
+        "message": ASSISTANT_MESSAGES[i % len(ASSISTANT_MESSAGES)],
+    })
+
+
+async def _recommendations_fast(ctx: BenchContext, i: int):
+    await ctx.request("GET", f"/api/job-agent/recommendations/fast/{ctx.user_id(i)}")
+
+
+async def _recommendations_calculate(ctx: BenchContext, i: int):
+    response = await ctx.request("POST", f"/api/job-agent/recommendations/calculate/{ctx.user_id(i)}")
+    body = response.json()
+    if not body.get("success"):
+        raise RuntimeError(f"추천 계산 실패: {body.get('error')}")
+
+
+async def _recommendation_pipeline(ctx: BenchContext, i: int):
+    from services.agents.recommendation.recommendation_pipeline import RecommendationPipeline
+
+    result = await RecommendationPipeline().run(PIPELINE_PROFILE)
+    if not result.get("jobs"):
+        raise RuntimeError("추천 직업이 비어 있음")
+
+
+async def _daily_crawl_job(ctx: BenchContext, i: int):
+    from scheduler import daily_crawl_job
+    from services import crawl_pipeline
+
+    # 요청 간격(호스트당 2초)은 실제 사이트 보호용이므로 가짜 사이트에서는 0으로
+    sites = [replace(site, budget=replace(site.budget, request_delay_seconds=0.0))
+             for site in crawl_pipeline.DEFAULT_SITES]
+    ctx.env.patch(crawl_pipeline, "DEFAULT_SITES", sites)
+    await daily_crawl_job()
+
+
+FLOWS: Dict[str, Flow] = {flow.name: flow for flow in [
+    Flow("chat", "POST /api/chat (상담 응답 + 백그라운드 에이전트)", _chat, settle=_wait_agent_executor),
+    Flow("assistant_chat", "POST /api/assistant/chat (FAQ 매칭 + Function Calling)", _assistant_chat, needs_db=True),
+    Flow("recommendations_fast", "GET /api/job-agent/recommendations/fast/{id}", _recommendations_fast, needs_db=True),
+    Flow("recommendations_calculate", "POST /api/job-agent/recommendations/calculate/{id}",
+         _recommendations_calculate, needs_db=True),
+    Flow("recommendation_pipeline", "RecommendationPipeline.run (Pinecone + Supabase + LLM 사유)",
+         _recommendation_pipeline),
+    Flow("daily_crawl_job", "scheduler.daily_crawl_job (3개 사이트 크롤링 → 저장 → 증분 추천)",
+         _daily_crawl_job, needs_db=True, concurrent=False, max_requests=2),
+]}
+
+
+# =========================================
+# 측정 / 보고서
+# =========================================
+
+def percentile(values: List[float], q: float) -> float:
+    """nearest-rank 백분위수 (q: 0~1)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(latencies: List[float], errors: List[str], elapsed: float, calls: Dict[str, int]) -> Dict[str, Any]:
+    count = len(latencies)
+    ms = [value * 1000 for value in latencies]
+    return {
+        "requests": count,
+        "errors": len(errors),
+        "error_rate": round(len(errors) / count, 4) if count else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(ms, 0.50), 2),
+            "p95": round(percentile(ms, 0.95), 2),
+            "p99": round(percentile(ms, 0.99), 2),
+            "mean": round(sum(ms) / count, 2) if count else 0.0,
+            "max": round(max(ms), 2) if ms else 0.0,
+        },
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_rps": round(count / elapsed, 2) if elapsed > 0 else 0.0,
+        "external_calls": calls,
+        "external_calls_per_request": {kind: round(value / count, 2) for kind, value in calls.items()} if count else {},
+        "errors_sample": errors[:ERROR_SAMPLE_SIZE],
+    }
+
+
+async def run_flow(ctx: BenchContext, flow: Flow, requests: int, concurrency: int) -> Dict[str, Any]:
+    """요청 requests개를 concurrency개 워커로 보내고 요약"""
+    if flow.max_requests:
+        requests = min(requests, flow.max_requests)
+    workers = max(1, min(concurrency if flow.concurrent else 1, requests))
+    latencies: List[float] = []
+    errors: List[str] = []
+    next_index = iter(range(requests))
+
+    async def worker():
+        for i in next_index:
+            started = time.perf_counter()
+            try:
+                await flow.run(ctx, i)
+            except Exception as e:
+                errors.append(f"{type(e).__name__}: {e}"[:300])
+            latencies.append(time.perf_counter() - started)
+
+    before = ctx.env.calls.snapshot()
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    elapsed = time.perf_counter() - started
+    if flow.settle:
+        await flow.settle(ctx)
+    calls = ExternalCalls.diff(ctx.env.calls.snapshot(), before)
+    return {"description": flow.description, "concurrency": workers, **summarize(latencies, errors, elapsed, calls)}
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), timeout=5).stdout.strip() or None
+    except Exception:
+        return None
+
+
+async def _run_flows(env: OfflineEnvironment, flows: List[Flow], requests: int, concurrency: int,
+                     users: int, has_db: bool, db_reason: str) -> Dict[str, Any]:
+    from services.agent_executor import shutdown_agent_executor
+
+    results: Dict[str, Any] = {}
+    try:
+        async with BenchContext(env, users) as ctx:
+            for flow in flows:
+                if flow.needs_db and not has_db:
+                    results[flow.name] = {"skipped": db_reason}
+                    continue
+                results[flow.name] = await run_flow(ctx, flow, requests, concurrency)
+    finally:
+        shutdown_agent_executor()
+    return results
+
+
+def silence_app_output(stack: contextlib.ExitStack):
+    """로그는 원래 stdout으로 (WARNING 이상), 앱 곳곳의 print는 결과 출력에 섞이지 않도록 버림"""
+    from services.common.logging_config import configure_logging
+    configure_logging()
+    stack.enter_context(contextlib.redirect_stdout(stack.enter_context(open(os.devnull, "w"))))
+
+
+def run_benchmark(
+    flow_names: Optional[List[str]] = None,
+    requests: int = 20,
+    concurrency: int = 4,
+    latency: Optional[FakeLatency] = None,
+    users: int = 20,
+    listings: int = 500,
+    use_db: bool = True,
+    database_url: Optional[str] = None,
+    quiet: bool = True,
+) -> Dict[str, Any]:
+    """
+    선택한 흐름을 오프라인 환경에서 실행하고 보고서(dict) 반환
+    DB가 필요한 흐름은 Postgres를 띄우지 못하면 skipped로 기록
+    """
+    unknown = [name for name in flow_names or [] if name not in FLOWS]
+    if unknown:
+        raise ValueError(f"알 수 없는 흐름: {', '.join(unknown)} (가능: {', '.join(FLOWS)})")
+    flows = [FLOWS[name] for name in flow_names] if flow_names else list(FLOWS.values())
+    latency = latency or FakeLatency()
+
+    with contextlib.ExitStack() as stack:
+        postgres, db_reason = None, "--no-db"
+        if use_db and any(flow.needs_db for flow in flows):
+            try:
+                postgres = stack.enter_context(disposable_postgres(database_url))
+            except PostgresUnavailable as e:
+                db_reason = str(e)
+
+        env = stack.enter_context(OfflineEnvironment(latency, postgres))
+        if quiet:
+            silence_app_output(stack)
+
+        seeded = seed_database(postgres, users=users, listings=listings) if postgres else None
+
+        results = asyncio.run(_run_flows(env, flows, requests, concurrency, users, postgres is not None, db_reason))
+
+        return {
+            "benchmark": "e2e",
+            "version": REPORT_VERSION,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "config": {
+                "requests": requests,
+                "concurrency": concurrency,
+                "users": users,
+                "listings": listings,
+                "latency_seconds": vars(latency),
+                "redis": env.redis_mode,
+            },
+            "database": {**postgres.describe(), "seeded": seeded} if postgres else {"skipped": db_reason},
+            "flows": results,
+        }
+
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float = 0.2) -> List[Dict[str, Any]]:
+    """
+    기준 보고서 대비 회귀 목록
+    - p95 지연 시간이 tolerance 비율 이상 증가
+    - 외부 호출 종류별 요청당 횟수가 tolerance 비율 이상(최소 0.1회) 증가
+    - 오류율이 1%p 이상 증가
+    """
+    regressions = []
+    for name, cur in current.get("flows", {}).items():
+        base = baseline.get("flows", {}).get(name)
+        if not base or "skipped" in base or "skipped" in cur:
+            continue
+
+        base_p95, cur_p95 = base["latency_ms"]["p95"], cur["latency_ms"]["p95"]
+        if cur_p95 > base_p95 * (1 + tolerance) and cur_p95 - base_p95 >= 1.0:
+            regressions.append({"flow": name, "metric": "latency_ms.p95", "baseline": base_p95, "current": cur_p95})
+
+        base_calls = base.get("external_calls_per_request", {})
+        for kind, value in cur.get("external_calls_per_request", {}).items():
+            before = base_calls.get(kind, 0.0)
+            if value > before * (1 + tolerance) and value - before >= 0.1:
+                regressions.append({"flow": name, "metric": f"external_calls_per_request.{kind}",
+                                    "baseline": before, "current": value})
+
+        if cur["error_rate"] - base["error_rate"] >= 0.01:
+            regressions.append({"flow": name, "metric": "error_rate",
+                                "baseline": base["error_rate"], "current": cur["error_rate"]})
+    return regressions
@@ -0,0 +1,546 @@
+"""
+부하 테스트 - 실제 상담 세션 스크립트를 가짜 외부 서비스 위의 앱에 재생
+
+- 가상 사용자(닫힌 루프)가 가중치에 따라 세션 스크립트를 골라 단계별로 요청을 보냄
+    - counseling: 여러 턴의 상담 대화 (대화 이력이 턴마다 늘어남)
+    - agent_trigger: 에이전트를 부르는 메시지 → 결과 폴링 (프론트엔드와 같은 방식)
+    - recommendations: 빠른 채용 추천 조회 + 어시스턴트 질문 (DB 필요)
+- 동시 사용자 수를 단계적으로 올리며(ramp) 단계별 지연 시간 / 처리량 / 오류율과
+  이벤트 루프 지연, 스레드 수, DB 연결 수, 메모리 추이를 기록
+- 처리량이 늘지 않고 지연만 커지는 첫 단계를 포화 지점으로 보고
+- LoadBudget(예산)을 넘으면 위반 목록을 남김 (릴리스 전 통과/실패 판정용)
+"""
+import asyncio
+import contextlib
+import json
+import platform
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from benchmarks.database import PostgresUnavailable, disposable_postgres, seed_database
+from benchmarks.environment import OfflineEnvironment
+from benchmarks.fakes import ExternalCalls, FakeLatency
+from benchmarks.harness import (
+    ASSISTANT_MESSAGES, BenchContext, _git_commit, _wait_agent_executor, percentile, silence_app_output, summarize,
+)
+
+REPORT_VERSION = 1
+SAMPLE_INTERVAL = 0.05       # 이벤트 루프 지연 측정 주기 (초)
+TIMELINE_INTERVAL = 0.5      # 시계열(메모리/스레드/연결 수) 기록 주기 (초)
+AGENT_POLL_INTERVAL = 0.25
+AGENT_POLL_TIMEOUT = 60.0
+
+COUNSELING_TURNS = [
+    "요즘 진로 때문에 고민이 많아요.",
+    "무언가를 직접 만드는 게 좋은데 어떤 일이 맞을지 모르겠어요.",
+    "사람들이 제가 만든 걸 쓰는 걸 보면 뿌듯해요.",
+    "그런데 잘할 수 있을지 좀 걱정돼요.",
+]
+AGENT_MESSAGES = [
+    "현직자 멘토랑 얘기해보고 싶어요.",
+    "데이터 분석가가 되려면 뭐부터 공부해야 해? 로드맵 알려줘",
+    "백엔드 개발자 연봉이랑 전망이 궁금해요.",
+]
+ASSISTANT_REPLY = "그렇군요. 조금 더 이야기해 줄래요?"
+
+
+# =========================================
+# 세션 스크립트
+# =========================================
+
+@dataclass
+class Session:
+    """가상 사용자 한 명의 세션 상태"""
+    index: int
+    user_id: int
+    session_id: str
+    history: List[Dict[str, str]] = field(default_factory=list)
+    agent_task_id: Optional[str] = None  # 직전 턴이 만든 에이전트 태스크
+
+
+@dataclass
+class Step:
+    """세션의 한 단계 - name은 보고서의 엔드포인트별 집계 키"""
+    name: str
+    run: Callable[[BenchContext, Session], Awaitable[None]]
+
+
+@dataclass
+class SessionScript:
+    name: str
+    description: str
+    steps: List[Step]
+    weight: int = 1
+    needs_db: bool = False
+
+
+def _chat_turn(message: str) -> Callable[[BenchContext, Session], Awaitable[None]]:
+    async def run(ctx: BenchContext, session: Session):
+        response = await ctx.request("POST", "/api/chat", json={
+            "sessionId": session.session_id,
+            "userMessage": message,
+            "currentStage": "PRESENT",
+            "conversationHistory": session.history,
+            "userId": session.user_id,
+        })
+        body = response.json()
+        session.history += [{"role": "user", "content": message},
+                            {"role": "assistant", "content": body.get("message") or ASSISTANT_REPLY}]
+        session.agent_task_id = body.get("taskId")
+    return run
+
+
+async def _poll_agent_result(ctx: BenchContext, session: Session):
+    task_id, session.agent_task_id = session.agent_task_id, None
+    if task_id is None:
+        return
+    deadline = time.monotonic() + AGENT_POLL_TIMEOUT
+    while time.monotonic() < deadline:
+        status = (await ctx.request("GET", f"/api/chat/agent-result/{task_id}")).json()["status"]
+        if status not in ("pending", "running"):
+            if status == "failed":
+                raise RuntimeError(f"에이전트 태스크 실패: {task_id}")
+            return
+        await asyncio.sleep(AGENT_POLL_INTERVAL)
+    raise TimeoutError(f"에이전트 결과 대기 시간 초과 ({AGENT_POLL_TIMEOUT:.0f}초): {task_id}")
+
+
+async def _fast_recommendations(ctx: BenchContext, session: Session):
+    await ctx.request("GET", f"/api/job-agent/recommendations/fast/{session.user_id}")
+
+
+async def _assistant_question(ctx: BenchContext, session: Session):
+    await ctx.request("POST", "/api/assistant/chat", json={
+        "userId": session.user_id,
+        "message": ASSISTANT_MESSAGES[session.index % len(ASSISTANT_MESSAGES)],
+    })
+
+
+SCRIPTS: Dict[str, SessionScript] = {script.name: script for script in [
+    SessionScript(
+        "counseling", f"상담 대화 {len(COUNSELING_TURNS)}턴 (POST /api/chat)",
+        [Step("POST /api/chat", _chat_turn(message)) for message in COUNSELING_TURNS],
+        weight=3,
+    ),
+    SessionScript(
+        "agent_trigger", "에이전트 호출 메시지 → GET /api/chat/agent-result 폴링",
+        [step for message in AGENT_MESSAGES[:2] for step in (
+            Step("POST /api/chat (agent)", _chat_turn(message)),
+            Step("GET /api/chat/agent-result (완료까지)", _poll_agent_result),
+        )],
+        weight=1,
+    ),
+    SessionScript(
+        "recommendations", "빠른 채용 추천 조회 + 어시스턴트 질문",
+        [Step("GET /api/job-agent/recommendations/fast", _fast_recommendations),
+         Step("POST /api/assistant/chat", _assistant_question)],
+        weight=2, needs_db=True,
+    ),
+]}
+
+
+# =========================================
+# 자원 측정
+# =========================================
+
+def _memory_reader():
+    """(현재 메모리 MB를 돌려주는 함수, 출처) - psutil이 없으면 ru_maxrss(최대 상주 메모리)"""
+    try:
+        import psutil
+        process = psutil.Process()
+        return (lambda: process.memory_info().rss / 2 ** 20), "psutil.rss"
+    except ImportError:
+        pass
+    try:
+        import resource
+        unit = 1 if sys.platform == "darwin" else 1024  # macOS는 바이트, Linux는 KB
+        return (lambda: resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * unit / 2 ** 20), "ru_maxrss"
+    except ImportError:
+        return (lambda: None), "unavailable"
+
+
+class ResourceMonitor:
+    """
+    이벤트 루프 안에서 주기적으로 깨어나 지연(예정보다 늦게 깨어난 시간)을 재고
+    스레드 수 / 메모리 / DB 연결 수를 시계열로 기록
+    """
+
+    def __init__(self, pg_connection=None):
+        self.read_memory, self.memory_source = _memory_reader()
+        self.pg_connection = pg_connection
+        # DB 조회는 블로킹이므로 전용 스레드 1개에서 (이 스레드도 스레드 수에 포함됨)
+        self._pg_executor = ThreadPoolExecutor(1, thread_name_prefix="loadtest-pg") if pg_connection else None
+        self.timeline: List[Dict[str, Any]] = []
+        self.stage: Optional[int] = None
+        self.in_flight = 0
+        self._window: Dict[str, Any] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._started = 0.0
+
+    @property
+    def db_connections_source(self) -> str:
+        return "pg_stat_activity" if self.pg_connection else "unavailable"
+
+    def _count_db_connections(self) -> Optional[int]:
+        with self.pg_connection.cursor() as cur:
+            cur.execute("SELECT count(*) FROM pg_stat_activity "
+                        "WHERE datname = current_database() AND pid <> pg_backend_pid()")
+            return cur.fetchone()[0]
+
+    def begin_stage(self, concurrency: int):
+        self.stage = concurrency
+        self._window = {"lags": [], "threads": 0, "db_connections": None, "memory": []}
+
+    def end_stage(self) -> Dict[str, Any]:
+        window, self._window = self._window, {}
+        lags = [lag * 1000 for lag in window["lags"]]
+        memory = window["memory"]
+        return {
+            "event_loop_lag_ms": {"p95": round(percentile(lags, 0.95), 2), "max": round(max(lags, default=0.0), 2)},
+            "threads_max": max(window["threads"], threading.active_count()),
+            "db_connections_max": window["db_connections"],
+            "memory_mb": {"start": memory[0], "end": memory[-1]} if memory else None,
+        }
+
+    async def start(self):
+        self._started = time.monotonic()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        if self._pg_executor:
+            self._pg_executor.shutdown(wait=True)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        next_timeline = 0.0
+        while True:
+            expected = time.monotonic() + SAMPLE_INTERVAL
+            await asyncio.sleep(SAMPLE_INTERVAL)
+            lag = max(0.0, time.monotonic() - expected)
+            threads = threading.active_count()
+            if self._window:
+                self._window["lags"].append(lag)
+                self._window["threads"] = max(self._window["threads"], threads)
+
+            elapsed = time.monotonic() - self._started
+            if elapsed < next_timeline:
+                continue
+            next_timeline = elapsed + TIMELINE_INTERVAL
+
+            memory = self.read_memory()
+            memory = round(memory, 1) if memory is not None else None
+            db_connections = None
+            if self._pg_executor:
+                try:
+                    db_connections = await loop.run_in_executor(self._pg_executor, self._count_db_connections)
+                except Exception:
+                    db_connections = None
+            if self._window:
+                self._window["memory"].append(memory)
+                if db_connections is not None:
+                    self._window["db_connections"] = max(self._window["db_connections"] or 0, db_connections)
+            self.timeline.append({
+                "t": round(elapsed, 2),
+                "concurrency": self.stage,
+                "in_flight": self.in_flight,
+                "event_loop_lag_ms": round(lag * 1000, 2),
+                "threads": threads,
+                "memory_mb": memory,
+                "db_connections": db_connections,
+            })
+
+
+# =========================================
+# 예산 / 포화 지점
+# =========================================
+
+@dataclass
+class LoadBudget:
+    """
+    릴리스 전 통과 기준 (None이면 검사하지 않음)
+    지연 시간 / 오류율은 모든 단계에, 나머지는 전체 실행의 최댓값에 적용
+    """
+    max_error_rate: Optional[float] = 0.01
+    max_p95_ms: Optional[float] = None
+    max_event_loop_lag_ms: Optional[float] = None
+    max_threads: Optional[int] = None
+    max_db_connections: Optional[int] = None
+    max_memory_growth_mb: Optional[float] = None
+    min_saturation_concurrency: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LoadBudget":
+        known = {f.name for f in fields(cls)}
+        unknown = sorted(set(data) - known)
+        if unknown:
+            raise ValueError(f"알 수 없는 예산 항목: {', '.join(unknown)} (가능: {', '.join(sorted(known))})")
+        return cls(**data)
+
+    @classmethod
+    def from_file(cls, path: str) -> "LoadBudget":
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+def find_saturation(stages: List[Dict[str, Any]], max_error_rate: Optional[float] = 0.01,
+                    min_throughput_gain: float = 0.1, latency_growth: float = 0.5) -> Optional[Dict[str, Any]]:
+    """
+    포화 지점 = 다음 중 하나가 처음 나타난 단계
+    - 오류율이 max_error_rate 초과
+    - 동시 사용자를 늘렸는데 처리량 증가가 min_throughput_gain 미만이고 p95가 latency_growth 이상 증가
+    """
+    previous = None
+    for stage in stages:
+        reason = None
+        if max_error_rate is not None and stage["error_rate"] > max_error_rate:
+            reason = f"오류율 {stage['error_rate']:.1%}"
+        elif previous and previous["requests"] and stage["requests"]:
+            gain = stage["throughput_rps"] / previous["throughput_rps"] - 1 if previous["throughput_rps"] else 0.0
+            p95_before, p95_now = previous["latency_ms"]["p95"], stage["latency_ms"]["p95"]
+            if gain < min_throughput_gain and p95_now > p95_before * (1 + latency_growth):
+                reason = f"처리량 +{gain:.0%}, p95 {p95_before:.0f}ms → {p95_now:.0f}ms"
+        if reason:
+            return {
+                "concurrency": stage["concurrency"],
+                "last_healthy_concurrency": previous["concurrency"] if previous else None,
+                "reason": reason,
+            }
+        previous = stage
+    return None
+
+
+def evaluate_budget(report: Dict[str, Any], budget: LoadBudget) -> List[Dict[str, Any]]:
+    """예산 위반 목록 (비어 있으면 통과)"""
+    violations = []
+
+    def check(metric: str, limit, actual, stage: Optional[int] = None):
+        if limit is not None and actual is not None and actual > limit:
+            violations.append({"metric": metric, "limit": limit, "actual": actual, "concurrency": stage})
+
+    stages = report["stages"]
+    for stage in stages:
+        check("error_rate", budget.max_error_rate, stage["error_rate"], stage["concurrency"])
+        check("latency_ms.p95", budget.max_p95_ms, stage["latency_ms"]["p95"], stage["concurrency"])
+
+    check("event_loop_lag_ms.max", budget.max_event_loop_lag_ms,
+          max((s["event_loop_lag_ms"]["max"] for s in stages), default=None))
+    check("threads_max", budget.max_threads, max((s["threads_max"] for s in stages), default=None))
+    db_connections = [s["db_connections_max"] for s in stages if s["db_connections_max"] is not None]
+    check("db_connections_max", budget.max_db_connections, max(db_connections, default=None))
+    check("memory_growth_mb", budget.max_memory_growth_mb, report["memory"]["growth_mb"])
+
+    if budget.min_saturation_concurrency is not None and report["saturation"]:
+        saturated_at = report["saturation"]["concurrency"]
+        if saturated_at < budget.min_saturation_concurrency:
+            violations.append({"metric": "saturation_concurrency", "limit": budget.min_saturation_concurrency,
+                               "actual": saturated_at, "concurrency": saturated_at})
+    return violations
+
+
+# =========================================
+# 실행
+# =========================================
+
+async def _run_stage(ctx: BenchContext, monitor: ResourceMonitor, scripts: List[SessionScript],
+                     concurrency: int, stage_seconds: float, think_time: float, seed: int) -> Dict[str, Any]:
+    """동시 사용자 concurrency명이 stage_seconds 동안 세션을 반복 (마감 후에는 새 요청을 보내지 않음)"""
+    from services import agent_executor
+
+    latencies: List[float] = []
+    errors: List[str] = []
+    endpoints: Dict[str, Dict[str, Any]] = {}
+    sessions = {"started": 0, "completed": 0}
+    weights = [script.weight for script in scripts]
+    before_calls = ctx.env.calls.snapshot()
+    max_queue_depth = 0
+
+    async def user(slot: int):
+        nonlocal max_queue_depth
+        rng = random.Random(seed * 1000 + concurrency * 100 + slot)
+        n = 0
+        while time.monotonic() < deadline:
+            script = rng.choices(scripts, weights)[0]
+            index = slot + n * concurrency
+            session = Session(index, ctx.user_id(index), f"load-{concurrency}-{slot}-{n}")
+            sessions["started"] += 1
+            n += 1
+            for step in script.steps:
+                if time.monotonic() >= deadline:
+                    break
+                monitor.in_flight += 1
+                started = time.perf_counter()
+                try:
+                    await step.run(ctx, session)
+                    error = None
+                except Exception as e:
+                    error = f"{step.name}: {type(e).__name__}: {e}"[:300]
+                finally:
+                    monitor.in_flight -= 1
+                elapsed = time.perf_counter() - started
+                latencies.append(elapsed)
+                stats = endpoints.setdefault(step.name, {"latencies": [], "errors": 0})
+                stats["latencies"].append(elapsed)
+                if error:
+                    errors.append(error)
+                    stats["errors"] += 1
+                    break
+                if agent_executor._agent_executor is not None:
+                    max_queue_depth = max(max_queue_depth, agent_executor._agent_executor.stats()["queue_depth"])
+                if think_time:
+                    await asyncio.sleep(think_time)
+            else:
+                sessions["completed"] += 1
+
+    monitor.begin_stage(concurrency)
+    started = time.perf_counter()
+    deadline = time.monotonic() + stage_seconds
+    await asyncio.gather(*(user(slot) for slot in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    resources = monitor.end_stage()
+
+    settle_started = time.perf_counter()
+    await _wait_agent_executor(ctx)
+    calls = ExternalCalls.diff(ctx.env.calls.snapshot(), before_calls)
+
+    result = summarize(latencies, errors, elapsed, calls)
+    return {
+        "concurrency": concurrency,
+        "sessions": sessions,
+        **result,
+        "endpoints": {
+            name: {"requests": len(stats["latencies"]), "errors": stats["errors"],
+                   "p50_ms": round(percentile(stats["latencies"], 0.5) * 1000, 2),
+                   "p95_ms": round(percentile(stats["latencies"], 0.95) * 1000, 2)}
+            for name, stats in endpoints.items()
+        },
+        **resources,
+        "db_connections_opened": calls.get("postgres.connect", 0),
+        "agent_queue_depth_max": max_queue_depth,
+        "settle_seconds": round(time.perf_counter() - settle_started, 3),
+    }
+
+
+async def _run_ramp(env: OfflineEnvironment, scripts: List[SessionScript], ramp: Sequence[int], stage_seconds: float,
+                    think_time: float, users: int, seed: int, pg_connection) -> Dict[str, Any]:
+    from services.agent_executor import shutdown_agent_executor
+
+    monitor = ResourceMonitor(pg_connection)
+    stages = []
+    try:
+        async with BenchContext(env, users) as ctx:
+            await monitor.start()
+            try:
+                for concurrency in ramp:
+                    stages.append(await _run_stage(ctx, monitor, scripts, concurrency, stage_seconds, think_time, seed))
+            finally:
+                await monitor.stop()
+    finally:
+        shutdown_agent_executor()
+
+    memory = [point["memory_mb"] for point in monitor.timeline if point["memory_mb"] is not None]
+    return {
+        "stages": stages,
+        "timeline": monitor.timeline,
+        "memory": {
+            "source": monitor.memory_source,
+            "start_mb": memory[0] if memory else None,
+            "end_mb": memory[-1] if memory else None,
+            "growth_mb": round(memory[-1] - memory[0], 1) if memory else None,
+        },
+        "db_connections_source": monitor.db_connections_source,
+    }
+
+
+def run_loadtest(
+    ramp: Sequence[int] = (1, 2, 4, 8, 16),
+    stage_seconds: float = 10.0,
+    think_time: float = 0.0,
+    script_names: Optional[List[str]] = None,
+    latency: Optional[FakeLatency] = None,
+    users: int = 20,
+    listings: int = 500,
+    use_db: bool = True,
+    database_url: Optional[str] = None,
+    budget: Optional[LoadBudget] = None,
+    quiet: bool = True,
+    seed: int = 7,
+) -> Dict[str, Any]:
+    """
+    세션 스크립트를 ramp의 동시 사용자 수마다 stage_seconds 동안 재생하고 보고서(dict) 반환
+    DB가 필요한 스크립트는 Postgres를 띄우지 못하면 제외하고 skipped_scripts에 기록
+    """
+    unknown = [name for name in script_names or [] if name not in SCRIPTS]
+    if unknown:
+        raise ValueError(f"알 수 없는 스크립트: {', '.join(unknown)} (가능: {', '.join(SCRIPTS)})")
+    if not ramp or any(concurrency < 1 for concurrency in ramp):
+        raise ValueError(f"ramp는 1 이상의 동시 사용자 수 목록이어야 합니다: {list(ramp)}")
+    scripts = [SCRIPTS[name] for name in script_names] if script_names else list(SCRIPTS.values())
+    latency = latency or FakeLatency()
+    budget = budget or LoadBudget()
+
+    with contextlib.ExitStack() as stack:
+        postgres, db_reason = None, "--no-db"
+        if use_db and any(script.needs_db for script in scripts):
+            try:
+                postgres = stack.enter_context(disposable_postgres(database_url))
+            except PostgresUnavailable as e:
+                db_reason = str(e)
+
+        skipped = {script.name: db_reason for script in scripts if script.needs_db and postgres is None}
+        scripts = [script for script in scripts if script.name not in skipped]
+        if not scripts:
+            raise ValueError(f"실행할 스크립트가 없습니다 ({db_reason})")
+
+        # 모니터 연결은 환경 설치 전에 열어 앱의 연결 수(postgres.connect)에 섞이지 않게 함
+        pg_connection = None
+        if postgres:
+            pg_connection = postgres.connect()
+            pg_connection.autocommit = True
+            stack.callback(pg_connection.close)
+
+        env = stack.enter_context(OfflineEnvironment(latency, postgres))
+        if quiet:
+            silence_app_output(stack)
+
+        seeded = seed_database(postgres, users=users, listings=listings) if postgres else None
+
+        result = asyncio.run(_run_ramp(env, scripts, ramp, stage_seconds, think_time, users, seed, pg_connection))
+
+        peak = max(result["stages"], key=lambda stage: stage["throughput_rps"])
+        report = {
+            "benchmark": "loadtest",
+            "version": REPORT_VERSION,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "config": {
+                "ramp": list(ramp),
+                "stage_seconds": stage_seconds,
+                "think_time": think_time,
+                "users": users,
+                "listings": listings,
+                "scripts": {script.name: script.weight for script in scripts},
+                "skipped_scripts": skipped,
+                "latency_seconds": vars(latency),
+                "redis": env.redis_mode,
+                "db_connections_source": result["db_connections_source"],
+            },
+            "database": {**postgres.describe(), "seeded": seeded} if postgres else {"skipped": db_reason},
+            "stages": result["stages"],
+            "saturation": find_saturation(result["stages"], budget.max_error_rate),
+            "peak_throughput": {"concurrency": peak["concurrency"], "throughput_rps": peak["throughput_rps"]},
+            "memory": result["memory"],
+            "timeline": result["timeline"],
+        }
+        violations = evaluate_budget(report, budget)
+        report["budget"] = {"limits": asdict(budget), "violations": violations, "passed": not violations}
+        return report
@@ -4,6 +4,7 @@ Python FastAPI Microservice
 # 서버 스펙 업그레이드: 0.5 vCPU/1GB → 1 vCPU/2GB
 """
 
+import asyncio
 import os
 from dotenv import load_dotenv
 load_dotenv()  # 🔥 FastAPI 시작 전에 .env 강제 로드
@@ -13,17 +14,18 @@ from dotenv import load_dotenv
 # 환경변수를 먼저 로드 (다른 모듈 import 전에 반드시 실행)
 load_dotenv()
 
-# 로깅 설정 (에이전트 로그 표시용)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-# 에이전트 관련 로거만 DEBUG 레벨로
-logging.getLogger("services.agents").setLevel(logging.DEBUG)
-logging.getLogger("services.chat_service").setLevel(logging.DEBUG)
+# 로깅 설정 - JSON 구조화 로그, 출력은 전용 스레드에서 (에이전트 / 채팅 로거는 기본 DEBUG, LOG_LEVELS로 조정)
+from services.common.logging_config import configure_logging, shutdown_logging
+configure_logging()
+
+# 시작 시간 프로파일 (아래 라우터/서비스 import 시간 측정)
+from services.service_registry import get_service_registry, get_startup_profiler, lazy_service
+startup_profiler = get_startup_profiler()
+startup_profiler.install()
 
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
@@ -31,6 +33,10 @@ from typing import List, Optional, Dict, Any
 from config import settings
 from routers import api_router
 from scheduler import start_scheduler, stop_scheduler
+from services.agent_executor import shutdown_agent_executor
+from services.common.llm_clients import close_llm_clients
+from services.common.llm_gateway import get_llm_gateway
+from services.common.metrics import CONTENT_TYPE, MetricsMiddleware, get_metrics_registry, get_trace_recorder
 
 # ====== Routers (kyoungjin additions) ======
 from routers.vector_router import router as vector_router
@@ -53,11 +59,7 @@ from routers.application_router import router as application_router
 
 # ====== Services ======
 from services.common.openai_client import OpenAIService as OpenAIServiceDev
-from services.learning import (
-    QuestionGeneratorService,
-    AnswerEvaluatorService,
-    CodeExecutorService,
-)
+from services.learning import CodeExecutorService
 from services.recommend.recommend_service import RecommendService
 from services.recommend.hybrid_recommend_service import HybridRecommendService
 
@@ -65,6 +67,8 @@ from services.career_analysis_service import CareerAnalysisService
 from services.identity_analysis_service import IdentityAnalysisService
 from services.chat_service import ChatService
 
+startup_profiler.mark("imports_done")
+startup_profiler.uninstall()
 
 # =========================================
 # Environment Variables
@@ -80,10 +84,16 @@ async def lifespan(app: FastAPI):
     # Startup
     print("[AI Service] 서버 시작...")
     start_scheduler()
+    # 서비스 생성(DB 연결, 외부 클라이언트)은 요청 수신을 막지 않도록 백그라운드에서 진행
+    get_service_registry().start_warm_up()
+    startup_profiler.mark("app_ready")
     yield
     # Shutdown
     print("[AI Service] 서버 종료...")
     stop_scheduler()
+    shutdown_agent_executor()
+    close_llm_clients()
+    shutdown_logging()
 
 
 # =========================================
@@ -107,6 +117,11 @@ app.add_middleware(
     allow_headers=settings.CORS_HEADERS,
 )
 
+# =========================================
+# Metrics (가장 바깥 미들웨어 - 라우트별 요청 수 / 지연 시간, 요청 단위 trace)
+# =========================================
+app.add_middleware(MetricsMiddleware)
+
 # =========================================
 # Core Routers
 # =========================================
@@ -131,29 +146,45 @@ app.include_router(application_router)        # AI 지원서 작성 도우미 AP
 
 
 # =========================================
-# Initialize Services
+# Initialize Services (지연 초기화 - 첫 사용 또는 백그라운드 워밍업 시 생성)
 # =========================================
 
-try:
-    openai_service = OpenAIServiceDev()
-except Exception:
-    openai_service = None
+def _create_openai_service():
+    try:
+        return OpenAIServiceDev()
+    except Exception:
+        return None
+
+
+def _create_recommend_service(service_cls):
+    def factory():
+        try:
+            return service_cls()
+        except Exception as e:
+            print(f"{service_cls.__name__} 초기화 실패 (SUPABASE 환경변수 확인): {e}")
+            return None
+    return factory
+
+
+openai_service = lazy_service("openai", _create_openai_service)
+analysis_service = lazy_service(
+    "career_analysis", lambda: CareerAnalysisService(openai_service.get()), required=True
+)
+identity_service = lazy_service("identity", lambda: IdentityAnalysisService(api_key, model) if api_key else None)
+chat_service = lazy_service("chat", lambda: ChatService(api_key, model) if api_key else None)
+
+def _create_code_executor():
+    service = CodeExecutorService()
+    if service.local_executor is not None:
+        # 작업자 스레드 / 작업 디렉터리 미리 생성 + 언어별 실행 환경 확인
+        print(f"[CodeExecutor] 로컬 실행기 워밍업: {service.local_executor.warm_up()}")
+    return service
 
-analysis_service = CareerAnalysisService(openai_service)
-identity_service = IdentityAnalysisService(api_key, model) if api_key else None
-chat_service = ChatService(api_key, model) if api_key else None
 
-question_generator = QuestionGeneratorService() if api_key else None
-answer_evaluator = AnswerEvaluatorService() if api_key else None
-code_executor = CodeExecutorService()
+code_executor = lazy_service("code_executor", _create_code_executor)
 
-try:
-    recommend_service = RecommendService()
-    hybrid_recommender = HybridRecommendService()
-except Exception as e:
-    print(f"RecommendService 초기화 실패 (SUPABASE 환경변수 확인): {e}")
-    recommend_service = None
-    hybrid_recommender = None
+recommend_service = lazy_service("recommend", _create_recommend_service(RecommendService))
+hybrid_recommender = lazy_service("hybrid_recommend", _create_recommend_service(HybridRecommendService))
 
 # =========================================
 # Basic Endpoints
@@ -168,9 +199,40 @@ async def health():
     return {"status": "healthy"}
 
 
+@app.get("/ready")
+async def ready():
+    """준비 상태 - 워밍업이 끝나고 필수 서비스가 모두 생성되어야 200"""
+    readiness = get_service_registry().readiness()
+    return JSONResponse(status_code=200 if readiness["ready"] else 503, content=readiness)
+
+
+@app.get("/api/startup-profile")
+async def startup_profile():
+    """시작 시간 프로파일 (느린 import 모듈, 단계별 경과 시간, 서비스 초기화 시간)"""
+    return startup_profiler.report()
+
+
+@app.get("/api/llm-gateway/stats")
+async def llm_gateway_stats():
+    """LLM 게이트웨이 상태 (레인별 대기 시간 / 토큰 사용량, 모델별 남은 레이트 리밋 예산)"""
+    return get_llm_gateway().stats()
+
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus 스크레이프 엔드포인트 (요청 / 외부 호출 / 캐시 / 게이트웨이 / 스케줄러 지표)"""
+    return Response(content=get_metrics_registry().render(), media_type=CONTENT_TYPE)
+
+
+@app.get("/api/traces/recent")
+async def recent_traces(trace_id: Optional[str] = None, limit: int = 100):
+    """최근 종료된 span (trace_id를 주면 해당 요청의 span만 - 응답 헤더 x-trace-id 값)"""
+    return {"spans": get_trace_recorder().spans(trace_id=trace_id, limit=min(max(limit, 1), 1000))}
+
+
 @app.post("/api/scheduler/trigger")
 async def trigger_crawl():
-    """수동으로 크롤링 즉시 실행 (테스트/관리자용)"""
+    """수동 크롤링 요청 (테스트/관리자용 - 실행은 스케줄러 워커의 리더가 담당)"""
     from scheduler import trigger_crawl_now
     result = await trigger_crawl_now()
     return result
@@ -178,16 +240,9 @@ async def trigger_crawl():
 
 @app.get("/api/scheduler/status")
 async def scheduler_status():
-    """스케줄러 상태 확인"""
-    from scheduler import scheduler
-    if scheduler and scheduler.running:
-        job = scheduler.get_job("daily_crawl")
-        next_run = job.next_run_time.isoformat() if job else None
-        return {
-            "running": True,
-            "next_run": next_run
-        }
-    return {"running": False, "next_run": None}
+    """스케줄러 상태 확인 (워커가 Redis에 남긴 리더 / 실행 기록 기준)"""
+    from scheduler import get_scheduler_status
+    return await asyncio.to_thread(get_scheduler_status)
 
 
 # =========================================
@@ -236,6 +291,9 @@ class AnalysisResponse(BaseModel):
     interest: InterestAnalysis
     comprehensiveAnalysis: str
     recommendedCareers: List[CareerRecommendation]
+    stageTimings: Optional[Dict[str, float]] = None  # 단계별 소요 시간 (초)
+    partial: bool = False  # 일부 단계가 실패해 기본값이 포함된 결과
+    failedStages: List[str] = []
 
 
 # =========================================
@@ -304,7 +362,7 @@ async def identity_clarity(req: ClarityRequest):
     if not identity_service:
         raise HTTPException(status_code=500, detail="OpenAI API Key 필요")
 
-    return ClarityResponse(**await identity_service.assess_clarity(req.conversationHistory))
+    return ClarityResponse(**await identity_service.assess_clarity(req.conversationHistory, req.sessionId))
 
 
 @app.post("/api/identity/extract", response_model=IdentityResponse)
@@ -313,7 +371,7 @@ async def extract_identity(req: IdentityRequest):
     if not identity_service:
         raise HTTPException(status_code=500, detail="OpenAI API Key 필요")
 
-    result = await identity_service.extract_identity(req.conversationHistory)
+    result = await identity_service.extract_identity(req.conversationHistory, req.sessionId)
     traits = [IdentityTrait(**t) for t in result.get("traits", [])]
 
     return IdentityResponse(
@@ -347,7 +405,8 @@ async def identity_progress(req: ProgressRequest):
 
     result = await identity_service.assess_stage_progress(
         req.conversationHistory,
-        req.currentStage
+        req.currentStage,
+        req.sessionId
     )
     return ProgressResponse(**result)
 
@@ -477,51 +536,22 @@ async def recommend_hybrid_jobs(payload: dict):
 
 # =========================================
 # Learning APIs
+# (문제 생성 / 채점 / 약점 분석은 routers/learning.py - 여기는 코드 실행만)
 # =========================================
 
-class GenerateQuestionsRequest(BaseModel):
-    domain: str
-    weekNumber: int
-    count: int = 5
-
-class EvaluateAnswerRequest(BaseModel):
-    questionType: str
-    questionText: str
-    userAnswer: str
-    correctAnswer: str
-    maxScore: int
-
 class ExecuteCodeRequest(BaseModel):
     code: str
     language: str
     stdin: str = ""
 
+class TestCaseItem(BaseModel):
+    stdin: str = ""
+    expectedOutput: Optional[str] = None
 
-@app.post("/api/learning/generate-questions")
-async def generate_questions(req: GenerateQuestionsRequest):
-
-    if not question_generator:
-        raise HTTPException(status_code=500, detail="OpenAI 설정 필요")
-
-    result = await question_generator.generate_questions(
-        req.domain, req.weekNumber, req.count
-    )
-    return {"questions": result}
-
-
-@app.post("/api/learning/evaluate-answer")
-async def evaluate_answer(req: EvaluateAnswerRequest):
-
-    if not answer_evaluator:
-        raise HTTPException(status_code=500, detail="OpenAI 설정 필요")
-
-    return await answer_evaluator.evaluate_answer(
-        req.questionType,
-        req.questionText,
-        req.userAnswer,
-        req.correctAnswer,
-        req.maxScore
-    )
+class ExecuteTestsRequest(BaseModel):
+    code: str
+    language: str
+    testCases: List[TestCaseItem]
 
 
 @app.post("/api/learning/execute-code")
@@ -534,6 +564,19 @@ async def execute_code(req: ExecuteCodeRequest):
     )
 
 
+@app.post("/api/learning/execute-tests")
+async def execute_tests(req: ExecuteTestsRequest):
+    """제출 코드를 테스트 케이스별로 실행 (한 번 컴파일 후 일괄 실행)"""
+    if not req.testCases:
+        raise HTTPException(status_code=400, detail="testCases가 비어 있습니다")
+
+    test_cases = [
+        {"stdin": case.stdin, **({"expected_output": case.expectedOutput} if case.expectedOutput is not None else {})}
+        for case in req.testCases
+    ]
+    return await code_executor.run_tests(req.code, req.language, test_cases)
+
+
 # =========================================
 # Run
 # =========================================
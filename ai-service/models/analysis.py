@@ -50,4 +50,7 @@ class AnalysisResponse(BaseModel):
     interest: InterestAnalysis
     comprehensiveAnalysis: str
     recommendedCareers: List[CareerRecommendation]
+    stageTimings: Optional[Dict[str, float]] = None  # 단계별 소요 시간 (초)
+    partial: bool = False  # 일부 단계가 실패해 기본값이 포함된 결과
+    failedStages: List[str] = []
 
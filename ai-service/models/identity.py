@@ -7,12 +7,14 @@ from typing import List, Optional
 
 class ClarityRequest(BaseModel):
     conversationHistory: str
-    userId: Optional[str] = None  # userId가 있으면 이전 대화도 포함
+    userId: Optional[str] = None
+    sessionId: Optional[str] = None  # 상담 세션 ID (긴 대화 요약을 세션 단위로 유지)
 
 
 class IdentityRequest(BaseModel):
     conversationHistory: str
-    userId: Optional[str] = None  # userId가 있으면 이전 대화도 포함
+    userId: Optional[str] = None
+    sessionId: Optional[str] = None  # 상담 세션 ID (긴 대화 요약을 세션 단위로 유지)
 
 
 class InsightRequest(BaseModel):
@@ -25,6 +27,7 @@ class ProgressRequest(BaseModel):
     conversationHistory: str
     currentStage: str
     userId: Optional[str] = None
+    sessionId: Optional[str] = None  # 상담 세션 ID (긴 대화 요약을 세션 단위로 유지)
 
 
 class ClarityResponse(BaseModel):
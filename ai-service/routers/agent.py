@@ -43,14 +43,15 @@ from services.agents.job_recommendation_agent import JobRecommendationAgent
 from services.agents.application_tracker_agent import ApplicationTrackerAgent
 from services.agents.career_growth_agent import CareerGrowthAgent
 from services.agents.resume_optimizer_agent import ResumeOptimizerAgent
+from services.service_registry import lazy_service
 
 router = APIRouter(prefix="/api/agent", tags=["ai-agent"])
 
-# 에이전트 인스턴스
-job_recommendation_agent = JobRecommendationAgent()
-application_tracker_agent = ApplicationTrackerAgent()
-career_growth_agent = CareerGrowthAgent()
-resume_optimizer_agent = ResumeOptimizerAgent()
+# 에이전트 인스턴스 (처음 사용할 때 생성)
+job_recommendation_agent = lazy_service("agent.job_recommendation", JobRecommendationAgent)
+application_tracker_agent = lazy_service("agent.application_tracker", ApplicationTrackerAgent)
+career_growth_agent = lazy_service("agent.career_growth", CareerGrowthAgent)
+resume_optimizer_agent = lazy_service("agent.resume_optimizer", ResumeOptimizerAgent)
 
 
 # ============== 1. 채용 공고 추천 ==============
@@ -1,83 +1,123 @@
 """
 회원용 AI 챗봇 비서 라우터 (Function Calling 전용)
 """
+import logging
+import os
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
+from typing import List
 from uuid import UUID, uuid4
 from datetime import datetime
 
 from models.chatbotassistant import AssistantChatRequest, AssistantChatResponse
 from services.chatbot.assistant import AssistantService
 from services.database_service import DatabaseService
+from services.service_registry import lazy_service
+from services.streaming import SSE_HEADERS, get_streaming_metrics, iterate_in_thread, sse_event
 from dependencies import get_db
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/assistant", tags=["assistant"])
 
-# 서비스 인스턴스 (싱글톤)
-assistant_service = AssistantService()
-db_service = DatabaseService()
+# 서비스 인스턴스 (싱글톤, 처음 사용할 때 생성)
+assistant_service = lazy_service("assistant", AssistantService, required=True)
+db_service = lazy_service("assistant.db", DatabaseService, required=True)
+
+# 대화 히스토리 조회 상한 (프롬프트에는 토큰 예산 이내만 포함, 이전 대화는 세션 요약으로 대체)
+HISTORY_FETCH_LIMIT = int(os.getenv("ASSISTANT_HISTORY_FETCH_LIMIT", 100))
 
 
 def get_db():
     """데이터베이스 서비스 의존성 (싱글톤 인스턴스 재사용)"""
-    return db_service
+    return db_service.get()
 
 
-@router.post("/chat", response_model=AssistantChatResponse)
-async def chat(dto: AssistantChatRequest, db: DatabaseService = Depends(get_db)):
-    """회원용 AI 챗봇 비서"""
-    try:
-        # 1. User 조회 (회원 전용이므로 필수)
-        user_query = "SELECT * FROM users WHERE user_id = %s"
-        user_result = db.execute_query(user_query, (dto.userId,))
-        if not user_result:
-            raise HTTPException(status_code=404, detail=f"User not found with id: {dto.userId}")
-        user = user_result[0]
-
-        # 2. 세션 생성 또는 조회
-        if not dto.sessionId:
-            # 새 세션 생성
-            session_id = uuid4()
-            insert_session_query = """
-                INSERT INTO chatbot_sessions (id, cb_user_id, conversation_title, created_at)
-                VALUES (%s, %s, %s, %s)
-            """
-            db.execute_update(
-                insert_session_query,
-                (str(session_id), dto.userId, dto.conversationTitle, datetime.now())
-            )
-        else:
-            session_id = dto.sessionId
-            # 기존 세션 확인
-            session_query = "SELECT * FROM chatbot_sessions WHERE id = %s AND cb_user_id = %s"
-            session_result = db.execute_query(session_query, (str(session_id), dto.userId))
-            if not session_result:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Session not found or unauthorized"
-                )
-
-        # 3. 대화 히스토리 조회 (Function Calling에 컨텍스트 제공)
-        history_query = """
-            SELECT role, message
-            FROM chatbot_messages
-            WHERE cb_session_id = %s
-            ORDER BY created_at ASC
-        """
-        history_result = db.execute_query(history_query, (str(session_id),))
-        conversation_history = [
-            {"role": msg["role"], "content": msg["message"]}
-            for msg in (history_result or [])
-        ]
+def _start_chat(dto: AssistantChatRequest, db: DatabaseService):
+    """
+    사용자/세션 확인, 대화 히스토리 조회 후 사용자 메시지 저장
 
-        # 4. 사용자 메시지 저장
-        insert_user_msg_query = """
-            INSERT INTO chatbot_messages (cb_session_id, cb_user_id, role, message, created_at)
-            VALUES (%s, %s, %s, %s, %s)
+    Returns:
+        (session_id, conversation_history)
+    """
+    # 1. User 조회 (회원 전용이므로 필수)
+    user_query = "SELECT * FROM users WHERE user_id = %s"
+    user_result = db.execute_query(user_query, (dto.userId,))
+    if not user_result:
+        raise HTTPException(status_code=404, detail=f"User not found with id: {dto.userId}")
+    user = user_result[0]
+
+    # 2. 세션 생성 또는 조회
+    if not dto.sessionId:
+        # 새 세션 생성
+        session_id = uuid4()
+        insert_session_query = """
+            INSERT INTO chatbot_sessions (id, cb_user_id, conversation_title, created_at)
+            VALUES (%s, %s, %s, %s)
         """
         db.execute_update(
-            insert_user_msg_query,
-            (str(session_id), dto.userId, "user", dto.message, datetime.now())
+            insert_session_query,
+            (str(session_id), dto.userId, dto.conversationTitle, datetime.now())
         )
+    else:
+        session_id = dto.sessionId
+        # 기존 세션 확인
+        session_query = "SELECT * FROM chatbot_sessions WHERE id = %s AND cb_user_id = %s"
+        session_result = db.execute_query(session_query, (str(session_id), dto.userId))
+        if not session_result:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Session not found or unauthorized"
+            )
+
+    # 3. 대화 히스토리 조회 (Function Calling에 컨텍스트 제공)
+    history_query = """
+        SELECT id, role, message
+        FROM (
+            SELECT id, role, message, created_at
+            FROM chatbot_messages
+            WHERE cb_session_id = %s
+            ORDER BY created_at DESC
+            LIMIT %s
+        ) recent
+        ORDER BY created_at ASC
+    """
+    history_result = db.execute_query(history_query, (str(session_id), HISTORY_FETCH_LIMIT))
+    # id: 조회 구간이 요약 경계보다 뒤로 밀려나도 이미 요약한 메시지를 구분하기 위해 전달
+    conversation_history = [
+        {"role": msg["role"], "content": msg["message"], "id": msg["id"]}
+        for msg in (history_result or [])
+    ]
+
+    # 4. 사용자 메시지 저장
+    insert_user_msg_query = """
+        INSERT INTO chatbot_messages (cb_session_id, cb_user_id, role, message, created_at)
+        VALUES (%s, %s, %s, %s, %s)
+    """
+    db.execute_update(
+        insert_user_msg_query,
+        (str(session_id), dto.userId, "user", dto.message, datetime.now())
+    )
+    return session_id, conversation_history
+
+
+def _save_answer(dto: AssistantChatRequest, db: DatabaseService, session_id, answer: str):
+    """AI 답변 저장"""
+    insert_ai_msg_query = """
+        INSERT INTO chatbot_messages (cb_session_id, cb_user_id, role, message, created_at)
+        VALUES (%s, %s, %s, %s, %s)
+    """
+    db.execute_update(
+        insert_ai_msg_query,
+        (str(session_id), dto.userId, "assistant", answer, datetime.now())
+    )
+
+
+@router.post("/chat", response_model=AssistantChatResponse)
+async def chat(dto: AssistantChatRequest, db: DatabaseService = Depends(get_db)):
+    """회원용 AI 챗봇 비서"""
+    try:
+        session_id, conversation_history = _start_chat(dto, db)
 
         # 5. AI 응답 생성 (Function Calling)
         answer = assistant_service.chat(
@@ -85,18 +125,12 @@ async def chat(dto: AssistantChatRequest, db: DatabaseService = Depends(get_db))
             message=dto.message,
             conversation_history=conversation_history,
             db=db,
-            function_name=dto.functionName  # FAQ 직접 호출용
+            function_name=dto.functionName,  # FAQ 직접 호출용
+            session_id=str(session_id)
         )
 
         # 6. AI 답변 저장
-        insert_ai_msg_query = """
-            INSERT INTO chatbot_messages (cb_session_id, cb_user_id, role, message, created_at)
-            VALUES (%s, %s, %s, %s, %s)
-        """
-        db.execute_update(
-            insert_ai_msg_query,
-            (str(session_id), dto.userId, "assistant", answer, datetime.now())
-        )
+        _save_answer(dto, db, session_id, answer)
 
         # 7. 응답 반환
         return AssistantChatResponse(session=session_id, response=answer)
@@ -107,6 +141,67 @@ async def chat(dto: AssistantChatRequest, db: DatabaseService = Depends(get_db))
         raise HTTPException(status_code=500, detail=f"챗봇 비서 처리 실패: {str(e)}")
 
 
+@router.post("/chat/stream")
+async def chat_stream(dto: AssistantChatRequest, db: DatabaseService = Depends(get_db)):
+    """
+    회원용 AI 챗봇 비서 (SSE 스트리밍)
+
+    이벤트:
+    - session: {"session"} - 세션 ID (첫 이벤트)
+    - token: {"text"} - 답변 조각
+    - done: {"session", "response", "ttftMs", "totalMs"} - 완료 (답변 저장 후)
+    - error: {"detail"}
+
+    사용자 메시지는 스트리밍 전에 저장하고, 연결이 끊기거나 오류로 중단돼도 받은 만큼의 답변을 저장합니다.
+    """
+    try:
+        session_id, conversation_history = _start_chat(dto, db)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"챗봇 비서 처리 실패: {str(e)}")
+
+    async def event_stream():
+        timer = get_streaming_metrics().start("assistant_chat")
+        parts: List[str] = []
+        completed = False
+        save_attempted = False
+        try:
+            yield sse_event("session", {"session": str(session_id)})
+
+            chunks = iterate_in_thread(lambda: assistant_service.chat_stream(
+                user_id=dto.userId,
+                message=dto.message,
+                conversation_history=conversation_history,
+                db=db,
+                function_name=dto.functionName,
+                session_id=str(session_id)
+            ))
+            async for text in chunks:
+                timer.first_token()
+                parts.append(text)
+                yield sse_event("token", {"text": text})
+
+            answer = "".join(parts)
+            save_attempted = True
+            _save_answer(dto, db, session_id, answer)
+            completed = True
+            yield sse_event("done", {"session": str(session_id), "response": answer, **timer.finish()})
+        except Exception as e:
+            logger.warning(f"[AssistantRouter] 스트리밍 오류: {e}")
+            yield sse_event("error", {"detail": f"챗봇 비서 처리 실패: {str(e)}"})
+        finally:
+            # 클라이언트 연결 종료 / 오류로 중단 → 부분 답변이라도 저장 (히스토리에 질문만 남지 않도록)
+            if parts and not save_attempted:
+                try:
+                    _save_answer(dto, db, session_id, "".join(parts))
+                except Exception as e:
+                    logger.warning(f"[AssistantRouter] 부분 답변 저장 실패: {e}")
+            timer.finish(completed)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
 @router.get("/history/{session_id}")
 async def get_history(session_id: UUID, user_id: int, db: DatabaseService = Depends(get_db)):
     """챗봇 비서 히스토리 조회 (회원 전용)"""
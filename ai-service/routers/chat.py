@@ -1,11 +1,13 @@
 """
 채팅 API 라우터
 에이전트 호출 분리: 상담 응답 즉시 반환, 에이전트는 백그라운드 실행
+에이전트 결과는 SSE(/chat/agent-events)로 푸시, 폴링(/chat/agent-result)은 폴백용
 """
 import asyncio
-import threading
 import logging
-from fastapi import APIRouter, HTTPException, Depends
+from functools import partial
+from fastapi import APIRouter, HTTPException, Depends, Header
+from fastapi.responses import StreamingResponse
 
 from models.chat import (
     ChatRequest, ChatResponse, AgentTaskResponse,
@@ -13,14 +15,19 @@ from models.chat import (
 )
 from services.chat_service import ChatService
 from services.agent_task_store import get_agent_task_store
+from services.agent_executor import get_agent_executor
+from services.streaming import SSE_HEADERS, get_streaming_metrics, sse_event
 from services.agents import should_use_agent
+from services.agents.events import bind_agent_task, unbind_agent_task
+from services.agents.node_metrics import get_agent_node_metrics
+from services.agents.tool_cache import get_tool_result_cache
 from dependencies import get_chat_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api", tags=["chat"])
 
 
-def run_agent_in_background(
+async def run_agent_in_background(
     task_id: str,
     chat_service: ChatService,
     session_id: str,
@@ -29,41 +36,63 @@ def run_agent_in_background(
     conversation_history: list,
 ):
     """
-    백그라운드에서 에이전트 실행 후 Redis에 결과 저장
+    에이전트 실행기 워커에서 에이전트 실행 후 Redis에 결과 저장
+    (취소/시간 초과/예외는 AgentExecutor가 태스크 상태로 기록)
+
+    워커들이 이벤트 루프 하나를 공유하므로 동기 Redis 쓰기는 스레드에서 실행
     """
     task_store = get_agent_task_store()
 
+    await asyncio.to_thread(task_store.set_running, task_id)
+    logger.info(f"[Agent Background] 시작: task_id={task_id}")
+
+    # ReAct 단계 진행을 태스크 이벤트로 발행
+    token = bind_agent_task(task_id)
     try:
-        task_store.set_running(task_id)
-        logger.info(f"[Agent Background] 시작: task_id={task_id}")
+        result = await chat_service.run_agent_task(
+            session_id=session_id,
+            user_message=user_message,
+            user_id=user_id,
+            conversation_history=conversation_history,
+        )
+    finally:
+        unbind_agent_task(token)
 
-        # 새 이벤트 루프 생성 (백그라운드 스레드용)
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+    if result.get("used_agent") and result.get("agent_action"):
+        await asyncio.to_thread(task_store.set_completed, task_id, result)
+        logger.info(f"[Agent Background] 완료: task_id={task_id}")
+    else:
+        await asyncio.to_thread(task_store.set_skipped, task_id)
+        logger.info(f"[Agent Background] 스킵 (도구 미사용): task_id={task_id}")
 
-        try:
-            result = loop.run_until_complete(
-                chat_service.run_agent_task(
-                    session_id=session_id,
-                    user_message=user_message,
-                    user_id=user_id,
-                    conversation_history=conversation_history,
-                )
-            )
 
-            if result.get("used_agent") and result.get("agent_action"):
-                task_store.set_completed(task_id, result)
-                logger.info(f"[Agent Background] 완료: task_id={task_id}")
-            else:
-                task_store.set_skipped(task_id)
-                logger.info(f"[Agent Background] 스킵 (도구 미사용): task_id={task_id}")
+def _submit_agent_task(request: ChatRequest, chat_service: ChatService, history: list):
+    """에이전트가 필요한 메시지면 백그라운드 태스크 등록 후 task_id 반환 (아니면 None)"""
+    if not should_use_agent(request.userMessage):
+        return None
 
-        finally:
-            loop.close()
+    task_store = get_agent_task_store()
+    task_id = task_store.create_task(
+        session_id=request.sessionId,
+        user_id=request.userId
+    )
 
-    except Exception as e:
-        logger.error(f"[Agent Background] 실패: task_id={task_id}, error={e}")
-        task_store.set_failed(task_id, str(e))
+    # 에이전트 실행기 대기열에 등록 (같은 사용자의 이전 태스크는 취소)
+    admission = get_agent_executor().submit(
+        task_id,
+        key=str(request.userId or request.sessionId),
+        func=partial(
+            run_agent_in_background,
+            task_id,
+            chat_service,
+            request.sessionId,
+            request.userMessage,
+            request.userId,
+            history,
+        ),
+    )
+    logger.info(f"[Chat] 에이전트 백그라운드 등록: task_id={task_id}, {admission}")
+    return task_id
 
 
 @router.post("/chat", response_model=ChatResponse)
@@ -97,29 +126,7 @@ async def chat(
         )
 
         # 2. 에이전트 필요 여부 판단
-        task_id = None
-        if should_use_agent(request.userMessage):
-            task_store = get_agent_task_store()
-            task_id = task_store.create_task(
-                session_id=request.sessionId,
-                user_id=request.userId
-            )
-
-            # 백그라운드에서 에이전트 실행
-            thread = threading.Thread(
-                target=run_agent_in_background,
-                args=(
-                    task_id,
-                    chat_service,
-                    request.sessionId,
-                    request.userMessage,
-                    request.userId,
-                    history,
-                ),
-                daemon=True,
-            )
-            thread.start()
-            logger.info(f"[Chat] 에이전트 백그라운드 시작: task_id={task_id}")
+        task_id = _submit_agent_task(request, chat_service, history)
 
         # 3. 즉시 응답 반환
         return ChatResponse(
@@ -133,10 +140,71 @@ async def chat(
         raise HTTPException(status_code=500, detail=f"채팅 응답 생성 실패: {str(e)}")
 
 
+@router.post("/chat/stream")
+async def chat_stream(
+    request: ChatRequest,
+    chat_service: ChatService = Depends(get_chat_service)
+):
+    """
+    대화형 진로 상담 응답 생성 (SSE 스트리밍)
+
+    이벤트:
+    - task: {"taskId"} - 에이전트 태스크가 등록된 경우 (첫 이벤트, 상담 응답과 동시에 실행)
+    - token: {"text"} - 상담 응답 조각
+    - done: {"sessionId", "message", "taskId", "ttftMs", "totalMs"} - 완료
+    - error: {"detail"}
+    """
+    history = [
+        {"role": msg.role, "content": msg.content}
+        for msg in request.conversationHistory
+    ]
+
+    async def event_stream():
+        timer = get_streaming_metrics().start("counseling_chat")
+        parts = []
+        completed = False
+        try:
+            task_id = _submit_agent_task(request, chat_service, history)
+            if task_id:
+                yield sse_event("task", {"taskId": task_id})
+
+            async for text in chat_service.stream_counseling_response(
+                session_id=request.sessionId,
+                user_message=request.userMessage,
+                current_stage=request.currentStage,
+                conversation_history=history,
+                survey_data=request.surveyData,
+            ):
+                timer.first_token()
+                parts.append(text)
+                yield sse_event("token", {"text": text})
+
+            completed = True
+            yield sse_event("done", {
+                "sessionId": request.sessionId,
+                "message": "".join(parts),
+                "taskId": task_id,
+                **timer.finish(),
+            })
+        except Exception as e:
+            logger.error(f"[Chat] 스트리밍 에러: {e}")
+            yield sse_event("error", {"detail": f"채팅 응답 생성 실패: {str(e)}"})
+        finally:
+            timer.finish(completed)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
+@router.get("/chat/streaming-metrics")
+async def get_chat_streaming_metrics():
+    """스트리밍 엔드포인트별 첫 토큰까지 걸린 시간(TTFT) / 전체 생성 시간 (초)"""
+    return get_streaming_metrics().snapshot()
+
+
 @router.get("/chat/agent-result/{task_id}", response_model=AgentTaskResponse)
 async def get_agent_result(task_id: str):
     """
-    에이전트 태스크 결과 조회 (폴링용)
+    에이전트 태스크 결과 조회 (폴링용 - SSE 연결이 불가능할 때 폴백)
 
     상태:
     - pending: 대기 중
@@ -151,7 +219,50 @@ async def get_agent_result(task_id: str):
     if not task:
         raise HTTPException(status_code=404, detail="태스크를 찾을 수 없습니다")
 
-    # 결과 변환
+    return _to_task_response(task_id, task)
+
+
+@router.get("/chat/agent-events/{task_id}")
+async def stream_agent_events(task_id: str, last_event_id: str = Header(None)):
+    """
+    에이전트 태스크 이벤트 스트림 (SSE)
+
+    이벤트:
+    - status: 상태 변경 (pending → running → completed/skipped/failed)
+    - step: ReAct 단계 진행 (AgentStep 형식)
+    - result: 종료 시 최종 결과 (agent-result 응답과 동일)
+
+    재접속 시 Last-Event-ID 이후 이벤트부터 다시 전송합니다.
+    """
+    task_store = get_agent_task_store()
+    if not task_store.get_task(task_id):
+        raise HTTPException(status_code=404, detail="태스크를 찾을 수 없습니다")
+
+    start = int(last_event_id) if last_event_id and last_event_id.isdigit() else 0
+
+    async def event_stream():
+        yield "retry: 2000\n\n"
+        async for item in task_store.stream_events(task_id, start=start):
+            if item is None:
+                yield ": ping\n\n"  # 프록시 유휴 연결 종료 방지
+                continue
+
+            seq, event = item
+            yield sse_event(event["type"], event, event_id=seq)
+
+        task = task_store.get_task(task_id)
+        if task and task["status"] in ("completed", "skipped", "failed"):
+            yield sse_event("result", _to_task_response(task_id, task).model_dump())
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
+def _to_task_response(task_id: str, task: dict) -> AgentTaskResponse:
+    """저장된 태스크 → API 응답 모델"""
     agent_action = None
     agent_steps = None
 
@@ -182,3 +293,21 @@ async def get_agent_result(task_id: str):
         agentSteps=agent_steps,
         error=task.get("error"),
     )
+
+
+@router.get("/chat/agent-executor/stats")
+async def get_agent_executor_stats():
+    """에이전트 실행기 지표 (대기열 깊이, 동시 실행 수, 대기/실행 시간)"""
+    return get_agent_executor().stats()
+
+
+@router.get("/chat/agent-node-metrics")
+async def get_agent_node_metrics_snapshot():
+    """에이전트 노드별 지연 시간 / 토큰 사용량 (reason, action:<도구>, answer)"""
+    return get_agent_node_metrics().snapshot()
+
+
+@router.get("/chat/agent-tool-cache/stats")
+async def get_agent_tool_cache_stats():
+    """에이전트 외부 도구 결과 캐시 지표 (적중 / 미스 / 동시 조회 병합 수)"""
+    return get_tool_result_cache().stats()
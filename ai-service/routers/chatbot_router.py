@@ -1,6 +1,8 @@
+import logging
 import os
 import httpx
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from typing import List, Dict, Any
 from uuid import UUID, uuid4
 from datetime import datetime
@@ -15,109 +17,135 @@ from services.chatbot import (
     RagAnswerService,
 )
 from services.chatbot.shared.faq_service import FaqService
+from services.chatbot.shared.faq_matcher import get_faq_matcher
 from services.database_service import DatabaseService
+from services.service_registry import lazy_service
+from services.streaming import SSE_HEADERS, get_streaming_metrics, iterate_in_thread, sse_event
 from dependencies import get_db
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/rag", tags=["rag-chatbot"])
 
-# 서비스 인스턴스 (싱글톤)
-embedding_service = RagEmbeddingService()
-search_service = RagSearchService()
-answer_service = RagAnswerService()
-faq_service = FaqService()
-db_service = DatabaseService()
+# 서비스 인스턴스 (싱글톤, 처음 사용할 때 생성)
+embedding_service = lazy_service("rag.embedding", RagEmbeddingService)
+search_service = lazy_service("rag.search", RagSearchService)
+answer_service = lazy_service("rag.answer", RagAnswerService)
+faq_service = lazy_service("rag.faq", FaqService)
+db_service = lazy_service("rag.db", DatabaseService, required=True)
 
 
 def get_db():
     """데이터베이스 서비스 의존성 (싱글톤 인스턴스 재사용)"""
-    return db_service
+    return db_service.get()
 
 
 # ============ Chat RAG API ============
 
+def _start_chat(dto: ChatRequestDto, db: DatabaseService):
+    """사용자/세션 확인 후 사용자 메시지 저장. 세션 ID 반환"""
+    # 1. User 조회 (비회원이면 None)
+    user = None
+    if dto.userId:
+        user_query = "SELECT * FROM users WHERE user_id = %s"
+        user_result = db.execute_query(user_query, (dto.userId,))
+        if not user_result:
+            raise HTTPException(status_code=404, detail=f"User not found with id: {dto.userId}")
+        user = user_result[0]
+
+    # 2. 세션 생성 또는 조회
+    if not dto.sessionId:
+        # 새 세션 생성
+        session_id = uuid4()
+        insert_session_query = """
+            INSERT INTO chatbot_sessions (id, cb_user_id, guest_id, conversation_title, created_at)
+            VALUES (%s, %s, %s, %s, %s)
+        """
+        db.execute_update(
+            insert_session_query,
+            (str(session_id), dto.userId, dto.guestId, dto.conversationTitle, datetime.now())
+        )
+    else:
+        session_id = dto.sessionId
+        # 기존 세션 확인
+        session_query = "SELECT * FROM chatbot_sessions WHERE id = %s"
+        session_result = db.execute_query(session_query, (str(session_id),))
+        if not session_result:
+            raise HTTPException(status_code=404, detail=f"Session not found with id: {session_id}")
+
+    # 3. 사용자 메시지 저장
+    insert_user_msg_query = """
+        INSERT INTO chatbot_messages (cb_session_id, cb_user_id, guest_id, role, message, created_at)
+        VALUES (%s, %s, %s, %s, %s, %s)
+    """
+    db.execute_update(
+        insert_user_msg_query,
+        (str(session_id), dto.userId, dto.guestId, "user", dto.message, datetime.now())
+    )
+    return session_id
+
+
+def _find_answer(dto: ChatRequestDto, db: DatabaseService):
+    """
+    FAQ 매칭 → 실패 시 RAG 검색
+
+    Returns:
+        (faq_answer, matches) - FAQ가 매칭되면 faq_answer, 아니면 RAG 검색 결과
+    """
+    # 4. FAQ 검색 먼저 시도
+    user_type = "member" if dto.userId else "guest"
+    logger.debug(f"[ROUTER] user_type={user_type}, 질문: {dto.message}")
+
+    faq_match = faq_service.search_faq(dto.message, user_type=user_type, db=db)
+
+    if faq_match:
+        # FAQ 매칭되면 FAQ 답변 반환
+        logger.info(f"[FAQ 매칭] 카테고리: {faq_match.get('category')}", extra={"user_type": user_type})
+        return faq_match.get("answer", "답변을 찾을 수 없습니다."), None
+
+    # FAQ 매칭 안되면 RAG 답변 생성
+    logger.debug("[FAQ 매칭 실패] RAG로 답변 생성 시도...")
+    # FAQ 매처의 메시지 임베딩 캐시 재사용 (같은 질문 반복 시 임베딩 API 호출 생략)
+    vector = get_faq_matcher().embed(dto.message).tolist()
+    logger.debug(f"[RAG] 임베딩 벡터 생성 완료 (차원: {len(vector)})")
+    matches = search_service.search(vector, user_type=user_type)
+    logger.info(f"[RAG] Pinecone 검색 결과 개수: {len(matches)}", extra={"user_type": user_type})
+
+    if matches and logger.isEnabledFor(logging.DEBUG):
+        for i, match in enumerate(matches[:3]):
+            score = match.get('score', 0)
+            metadata = match.get('metadata', {})
+            question = metadata.get('question', 'N/A')
+            logger.debug(f"  [{i+1}] 유사도: {score:.3f}, 질문: {question[:50]}")
+
+    return None, matches
+
+
+def _save_answer(dto: ChatRequestDto, db: DatabaseService, session_id, answer: str):
+    """AI 답변 저장"""
+    logger.debug(f"[최종 답변] {answer[:100]}...")
+
+    insert_ai_msg_query = """
+        INSERT INTO chatbot_messages (cb_session_id, cb_user_id, guest_id, role, message, created_at)
+        VALUES (%s, %s, %s, %s, %s, %s)
+    """
+    db.execute_update(
+        insert_ai_msg_query,
+        (str(session_id), dto.userId, dto.guestId, "assistant", answer, datetime.now())
+    )
+
+
 @router.post("/chat", response_model=ChatResponse)
 async def chat(dto: ChatRequestDto, db: DatabaseService = Depends(get_db)):
     """챗봇 메시지 처리"""
     try:
-        # 1. User 조회 (비회원이면 None)
-        user = None
-        if dto.userId:
-            user_query = "SELECT * FROM users WHERE user_id = %s"
-            user_result = db.execute_query(user_query, (dto.userId,))
-            if not user_result:
-                raise HTTPException(status_code=404, detail=f"User not found with id: {dto.userId}")
-            user = user_result[0]
-
-        # 2. 세션 생성 또는 조회
-        if not dto.sessionId:
-            # 새 세션 생성
-            session_id = uuid4()
-            insert_session_query = """
-                INSERT INTO chatbot_sessions (id, cb_user_id, guest_id, conversation_title, created_at)
-                VALUES (%s, %s, %s, %s, %s)
-            """
-            db.execute_update(
-                insert_session_query,
-                (str(session_id), dto.userId, dto.guestId, dto.conversationTitle, datetime.now())
-            )
-        else:
-            session_id = dto.sessionId
-            # 기존 세션 확인
-            session_query = "SELECT * FROM chatbot_sessions WHERE id = %s"
-            session_result = db.execute_query(session_query, (str(session_id),))
-            if not session_result:
-                raise HTTPException(status_code=404, detail=f"Session not found with id: {session_id}")
-
-        # 3. 사용자 메시지 저장
-        insert_user_msg_query = """
-            INSERT INTO chatbot_messages (cb_session_id, cb_user_id, guest_id, role, message, created_at)
-            VALUES (%s, %s, %s, %s, %s, %s)
-        """
-        db.execute_update(
-            insert_user_msg_query,
-            (str(session_id), dto.userId, dto.guestId, "user", dto.message, datetime.now())
-        )
+        session_id = _start_chat(dto, db)
 
-        # 4. FAQ 검색 먼저 시도
-        user_type = "member" if dto.userId else "guest"
-        print(f"\n{'='*60}")
-        print(f"[ROUTER] user_type={user_type}, 질문: {dto.message}")
-
-        faq_match = faq_service.search_faq(dto.message, user_type=user_type, db=db)
-
-        if faq_match:
-            # FAQ 매칭되면 FAQ 답변 반환
-            answer = faq_match.get("answer", "답변을 찾을 수 없습니다.")
-            print(f"[FAQ 매칭 ✅] 카테고리: {faq_match.get('category')}, 질문: {faq_match.get('question')}")
-        else:
-            # FAQ 매칭 안되면 RAG 답변 생성
-            print("[FAQ 매칭 실패] RAG로 답변 생성 시도...")
-            vector = embedding_service.embed(dto.message)
-            print(f"[RAG] 임베딩 벡터 생성 완료 (차원: {len(vector)})")
-            matches = search_service.search(vector, user_type=user_type)
-            print(f"[RAG] Pinecone 검색 결과 개수: {len(matches)}")
-
-            if matches:
-                for i, match in enumerate(matches[:3]):
-                    score = match.get('score', 0)
-                    metadata = match.get('metadata', {})
-                    question = metadata.get('question', 'N/A')
-                    print(f"  [{i+1}] 유사도: {score:.3f}, 질문: {question[:50]}")
-
-            answer = answer_service.generate_answer(dto.message, matches)
-
-        print(f"[최종 답변] {answer[:100]}...")
-        print(f"{'='*60}\n")
+        faq_answer, matches = _find_answer(dto, db)
+        answer = faq_answer if faq_answer is not None else answer_service.generate_answer(dto.message, matches)
 
         # 5. AI 답변 저장
-        insert_ai_msg_query = """
-            INSERT INTO chatbot_messages (cb_session_id, cb_user_id, guest_id, role, message, created_at)
-            VALUES (%s, %s, %s, %s, %s, %s)
-        """
-        db.execute_update(
-            insert_ai_msg_query,
-            (str(session_id), dto.userId, dto.guestId, "assistant", answer, datetime.now())
-        )
+        _save_answer(dto, db, session_id, answer)
 
         # 6. 응답 반환
         return ChatResponse(session=session_id, response=answer)
@@ -128,6 +156,56 @@ async def chat(dto: ChatRequestDto, db: DatabaseService = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"챗봇 메시지 처리 실패: {str(e)}")
 
 
+@router.post("/chat/stream")
+async def chat_stream(dto: ChatRequestDto, db: DatabaseService = Depends(get_db)):
+    """
+    챗봇 메시지 처리 (SSE 스트리밍)
+
+    이벤트:
+    - session: {"session"} - 세션 ID (첫 이벤트)
+    - token: {"text"} - 답변 조각
+    - done: {"session", "response", "ttftMs", "totalMs"} - 완료 (답변 저장 후)
+    - error: {"detail"}
+    """
+    try:
+        session_id = _start_chat(dto, db)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"챗봇 메시지 처리 실패: {str(e)}")
+
+    async def event_stream():
+        timer = get_streaming_metrics().start("rag_chat")
+        parts: List[str] = []
+        completed = False
+        try:
+            yield sse_event("session", {"session": str(session_id)})
+
+            faq_answer, matches = _find_answer(dto, db)
+            if faq_answer is not None:
+                # FAQ 답변은 한 번에 전송
+                chunks = iterate_in_thread(lambda: iter([faq_answer]))
+            else:
+                chunks = iterate_in_thread(lambda: answer_service.stream_answer(dto.message, matches))
+
+            async for text in chunks:
+                timer.first_token()
+                parts.append(text)
+                yield sse_event("token", {"text": text})
+
+            answer = "".join(parts)
+            _save_answer(dto, db, session_id, answer)
+            completed = True
+            yield sse_event("done", {"session": str(session_id), "response": answer, **timer.finish()})
+        except Exception as e:
+            logger.exception(f"[RAG 스트리밍] 오류: {e}")
+            yield sse_event("error", {"detail": f"챗봇 메시지 처리 실패: {str(e)}"})
+        finally:
+            timer.finish(completed)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
 @router.get("/history/{session_id}")
 async def get_history(session_id: UUID, db: DatabaseService = Depends(get_db)):
     """챗봇 히스토리 조회"""
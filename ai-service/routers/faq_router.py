@@ -1,3 +1,4 @@
+import asyncio
 import os
 import httpx
 from fastapi import APIRouter, HTTPException, Depends
@@ -11,18 +12,30 @@ from models.chatbot import (
 from services.chatbot.rag import (
     RagEmbeddingService,
 )
+from services.chatbot.shared.faq_matcher import get_faq_matcher
 from services.database_service import DatabaseService
+from services.service_registry import lazy_service
 from dependencies import get_db
 
 router = APIRouter(prefix="/api/faq", tags=["faq"])
 
-# 서비스 인스턴스 (싱글톤)
-embedding_service = RagEmbeddingService()
-db_service = DatabaseService()
+# 서비스 인스턴스 (싱글톤, 처음 사용할 때 생성)
+embedding_service = lazy_service("faq.embedding", RagEmbeddingService)
+db_service = lazy_service("faq.db", DatabaseService, required=True)
 
 def get_db():
     """데이터베이스 서비스 의존성 (싱글톤 인스턴스 재사용)"""
-    return db_service
+    return db_service.get()
+
+
+def _load_faq_index():
+    """FAQ 인메모리 인덱스 최초 로드 (서버 시작 시 워밍업 스레드에서 - 첫 채팅 요청이 로드를 기다리지 않도록)"""
+    matcher = get_faq_matcher()
+    matcher.ensure_loaded(db_service.get())
+    return matcher
+
+
+faq_index = lazy_service("faq.index", _load_faq_index)
 
 
 # ============ FAQ 관리 API ============
@@ -252,6 +265,9 @@ async def create_faq(request: FaqRequest, db: DatabaseService = Depends(get_db))
         )
         saved_faq = result[0]
 
+        # 인메모리 FAQ 인덱스 갱신
+        await asyncio.to_thread(refresh_faq_index, db)
+
         # Pinecone에 업로드 (static + function 모두)
         try:
             await upload_to_pinecone(saved_faq)
@@ -332,6 +348,9 @@ async def update_faq(
         # 업데이트된 FAQ 조회
         updated_faq = db.execute_query(select_query, (faq_id,))[0]
 
+        # 인메모리 FAQ 인덱스 갱신
+        await asyncio.to_thread(refresh_faq_index, db)
+
         # Pinecone에 업데이트 (static + function 모두)
         try:
             await upload_to_pinecone(updated_faq)
@@ -366,6 +385,9 @@ async def delete_faq(faq_id: int, db: DatabaseService = Depends(get_db)):
         delete_query = "DELETE FROM faq WHERE id = %s"
         db.execute_update(delete_query, (faq_id,))
 
+        # 인메모리 FAQ 인덱스 갱신
+        await asyncio.to_thread(refresh_faq_index, db)
+
         # Pinecone에서 삭제
         try:
             await delete_from_pinecone(faq_id)
@@ -426,6 +448,17 @@ async def sync_to_pinecone(db: DatabaseService = Depends(get_db)):
 
 # ============ Helper Functions ============
 
+def refresh_faq_index(db: DatabaseService):
+    """
+    FAQ 변경 후 인메모리 매칭 인덱스 재구성 (실패해도 FAQ 저장은 유지)
+    DB 조회 + 임베딩으로 오래 걸리므로 asyncio.to_thread로 호출 - 그동안 채팅은 기존 인덱스로 매칭
+    """
+    try:
+        get_faq_matcher().refresh(db)
+    except Exception as e:
+        print(f"FAQ 인덱스 갱신 실패: {str(e)}")
+
+
 async def upload_to_pinecone(faq: Dict[str, Any]):
     """FAQ를 Pinecone에 업로드/업데이트 (static + function 모두 지원)"""
     faq_id = str(faq["id"])
@@ -19,11 +19,11 @@ async def assess_clarity(
     request: ClarityRequest,
     identity_service: IdentityAnalysisService = Depends(get_identity_service)
 ):
-    """정체성 명확도 평가 (userId가 있으면 이전 대화 기록도 포함)"""
+    """정체성 명확도 평가 (sessionId가 있으면 긴 대화를 세션 요약으로 압축)"""
     try:
         result = await identity_service.assess_clarity(
             request.conversationHistory,
-            request.userId
+            request.sessionId
         )
         return ClarityResponse(**result)
     except Exception as e:
@@ -35,11 +35,11 @@ async def extract_identity(
     request: IdentityRequest,
     identity_service: IdentityAnalysisService = Depends(get_identity_service)
 ):
-    """정체성 특징 추출 (userId가 있으면 이전 대화 기록도 포함)"""
+    """정체성 특징 추출 (sessionId가 있으면 긴 대화를 세션 요약으로 압축)"""
     try:
         result = await identity_service.extract_identity(
             request.conversationHistory,
-            request.userId
+            request.sessionId
         )
         # traits 변환
         traits = [IdentityTrait(**t) for t in result.get("traits", [])]
@@ -75,12 +75,12 @@ async def assess_progress(
     request: ProgressRequest,
     identity_service: IdentityAnalysisService = Depends(get_identity_service)
 ):
-    """단계 진행 평가 (userId가 있으면 이전 대화 기록도 포함)"""
+    """단계 진행 평가 (sessionId가 있으면 긴 대화를 세션 요약으로 압축)"""
     try:
         result = await identity_service.assess_stage_progress(
             request.conversationHistory,
             request.currentStage,
-            request.userId
+            request.sessionId
         )
         return ProgressResponse(**result)
     except Exception as e:
@@ -11,12 +11,15 @@ from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 import json
 import asyncio
-from openai import OpenAI
+import logging
+from services.common.llm_clients import get_openai_client
 from services.agents.job_agent import run_job_agent
 from services.agents.job_recommendation_agent import JobRecommendationAgent
 from services.database_service import DatabaseService
 from services.job_recommendation_calculator import calculate_user_recommendations_sync, JobRecommendationCalculator
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/job-agent", tags=["job-agent"])
 
 
@@ -113,7 +116,7 @@ def evaluate_job_fitness_batch(career_names: List[str], jobs: List[Dict]) -> Lis
         return []
 
     try:
-        client = OpenAI()
+        client = get_openai_client()
 
         # 공고 목록 텍스트 생성
         jobs_text = ""
@@ -164,11 +167,11 @@ def evaluate_job_fitness_batch(career_names: List[str], jobs: List[Dict]) -> Lis
                 result_text = result_text[4:]
 
         results = json.loads(result_text)
-        print(f"[AI Batch Fitness] {len(jobs)}개 공고 평가 완료")
+        logger.info(f"[AI Batch Fitness] {len(jobs)}개 공고 평가 완료")
         return results
 
     except Exception as e:
-        print(f"[AI Batch Fitness Error] {str(e)}")
+        logger.error(f"[AI Batch Fitness Error] {str(e)}")
         # 실패 시 기본값 반환
         return [
             {
@@ -200,7 +203,7 @@ def evaluate_job_fitness_with_ai(career_names: List[str], job_title: str, job_de
         }
     """
     try:
-        client = OpenAI()
+        client = get_openai_client()
         
         prompt = f"""당신은 채용 전문가입니다. 사용자의 추천 직업 목록과 채용공고를 비교하여 적합도를 평가해주세요.
 
@@ -242,11 +245,11 @@ def evaluate_job_fitness_with_ai(career_names: List[str], job_title: str, job_de
                 result_text = result_text[4:]
         
         result = json.loads(result_text)
-        print(f"[AI Fitness] {job_title[:30]}... -> score: {result.get('match_score')}, career: {result.get('matched_career')}")
+        logger.debug(f"[AI Fitness] {job_title[:30]}... -> score: {result.get('match_score')}, career: {result.get('matched_career')}")
         return result
         
     except Exception as e:
-        print(f"[AI Fitness Error] {str(e)}")
+        logger.error(f"[AI Fitness Error] {str(e)}")
         return {
             "is_relevant": False,
             "match_score": 50,
@@ -473,7 +476,7 @@ async def get_cached_recommendations(
             results = db.execute_query(query, (user_id, min_score, limit))
         except Exception as db_error:
             # user_job_recommendations 테이블이 없으면 job_listings에서 직접 조회
-            print(f"user_job_recommendations 조회 실패, job_listings에서 직접 조회: {db_error}")
+            logger.warning(f"user_job_recommendations 조회 실패, job_listings에서 직접 조회: {db_error}")
             try:
                 fallback_query = '''
                     SELECT
@@ -592,9 +595,7 @@ async def get_cached_recommendations(
                         error=None
                     )
             except Exception as fallback_error:
-                print(f"job_listings 조회도 실패: {fallback_error}")
-                import traceback
-                traceback.print_exc()
+                logger.exception(f"job_listings 조회도 실패: {fallback_error}")
 
             return RecommendationResponse(
                 success=True,
@@ -606,7 +607,7 @@ async def get_cached_recommendations(
 
         if not results:
             # 캐시된 데이터가 없으면 job_listings에서 직접 조회 (fallback)
-            print(f"user_job_recommendations에 데이터 없음, job_listings에서 조회")
+            logger.debug(f"user_job_recommendations에 데이터 없음, job_listings에서 조회")
             try:
                 fallback_query = '''
                     SELECT
@@ -725,9 +726,7 @@ async def get_cached_recommendations(
                         error=None
                     )
             except Exception as fallback_error:
-                print(f"job_listings fallback 조회 실패: {fallback_error}")
-                import traceback
-                traceback.print_exc()
+                logger.exception(f"job_listings fallback 조회 실패: {fallback_error}")
 
             return RecommendationResponse(
                 success=True,
@@ -794,8 +793,7 @@ async def get_cached_recommendations(
         )
 
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"[get_cached_recommendations] 처리 실패: {e}")
         raise HTTPException(
             status_code=500,
             detail=f"추천 조회 실패: {str(e)}"
@@ -859,8 +857,7 @@ async def trigger_recommendation_calculation(
                 }
 
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"[trigger_recommendation_calculation] 처리 실패: {e}")
         raise HTTPException(
             status_code=500,
             detail=f"추천 계산 실패: {str(e)}"
@@ -942,8 +939,7 @@ async def get_comprehensive_recommendations(
         )
 
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"[get_comprehensive_recommendations] 처리 실패: {e}")
         return ComprehensiveAnalysisResponse(
             success=False,
             error=str(e)
@@ -985,7 +981,7 @@ async def get_recommendations_by_career_analysis(
             career_names = [r.get("job_name") for r in job_rec_results if r.get("job_name")]
             data_source = "job_recommendations"
             career_analysis_data["recommendedCareers"] = [{"careerName": name} for name in career_names]
-            print(f"[JobRecommendation] job_recommendations에서 직업 조회: {career_names}")
+            logger.debug(f"[JobRecommendation] job_recommendations에서 직업 조회: {career_names}")
 
         # 2. job_recommendations가 없으면 career_analyses에서 조회 (우선순위 2)
         if not career_names:
@@ -1032,7 +1028,7 @@ async def get_recommendations_by_career_analysis(
                         "interests": interest_areas,
                         "interestAnalysis": row.get("interest_analysis") or ""
                     }
-                    print(f"[JobRecommendation] career_analyses에서 직업 조회: {career_names}")
+                    logger.debug(f"[JobRecommendation] career_analyses에서 직업 조회: {career_names}")
 
         # 3. 둘 다 없으면 에러
         if not career_names:
@@ -1055,7 +1051,7 @@ async def get_recommendations_by_career_analysis(
 
         # 중복 키워드 제거
         unique_keywords = list(set(all_keywords))
-        print(f"[AI JobRecommendation] 직업명: {career_names} → AI 생성 키워드: {unique_keywords}")
+        logger.debug(f"[AI JobRecommendation] 직업명: {career_names} → AI 생성 키워드: {unique_keywords}")
 
         # 5. job_listings에서 관련 채용공고 검색 (AI 생성 키워드 사용)
         like_conditions = []
@@ -1116,7 +1112,7 @@ async def get_recommendations_by_career_analysis(
                 original_idx = i + j
                 ai_results_map[original_idx] = result
 
-        print(f"[AI Batch] {len(ai_results_map)}개 공고 배치 평가 완료 (API 호출 {(len(jobs_for_ai) + batch_size - 1) // batch_size}회)")
+        logger.info(f"[AI Batch] {len(ai_results_map)}개 공고 배치 평가 완료 (API 호출 {(len(jobs_for_ai) + batch_size - 1) // batch_size}회)")
 
         # 결과 포맷팅
         for idx, row in enumerate(job_results):
@@ -1187,7 +1183,7 @@ async def get_recommendations_by_career_analysis(
             top_recommendations = recommendations[:AI_ANALYSIS_LIMIT]
             rest_recommendations = recommendations[AI_ANALYSIS_LIMIT:]
 
-            print(f"[AI Analysis] 상위 {len(top_recommendations)}개 공고에 대해 AI 종합 분석 시작... (나머지 {len(rest_recommendations)}개는 템플릿)")
+            logger.info(f"[AI Analysis] 상위 {len(top_recommendations)}개 공고에 대해 AI 종합 분석 시작... (나머지 {len(rest_recommendations)}개는 템플릿)")
             try:
                 agent = JobRecommendationAgent()
 
@@ -1217,11 +1213,9 @@ async def get_recommendations_by_career_analysis(
                 for rec in rest_recommendations:
                     rec["comprehensiveAnalysis"] = _get_default_comprehensive_analysis_template(rec)
 
-                print(f"[AI Analysis] 종합 분석 완료 (AI: {len(top_recommendations)}개, 템플릿: {len(rest_recommendations)}개)")
+                logger.info(f"[AI Analysis] 종합 분석 완료 (AI: {len(top_recommendations)}개, 템플릿: {len(rest_recommendations)}개)")
             except Exception as ai_error:
-                print(f"[AI Analysis] 종합 분석 실패: {ai_error}")
-                import traceback
-                traceback.print_exc()
+                logger.exception(f"[AI Analysis] 종합 분석 실패: {ai_error}")
                 # 실패 시 전체 기본 템플릿 데이터 사용
                 for rec in recommendations:
                     rec["comprehensiveAnalysis"] = _get_default_comprehensive_analysis_template(rec)
@@ -1242,8 +1236,7 @@ async def get_recommendations_by_career_analysis(
         }
 
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"[get_recommendations_by_career_analysis] 처리 실패: {e}")
         return {
             "success": False,
             "error": f"추천 조회 실패: {str(e)}",
@@ -1335,6 +1328,5 @@ async def analyze_single_job(
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"[analyze_single_job] 처리 실패: {e}")
         raise HTTPException(status_code=500, detail=f"분석 실패: {str(e)}")
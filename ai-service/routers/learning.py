@@ -4,16 +4,17 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import List, Optional, Any
-from services.learning.question_generator import QuestionGeneratorService
 from services.learning.answer_evaluator import AnswerEvaluatorService
 from services.learning.weakness_analyzer import WeaknessAnalyzerService
+from services.learning.question_bank import get_question_bank
+from services.service_registry import lazy_service
 
 router = APIRouter(prefix="/api/learning", tags=["learning"])
 
-# 서비스 인스턴스
-question_generator = QuestionGeneratorService()
-answer_evaluator = AnswerEvaluatorService()
-weakness_analyzer = WeaknessAnalyzerService()
+# 서비스 인스턴스 (처음 사용할 때 생성)
+question_bank = lazy_service("learning.question_bank", get_question_bank)
+answer_evaluator = lazy_service("learning.answer_evaluator", AnswerEvaluatorService)
+weakness_analyzer = lazy_service("learning.weakness_analyzer", WeaknessAnalyzerService)
 
 
 # ========== Request/Response Models ==========
@@ -22,6 +23,7 @@ class GenerateQuestionsRequest(BaseModel):
     domain: str
     weekNumber: int
     count: int = 5
+    userId: Optional[str] = None  # 있으면 이미 푼 문제 제외
 
 
 class QuestionItem(BaseModel):
@@ -54,6 +56,21 @@ class EvaluateAnswerResponse(BaseModel):
     isCorrect: bool
 
 
+class EvaluateAnswersRequest(BaseModel):
+    answers: List[EvaluateAnswerRequest]
+
+
+class EvaluatedAnswerItem(EvaluateAnswerResponse):
+    source: str  # rule(LLM 없이 채점) | cache | llm | error
+
+
+class EvaluateAnswersResponse(BaseModel):
+    results: List[EvaluatedAnswerItem]
+    totalScore: int
+    maxScore: int
+    llmGraded: int
+
+
 class WrongAnswerItem(BaseModel):
     questionType: str
     questionText: str
@@ -99,12 +116,16 @@ async def generate_questions(request: GenerateQuestionsRequest):
     - domain: 학습 분야 (예: "프로그래밍", "디자인")
     - weekNumber: 주차 (1-4)
     - count: 생성할 문제 개수
+    - userId: 사용자 ID (이미 푼 문제 제외)
+
+    문제 은행 재고에서 바로 제공하고, 재고가 부족할 때만 즉시 생성합니다.
     """
     try:
-        questions = await question_generator.generate_questions(
+        questions = await question_bank.get_questions(
             domain=request.domain,
             week_number=request.weekNumber,
-            count=request.count
+            count=request.count,
+            user_id=request.userId
         )
 
         return GenerateQuestionsResponse(
@@ -116,6 +137,12 @@ async def generate_questions(request: GenerateQuestionsRequest):
         raise HTTPException(status_code=500, detail=f"문제 생성 실패: {str(e)}")
 
 
+@router.get("/question-bank/stats")
+async def question_bank_stats():
+    """문제 은행 적중률 / 보충 지연 / 재고"""
+    return question_bank.stats()
+
+
 @router.post("/evaluate-answer", response_model=EvaluateAnswerResponse)
 async def evaluate_answer(request: EvaluateAnswerRequest):
     """
@@ -145,6 +172,48 @@ async def evaluate_answer(request: EvaluateAnswerRequest):
         raise HTTPException(status_code=500, detail=f"답변 평가 실패: {str(e)}")
 
 
+@router.post("/evaluate-answers", response_model=EvaluateAnswersResponse)
+async def evaluate_answers(request: EvaluateAnswersRequest):
+    """
+    AI 답변 일괄 평가 (퀴즈 제출 한 번의 모든 답안)
+
+    - answers: evaluate-answer 요청 항목 리스트
+    - 빈 답안 / 모범답안과 같은 답안 / 이전에 채점한 답안은 LLM을 호출하지 않음
+    """
+    if not request.answers:
+        raise HTTPException(status_code=400, detail="answers가 비어 있습니다")
+
+    try:
+        results = await answer_evaluator.evaluate_answers([
+            {
+                "question_type": item.questionType,
+                "question_text": item.question,
+                "correct_answer": item.correctAnswer,
+                "user_answer": item.userAnswer,
+                "max_score": item.maxScore,
+            }
+            for item in request.answers
+        ])
+
+        items = [
+            EvaluatedAnswerItem(
+                score=result["score"],
+                feedback=result["feedback"],
+                isCorrect=result["score"] == item.maxScore,
+                source=result["source"]
+            )
+            for item, result in zip(request.answers, results)
+        ]
+        return EvaluateAnswersResponse(
+            results=items,
+            totalScore=sum(item.score for item in items),
+            maxScore=sum(item.maxScore for item in request.answers),
+            llmGraded=sum(1 for item in items if item.source == "llm")
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"답변 평가 실패: {str(e)}")
+
+
 @router.post("/analyze-weakness", response_model=AnalyzeWeaknessResponse)
 async def analyze_weakness(request: AnalyzeWeaknessRequest):
     """
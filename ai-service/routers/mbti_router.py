@@ -1,9 +1,10 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from services.mbti.mbti_service import MBTIService
+from services.service_registry import lazy_service
 
 router = APIRouter()
-svc = MBTIService()
+svc = lazy_service("mbti", MBTIService)
 
 
 class MBTIRequest(BaseModel):
@@ -4,9 +4,10 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
 from services.agents.personality_pipeline import PersonalityPipeline
+from services.service_registry import lazy_service
 
 router = APIRouter(prefix="/api/agent", tags=["personality-agent"])
-pipeline = PersonalityPipeline()
+pipeline = lazy_service("personality_pipeline", PersonalityPipeline)
 
 
 class PersonalityAgentRequest(BaseModel):
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import List
-from services.vector.pinecone_client import index
+from services.vector.pinecone_client import get_index
 from services.rag.profile_rag_service import ProfileRAGService
 from services.common.openai_client import OpenAIService
 import numpy as np
@@ -16,6 +16,7 @@ class ProfileMatchResponse(BaseModel):
 @router.get('/profiles/search', response_model=List[ProfileMatchResponse])
 async def search_profile_matches(profile_id: int, top_k: int = 5):
 
+    index = get_index()
     if index is None:
         raise HTTPException(status_code=500, detail='Pinecone index가 활성화되지 않았습니다.')
 
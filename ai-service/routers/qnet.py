@@ -21,18 +21,23 @@ from models.qnet import (
 )
 from services.qnet_api_service import QnetApiService, SERIES_CODES
 from services.database_service import DatabaseService
+from services.service_registry import lazy_service
 
 router = APIRouter(prefix="/api/qnet", tags=["qnet-certification"])
 
 # 데이터베이스 서비스 인스턴스
-try:
-    db_service = DatabaseService()
-except Exception as e:
-    print(f"DB 연결 실패 (자격증 저장 기능 비활성화): {str(e)}")
-    db_service = None
-
-# 서비스 인스턴스
-qnet_service = QnetApiService()
+def _create_db_service():
+    try:
+        return DatabaseService()
+    except Exception as e:
+        print(f"DB 연결 실패 (자격증 저장 기능 비활성화): {str(e)}")
+        return None
+
+
+db_service = lazy_service("qnet.db", _create_db_service)
+
+# 서비스 인스턴스 (처음 사용할 때 생성)
+qnet_service = lazy_service("qnet", QnetApiService)
 
 
 @router.get("/series-codes")
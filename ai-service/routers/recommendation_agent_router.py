@@ -1,8 +1,9 @@
 from fastapi import APIRouter
 from services.agents.recommendation.recommendation_pipeline import RecommendationPipeline
+from services.service_registry import lazy_service
 
 router = APIRouter(prefix="/api/agent/recommendation")
-pipeline = RecommendationPipeline()
+pipeline = lazy_service("recommendation_pipeline", RecommendationPipeline)
 
 @router.post("")
 async def run_recommendation(payload: dict):
@@ -1,184 +1,246 @@
 """
 채용 공고 크롤링 스케줄러
-매일 자동으로 채용 사이트에서 공고를 크롤링합니다.
+매일 자동으로 채용 사이트에서 공고를 크롤링하고 (새 공고 관련 사용자만 추천 재계산),
+매주 한 번 전체 사용자의 추천을 다시 계산합니다.
 """
 import os
 import asyncio
-from datetime import datetime
+import logging
+from datetime import datetime, timedelta
 from typing import Optional
+from zoneinfo import ZoneInfo
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+
+from services.common.metrics import get_metrics_registry, traced
+
+logger = logging.getLogger(__name__)
 
 # 스케줄러 인스턴스
 scheduler: Optional[AsyncIOScheduler] = None
 
+SCHEDULER_TIMEZONE = ZoneInfo("Asia/Seoul")
+DAILY_CRAWL_JOB_ID = "daily_crawl"
+DAILY_CRAWL_HOUR = 3
+FULL_RECOMMENDATION_JOB_ID = "weekly_full_recommendation"
+MANUAL_TRIGGER_POLL_SECONDS = int(os.getenv("SCHEDULER_TRIGGER_POLL_SECONDS", 5))
 
-async def crawl_wanted():
-    """원티드 크롤링"""
-    from services.web_crawler_service import WebCrawlerService
 
-    print(f"[스케줄러] 원티드 크롤링 시작 - {datetime.now()}")
-    try:
-        crawler = WebCrawlerService()
-        result = await crawler.crawl_wanted(
-            search_keyword=None,
-            max_results=0,  # 0 = 전체 크롤링
-            force_refresh=True
-        )
+@traced("scheduler")
+async def calculate_job_recommendations():
+    """
+    채용공고 추천 계산 (모든 사용자)
+    증분 계산은 새 공고만 보므로 마감/삭제된 공고와 바뀐 프로필은 이 전체 재계산에서 반영됩니다.
+    """
+    from services.job_recommendation_calculator import JobRecommendationCalculator
 
-        if result.get("success"):
-            print(f"[스케줄러] 원티드 크롤링 완료 - {result.get('totalResults', 0)}개 수집")
-        else:
-            print(f"[스케줄러] 원티드 크롤링 실패 - {result.get('error', '알 수 없는 오류')}")
+    logger.info("[스케줄러] 채용공고 전체 추천 계산 시작")
+    result = await JobRecommendationCalculator().calculate_all_user_recommendations(
+        batch_size=10,  # 초기 동시 처리 10명 (지연 시간에 따라 자동 조절)
+        max_recommendations=50  # 사용자당 최대 50개 추천
+    )
 
-    except Exception as e:
-        print(f"[스케줄러] 원티드 크롤링 오류 - {str(e)}")
+    metrics = result.get("metrics", {})
+    logger.info(f"[스케줄러] 전체 추천 계산 완료 - {result.get('processed_users', 0)}명 처리, "
+                f"{result.get('total_recommendations', 0)}개 추천 생성, "
+                f"처리량 {metrics.get('throughput_per_min', 0)}명/분")
+    return result
 
 
-async def crawl_saramin():
-    """사람인 크롤링"""
-    from services.web_crawler_service import WebCrawlerService
+@traced("scheduler")
+async def daily_crawl_job():
+    """
+    매일 실행되는 크롤링 작업
+    사이트별로 동시에 크롤링하고, 사이트 결과가 도착하는 대로
+    기업정보 보강과 증분 추천 계산을 진행합니다.
+    """
+    from services.crawl_pipeline import CrawlPipeline
 
-    print(f"[스케줄러] 사람인 크롤링 시작 - {datetime.now()}")
-    try:
-        crawler = WebCrawlerService()
-        result = await crawler.crawl_job_site(
-            site_name="사람인",
-            site_url="https://www.saramin.co.kr",
-            search_keyword=None,
-            max_results=0,  # 0 = 전체 크롤링
-            force_refresh=True
-        )
+    logger.info("[스케줄러] 일일 채용공고 크롤링 파이프라인 시작")
 
-        if result.get("success"):
-            print(f"[스케줄러] 사람인 크롤링 완료 - {result.get('totalResults', 0)}개 수집")
-        else:
-            print(f"[스케줄러] 사람인 크롤링 실패 - {result.get('error', '알 수 없는 오류')}")
+    report = await CrawlPipeline().run()
 
-    except Exception as e:
-        print(f"[스케줄러] 사람인 크롤링 오류 - {str(e)}")
+    logger.info(f"[스케줄러] 전체 작업 완료 - 총 소요시간: {report['total_seconds']:.1f}초")
 
+    return report
 
-async def crawl_jobkorea():
-    """잡코리아 크롤링"""
-    from services.web_crawler_service import WebCrawlerService
 
-    print(f"[스케줄러] 잡코리아 크롤링 시작 - {datetime.now()}")
-    try:
-        crawler = WebCrawlerService()
-        result = await crawler.crawl_job_site(
-            site_name="잡코리아",
-            site_url="https://www.jobkorea.co.kr",
-            search_keyword=None,
-            max_results=0,  # 0 = 전체 크롤링
-            force_refresh=True
-        )
+async def scheduled_daily_crawl():
+    """예약된 일일 크롤링 (리더 노드에서만, 클러스터 전체 단일 실행)"""
+    from services.scheduler_coordinator import get_scheduler_coordinator
 
-        if result.get("success"):
-            print(f"[스케줄러] 잡코리아 크롤링 완료 - {result.get('totalResults', 0)}개 수집")
-        else:
-            print(f"[스케줄러] 잡코리아 크롤링 실패 - {result.get('error', '알 수 없는 오류')}")
+    coordinator = get_scheduler_coordinator()
+    if not coordinator.try_acquire_leadership():
+        logger.info(f"[스케줄러] 리더가 아니므로 일일 크롤링 스킵 (leader={coordinator.get_leader()})")
+        return
 
-    except Exception as e:
-        print(f"[스케줄러] 잡코리아 크롤링 오류 - {str(e)}")
+    await coordinator.run_single_flight(DAILY_CRAWL_JOB_ID, daily_crawl_job)
 
 
-async def calculate_job_recommendations():
-    """채용공고 추천 계산 (모든 사용자)"""
-    from services.job_recommendation_calculator import JobRecommendationCalculator
+async def scheduled_full_recommendation():
+    """예약된 주간 전체 추천 재계산 (리더 노드에서만, 클러스터 전체 단일 실행)"""
+    from services.scheduler_coordinator import get_scheduler_coordinator
 
-    print(f"[스케줄러] 채용공고 추천 계산 시작 - {datetime.now()}")
-    try:
-        calculator = JobRecommendationCalculator()
-        result = await calculator.calculate_all_user_recommendations(
-            batch_size=10,  # 동시에 10명씩 처리
-            max_recommendations=50  # 사용자당 최대 50개 추천
-        )
+    coordinator = get_scheduler_coordinator()
+    if not coordinator.try_acquire_leadership():
+        logger.info(f"[스케줄러] 리더가 아니므로 전체 추천 계산 스킵 (leader={coordinator.get_leader()})")
+        return
 
-        if result.get("success"):
-            print(f"[스케줄러] 추천 계산 완료 - {result.get('processed_users', 0)}명 처리, "
-                  f"{result.get('total_recommendations', 0)}개 추천 생성")
-        else:
-            print(f"[스케줄러] 추천 계산 실패")
+    await coordinator.run_single_flight(FULL_RECOMMENDATION_JOB_ID, calculate_job_recommendations)
 
-        return result
 
-    except Exception as e:
-        print(f"[스케줄러] 추천 계산 오류 - {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return {"success": False, "error": str(e)}
+def _previous_fire_time(now: datetime) -> datetime:
+    """가장 최근의 예약 실행 시각 (매일 DAILY_CRAWL_HOUR시)"""
+    fire_time = now.replace(hour=DAILY_CRAWL_HOUR, minute=0, second=0, microsecond=0)
+    if fire_time > now:
+        fire_time -= timedelta(days=1)
+    return fire_time
 
 
-async def daily_crawl_job():
-    """매일 실행되는 크롤링 작업"""
-    print(f"\n{'='*50}")
-    print(f"[스케줄러] 일일 채용공고 크롤링 시작 - {datetime.now()}")
-    print(f"{'='*50}\n")
+def is_daily_crawl_missed(last_run: Optional[dict], now: Optional[datetime] = None) -> bool:
+    """
+    최근 예약 시각 이후 실행 기록이 없고, 허용 지연 시간 이내인지 확인
+    (배포/장애로 03:00 실행을 놓친 경우 리더가 보충 실행)
+    """
+    now = now or datetime.now(SCHEDULER_TIMEZONE)
+    fire_time = _previous_fire_time(now)
+    grace_hours = float(os.getenv("SCHEDULER_MISSED_RUN_GRACE_HOURS", 6))
+
+    if now - fire_time > timedelta(hours=grace_hours):
+        return False
+
+    started_at = (last_run or {}).get("started_at")
+    if not started_at:
+        return True
 
-    start_time = datetime.now()
+    try:
+        last_started = datetime.fromisoformat(started_at)
+    except ValueError:
+        return True
+    # 실행 기록은 서버 로컬 시간(naive)으로 저장됨
+    return last_started.astimezone(SCHEDULER_TIMEZONE) < fire_time
 
-    # 순차적으로 크롤링 (IP 차단 방지)
-    await crawl_wanted()
-    await asyncio.sleep(5)  # 5초 대기
 
-    await crawl_saramin()
-    await asyncio.sleep(5)
+async def renew_leadership():
+    """리더 lease 갱신 (리더가 되면 누락된 실행을 확인)"""
+    from services.scheduler_coordinator import get_scheduler_coordinator
 
-    await crawl_jobkorea()
+    coordinator = get_scheduler_coordinator()
+    was_leader = coordinator.is_leader
+    if not coordinator.try_acquire_leadership() or was_leader:
+        return
 
-    end_time = datetime.now()
-    duration = (end_time - start_time).total_seconds()
+    logger.info(f"[스케줄러] 리더로 선출됨 (node={coordinator.node_id})")
+    if is_daily_crawl_missed(coordinator.get_last_run(DAILY_CRAWL_JOB_ID)):
+        logger.warning("[스케줄러] 누락된 일일 크롤링 발견 → 즉시 보충 실행")
+        scheduler.add_job(
+            scheduled_daily_crawl,
+            id=f"{DAILY_CRAWL_JOB_ID}_catchup",
+            name="일일 채용공고 크롤링 (누락 보충)",
+            replace_existing=True
+        )
 
-    print(f"\n{'='*50}")
-    print(f"[스케줄러] 일일 크롤링 완료 - 소요시간: {duration:.1f}초")
-    print(f"{'='*50}\n")
 
-    # 크롤링 완료 후 추천 계산
-    print(f"\n{'='*50}")
-    print(f"[스케줄러] 추천 계산 시작")
-    print(f"{'='*50}\n")
+async def poll_manual_triggers():
+    """API 서버가 남긴 수동 실행 요청을 리더가 가져가서 실행"""
+    from services.scheduler_coordinator import get_scheduler_coordinator
 
-    await calculate_job_recommendations()
+    coordinator = get_scheduler_coordinator()
+    if not coordinator.is_leader:
+        return
+
+    requested_at = coordinator.pop_trigger(DAILY_CRAWL_JOB_ID)
+    if requested_at:
+        logger.info(f"[스케줄러] 수동 크롤링 요청 실행 (requested_at={requested_at})")
+        scheduler.add_job(
+            scheduled_daily_crawl,
+            id=f"{DAILY_CRAWL_JOB_ID}_manual",
+            name="일일 채용공고 크롤링 (수동 요청)",
+            replace_existing=True
+        )
 
-    final_time = datetime.now()
-    total_duration = (final_time - start_time).total_seconds()
 
-    print(f"\n{'='*50}")
-    print(f"[스케줄러] 전체 작업 완료 - 총 소요시간: {total_duration:.1f}초")
-    print(f"{'='*50}\n")
+def _daily_crawl_trigger() -> CronTrigger:
+    """매일 새벽 DAILY_CRAWL_HOUR시"""
+    return CronTrigger(hour=DAILY_CRAWL_HOUR, minute=0, timezone=SCHEDULER_TIMEZONE)
 
 
 def start_scheduler():
-    """스케줄러 시작"""
+    """
+    스케줄러 시작
+    여러 프로세스/컨테이너에서 시작되어도 Redis lease를 가진 리더만 작업을 실행합니다.
+    """
     global scheduler
 
     # 환경변수로 스케줄러 ON/OFF 제어
     enabled = os.getenv("SCHEDULER_ENABLED", "true").lower() == "true"
 
     if not enabled:
-        print("[스케줄러] 비활성화 상태 (SCHEDULER_ENABLED=false)")
+        logger.info("[스케줄러] 비활성화 상태 (SCHEDULER_ENABLED=false)")
         return
 
-    scheduler = AsyncIOScheduler(timezone="Asia/Seoul")
+    from services.scheduler_coordinator import get_scheduler_coordinator
+    coordinator = get_scheduler_coordinator()
+
+    scheduler = AsyncIOScheduler(timezone=SCHEDULER_TIMEZONE)
 
     # 매일 새벽 3시에 실행
     scheduler.add_job(
-        daily_crawl_job,
-        CronTrigger(hour=3, minute=0),
-        id="daily_crawl",
+        scheduled_daily_crawl,
+        _daily_crawl_trigger(),
+        id=DAILY_CRAWL_JOB_ID,
         name="일일 채용공고 크롤링",
+        replace_existing=True,
+        coalesce=True,
+        max_instances=1,
+        misfire_grace_time=3600
+    )
+
+    # 매주 일요일 새벽 5시 전체 추천 재계산 (일일 크롤링 이후)
+    scheduler.add_job(
+        scheduled_full_recommendation,
+        CronTrigger(
+            day_of_week=os.getenv("FULL_RECOMMENDATION_DAY", "sun"),
+            hour=int(os.getenv("FULL_RECOMMENDATION_HOUR", 5)),
+            minute=0,
+            timezone=SCHEDULER_TIMEZONE
+        ),
+        id=FULL_RECOMMENDATION_JOB_ID,
+        name="주간 전체 추천 재계산",
+        replace_existing=True,
+        coalesce=True,
+        max_instances=1,
+        misfire_grace_time=3600
+    )
+
+    # 리더 lease 갱신 (TTL의 1/3 주기)
+    scheduler.add_job(
+        renew_leadership,
+        IntervalTrigger(seconds=max(1, coordinator.lease_ttl // 3)),
+        id="leader_election",
+        name="스케줄러 리더 선출",
+        replace_existing=True,
+        next_run_time=datetime.now(SCHEDULER_TIMEZONE)
+    )
+
+    # API 서버의 수동 실행 요청 확인
+    scheduler.add_job(
+        poll_manual_triggers,
+        IntervalTrigger(seconds=max(1, MANUAL_TRIGGER_POLL_SECONDS)),
+        id="manual_trigger_poll",
+        name="수동 실행 요청 확인",
         replace_existing=True
     )
 
     scheduler.start()
-    print("[스케줄러] 시작됨 - 매일 새벽 3시에 크롤링 실행")
+    logger.info("[스케줄러] 시작됨 - 매일 새벽 3시 크롤링, 매주 전체 추천 재계산 (리더 노드만)")
 
     # 다음 실행 시간 출력
-    job = scheduler.get_job("daily_crawl")
+    job = scheduler.get_job(DAILY_CRAWL_JOB_ID)
     if job:
         next_run = job.next_run_time
-        print(f"[스케줄러] 다음 실행 예정: {next_run}")
+        logger.info(f"[스케줄러] 다음 실행 예정: {next_run}")
 
 
 def stop_scheduler():
@@ -187,11 +249,132 @@ def stop_scheduler():
 
     if scheduler and scheduler.running:
         scheduler.shutdown()
-        print("[스케줄러] 중지됨")
+        logger.info("[스케줄러] 중지됨")
+
+        from services.scheduler_coordinator import get_scheduler_coordinator
+        get_scheduler_coordinator().release_leadership()
+
+
+def get_scheduler_status() -> dict:
+    """
+    스케줄러 상태 (리더/실행 중 여부 포함)
+    스케줄러가 없는 API 프로세스에서도 워커(리더)가 Redis에 남긴 리더 / 실행 기록으로 상태를 보고합니다.
+    """
+    from services.scheduler_coordinator import get_scheduler_coordinator
+
+    coordinator = get_scheduler_coordinator()
+    local = bool(scheduler and scheduler.running)
+    leader = coordinator.get_leader() if local or coordinator.enabled else None
+    if not leader:
+        return {"running": False, "next_run": None, "last_run": coordinator.get_last_run(DAILY_CRAWL_JOB_ID)}
+
+    job = scheduler.get_job(DAILY_CRAWL_JOB_ID) if local else None
+    if job:
+        next_run = job.next_run_time
+    else:
+        next_run = _daily_crawl_trigger().get_next_fire_time(None, datetime.now(SCHEDULER_TIMEZONE))
+    return {
+        "running": True,
+        "next_run": next_run.isoformat() if next_run else None,
+        "node": coordinator.node_id,
+        "is_leader": coordinator.is_leader,
+        "leader": leader,
+        "job_running_on": coordinator.get_running_node(DAILY_CRAWL_JOB_ID),
+        "trigger_pending_since": coordinator.get_pending_trigger(DAILY_CRAWL_JOB_ID),
+        "last_run": coordinator.get_last_run(DAILY_CRAWL_JOB_ID),
+        "full_recommendation_last_run": coordinator.get_last_run(FULL_RECOMMENDATION_JOB_ID)
+    }
+
+
+def _collect_scheduler_metrics():
+    """/metrics 수집기 - 스케줄러 실행 / 리더 여부 / 다음 실행 시각 (Redis 조회 없이 로컬 상태만)"""
+    registry = get_metrics_registry()
+    running = registry.family("scheduler_running", "gauge", "스케줄러 실행 여부")
+    if not (scheduler and scheduler.running):
+        return [running.add(0)]
+
+    from services.scheduler_coordinator import get_scheduler_coordinator
+
+    leader = registry.family("scheduler_is_leader", "gauge", "이 노드가 스케줄러 리더인지 여부")
+    next_run = registry.family("scheduler_next_run_timestamp_seconds", "gauge", "작업별 다음 실행 예정 시각 (유닉스 시간)")
+    for job in scheduler.get_jobs():
+        if job.next_run_time:
+            next_run.add(job.next_run_time.timestamp(), job=job.id)
+    return [running.add(1), leader.add(int(get_scheduler_coordinator().is_leader)), next_run]
+
+
+get_metrics_registry().register_collector("scheduler", _collect_scheduler_metrics)
 
 
 async def trigger_crawl_now():
-    """수동으로 즉시 크롤링 실행 (테스트/관리자용)"""
-    print("[스케줄러] 수동 크롤링 트리거됨")
-    await daily_crawl_job()
-    return {"success": True, "message": "크롤링이 완료되었습니다."}
+    """
+    수동 크롤링 요청 (테스트/관리자용, 실행 중이면 스킵)
+    실행은 리더 워커가 담당하고 여기서는 요청만 남긴 뒤 바로 반환합니다.
+    Redis가 없는 단일 프로세스 모드에서만 이 프로세스에서 직접 실행합니다.
+    """
+    from services.scheduler_coordinator import get_scheduler_coordinator
+
+    logger.info("[스케줄러] 수동 크롤링 트리거됨")
+    coordinator = get_scheduler_coordinator()
+    running_on = coordinator.get_running_node(DAILY_CRAWL_JOB_ID)
+    if running_on:
+        return {"success": False, "message": "크롤링이 이미 실행 중입니다.", "runningOn": running_on}
+
+    if not coordinator.enabled:
+        result = await coordinator.run_single_flight(DAILY_CRAWL_JOB_ID, daily_crawl_job)
+        if result.get("skipped"):
+            return {
+                "success": False,
+                "message": "크롤링이 이미 실행 중입니다.",
+                "runningOn": result.get("running_on")
+            }
+        return {"success": True, "message": "크롤링이 완료되었습니다."}
+
+    if not coordinator.request_trigger(DAILY_CRAWL_JOB_ID):
+        return {
+            "success": True,
+            "queued": True,
+            "message": "이미 요청된 크롤링이 워커 실행을 기다리고 있습니다.",
+            "requestedAt": coordinator.get_pending_trigger(DAILY_CRAWL_JOB_ID)
+        }
+
+    leader = coordinator.get_leader()
+    return {
+        "success": True,
+        "queued": True,
+        "message": "크롤링 요청을 워커에 전달했습니다." if leader
+        else "크롤링 요청을 남겼습니다 (실행 중인 워커 없음 - 워커가 시작되면 실행).",
+        "leader": leader
+    }
+
+
+async def run_worker():
+    """
+    전용 워커 프로세스로 스케줄러 실행
+    API 서버는 SCHEDULER_ENABLED=false로 띄우고, 크롤링/추천 계산은 이 프로세스에서만 수행합니다.
+
+    Usage:
+        python scheduler.py
+    """
+    os.environ["SCHEDULER_ENABLED"] = "true"
+    start_scheduler()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        stop_scheduler()
+
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    # LOG_LEVEL 등 환경변수를 읽은 뒤 설정 (API 서버의 main.py와 같은 로깅 구성)
+    from services.common.logging_config import configure_logging, shutdown_logging
+    configure_logging()
+
+    try:
+        asyncio.run(run_worker())
+    except (KeyboardInterrupt, SystemExit):
+        logger.info("[스케줄러] 워커 종료")
+    finally:
+        shutdown_logging()
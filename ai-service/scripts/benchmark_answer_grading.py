@@ -0,0 +1,160 @@
+"""
+답안 채점 벤치마크 - 퀴즈 한 번 채점 지연 시간 / LLM 호출 수 비교
+
+- baseline: 답안마다 evaluate-answer를 순서대로 호출 (MCQ 외 답안마다 LLM 호출 1회)
+- batch: evaluate_answers()로 한 번에 채점 (규칙 채점 + 채점 캐시 + 일괄 JSON 호출)
+
+기본은 지연 시간을 흉내 내는 가짜 OpenAI 클라이언트로 실행하고, --live면 실제 API를 호출합니다.
+
+    python scripts/benchmark_answer_grading.py --quizzes 20 --latency 0.8
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+from services.learning.answer_evaluator import AnswerEvaluatorService, GradeCache
+
+QUESTIONS = [
+    ("MCQ", "HTTP 상태 코드 404의 의미는?", "B"),
+    ("SCENARIO", "트래픽이 급증해 API 응답이 느려졌습니다. 먼저 무엇을 확인하겠습니까?", "병목 구간을 모니터링 지표로 확인하고 캐시/DB 부하를 점검합니다"),
+    ("CODING", "리스트에서 중복을 제거하는 함수를 작성하세요.", "def dedup(xs): return list(dict.fromkeys(xs))"),
+    ("DESIGN", "URL 단축 서비스를 설계하세요.", "키 생성, 저장소, 리다이렉트, 캐시 계층으로 구성합니다"),
+    ("SCENARIO", "배포 후 오류율이 올라갔습니다. 어떻게 대응하겠습니까?", "즉시 롤백 후 로그와 변경 사항을 분석합니다"),
+]
+
+# 학생 답안 풀 (빈 답안 / 모범답안 그대로 / 자주 나오는 오답 포함 → 실제 제출 분포 흉내)
+ANSWER_POOL = {
+    1: ["", "병목 구간을 모니터링 지표로 확인하고 캐시/DB 부하를 점검합니다", "서버를 재시작합니다", "로그를 봅니다"],
+    2: ["", "def dedup(xs): return list(set(xs))", "def dedup(xs): return list(dict.fromkeys(xs))"],
+    3: ["", "해시로 키를 만들고 DB에 저장합니다", "잘 모르겠습니다"],
+    4: ["", "즉시 롤백 후 로그와 변경 사항을 분석합니다", "모니터링을 합니다", "롤백합니다"],
+}
+
+
+class FakeCompletions:
+    """지연 시간만 흉내 내는 chat.completions 대역"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+
+    async def create(self, model, messages, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        prompt = messages[-1]["content"]
+        ids = re.findall(r"### 답안 ID: (\d+)", prompt)
+        if ids:
+            body = {"results": [{"id": int(i), "score": 6, "feedback": "부분 정답"} for i in ids]}
+        else:
+            body = {"score": 6, "feedback": "부분 정답"}
+        content = json.dumps(body, ensure_ascii=False)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def make_quiz(rng: random.Random):
+    quiz = []
+    for i, (question_type, question, correct) in enumerate(QUESTIONS):
+        user_answer = rng.choice(["A", "B", "C"]) if question_type == "MCQ" else rng.choice(ANSWER_POOL[i])
+        quiz.append({
+            "question_type": question_type,
+            "question_text": question,
+            "user_answer": user_answer,
+            "correct_answer": correct,
+            "max_score": 10,
+        })
+    return quiz
+
+
+def make_service(args):
+    service = AnswerEvaluatorService(grade_cache=GradeCache())
+    completions = None
+    if not args.live:
+        completions = FakeCompletions(args.latency)
+        service.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return service
+
+
+def count_calls(service):
+    return service.stats["llm_calls"]
+
+
+async def run_baseline(service, quizzes):
+    """기존 방식: MCQ 외 답안마다 LLM 호출을 순서대로 (캐시 / 규칙 채점 없음)"""
+    latencies = []
+    for quiz in quizzes:
+        started = time.perf_counter()
+        for item in quiz:
+            if item["question_type"] == "MCQ":
+                service._evaluate_mcq(item["user_answer"], item["correct_answer"], item["max_score"])
+            else:
+                await service._evaluate_with_ai(
+                    item["question_text"], item["user_answer"], item["correct_answer"], item["max_score"]
+                )
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+async def run_batch(service, quizzes):
+    latencies = []
+    for quiz in quizzes:
+        started = time.perf_counter()
+        await service.evaluate_answers(quiz)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def summarize(name, latencies, calls, quizzes):
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(f"- {name}: 평균 {statistics.mean(latencies):.3f}s / p50 {statistics.median(latencies):.3f}s "
+          f"/ p95 {p95:.3f}s / LLM 호출 {calls}회 ({calls / len(quizzes):.2f}회/퀴즈)")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="답안 채점 벤치마크")
+    parser.add_argument("--quizzes", type=int, default=20, help="채점할 퀴즈 제출 수")
+    parser.add_argument("--latency", type=float, default=0.8, help="가짜 LLM 응답 지연 (초)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--live", action="store_true", help="실제 OpenAI API 호출")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    quizzes = [make_quiz(rng) for _ in range(args.quizzes)]
+
+    print(f"# 답안 채점 벤치마크 (퀴즈 {args.quizzes}개 x {len(QUESTIONS)}문항, "
+          f"{'실제 API' if args.live else f'가짜 LLM 지연 {args.latency}s'})\n")
+
+    baseline_service = make_service(args)
+    baseline = await run_baseline(baseline_service, quizzes)
+    baseline_calls = count_calls(baseline_service)
+
+    batch_service = make_service(args)
+    batch = await run_batch(batch_service, quizzes)
+    batch_calls = count_calls(batch_service)
+
+    summarize("baseline (답안별 순차 호출)", baseline, baseline_calls, quizzes)
+    summarize("batch (일괄 채점)", batch, batch_calls, quizzes)
+
+    stats = batch_service.stats
+    saved = baseline_calls - batch_calls
+    print(f"\n- 절약한 LLM 호출: {saved}회 ({saved / max(baseline_calls, 1) * 100:.1f}%)")
+    print(f"- 규칙 채점 {stats['short_circuited']}건 / 캐시 적중 {stats['cache_hits']}건 / LLM 채점 {stats['llm_graded']}건")
+    print(f"- 퀴즈당 평균 지연 개선: {statistics.mean(baseline) / max(statistics.mean(batch), 1e-9):.1f}배")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
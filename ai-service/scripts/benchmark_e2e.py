@@ -0,0 +1,92 @@
+"""
+오프라인 엔드투엔드 벤치마크 - 실제 앱 경로를 로컬 가짜 외부 서비스 위에서 실행
+
+- OpenAI / Pinecone / Supabase / Redis / Serper / 채용 사이트(녹화된 HTML)는 모두 프로세스 내 가짜
+- DB가 필요한 흐름은 일회성 Postgres(pgserver → initdb → docker 순서)를 띄워 job_listings 등을 시드
+- 흐름별 p50/p95 지연 시간, 처리량, 요청당 외부 호출 수를 JSON으로 저장하고 기준 보고서와 비교
+
+    python scripts/benchmark_e2e.py --output report.json
+    python scripts/benchmark_e2e.py --flows chat,recommendations_fast --requests 50 --concurrency 8
+    python scripts/benchmark_e2e.py --baseline before.json --output after.json   # 회귀 시 종료 코드 1
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import FLOWS, FakeLatency, compare_reports, run_benchmark
+
+
+def print_report(report: dict):
+    config = report["config"]
+    database = report["database"]
+    print(f"\n=== 오프라인 E2E 벤치마크 (commit={report['git_commit']}, redis={config['redis']}) ===")
+    print(f"요청 {config['requests']}개 / 동시성 {config['concurrency']} / 사용자 {config['users']}명 / "
+          f"DB: {database.get('source') or '없음 - ' + database.get('skipped', '')}")
+    print(f"{'흐름':<28}{'p50(ms)':>10}{'p95(ms)':>10}{'rps':>8}{'오류율':>8}  요청당 외부 호출")
+    for name, result in report["flows"].items():
+        if "skipped" in result:
+            print(f"{name:<28}  건너뜀: {result['skipped']}")
+            continue
+        latency = result["latency_ms"]
+        calls = ", ".join(f"{kind}={value}" for kind, value in result["external_calls_per_request"].items())
+        print(f"{name:<28}{latency['p50']:>10.1f}{latency['p95']:>10.1f}{result['throughput_rps']:>8.2f}"
+              f"{result['error_rate']:>8.1%}  {calls}")
+        for error in result["errors_sample"]:
+            print(f"{'':<28}  ! {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 엔드투엔드 벤치마크")
+    parser.add_argument("--flows", default=",".join(FLOWS), help=f"쉼표로 구분 (가능: {', '.join(FLOWS)})")
+    parser.add_argument("--requests", type=int, default=20, help="흐름별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 요청 수")
+    parser.add_argument("--latency-scale", type=float, default=1.0,
+                        help="가짜 외부 서비스 지연 배율 (0이면 지연 없이 앱 자체 비용만 측정)")
+    parser.add_argument("--users", type=int, default=20, help="시드 사용자 수")
+    parser.add_argument("--listings", type=int, default=500, help="시드 채용공고 수")
+    parser.add_argument("--database-url", default=None, help="이미 떠 있는 Postgres (기본: 일회성 인스턴스)")
+    parser.add_argument("--no-db", action="store_true", help="DB가 필요한 흐름 건너뛰기")
+    parser.add_argument("--output", default=None, help="JSON 보고서 저장 경로")
+    parser.add_argument("--baseline", default=None, help="비교할 기준 보고서 (회귀가 있으면 종료 코드 1)")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="회귀 판정 허용 비율")
+    parser.add_argument("--verbose", action="store_true", help="앱 로그 / 출력 그대로 보기")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        os.environ.setdefault("LOG_LEVELS", "services.agents=WARNING,services.chat_service=WARNING")
+
+    report = run_benchmark(
+        flow_names=[name.strip() for name in args.flows.split(",") if name.strip()],
+        requests=args.requests,
+        concurrency=args.concurrency,
+        latency=FakeLatency().scaled(args.latency_scale),
+        users=args.users,
+        listings=args.listings,
+        use_db=not args.no_db,
+        database_url=args.database_url,
+        quiet=not args.verbose,
+    )
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n보고서 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_reports(baseline, report, tolerance=args.tolerance)
+        if regressions:
+            print(f"\n회귀 {len(regressions)}건 (허용 {args.tolerance:.0%}):")
+            for item in regressions:
+                print(f"  - {item['flow']} {item['metric']}: {item['baseline']} → {item['current']}")
+            sys.exit(1)
+        print(f"\n기준 보고서 대비 회귀 없음 (허용 {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
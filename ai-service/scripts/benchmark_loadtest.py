@@ -0,0 +1,140 @@
+"""
+부하 테스트 - 상담 / 에이전트 / 추천 세션 스크립트를 동시 사용자 수를 올려 가며 재생
+
+- 앱은 가짜 외부 서비스(benchmarks.OfflineEnvironment) 위에서 실행, 추천 스크립트는 일회성 Postgres 사용
+- 단계별 처리량 / p95 / 오류율, 이벤트 루프 지연, 스레드 수, DB 연결 수, 메모리 추이와 포화 지점 출력
+- 예산(--budget JSON 또는 개별 옵션)을 넘으면 종료 코드 1 (릴리스 전 점검용)
+
+    python scripts/benchmark_loadtest.py
+    python scripts/benchmark_loadtest.py --ramp 1,4,16,32 --stage-seconds 20 --output load.json
+    python scripts/benchmark_loadtest.py --budget budget.json --max-p95-ms 2000
+
+budget.json 예시:
+    {"max_error_rate": 0.01, "max_p95_ms": 2500, "max_event_loop_lag_ms": 200,
+     "max_threads": 64, "max_db_connections": 20, "max_memory_growth_mb": 100,
+     "min_saturation_concurrency": 8}
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import SCRIPTS, FakeLatency, LoadBudget, run_loadtest
+
+BUDGET_OPTIONS = [
+    ("max_error_rate", float, "단계별 최대 오류율"),
+    ("max_p95_ms", float, "단계별 최대 p95 지연 (ms)"),
+    ("max_event_loop_lag_ms", float, "최대 이벤트 루프 지연 (ms)"),
+    ("max_threads", int, "최대 스레드 수"),
+    ("max_db_connections", int, "최대 DB 연결 수 (pg_stat_activity)"),
+    ("max_memory_growth_mb", float, "실행 동안 허용하는 메모리 증가 (MB)"),
+    ("min_saturation_concurrency", int, "이 동시 사용자 수보다 먼저 포화되면 실패"),
+]
+
+
+def _format(value, spec: str = "") -> str:
+    return "-" if value is None else format(value, spec)
+
+
+def print_report(report: dict):
+    config = report["config"]
+    database = report["database"]
+    print(f"\n=== 부하 테스트 (commit={report['git_commit']}, redis={config['redis']}) ===")
+    scripts = ", ".join(f"{name}×{weight}" for name, weight in config["scripts"].items())
+    print(f"단계당 {config['stage_seconds']}초 / 스크립트: {scripts} / "
+          f"DB: {database.get('source') or '없음 - ' + database.get('skipped', '')}")
+    for name, reason in config["skipped_scripts"].items():
+        print(f"  건너뛴 스크립트 {name}: {reason}")
+
+    print(f"\n{'동시':>4}{'요청':>7}{'rps':>8}{'p50(ms)':>10}{'p95(ms)':>10}{'오류율':>8}"
+          f"{'루프지연max':>12}{'스레드':>7}{'DB연결':>7}{'신규연결':>8}{'메모리(MB)':>11}")
+    for stage in report["stages"]:
+        latency = stage["latency_ms"]
+        memory = stage["memory_mb"] or {}
+        print(f"{stage['concurrency']:>4}{stage['requests']:>7}{stage['throughput_rps']:>8.2f}"
+              f"{latency['p50']:>10.1f}{latency['p95']:>10.1f}{stage['error_rate']:>8.1%}"
+              f"{stage['event_loop_lag_ms']['max']:>12.1f}{stage['threads_max']:>7}"
+              f"{_format(stage['db_connections_max']):>7}{stage['db_connections_opened']:>8}"
+              f"{_format(memory.get('end'), '.1f'):>11}")
+        for error in stage["errors_sample"]:
+            print(f"{'':>4}  ! {error}")
+
+    last = report["stages"][-1]
+    print(f"\n엔드포인트별 (동시 {last['concurrency']}):")
+    for name, stats in last["endpoints"].items():
+        print(f"  {name:<44} 요청 {stats['requests']:>5}  p50 {stats['p50_ms']:>9.1f}ms  p95 {stats['p95_ms']:>9.1f}ms"
+              f"  오류 {stats['errors']}")
+
+    saturation = report["saturation"]
+    peak = report["peak_throughput"]
+    print(f"\n최대 처리량: {peak['throughput_rps']} rps (동시 {peak['concurrency']})")
+    if saturation:
+        print(f"포화 지점: 동시 {saturation['concurrency']} ({saturation['reason']}), "
+              f"마지막 정상 단계: {_format(saturation['last_healthy_concurrency'])}")
+    else:
+        print("포화 지점: 없음 (ramp 범위 안에서 처리량이 계속 증가)")
+    memory = report["memory"]
+    print(f"메모리: {_format(memory['start_mb'])} → {_format(memory['end_mb'])} MB "
+          f"(증가 {_format(memory['growth_mb'])} MB, {memory['source']})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="채팅 / 추천 엔드포인트 부하 테스트")
+    parser.add_argument("--ramp", default="1,2,4,8,16", help="단계별 동시 사용자 수 (쉼표로 구분)")
+    parser.add_argument("--stage-seconds", type=float, default=10.0, help="단계별 실행 시간 (초)")
+    parser.add_argument("--think-time", type=float, default=0.0, help="사용자 요청 사이 대기 (초)")
+    parser.add_argument("--scripts", default=",".join(SCRIPTS), help=f"쉼표로 구분 (가능: {', '.join(SCRIPTS)})")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="가짜 외부 서비스 지연 배율")
+    parser.add_argument("--users", type=int, default=20, help="시드 사용자 수")
+    parser.add_argument("--listings", type=int, default=500, help="시드 채용공고 수")
+    parser.add_argument("--database-url", default=None, help="이미 떠 있는 Postgres (기본: 일회성 인스턴스)")
+    parser.add_argument("--no-db", action="store_true", help="DB가 필요한 스크립트 건너뛰기")
+    parser.add_argument("--budget", default=None, help="예산 JSON 파일 (개별 옵션이 우선)")
+    for name, kind, help_text in BUDGET_OPTIONS:
+        parser.add_argument(f"--{name.replace('_', '-')}", dest=name, type=kind, default=None, help=help_text)
+    parser.add_argument("--output", default=None, help="JSON 보고서 저장 경로 (시계열 포함)")
+    parser.add_argument("--verbose", action="store_true", help="앱 로그 / 출력 그대로 보기")
+    args = parser.parse_args()
+
+    budget = LoadBudget.from_file(args.budget) if args.budget else LoadBudget()
+    for name, _, _ in BUDGET_OPTIONS:
+        if getattr(args, name) is not None:
+            setattr(budget, name, getattr(args, name))
+
+    if not args.verbose:
+        os.environ.setdefault("LOG_LEVELS", "services.agents=WARNING,services.chat_service=WARNING")
+
+    report = run_loadtest(
+        ramp=[int(value) for value in args.ramp.split(",") if value.strip()],
+        stage_seconds=args.stage_seconds,
+        think_time=args.think_time,
+        script_names=[name.strip() for name in args.scripts.split(",") if name.strip()],
+        latency=FakeLatency().scaled(args.latency_scale),
+        users=args.users,
+        listings=args.listings,
+        use_db=not args.no_db,
+        database_url=args.database_url,
+        budget=budget,
+        quiet=not args.verbose,
+    )
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n보고서 저장: {args.output}")
+
+    violations = report["budget"]["violations"]
+    if violations:
+        print(f"\n예산 위반 {len(violations)}건:")
+        for item in violations:
+            where = f" (동시 {item['concurrency']})" if item["concurrency"] is not None else ""
+            print(f"  - {item['metric']}{where}: {item['actual']} > {item['limit']}")
+        sys.exit(1)
+    print("\n예산 통과")
+
+
+if __name__ == "__main__":
+    main()
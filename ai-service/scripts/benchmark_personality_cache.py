@@ -0,0 +1,146 @@
+"""
+성향 분석 파이프라인 캐시 벤치마크 - 실행 유형별 지연 시간 / LLM 호출 수 / 전송 프롬프트 크기 비교
+
+- cold: 캐시가 비어 있는 첫 실행 (전체 대화 요약 + Big Five)
+- warm: 같은 대화 / 설문으로 다시 실행 (단계 캐시 적중 → LLM 호출 없음)
+- incremental: 같은 세션에 새 메시지가 이어진 뒤 실행 (누적 요약에 새 메시지만 반영)
+- full rerun: 캐시 없이 늘어난 대화 전체를 다시 요약하는 기존 방식 (incremental 비교 기준)
+
+기본은 지연 시간을 흉내 내는 가짜 OpenAI 클라이언트로 실행하고, --live면 실제 API를 호출합니다.
+
+    python scripts/benchmark_personality_cache.py --sessions 10 --messages 40 --appended 6
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+from services.agents.personality_agent import PersonalityAgent, PersonalityAgentInput
+from services.agents.tool_cache import ToolResultCache
+
+TURNS = [
+    ("user", "요즘 진로 때문에 고민이 많아요. 디자인이랑 개발 둘 다 관심이 있어요."),
+    ("assistant", "두 분야 모두 관심이 있으시군요. 어떤 점이 가장 끌리나요?"),
+    ("user", "무언가를 직접 만들어서 사람들이 쓰는 걸 보는 게 좋아요."),
+    ("assistant", "사용자 반응을 보는 걸 좋아하시네요. 팀 작업은 어떠세요?"),
+    ("user", "혼자 집중하는 게 편하지만 발표는 자신 있어요."),
+    ("assistant", "집중력과 표현력을 모두 갖추셨네요. 걱정되는 점이 있나요?"),
+    ("user", "마감이 다가오면 불안해서 잠을 잘 못 자요."),
+    ("assistant", "일정 관리 방법을 함께 찾아보면 좋겠어요."),
+]
+
+
+class FakeCompletions:
+    """지연 시간만 흉내 내는 chat.completions 대역 (요약 / Big Five JSON 응답)"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+        self.prompt_chars = 0
+
+    async def create(self, model, messages, **kwargs):
+        self.calls += 1
+        self.prompt_chars += sum(len(m["content"]) for m in messages)
+        await asyncio.sleep(self.latency)
+        if "Big Five" in messages[0]["content"]:
+            body = {trait: {"score": 55 + self.calls % 10, "reason": "대화 근거"}
+                    for trait in ("openness", "conscientiousness", "extraversion", "agreeableness", "neuroticism")}
+        else:
+            body = {"summary": f"만드는 일을 좋아하는 학생 ({self.calls})", "strengths": ["표현력"],
+                    "risks": ["마감 불안"], "goals": ["프로덕트 디자이너"], "values": ["성장"]}
+        content = json.dumps(body, ensure_ascii=False)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def make_history(count: int, session: int):
+    return [
+        {"role": TURNS[i % len(TURNS)][0], "content": f"{TURNS[i % len(TURNS)][1]} (세션 {session}, {i})"}
+        for i in range(count)
+    ]
+
+
+def make_agent(args):
+    agent = PersonalityAgent(cache=ToolResultCache(use_redis=False))
+    completions = None
+    if not args.live:
+        completions = FakeCompletions(args.latency)
+        fake_client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+        agent.summarizer_tool.client = fake_client
+        agent.bigfive.client = fake_client
+    return agent, completions
+
+
+async def run_phase(agent, completions, bundles):
+    latencies = []
+    calls_before = completions.calls if completions else 0
+    chars_before = completions.prompt_chars if completions else 0
+    for bundle in bundles:
+        started = time.perf_counter()
+        await agent.run(bundle)
+        latencies.append(time.perf_counter() - started)
+    calls = (completions.calls - calls_before) if completions else None
+    chars = (completions.prompt_chars - chars_before) if completions else None
+    return latencies, calls, chars
+
+
+def report(name, result, sessions):
+    latencies, calls, chars = result
+    line = f"- {name}: 평균 {statistics.mean(latencies):.3f}s / p50 {statistics.median(latencies):.3f}s"
+    if calls is not None:
+        line += f" / LLM 호출 {calls}회 ({calls / sessions:.1f}회/실행) / 프롬프트 {chars / sessions:,.0f}자/실행"
+    print(line)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="성향 분석 파이프라인 캐시 벤치마크")
+    parser.add_argument("--sessions", type=int, default=10, help="분석할 세션 수")
+    parser.add_argument("--messages", type=int, default=40, help="첫 실행 시 대화 메시지 수")
+    parser.add_argument("--appended", type=int, default=6, help="incremental 실행 전에 이어진 메시지 수")
+    parser.add_argument("--latency", type=float, default=0.8, help="가짜 LLM 응답 지연 (초)")
+    parser.add_argument("--live", action="store_true", help="실제 OpenAI API 호출")
+    args = parser.parse_args()
+
+    survey = {"interest": "디자인, 개발", "style": "혼자 집중"}
+
+    def bundles(count):
+        return [
+            PersonalityAgentInput(conversation_history=make_history(count, s), survey_data=survey, session_id=f"bench-{s}")
+            for s in range(args.sessions)
+        ]
+
+    print(f"# 성향 분석 파이프라인 캐시 벤치마크 (세션 {args.sessions}개, 메시지 {args.messages} → "
+          f"{args.messages + args.appended}, {'실제 API' if args.live else f'가짜 LLM 지연 {args.latency}s'})\n")
+
+    agent, completions = make_agent(args)
+    cold = await run_phase(agent, completions, bundles(args.messages))
+    warm = await run_phase(agent, completions, bundles(args.messages))
+    incremental = await run_phase(agent, completions, bundles(args.messages + args.appended))
+
+    baseline_agent, baseline_completions = make_agent(args)
+    full_rerun = await run_phase(baseline_agent, baseline_completions, bundles(args.messages + args.appended))
+
+    report("cold (첫 실행)", cold, args.sessions)
+    report("warm (입력 동일)", warm, args.sessions)
+    report("incremental (새 메시지만 요약)", incremental, args.sessions)
+    report("full rerun (전체 재요약, 기준)", full_rerun, args.sessions)
+
+    print(f"\n- warm / cold 지연 비율: {statistics.mean(warm[0]) / max(statistics.mean(cold[0]), 1e-9) * 100:.1f}%")
+    if completions is not None:
+        saved = 1 - incremental[2] / max(full_rerun[2], 1)
+        print(f"- incremental 프롬프트 절감: {saved * 100:.1f}% (전체 재요약 대비)")
+    print(f"- 요약 실행 통계: {agent.stats}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
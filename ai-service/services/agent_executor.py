@@ -0,0 +1,320 @@
+"""
+에이전트 실행기 (백그라운드 리서치 에이전트 전용 워커 풀)
+메시지마다 스레드 + 이벤트 루프를 새로 만들던 방식을 대체합니다.
+
+- 전용 이벤트 루프 스레드 1개에서 최대 max_workers개의 에이전트만 동시에 실행
+- 대기열(max_queue)이 가득 차면 overflow_policy에 따라 처리
+    - drop_oldest: 가장 오래 기다린 태스크를 버리고 새 태스크를 받음 (기본)
+    - reject: 새 태스크를 받지 않음
+- 같은 사용자의 태스크는 하나만 유지: 새 메시지가 오면 이전 태스크(대기/실행 중)는 취소
+- 대기열 깊이, 대기/실행 시간 지표 제공 (stats)
+
+워커들은 이벤트 루프 하나를 공유하므로 에이전트 코드는 동기 I/O(Redis, DB, 동기 LLM 클라이언트)를
+루프에서 직접 호출하면 안 됨 - asyncio.to_thread로 넘기거나 비동기 클라이언트 사용.
+
+취소/거절된 태스크는 태스크 저장소에 skipped로 기록되어 프론트엔드 폴링이 바로 종료됩니다.
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from services.agent_task_store import get_agent_task_store
+from services.common.logging_config import log_context
+from services.common.metrics import get_metrics_registry, percentile
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_REJECT = "reject"
+
+
+@dataclass
+class _AgentJob:
+    task_id: str
+    key: str
+    func: Callable[[], Awaitable[Any]]
+    enqueued_at: float = field(default_factory=time.monotonic)
+    task: Optional[asyncio.Task] = None
+    superseded: bool = False
+
+
+class AgentExecutor:
+    """제한된 동시성의 에이전트 실행기"""
+
+    def __init__(
+        self,
+        max_workers: int = int(os.getenv("AGENT_MAX_WORKERS", 4)),
+        max_queue: int = int(os.getenv("AGENT_MAX_QUEUE", 32)),
+        overflow_policy: str = os.getenv("AGENT_QUEUE_OVERFLOW", OVERFLOW_DROP_OLDEST),
+        task_timeout: float = float(os.getenv("AGENT_TASK_TIMEOUT", 120)),
+        task_store=None
+    ):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.overflow_policy = overflow_policy
+        self.task_timeout = task_timeout
+        self.task_store = task_store or get_agent_task_store()
+
+        self._lock = threading.Lock()
+        self._pending: Deque[_AgentJob] = deque()
+        self._inflight: Dict[str, _AgentJob] = {}  # 사용자 키 → 최신 태스크
+        self._running = 0
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._signal: Optional[asyncio.Semaphore] = None
+        self._workers: List[asyncio.Task] = []
+
+        self._counters = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "timed_out": 0,
+            "superseded": 0,
+            "rejected": 0,
+            "dropped": 0,
+        }
+        self._wait_times: Deque[float] = deque(maxlen=500)
+        self._run_times: Deque[float] = deque(maxlen=500)
+
+    # ------------------------------------------------------------------
+    # 수명 주기
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """전용 이벤트 루프 스레드와 워커 시작 (이미 실행 중이면 무시)"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever, name="agent-executor", daemon=True)
+            self._thread.start()
+
+        asyncio.run_coroutine_threadsafe(self._start_workers(), self._loop).result()
+        logger.info(f"[AgentExecutor] 시작: workers={self.max_workers}, queue={self.max_queue}, "
+                    f"overflow={self.overflow_policy}")
+
+    async def _start_workers(self):
+        self._signal = asyncio.Semaphore(0)
+        self._workers = [asyncio.create_task(self._worker(i)) for i in range(self.max_workers)]
+
+    def stop(self, timeout: float = 5.0):
+        """실행 중인 태스크를 취소하고 루프 종료"""
+        with self._lock:
+            if self._thread is None:
+                return
+            loop, thread = self._loop, self._thread
+            self._thread = None
+            pending = list(self._pending)
+            self._pending.clear()
+            self._inflight.clear()
+
+        for job in pending:
+            self._mark_skipped(job, "서버 종료")
+
+        async def _shutdown():
+            # 워커 + 실행 중인 에이전트 태스크 모두 취소
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(_shutdown(), loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"[AgentExecutor] 종료 대기 실패: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        logger.info("[AgentExecutor] 종료")
+
+    # ------------------------------------------------------------------
+    # 제출
+    # ------------------------------------------------------------------
+
+    def submit(self, task_id: str, key: str, func: Callable[[], Awaitable[Any]]) -> str:
+        """
+        에이전트 태스크 제출 (어느 스레드/루프에서 호출해도 안전)
+
+        Args:
+            task_id: 태스크 저장소의 태스크 ID
+            key: 중복 제거 키 (사용자 ID 등) - 같은 키의 이전 태스크는 취소
+            func: 실행할 코루틴 함수
+
+        Returns:
+            "queued" | "rejected"
+        """
+        self.start()
+        job = _AgentJob(task_id=task_id, key=key, func=func)
+        skipped: List[tuple] = []
+
+        with self._lock:
+            self._counters["submitted"] += 1
+
+            # 같은 사용자의 대기 중인 이전 태스크는 대기열에서 제거
+            previous = self._inflight.get(key)
+            if previous is not None and previous in self._pending:
+                self._pending.remove(previous)
+                skipped.append((previous, "새 메시지로 대체됨"))
+
+            # 대기열 초과 처리
+            rejected = False
+            if len(self._pending) >= self.max_queue:
+                if self.overflow_policy == OVERFLOW_REJECT:
+                    rejected = True
+                    self._counters["rejected"] += 1
+                else:
+                    oldest = self._pending.popleft()
+                    self._counters["dropped"] += 1
+                    if self._inflight.get(oldest.key) is oldest:
+                        del self._inflight[oldest.key]
+                    skipped.append((oldest, "대기열 초과로 취소됨"))
+
+            if previous is not None and not rejected:
+                # 실행 중인 이전 태스크는 취소 (워커가 skipped로 기록)
+                previous.superseded = True
+                self._counters["superseded"] += 1
+                if previous.task is not None:
+                    self._loop.call_soon_threadsafe(previous.task.cancel)
+            elif previous is not None and previous.task is None:
+                # 거절됐지만 대기 중이던 이전 태스크는 이미 제거됨
+                self._counters["superseded"] += 1
+                del self._inflight[key]
+
+            if not rejected:
+                self._pending.append(job)
+                self._inflight[key] = job
+
+        for old_job, reason in skipped:
+            self._mark_skipped(old_job, reason)
+
+        if rejected:
+            logger.warning(f"[AgentExecutor] 대기열 초과로 거절: task_id={task_id}")
+            self._mark_skipped(job, "요청이 많아 처리하지 못함")
+            return "rejected"
+
+        self._loop.call_soon_threadsafe(self._signal.release)
+        return "queued"
+
+    # ------------------------------------------------------------------
+    # 워커
+    # ------------------------------------------------------------------
+
+    async def _worker(self, index: int):
+        while True:
+            await self._signal.acquire()
+            with self._lock:
+                if not self._pending:
+                    continue  # 취소/드롭된 태스크의 신호
+                job = self._pending.popleft()
+                # 태스크 안의 로그에 task_id 포함 (create_task가 현재 컨텍스트를 복사)
+                with log_context(task_id=job.task_id):
+                    job.task = asyncio.create_task(job.func())
+                self._running += 1
+                self._wait_times.append(time.monotonic() - job.enqueued_at)
+
+            try:
+                await self._run(job)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    if self._inflight.get(job.key) is job:
+                        del self._inflight[job.key]
+
+    async def _run(self, job: _AgentJob):
+        started = time.monotonic()
+        done, _ = await asyncio.wait({job.task}, timeout=self.task_timeout)
+        self._run_times.append(time.monotonic() - started)
+
+        if not done:
+            job.task.cancel()
+            await asyncio.gather(job.task, return_exceptions=True)
+            self._count("timed_out")
+            logger.warning(f"[AgentExecutor] 시간 초과: task_id={job.task_id}")
+            await asyncio.to_thread(self._mark_failed, job, f"에이전트 실행 시간 초과 ({self.task_timeout:.0f}초)")
+        elif job.task.cancelled():
+            logger.info(f"[AgentExecutor] 새 메시지로 취소: task_id={job.task_id}")
+            await asyncio.to_thread(self._mark_skipped, job, "새 메시지로 대체됨")
+        elif job.task.exception() is not None:
+            self._count("failed")
+            logger.error(f"[AgentExecutor] 실패: task_id={job.task_id}, error={job.task.exception()}")
+            await asyncio.to_thread(self._mark_failed, job, str(job.task.exception()))
+        else:
+            self._count("completed")
+
+    def _count(self, name: str):
+        with self._lock:
+            self._counters[name] += 1
+
+    def _mark_skipped(self, job: _AgentJob, reason: str):
+        try:
+            self.task_store.set_skipped(job.task_id, reason=reason)
+        except Exception as e:
+            logger.error(f"[AgentExecutor] 태스크 상태 저장 실패: task_id={job.task_id}, error={e}")
+
+    def _mark_failed(self, job: _AgentJob, error: str):
+        try:
+            self.task_store.set_failed(job.task_id, error)
+        except Exception as e:
+            logger.error(f"[AgentExecutor] 태스크 상태 저장 실패: task_id={job.task_id}, error={e}")
+
+    # ------------------------------------------------------------------
+    # 지표
+    # ------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """대기열 깊이 / 동시 실행 수 / 대기·실행 시간 (초)"""
+        with self._lock:
+            waits = sorted(self._wait_times)
+            runs = sorted(self._run_times)
+            return {
+                "running": self._running,
+                "queue_depth": len(self._pending),
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "overflow_policy": self.overflow_policy,
+                **self._counters,
+                "wait_p50": percentile(waits, 0.5),
+                "wait_p95": percentile(waits, 0.95),
+                "run_p50": percentile(runs, 0.5),
+                "run_p95": percentile(runs, 0.95),
+            }
+
+
+# 싱글톤 인스턴스
+_agent_executor: Optional[AgentExecutor] = None
+
+
+def get_agent_executor() -> AgentExecutor:
+    """에이전트 실행기 싱글톤"""
+    global _agent_executor
+    if _agent_executor is None:
+        _agent_executor = AgentExecutor()
+    return _agent_executor
+
+
+def shutdown_agent_executor():
+    """서버 종료 시 호출"""
+    if _agent_executor is not None:
+        _agent_executor.stop()
+
+
+def _collect_agent_executor_metrics():
+    """/metrics 수집기 - 백그라운드 에이전트 실행기 대기열 / 실행 수 / 처리 결과"""
+    if _agent_executor is None:
+        return []
+    stats = _agent_executor.stats()
+    registry = get_metrics_registry()
+    queue = registry.family("agent_executor_queue_depth", "gauge", "실행을 기다리는 에이전트 태스크 수")
+    running = registry.family("agent_executor_running", "gauge", "실행 중인 에이전트 태스크 수")
+    jobs = registry.family("agent_executor_jobs_total", "counter", "에이전트 태스크 처리 결과별 누적 수")
+    for result in ("submitted", "completed", "failed", "timed_out", "superseded", "rejected", "dropped"):
+        jobs.add(stats[result], result=result)
+    return [queue.add(stats["queue_depth"]), running.add(stats["running"]), jobs]
+
+
+get_metrics_registry().register_collector("agent_executor", _collect_agent_executor_metrics)
@@ -1,41 +1,151 @@
 """
 에이전트 태스크 저장소 (Redis 기반)
 백그라운드 에이전트 실행 결과를 저장하고 조회
+
+태스크 상태 변경과 ReAct 단계 진행은 이벤트로도 기록됩니다.
+- agent_task:{id}:events  이벤트 목록 (재접속 시 처음부터/Last-Event-ID부터 재생)
+- agent_task:{id}:notify  새 이벤트 알림 채널 (pub/sub)
+SSE 엔드포인트(/api/chat/agent-events/{task_id})가 이를 구독해 클라이언트로 푸시합니다.
+
+태스크는 Redis 해시(agent_task:{id})에 필드별로 저장되어 상태 변경이 필드 단위 갱신으로 처리됩니다.
+Redis가 없을 때는 크기/TTL 제한이 있는 인메모리 저장소를 사용합니다 (Redis와 같은 5분 TTL).
 """
+import asyncio
 import redis
+import redis.asyncio as aioredis
 import json
+import logging
 import os
+import threading
+import time
 import uuid
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from typing import Optional, Dict, Any, AsyncIterator, Callable, List, Tuple
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+# 이 상태가 되면 이벤트 스트림 종료
+TERMINAL_STATUSES = ("completed", "failed", "skipped")
+
+TASK_TTL_SECONDS = 300
+# 인메모리 모드에서 보관할 최대 태스크 수 (초과 시 가장 오래 갱신되지 않은 태스크부터 제거)
+MEMORY_MAX_TASKS = int(os.getenv("AGENT_TASK_MEMORY_MAX", 1000))
+
+# 키가 있을 때만 필드 갱신 + TTL 연장 (만료된 태스크를 일부 필드만으로 되살리지 않음)
+_UPDATE_IF_EXISTS_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return 1
+"""
+
+
+class MemoryTTLStore:
+    """
+    크기 + TTL 제한 인메모리 저장소 (Redis 대체용)
+    - 갱신할 때마다 만료 시각 연장 후 맨 뒤로 이동 → 앞쪽이 먼저 만료되는 항목
+    - 쓰기 시 앞쪽의 만료 항목 정리, 최대 개수 초과 시 가장 오래된 항목 제거
+    - 읽기 시 만료 확인 (정리 전이라도 만료된 항목은 반환하지 않음)
+    """
+
+    def __init__(self, max_entries: int = MEMORY_MAX_TASKS, ttl_seconds: int = TASK_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, List[Any]]" = OrderedDict()  # key → [만료 시각, 값]
+
+    def get(self, key: str, copy: Callable[[Any], Any] = lambda value: value) -> Any:
+        """값 조회 (copy로 잠금 안에서 복사본을 만들어 반환)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            return copy(entry[1])
+
+    def update(
+        self,
+        key: str,
+        mutate: Callable[[Any], None],
+        create: Optional[Callable[[], Any]] = None,
+        ttl: Optional[int] = None
+    ) -> bool:
+        """
+        잠금 안에서 값을 제자리 갱신하고 TTL 연장
+        키가 없으면 create가 있을 때만 새로 만들고, 없으면 아무것도 하지 않고 False 반환
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._purge_expired(now)
+            entry = self._entries.get(key)
+            if entry is None:
+                if create is None:
+                    return False
+                entry = [0.0, create()]
+                self._entries[key] = entry
+            mutate(entry[1])
+            entry[0] = now + (ttl or self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return True
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _purge_expired(self, now: float):
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if entry[0] > now:
+                break
+            del self._entries[key]
+
 
 class AgentTaskStore:
     """Redis 기반 에이전트 태스크 저장소"""
 
-    def __init__(self):
+    def __init__(self, use_redis: bool = True):
         redis_host = os.getenv("REDIS_HOST", "localhost")
         redis_port = int(os.getenv("REDIS_PORT", 6379))
         redis_db = int(os.getenv("REDIS_DB", 0))
+        self.redis_client = None
+        self.enabled = False
 
-        try:
-            self.redis_client = redis.Redis(
-                host=redis_host,
-                port=redis_port,
-                db=redis_db,
-                decode_responses=True,
-                socket_timeout=5,
-                socket_connect_timeout=5
-            )
-            self.redis_client.ping()
-            self.enabled = True
-            print(f"[AgentTaskStore] Redis 연결 성공: {redis_host}:{redis_port}")
-        except Exception as e:
-            print(f"[AgentTaskStore] Redis 연결 실패 (인메모리 모드): {e}")
-            self.redis_client = None
-            self.enabled = False
-            # Redis 없을 때 인메모리 저장소 사용
-            self._memory_store: Dict[str, Dict] = {}
+        if use_redis:
+            try:
+                self.redis_client = redis.Redis(
+                    host=redis_host,
+                    port=redis_port,
+                    db=redis_db,
+                    decode_responses=True,
+                    socket_timeout=5,
+                    socket_connect_timeout=5
+                )
+                self.redis_client.ping()
+                self.enabled = True
+                logger.info(f"[AgentTaskStore] Redis 연결 성공: {redis_host}:{redis_port}")
+                self._redis_params = {"host": redis_host, "port": redis_port, "db": redis_db}
+            except Exception as e:
+                logger.warning(f"[AgentTaskStore] Redis 연결 실패 (인메모리 모드): {e}")
+                self.redis_client = None
+
+        if self.enabled:
+            self._update_if_exists = self.redis_client.register_script(_UPDATE_IF_EXISTS_SCRIPT)
+        else:
+            # Redis 없을 때 인메모리 저장소 사용 (Redis 경로와 같은 TTL, 최대 개수 제한)
+            self._memory_store = MemoryTTLStore()
+
+        # 이벤트 구독 (Redis: 비동기 클라이언트는 구독 시 생성, 인메모리: 구독자 루프에 직접 알림)
+        self._async_client = None
+        self._memory_events = MemoryTTLStore()
+        self._subscribers: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+        self._events_lock = threading.Lock()
 
     def create_task(self, session_id: str, user_id: Optional[int] = None) -> str:
         """
@@ -55,67 +165,192 @@ class AgentTaskStore:
             "error": None
         }
 
-        self._save_task(task_id, task_data)
+        self._create_task(task_id, task_data)
+        self.publish_event(task_id, {"type": "status", "status": "pending"})
         return task_id
 
     def set_running(self, task_id: str):
         """태스크 실행 중 상태로 변경"""
-        task_data = self._get_task(task_id)
-        if task_data:
-            task_data["status"] = "running"
-            task_data["started_at"] = datetime.now().isoformat()
-            self._save_task(task_id, task_data)
+        if self._update_task(task_id, {"status": "running", "started_at": datetime.now().isoformat()}):
+            self.publish_event(task_id, {"type": "status", "status": "running"})
 
     def set_completed(self, task_id: str, result: Dict[str, Any]):
         """태스크 완료 + 결과 저장"""
-        task_data = self._get_task(task_id)
-        if task_data:
-            task_data["status"] = "completed"
-            task_data["result"] = result
-            task_data["completed_at"] = datetime.now().isoformat()
-            self._save_task(task_id, task_data)
+        if self._update_task(task_id, {
+            "status": "completed",
+            "result": result,
+            "completed_at": datetime.now().isoformat()
+        }):
+            self.publish_event(task_id, {"type": "status", "status": "completed"})
 
     def set_failed(self, task_id: str, error: str):
         """태스크 실패 + 에러 저장"""
-        task_data = self._get_task(task_id)
-        if task_data:
-            task_data["status"] = "failed"
-            task_data["error"] = error
-            task_data["completed_at"] = datetime.now().isoformat()
-            self._save_task(task_id, task_data)
-
-    def set_skipped(self, task_id: str):
-        """태스크 스킵 (에이전트 사용 안 함)"""
-        task_data = self._get_task(task_id)
-        if task_data:
-            task_data["status"] = "skipped"
-            task_data["completed_at"] = datetime.now().isoformat()
-            self._save_task(task_id, task_data)
+        if self._update_task(task_id, {
+            "status": "failed",
+            "error": error,
+            "completed_at": datetime.now().isoformat()
+        }):
+            self.publish_event(task_id, {"type": "status", "status": "failed", "error": error})
+
+    def set_skipped(self, task_id: str, reason: Optional[str] = None):
+        """태스크 스킵 (에이전트 사용 안 함 / 새 메시지로 대체 / 대기열 초과)"""
+        if self._update_task(task_id, {
+            "status": "skipped",
+            "error": reason,
+            "completed_at": datetime.now().isoformat()
+        }):
+            self.publish_event(task_id, {"type": "status", "status": "skipped", "error": reason})
 
     def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
         """태스크 조회"""
         return self._get_task(task_id)
 
-    def _save_task(self, task_id: str, task_data: Dict[str, Any], ttl: int = 300):
+    # ------------------------------------------------------------------
+    # 이벤트 (상태 변경 / ReAct 단계)
+    # ------------------------------------------------------------------
+
+    def publish_event(self, task_id: str, event: Dict[str, Any], ttl: int = TASK_TTL_SECONDS):
+        """이벤트 기록 + 구독자 알림 (이벤트 기록 실패는 태스크 처리에 영향 없음)"""
+        event = {**event, "at": datetime.now().isoformat()}
+        data = json.dumps(event, ensure_ascii=False, default=str)
+
+        if self.enabled and self.redis_client:
+            try:
+                key = f"agent_task:{task_id}:events"
+                pipe = self.redis_client.pipeline()
+                pipe.rpush(key, data)
+                pipe.expire(key, ttl)
+                pipe.publish(f"agent_task:{task_id}:notify", "1")
+                pipe.execute()
+            except Exception as e:
+                logger.warning(f"[AgentTaskStore] 이벤트 발행 실패: {task_id}, {e}")
+            return
+
+        self._memory_events.update(task_id, lambda events: events.append(json.loads(data)), create=list, ttl=ttl)
+        with self._events_lock:
+            subscribers = list(self._subscribers.get(task_id, []))
+        for loop, notify in subscribers:
+            loop.call_soon_threadsafe(notify.set)
+
+    def get_events(self, task_id: str, start: int = 0) -> List[Dict[str, Any]]:
+        """start번째 이후 이벤트 목록"""
+        if self.enabled and self.redis_client:
+            return [json.loads(e) for e in self.redis_client.lrange(f"agent_task:{task_id}:events", start, -1)]
+        return self._memory_events.get(task_id, copy=lambda events: events[start:]) or []
+
+    async def stream_events(
+        self,
+        task_id: str,
+        start: int = 0,
+        heartbeat_seconds: float = 15.0,
+        timeout_seconds: float = 300.0
+    ) -> AsyncIterator[Optional[Tuple[int, Dict[str, Any]]]]:
+        """
+        이벤트 스트림 (이미 기록된 이벤트 재생 후 새 이벤트 대기)
+        (seq, event)를 순서대로 반환하고, heartbeat_seconds 동안 새 이벤트가 없으면 None을 반환합니다.
+        종료 상태 이벤트 또는 timeout_seconds가 지나면 끝납니다.
+        """
+        if self.enabled and self.redis_client:
+            stream = self._stream_redis_events(task_id, start, heartbeat_seconds)
+        else:
+            stream = self._stream_memory_events(task_id, start, heartbeat_seconds)
+
+        deadline = asyncio.get_running_loop().time() + timeout_seconds
+        try:
+            async for item in stream:
+                yield item
+                if item is not None and item[1].get("type") == "status" and item[1].get("status") in TERMINAL_STATUSES:
+                    return
+                if asyncio.get_running_loop().time() > deadline:
+                    return
+        finally:
+            await stream.aclose()
+
+    async def _stream_redis_events(self, task_id: str, cursor: int, heartbeat_seconds: float):
+        if self._async_client is None:
+            self._async_client = aioredis.Redis(decode_responses=True, socket_connect_timeout=5, **self._redis_params)
+
+        pubsub = self._async_client.pubsub()
+        await pubsub.subscribe(f"agent_task:{task_id}:notify")
+        try:
+            while True:
+                # 구독 후 목록을 읽어 구독 전에 발행된 이벤트도 놓치지 않음
+                events = await self._async_client.lrange(f"agent_task:{task_id}:events", cursor, -1)
+                for data in events:
+                    cursor += 1
+                    yield cursor, json.loads(data)
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=heartbeat_seconds)
+                if message is None:
+                    yield None
+        finally:
+            await pubsub.unsubscribe()
+            await pubsub.aclose()
+
+    async def _stream_memory_events(self, task_id: str, cursor: int, heartbeat_seconds: float):
+        notify = asyncio.Event()
+        subscriber = (asyncio.get_running_loop(), notify)
+        with self._events_lock:
+            self._subscribers.setdefault(task_id, []).append(subscriber)
+        try:
+            while True:
+                notify.clear()
+                for event in self.get_events(task_id, cursor):
+                    cursor += 1
+                    yield cursor, event
+                try:
+                    await asyncio.wait_for(notify.wait(), timeout=heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    yield None
+        finally:
+            with self._events_lock:
+                self._subscribers[task_id].remove(subscriber)
+                if not self._subscribers[task_id]:
+                    del self._subscribers[task_id]
+
+    @staticmethod
+    def _encode_fields(fields: Dict[str, Any]) -> Dict[str, str]:
+        """해시 필드 값은 JSON으로 저장 (None / 숫자 / dict 결과 타입 유지)"""
+        return {name: json.dumps(value, ensure_ascii=False, default=str) for name, value in fields.items()}
+
+    def _create_task(self, task_id: str, task_data: Dict[str, Any], ttl: int = TASK_TTL_SECONDS):
         """태스크 저장 (TTL 5분)"""
         key = f"agent_task:{task_id}"
 
         if self.enabled and self.redis_client:
-            self.redis_client.setex(key, ttl, json.dumps(task_data, ensure_ascii=False, default=str))
+            pipe = self.redis_client.pipeline()
+            pipe.hset(key, mapping=self._encode_fields(task_data))
+            pipe.expire(key, ttl)
+            pipe.execute()
         else:
-            self._memory_store[task_id] = task_data
+            self._memory_store.update(task_id, lambda data: data.update(task_data), create=dict, ttl=ttl)
+
+    def _update_task(self, task_id: str, fields: Dict[str, Any], ttl: int = TASK_TTL_SECONDS) -> bool:
+        """
+        태스크 필드 갱신 + TTL 연장 (전체 문서를 읽고 다시 쓰지 않음)
+
+        Returns:
+            태스크가 존재해 갱신되었는지 여부
+        """
+        key = f"agent_task:{task_id}"
+
+        if self.enabled and self.redis_client:
+            args = [ttl]
+            for name, value in self._encode_fields(fields).items():
+                args.extend((name, value))
+            return bool(self._update_if_exists(keys=[key], args=args))
+        return self._memory_store.update(task_id, lambda data: data.update(fields), ttl=ttl)
 
     def _get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
         """태스크 조회 (내부)"""
         key = f"agent_task:{task_id}"
 
         if self.enabled and self.redis_client:
-            data = self.redis_client.get(key)
+            data = self.redis_client.hgetall(key)
             if data:
-                return json.loads(data)
+                return {name: json.loads(value) for name, value in data.items()}
             return None
         else:
-            return self._memory_store.get(task_id)
+            return self._memory_store.get(task_id, copy=dict)
 
 
 # 싱글톤 인스턴스
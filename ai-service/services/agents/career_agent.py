@@ -2,17 +2,21 @@
 DreamPath ReAct 진로 상담 에이전트
 LangGraph StateGraph 기반 구현
 """
-import os
 import json
 import logging
 import asyncio
 from typing import Literal
 
 from langgraph.graph import StateGraph, END
-from langchain_openai import ChatOpenAI
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from services.common.llm_clients import get_chat_model
+from services.common.metrics import traced
 
 from .state import AgentState, MAX_STEPS, TOOL_TIMEOUT_SECONDS
 from .career_tools import TOOL_MAP
+from .events import TOOL_LABELS, emit_step
+from .node_metrics import get_agent_node_metrics
 from .prompts import (
     REACT_SYSTEM_PROMPT,
     ANSWER_SYSTEM_PROMPT,
@@ -28,12 +32,14 @@ logger = logging.getLogger(__name__)
 # ============================================================
 
 def get_llm():
-    """LLM 인스턴스 반환 (팩트 기반 에이전트 - temperature=0)"""
-    return ChatOpenAI(
-        api_key=os.getenv("OPENAI_API_KEY"),
-        model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-        temperature=0,
-    )
+    """공유 LLM 인스턴스 반환 (팩트 기반 에이전트 - temperature=0, 커넥션 풀 재사용)"""
+    return get_chat_model(temperature=0)
+
+
+# 정적 시스템 프롬프트는 항상 첫 메시지로 고정 → 공급자 측 프롬프트 캐시 적중
+# (매 스텝 달라지는 대화/도구 결과는 뒤쪽 사용자 메시지에만 포함)
+REACT_SYSTEM_MESSAGE = SystemMessage(content=REACT_SYSTEM_PROMPT)
+ANSWER_SYSTEM_MESSAGE = SystemMessage(content=ANSWER_SYSTEM_PROMPT)
 
 
 # ============================================================
@@ -47,31 +53,33 @@ async def reason_node(state: AgentState) -> dict:
     LLM이 상황을 분석하고 다음 행동을 결정
     """
     logger.info(f"[Agent] reason_node - step {state['current_step']}")
+    await emit_step("analyze", "질문 분석", "in_progress")
+    timer = get_agent_node_metrics().timer("reason")
 
     try:
         llm = get_llm()
 
         context = format_conversation_for_reasoning(
             state["messages"],
-            state["tool_history"]
+            state["tool_history"],
+            state.get("session_id")
         )
 
-        prompt = f"""{REACT_SYSTEM_PROMPT}
-
-{context}
+        prompt = f"""{context}
 
 현재 스텝: {state['current_step'] + 1}/{MAX_STEPS}
 
 다음 행동을 결정하세요. 반드시 JSON 형식으로 응답하세요."""
 
-        response = await llm.ainvoke(prompt)
+        response = await llm.ainvoke([REACT_SYSTEM_MESSAGE, HumanMessage(content=prompt)])
         content = response.content.strip()
 
-        # 토큰 사용량 추적
-        token_usage = response.response_metadata.get("token_usage", {})
-        new_prompt_tokens = token_usage.get("prompt_tokens", 0)
-        new_completion_tokens = token_usage.get("completion_tokens", 0)
-        logger.info(f"[Agent] reason_node 토큰: +{new_prompt_tokens + new_completion_tokens}")
+        # 토큰 사용량 추적 (노드 지표에도 기록)
+        usage = timer.finish(response)
+        new_prompt_tokens = usage["prompt_tokens"]
+        new_completion_tokens = usage["completion_tokens"]
+        logger.info(f"[Agent] reason_node 토큰: +{new_prompt_tokens + new_completion_tokens} "
+                    f"(캐시 {usage['cached_tokens']})")
 
         parsed = _parse_json_response(content)
 
@@ -89,6 +97,7 @@ async def reason_node(state: AgentState) -> dict:
 
         logger.info(f"[Agent] thought: {parsed.get('thought', '')[:100]}")
         logger.info(f"[Agent] action: {parsed.get('action')}")
+        await emit_step("analyze", "질문 분석", "completed", thought=(parsed.get("thought") or "")[:100] or None)
 
         return {
             "thought": parsed.get("thought", ""),
@@ -102,6 +111,8 @@ async def reason_node(state: AgentState) -> dict:
 
     except Exception as e:
         logger.error(f"[Agent] reason_node 오류: {e}")
+        timer.finish(error=True)
+        await emit_step("analyze", "질문 분석", "failed")
         return {
             "thought": f"추론 중 오류: {str(e)}",
             "action": "FINISH",
@@ -140,6 +151,9 @@ async def action_node(state: AgentState) -> dict:
         }
 
     # 도구 실행 (타임아웃 적용)
+    tool_label = TOOL_LABELS.get(action, action)
+    await emit_step("tool", tool_label, "in_progress", tool=action)
+    timer = get_agent_node_metrics().timer(f"action:{action}")
     try:
         # LangChain @tool 도구의 입력 포맷: 단일 인자면 값만, 복수면 dict
         # arun()은 문자열/dict 입력을 받아 내부에서 파싱
@@ -158,19 +172,25 @@ async def action_node(state: AgentState) -> dict:
         if isinstance(result, str):
             result = {"message": result}
 
+        success = result.get("success", True) if isinstance(result, dict) else True
+        timer.finish(error=not success)
+        await emit_step("tool", tool_label, "completed" if success else "failed", tool=action, hasData=bool(result))
+
         return {
             "observation": result,
             "tool_history": state["tool_history"] + [{
                 "tool_name": action,
                 "tool_input": action_input,
                 "tool_output": result,
-                "success": result.get("success", True) if isinstance(result, dict) else True,
+                "success": success,
                 "error": None
             }]
         }
 
     except asyncio.TimeoutError:
         logger.error(f"[Agent] 도구 타임아웃: {action}")
+        timer.finish(error=True)
+        await emit_step("tool", tool_label, "failed", tool=action, hasData=False)
         return {
             "observation": {"error": "시간 초과", "success": False},
             "tool_history": state["tool_history"] + [{
@@ -185,6 +205,8 @@ async def action_node(state: AgentState) -> dict:
 
     except Exception as e:
         logger.error(f"[Agent] 도구 실행 오류: {action} - {e}")
+        timer.finish(error=True)
+        await emit_step("tool", tool_label, "failed", tool=action, hasData=False)
         return {
             "observation": {"error": str(e), "success": False},
             "tool_history": state["tool_history"] + [{
@@ -203,6 +225,8 @@ async def answer_node(state: AgentState) -> dict:
     최종 답변 생성
     """
     logger.info("[Agent] answer_node")
+    await emit_step("answer", "답변 생성", "in_progress")
+    timer = get_agent_node_metrics().timer("answer")
 
     try:
         llm = get_llm()
@@ -218,9 +242,7 @@ async def answer_node(state: AgentState) -> dict:
                 user_message = msg.content
                 break
 
-        prompt = f"""{ANSWER_SYSTEM_PROMPT}
-
-## 학생의 질문/고민
+        prompt = f"""## 학생의 질문/고민
 {user_message}
 
 ## 수집한 정보
@@ -232,16 +254,17 @@ async def answer_node(state: AgentState) -> dict:
 위 정보를 바탕으로 학생에게 도움이 되는 답변을 작성하세요.
 답변만 출력하세요."""
 
-        response = await llm.ainvoke(prompt)
+        response = await llm.ainvoke([ANSWER_SYSTEM_MESSAGE, HumanMessage(content=prompt)])
         answer = response.content.strip()
 
-        # 토큰 사용량 추적
-        token_usage = response.response_metadata.get("token_usage", {})
-        new_prompt_tokens = token_usage.get("prompt_tokens", 0)
-        new_completion_tokens = token_usage.get("completion_tokens", 0)
+        # 토큰 사용량 추적 (노드 지표에도 기록)
+        usage = timer.finish(response)
+        new_prompt_tokens = usage["prompt_tokens"]
+        new_completion_tokens = usage["completion_tokens"]
 
         total = state["total_tokens"] + new_prompt_tokens + new_completion_tokens
         logger.info(f"[Agent] answer_node 토큰: +{new_prompt_tokens + new_completion_tokens}, 총합: {total}")
+        await emit_step("answer", "답변 생성", "completed")
 
         return {
             "final_answer": answer,
@@ -252,6 +275,8 @@ async def answer_node(state: AgentState) -> dict:
 
     except Exception as e:
         logger.error(f"[Agent] answer_node 오류: {e}")
+        timer.finish(error=True)
+        await emit_step("answer", "답변 생성", "failed")
 
         # Fallback 답변
         return {
@@ -351,20 +376,12 @@ def _build_steps_info(result: dict) -> list:
     })
 
     # 2. 도구 사용 단계들
-    tool_labels = {
-        "search_mentoring_sessions": "멘토링 검색",
-        "get_learning_path": "학습 경로 조회",
-        "search_job_postings": "채용 공고 검색",
-        "book_mentoring": "멘토링 예약",
-        "web_search": "웹 검색",
-    }
-
     tool_history = result.get("tool_history", [])
     for tool in tool_history:
         tool_name = tool.get("tool_name", "")
         steps.append({
             "step": "tool",
-            "label": tool_labels.get(tool_name, tool_name),
+            "label": TOOL_LABELS.get(tool_name, tool_name),
             "status": "completed" if tool.get("success", True) else "failed",
             "tool": tool_name,
             "hasData": bool(tool.get("tool_output")),
@@ -436,10 +453,10 @@ def create_career_agent():
     """
     graph = StateGraph(AgentState)
 
-    # 노드 추가
-    graph.add_node("reason", reason_node)
-    graph.add_node("action", action_node)
-    graph.add_node("answer", answer_node)
+    # 노드 추가 (노드마다 langgraph span 기록, 토큰 / 도구별 지표는 node_metrics)
+    graph.add_node("reason", traced("langgraph", "career_agent.reason")(reason_node))
+    graph.add_node("action", traced("langgraph", "career_agent.action")(action_node))
+    graph.add_node("answer", traced("langgraph", "career_agent.answer")(answer_node))
 
     # 엣지 정의
     graph.set_entry_point("reason")
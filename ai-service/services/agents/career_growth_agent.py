@@ -4,7 +4,7 @@
 """
 import os
 from typing import List, Dict, Optional
-from openai import OpenAI
+from services.common.llm_clients import get_openai_client
 
 
 class CareerGrowthAgent:
@@ -15,7 +15,7 @@ class CareerGrowthAgent:
         if not api_key:
             raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다.")
 
-        self.client = OpenAI(api_key=api_key)
+        self.client = get_openai_client()
         self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 
     async def analyze_career_gap(
@@ -3,14 +3,18 @@ DreamPath ReAct 에이전트 Custom Tools
 LangChain @tool 데코레이터를 사용한 도구 정의
 """
 import os
+import re
 import logging
 from datetime import datetime
 import httpx
 from langchain_core.tools import tool
 
+from .tool_cache import get_tool_http_client, get_tool_result_cache
+
 logger = logging.getLogger(__name__)
 
 BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8080")
+SERPER_URL = os.getenv("SERPER_URL", "https://google.serper.dev/search")
 
 
 # ============================================================
@@ -39,38 +43,38 @@ async def search_mentoring_sessions(career_interest: str) -> dict:
         멘토링 세션 목록 (멘토 이름, 직함, 주제, 일정 등)
     """
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(f"{BACKEND_URL}/api/mentoring-sessions/available")
-            response.raise_for_status()
-            sessions = response.json()
-
-            # 검색어를 공백으로 분리 (예: "python 파이썬 개발" → ["python", "파이썬", "개발"])
-            keywords = [k.strip().lower() for k in career_interest.split() if k.strip()]
-            matched = []
-
-            for s in sessions:
-                title = (s.get("title") or "").lower()
-                desc = (s.get("description") or "").lower()
-                job = (s.get("mentorJob") or "").lower()
-                username = (s.get("mentorUsername") or "").lower()
-                searchable = f"{title} {desc} {job} {username}"
-
-                # 키워드 중 하나라도 매칭되면 포함
-                if any(kw in searchable for kw in keywords):
-                    matched.append({
-                        "sessionId": s.get("sessionId"),
-                        "mentorName": s.get("mentorName"),
-                        "mentorTitle": s.get("mentorJob"),
-                        "topic": s.get("title"),
-                        "description": s.get("description"),
-                        "sessionDate": _format_date(s.get("sessionDate")),
-                    })
-
-            if matched:
-                return {"success": True, "sessions": matched[:3], "total": len(matched)}
-
-            # 매칭 없음 → 조용히 스킵 (보조 에이전트는 결과 없으면 말 안함)
-            return {"success": True, "sessions": []}
+        # 예약 가능 세션 목록은 사용자와 무관 → 짧은 TTL로 공유 (검색어 매칭은 매번 수행)
+        sessions = await get_tool_result_cache().get_or_fetch(
+            "mentoring_sessions", {}, _fetch_available_sessions
+        )
+
+        # 검색어를 공백으로 분리 (예: "python 파이썬 개발" → ["python", "파이썬", "개발"])
+        keywords = [k.strip().lower() for k in career_interest.split() if k.strip()]
+        matched = []
+
+        for s in sessions:
+            title = (s.get("title") or "").lower()
+            desc = (s.get("description") or "").lower()
+            job = (s.get("mentorJob") or "").lower()
+            username = (s.get("mentorUsername") or "").lower()
+            searchable = f"{title} {desc} {job} {username}"
+
+            # 키워드 중 하나라도 매칭되면 포함
+            if any(kw in searchable for kw in keywords):
+                matched.append({
+                    "sessionId": s.get("sessionId"),
+                    "mentorName": s.get("mentorName"),
+                    "mentorTitle": s.get("mentorJob"),
+                    "topic": s.get("title"),
+                    "description": s.get("description"),
+                    "sessionDate": _format_date(s.get("sessionDate")),
+                })
+
+        if matched:
+            return {"success": True, "sessions": matched[:3], "total": len(matched)}
+
+        # 매칭 없음 → 조용히 스킵 (보조 에이전트는 결과 없으면 말 안함)
+        return {"success": True, "sessions": []}
 
     except Exception as e:
         logger.error(f"[Tools] 멘토링 검색 오류: {e}")
@@ -102,31 +106,32 @@ async def get_learning_path(career: str, user_id: int = None) -> dict:
     """
     try:
         if user_id:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{BACKEND_URL}/api/learning-paths/user/{user_id}")
-                if response.status_code == 200:
-                    paths = response.json()
-
-                    career_lower = career.lower()
-                    for path in paths:
-                        domain = (path.get("domain") or "").lower()
-                        if career_lower in domain or domain in career_lower:
-                            weeks = path.get("weeklySessions") or []
-                            topics = [w.get("topic") or f"{i+1}주차" for i, w in enumerate(weeks)]
-
-                            return {
-                                "success": True,
-                                "exists": True,
-                                "path": {
-                                    "pathId": path.get("pathId"),
-                                    "career": path.get("domain"),
-                                    "weeks": len(weeks),
-                                    "topics": topics[:6],
-                                    "status": path.get("status"),
-                                    "progress": path.get("progressRate", 0),
-                                },
-                                "message": "기존 학습 경로가 있어요. 이어서 학습할 수 있어요."
-                            }
+            paths = await get_tool_result_cache().get_or_fetch(
+                "learning_paths", {"user_id": user_id},
+                lambda: _fetch_learning_paths(user_id),
+                is_cacheable=lambda result: result is not None
+            )
+            if paths is not None:
+                career_lower = career.lower()
+                for path in paths:
+                    domain = (path.get("domain") or "").lower()
+                    if career_lower in domain or domain in career_lower:
+                        weeks = path.get("weeklySessions") or []
+                        topics = [w.get("topic") or f"{i+1}주차" for i, w in enumerate(weeks)]
+
+                        return {
+                            "success": True,
+                            "exists": True,
+                            "path": {
+                                "pathId": path.get("pathId"),
+                                "career": path.get("domain"),
+                                "weeks": len(weeks),
+                                "topics": topics[:6],
+                                "status": path.get("status"),
+                                "progress": path.get("progressRate", 0),
+                            },
+                            "message": "기존 학습 경로가 있어요. 이어서 학습할 수 있어요."
+                        }
 
         # 기존 경로가 없으면 새로 생성 가능
         return {
@@ -175,21 +180,25 @@ async def book_mentoring(session_id: int, user_id: int, reason: str = "") -> dic
         return {"success": False, "message": "로그인이 필요합니다."}
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                f"{BACKEND_URL}/api/mentoring-bookings",
-                json={"sessionId": session_id, "menteeId": user_id, "reason": reason or "AI 상담 중 예약"}
-            )
-            response.raise_for_status()
-            booking = response.json()
+        # 예약은 쓰기 요청이므로 캐시하지 않음 (커넥션 풀만 공유)
+        response = await get_tool_http_client().post(
+            f"{BACKEND_URL}/api/mentoring-bookings",
+            json={"sessionId": session_id, "menteeId": user_id, "reason": reason or "AI 상담 중 예약"}
+        )
+        response.raise_for_status()
+        booking = response.json()
+
+        # 챗봇 비서가 캐시해 둔 예약 목록을 바로 버림
+        from services.chatbot.assistant.tool_executor import get_assistant_tool_cache
+        get_assistant_tool_cache().invalidate_user(user_id)
 
-            return {
-                "success": True,
-                "bookingId": booking.get("bookingId"),
-                "mentorName": booking.get("mentorName"),
-                "sessionDate": booking.get("sessionDate"),
-                "message": "멘토링 예약 완료!"
-            }
+        return {
+            "success": True,
+            "bookingId": booking.get("bookingId"),
+            "mentorName": booking.get("mentorName"),
+            "sessionDate": booking.get("sessionDate"),
+            "message": "멘토링 예약 완료!"
+        }
 
     except httpx.HTTPStatusError as e:
         return {"success": False, "error": f"HTTP {e.response.status_code}"}
@@ -223,12 +232,7 @@ async def web_search(query: str) -> dict:
     Returns:
         검색 결과 목록 (제목, URL, 요약)
     """
-    import re
-    from datetime import datetime
-
     try:
-        import httpx
-
         serper_api_key = os.getenv("SERPER_API_KEY")
         if not serper_api_key:
             logger.warning("[Tools] SERPER_API_KEY 환경변수 미설정")
@@ -243,54 +247,15 @@ async def web_search(query: str) -> dict:
             if not re.search(r'\b20\d{2}\b', optimized_query):
                 optimized_query = f"{optimized_query} {current_year}"
 
-        logger.info(f"[Tools] Serper 검색: '{query}' → '{optimized_query}'")
-
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                "https://google.serper.dev/search",
-                headers={
-                    "X-API-KEY": serper_api_key,
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "q": optimized_query,
-                    "gl": "kr",
-                    "hl": "ko",
-                    "num": 5
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-
-        results = []
-
-        for item in data.get("organic", [])[:5]:
-            results.append({
-                "title": item.get("title", ""),
-                "url": item.get("link", ""),
-                "snippet": item.get("snippet", "")[:200] + "..." if item.get("snippet") else "",
-            })
-
-        if data.get("knowledgeGraph"):
-            kg = data["knowledgeGraph"]
-            if kg.get("description"):
-                results.insert(0, {
-                    "title": kg.get("title", "정보"),
-                    "url": kg.get("website", ""),
-                    "snippet": kg.get("description", "")[:200],
-                })
-
-        if results:
-            logger.info(f"[Tools] Serper 검색 성공: {len(results)}개 결과")
-            return {
-                "success": True,
-                "results": results,
-                "total": len(results),
-                "query": query,
-            }
-
-        logger.warning(f"[Tools] Serper 검색 결과 없음: {query}")
-        return {"success": False, "results": [], "message": "검색 결과 없음"}
+        # 같은 검색어는 사용자와 무관하게 결과 공유 (성공 결과만 캐시)
+        result = await get_tool_result_cache().get_or_fetch(
+            "web_search", {"q": optimized_query},
+            lambda: _serper_search(optimized_query, serper_api_key),
+            is_cacheable=lambda r: r.get("success") is True
+        )
+        if result.get("success"):
+            return {**result, "query": query}
+        return result
 
     except httpx.HTTPStatusError as e:
         logger.error(f"[Tools] Serper API 오류: {e.response.status_code}")
@@ -300,6 +265,75 @@ async def web_search(query: str) -> dict:
         return {"success": False, "error": str(e)}
 
 
+# ============================================================
+# 외부 API 호출 (결과는 tool_cache에서 도구별 TTL로 공유)
+# ============================================================
+
+async def _fetch_available_sessions() -> list:
+    """백엔드에서 예약 가능한 멘토링 세션 목록 조회"""
+    response = await get_tool_http_client().get(f"{BACKEND_URL}/api/mentoring-sessions/available")
+    response.raise_for_status()
+    return response.json()
+
+
+async def _fetch_learning_paths(user_id: int):
+    """백엔드에서 사용자의 학습 경로 목록 조회 (200이 아니면 None)"""
+    response = await get_tool_http_client().get(f"{BACKEND_URL}/api/learning-paths/user/{user_id}")
+    if response.status_code != 200:
+        return None
+    return response.json()
+
+
+async def _serper_search(optimized_query: str, serper_api_key: str) -> dict:
+    """Serper API 검색 → 결과 정리"""
+    logger.info(f"[Tools] Serper 검색: '{optimized_query}'")
+
+    response = await get_tool_http_client().post(
+        SERPER_URL,
+        headers={
+            "X-API-KEY": serper_api_key,
+            "Content-Type": "application/json"
+        },
+        json={
+            "q": optimized_query,
+            "gl": "kr",
+            "hl": "ko",
+            "num": 5
+        }
+    )
+    response.raise_for_status()
+    data = response.json()
+
+    results = []
+
+    for item in data.get("organic", [])[:5]:
+        results.append({
+            "title": item.get("title", ""),
+            "url": item.get("link", ""),
+            "snippet": item.get("snippet", "")[:200] + "..." if item.get("snippet") else "",
+        })
+
+    if data.get("knowledgeGraph"):
+        kg = data["knowledgeGraph"]
+        if kg.get("description"):
+            results.insert(0, {
+                "title": kg.get("title", "정보"),
+                "url": kg.get("website", ""),
+                "snippet": kg.get("description", "")[:200],
+            })
+
+    if results:
+        logger.info(f"[Tools] Serper 검색 성공: {len(results)}개 결과")
+        return {
+            "success": True,
+            "results": results,
+            "total": len(results),
+        }
+
+    logger.warning(f"[Tools] Serper 검색 결과 없음: {optimized_query}")
+    return {"success": False, "results": [], "message": "검색 결과 없음"}
+
+
 # ============================================================
 # Helper
 # ============================================================
@@ -0,0 +1,53 @@
+"""
+에이전트 진행 이벤트
+백그라운드 태스크로 실행 중인 에이전트의 ReAct 단계 진행을 태스크 이벤트로 발행합니다.
+(태스크 ID는 contextvar로 전달되어 LangGraph 노드 안에서도 그대로 사용 가능)
+"""
+import asyncio
+import logging
+from contextvars import ContextVar, Token
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_current_task_id: ContextVar[Optional[str]] = ContextVar("agent_task_id", default=None)
+
+# 도구 이름 → 사용자에게 보여줄 라벨
+TOOL_LABELS = {
+    "search_mentoring_sessions": "멘토링 검색",
+    "get_learning_path": "학습 경로 조회",
+    "search_job_postings": "채용 공고 검색",
+    "book_mentoring": "멘토링 예약",
+    "web_search": "웹 검색",
+}
+
+
+def bind_agent_task(task_id: str) -> Token:
+    """현재 컨텍스트에서 실행되는 에이전트의 태스크 ID 지정"""
+    return _current_task_id.set(task_id)
+
+
+def unbind_agent_task(token: Token):
+    _current_task_id.reset(token)
+
+
+async def emit_step(step: str, label: str, status: str, **fields):
+    """
+    ReAct 단계 이벤트 발행 (태스크로 실행 중이 아니면 무시)
+    필드는 AgentStep 모델과 동일: step, label, status, tool, thought, hasData
+
+    저장소 쓰기(동기 Redis)는 스레드에서 실행 - 에이전트 실행기 루프를 공유하는 다른 에이전트를 막지 않도록
+    """
+    task_id = _current_task_id.get()
+    if not task_id:
+        return
+
+    from services.agent_task_store import get_agent_task_store
+
+    try:
+        await asyncio.to_thread(get_agent_task_store().publish_event, task_id, {
+            "type": "step",
+            "step": {"step": step, "label": label, "status": status, **fields},
+        })
+    except Exception as e:
+        logger.warning(f"[Agent] 단계 이벤트 발행 실패: {e}")
@@ -3,7 +3,8 @@ import os
 import json
 from pathlib import Path
 from typing import Optional, List, Dict
-from agents import Agent, Runner, function_tool
+from agents import Agent, Runner, function_tool, set_default_openai_client
+from services.common.llm_clients import get_async_openai_client
 from services.database_service import DatabaseService
 from services.qnet_api_service import QnetApiService
 
@@ -11,6 +12,16 @@ from services.qnet_api_service import QnetApiService
 # 프롬프트 디렉토리 경로
 PROMPTS_DIR = Path(__file__).parent / "prompts"
 
+_gateway_client_set = False
+
+
+def _use_gateway_client():
+    """Agents SDK 호출도 LLM 게이트웨이를 거치도록 기본 클라이언트 지정 (처음 실행할 때 한 번)"""
+    global _gateway_client_set
+    if not _gateway_client_set:
+        set_default_openai_client(get_async_openai_client(), use_for_tracing=False)
+        _gateway_client_set = True
+
 
 def load_prompt(filename: str) -> str:
     """
@@ -730,6 +741,7 @@ async def run_job_agent(
             input_text = f"[user_id: {user_id}] {user_request}"
 
         # 에이전트 실행
+        _use_gateway_client()
         result = await Runner.run(agent, input=input_text)
 
         return {
@@ -784,6 +796,7 @@ def run_job_agent_sync(
         if user_id:
             input_text = f"[user_id: {user_id}] {user_request}"
 
+        _use_gateway_client()
         result = Runner.run_sync(agent, input=input_text)
 
         return {
@@ -874,6 +887,7 @@ async def run_job_agent_json(
         print(f"[JobAgentJSON] Input: {input_text[:200]}...")
 
         # 에이전트 실행
+        _use_gateway_client()
         result = await Runner.run(agent, input=input_text)
         output = result.final_output
 
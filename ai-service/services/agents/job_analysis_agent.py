@@ -6,7 +6,7 @@ import os
 from typing import List, Dict, Optional
 from collections import Counter
 from datetime import datetime, timedelta
-from openai import OpenAI
+from services.common.llm_clients import get_openai_client
 from services.database_service import DatabaseService
 
 
@@ -18,7 +18,7 @@ class JobAnalysisAgent:
         if not api_key:
             raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다.")
 
-        self.client = OpenAI(api_key=api_key)
+        self.client = get_openai_client()
         self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
         self.db_service = DatabaseService()
 
@@ -0,0 +1,124 @@
+"""
+에이전트 노드별 비용 지표
+LangGraph 노드(reason / action:<도구> / answer) 실행마다 지연 시간과 토큰 사용량을 기록합니다.
+cached_tokens는 공급자 측 프롬프트 캐시에서 재사용된 입력 토큰 수입니다.
+"""
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from services.common.metrics import get_metrics_registry, percentile
+
+
+def extract_token_usage(response) -> Dict[str, int]:
+    """LangChain 응답에서 토큰 사용량 추출 (prompt / completion / cached)"""
+    token_usage = (getattr(response, "response_metadata", None) or {}).get("token_usage") or {}
+    details = token_usage.get("prompt_tokens_details") or {}
+    return {
+        "prompt_tokens": token_usage.get("prompt_tokens", 0) or 0,
+        "completion_tokens": token_usage.get("completion_tokens", 0) or 0,
+        "cached_tokens": details.get("cached_tokens", 0) or 0,
+    }
+
+
+class AgentNodeMetrics:
+    """노드별 호출 수 / 오류 수 / 지연 시간 / 토큰 (최근 N건 분위수 + 누적 합계)"""
+
+    def __init__(self, window: int = 500):
+        self.window = window
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._totals: Dict[str, Dict[str, int]] = {}
+
+    def record(
+        self,
+        node: str,
+        latency: float,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        cached_tokens: int = 0,
+        error: bool = False
+    ):
+        with self._lock:
+            totals = self._totals.setdefault(node, {
+                "calls": 0, "errors": 0, "prompt_tokens": 0, "completion_tokens": 0, "cached_tokens": 0,
+            })
+            totals["calls"] += 1
+            totals["errors"] += int(error)
+            totals["prompt_tokens"] += prompt_tokens
+            totals["completion_tokens"] += completion_tokens
+            totals["cached_tokens"] += cached_tokens
+            self._latencies.setdefault(node, deque(maxlen=self.window)).append(latency)
+
+    def timer(self, node: str) -> "NodeTimer":
+        return NodeTimer(self, node)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """노드별 지표 (지연 시간은 초)"""
+        with self._lock:
+            result = {}
+            for node, totals in self._totals.items():
+                latencies = sorted(self._latencies.get(node, []))
+                calls = totals["calls"] or 1
+                result[node] = {
+                    **totals,
+                    "latency_p50": percentile(latencies, 0.5),
+                    "latency_p95": percentile(latencies, 0.95),
+                    "avg_prompt_tokens": round(totals["prompt_tokens"] / calls, 1),
+                    "avg_completion_tokens": round(totals["completion_tokens"] / calls, 1),
+                    "prompt_cache_ratio": round(totals["cached_tokens"] / totals["prompt_tokens"], 3)
+                    if totals["prompt_tokens"] else 0.0,
+                }
+            return result
+
+
+class NodeTimer:
+    """노드 실행 하나의 측정 (finish는 한 번만 기록)"""
+
+    def __init__(self, metrics: AgentNodeMetrics, node: str):
+        self.metrics = metrics
+        self.node = node
+        self.started = time.monotonic()
+        self._recorded = False
+
+    def finish(self, response=None, error: bool = False) -> Dict[str, int]:
+        usage = extract_token_usage(response) if response is not None else {
+            "prompt_tokens": 0, "completion_tokens": 0, "cached_tokens": 0,
+        }
+        if not self._recorded:
+            self._recorded = True
+            self.metrics.record(self.node, time.monotonic() - self.started, error=error, **usage)
+        return usage
+
+
+# 싱글톤 인스턴스
+_agent_node_metrics: Optional[AgentNodeMetrics] = None
+
+
+def get_agent_node_metrics() -> AgentNodeMetrics:
+    """에이전트 노드 지표 싱글톤"""
+    global _agent_node_metrics
+    if _agent_node_metrics is None:
+        _agent_node_metrics = AgentNodeMetrics()
+    return _agent_node_metrics
+
+
+def _collect_node_metrics():
+    """/metrics 수집기 - 에이전트 노드별 호출 / 오류 / 토큰 누적 (지연 시간은 langgraph span 히스토그램)"""
+    if _agent_node_metrics is None:
+        return []
+    with _agent_node_metrics._lock:
+        totals = {node: dict(values) for node, values in _agent_node_metrics._totals.items()}
+    registry = get_metrics_registry()
+    calls = registry.family("agent_node_calls_total", "counter", "에이전트 노드 실행 수 (result=ok|error)")
+    tokens = registry.family("agent_node_tokens_total", "counter", "에이전트 노드 토큰 사용량")
+    for node, values in totals.items():
+        calls.add(values["calls"] - values["errors"], node=node, result="ok")
+        calls.add(values["errors"], node=node, result="error")
+        for token_type in ("prompt", "completion", "cached"):
+            tokens.add(values[f"{token_type}_tokens"], node=node, type=token_type)
+    return [calls, tokens]
+
+
+get_metrics_registry().register_collector("agent_nodes", _collect_node_metrics)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import hashlib
 import json
 from dataclasses import dataclass, field, asdict
-from typing import Any, Dict, List, Mapping, MutableMapping
+from typing import Any, Dict, List, Mapping, MutableMapping, Optional
 
+from .tool_cache import ToolResultCache, get_tool_result_cache
 from .tools.profile_document_tool import ProfileDocumentTool
 from .tools.summarizer_tool import ConversationHistory, SummarizerTool
 from services.bigfive.bigfive_service import BigFiveService
@@ -55,17 +57,28 @@ class PersonalityAgentOutput:
         return payload
 
 
+def _history_hash(messages: List[Dict[str, str]]) -> str:
+    raw = json.dumps(messages, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
 class PersonalityAgent:
     """
     Agent #1 implementation that orchestrates summarization, Big Five, MBTI, and document building.
+
+    LLM stage outputs (summary, Big Five) are cached by a hash of their exact inputs, so a rerun
+    with unchanged history and survey makes no LLM calls. When only new messages were appended
+    to a session, the previous running summary is updated with just those messages.
     """
 
-    def __init__(self, model: str = "gpt-4o-mini") -> None:
+    def __init__(self, model: str = "gpt-4o-mini", cache: Optional[ToolResultCache] = None) -> None:
         self.model = model
         self.summarizer_tool = SummarizerTool(model=model)
         self.profile_document_tool = ProfileDocumentTool()
         self.bigfive = BigFiveService()
         self.mbti = MBTIService()
+        self.cache = cache or get_tool_result_cache()
+        self.stats = {"summary_full": 0, "summary_incremental": 0, "bigfive_calls": 0}
 
         self.agent = OpenAIAgent(
             instructions=(
@@ -79,16 +92,17 @@ class PersonalityAgent:
         )
 
     async def run(self, bundle: PersonalityAgentInput) -> Dict[str, Any]:
-        summary_result = await self.summarizer_tool.run(
-            conversation_history=bundle.conversation_history,
-            survey_data=bundle.survey_data or {},
-            user_profile=bundle.user_profile or {},
-        )
+        summary_result = await self._summarize(bundle)
 
         summary_text = summary_result.get("summary", "").strip()
         document = self._build_analysis_document(bundle, summary_result, summary_text)
 
-        big_five_raw = await self.bigfive.analyze_bigfive(document)
+        big_five_raw = await self.cache.get_or_fetch(
+            "personality_bigfive",
+            {"model": self.bigfive.model, "document": document},
+            lambda: self._analyze_bigfive(document),
+            is_cacheable=lambda raw: bool(self._safe_json(raw)),
+        )
         big_five = self._safe_json(big_five_raw)
         
         # Ensure scores are integers
@@ -125,6 +139,87 @@ class PersonalityAgent:
             "embedding_document": embedding_doc,
         }
 
+    async def _summarize(self, bundle: PersonalityAgentInput) -> Dict[str, Any]:
+        messages = self.summarizer_tool.normalize_history(bundle.conversation_history)
+        survey = dict(bundle.survey_data or {})
+        profile = dict(bundle.user_profile or {})
+        params = {
+            "model": self.model,
+            "version": self.summarizer_tool.prompt_version,
+            "history": messages,
+            "survey": survey,
+            "profile": profile,
+        }
+
+        async def summarize() -> Dict[str, Any]:
+            running = self._load_running_summary(bundle, messages)
+            if running is not None:
+                self.stats["summary_incremental"] += 1
+                return await self.summarizer_tool.run_incremental(
+                    previous_summary=running["result"],
+                    new_messages=messages[running["covered"]:],
+                    survey_data=survey,
+                    user_profile=profile,
+                )
+            self.stats["summary_full"] += 1
+            return await self.summarizer_tool.run(
+                conversation_history=bundle.conversation_history,
+                survey_data=survey,
+                user_profile=profile,
+            )
+
+        result = await self.cache.get_or_fetch(
+            "personality_summary",
+            params,
+            summarize,
+            is_cacheable=lambda value: bool(str(value.get("summary") or "").strip()),
+        )
+        self._save_running_summary(bundle, messages, result)
+        return result
+
+    async def _analyze_bigfive(self, document: str) -> str:
+        self.stats["bigfive_calls"] += 1
+        return await self.bigfive.analyze_bigfive(document)
+
+    def _running_summary_key(self, bundle: PersonalityAgentInput) -> Optional[Dict[str, Any]]:
+        # Incremental updates need a stable session and an ordered message list.
+        if not bundle.session_id or isinstance(bundle.conversation_history, str):
+            return None
+        return {
+            "session_id": bundle.session_id,
+            "model": self.model,
+            "version": self.summarizer_tool.prompt_version,
+        }
+
+    def _load_running_summary(
+        self, bundle: PersonalityAgentInput, messages: List[Dict[str, str]]
+    ) -> Optional[Dict[str, Any]]:
+        key = self._running_summary_key(bundle)
+        if key is None:
+            return None
+        state = self.cache.get("personality_running_summary", key)
+        if not state:
+            return None
+        covered = int(state.get("covered") or 0)
+        # Only reuse it when the summarized messages are an unchanged prefix of the current history.
+        if covered <= 0 or covered > len(messages):
+            return None
+        if state.get("prefix_hash") != _history_hash(messages[:covered]):
+            return None
+        return state
+
+    def _save_running_summary(
+        self, bundle: PersonalityAgentInput, messages: List[Dict[str, str]], result: Mapping[str, Any]
+    ) -> None:
+        key = self._running_summary_key(bundle)
+        if key is None or not messages:
+            return
+        self.cache.set(
+            "personality_running_summary",
+            key,
+            {"covered": len(messages), "prefix_hash": _history_hash(messages), "result": dict(result)},
+        )
+
     def _build_analysis_document(
         self,
         bundle: PersonalityAgentInput,
@@ -1,6 +1,12 @@
 """
 DreamPath ReAct 에이전트 프롬프트
 """
+import os
+
+from services.conversation_context import get_conversation_context_manager, select_recent
+
+# 추론 컨텍스트에 포함할 최근 대화 토큰 예산
+REASONING_CONTEXT_TOKENS = int(os.getenv("REASONING_CONTEXT_TOKENS", 800))
 
 # ============================================================
 # ReAct 추론 프롬프트 (reason 노드에서 사용)
@@ -127,19 +133,28 @@ def _summarize_tool_output(tool_name: str, output: dict) -> str:
 
 
 # reason 노드용: 최근 대화 + 도구 실행 결과를 컨텍스트로 구성
-def format_conversation_for_reasoning(messages: list, tool_history: list) -> str:
+def format_conversation_for_reasoning(messages: list, tool_history: list, session_id: str = None) -> str:
     """
     추론을 위한 대화 컨텍스트 포맷팅
 
     원칙:
-    - 최근 3개 메시지 포함 (토큰 절약, 프롬프트에서 맥락 활용 지시)
+    - 최근 3개 메시지까지, 토큰 예산 이내로 포함 (토큰 절약, 프롬프트에서 맥락 활용 지시)
     - "이거", "그거" 같은 지시어 해석을 위해 직전 맥락 필요
+    - 그 이전 대화는 상담 세션 요약으로 대체 (요약 생성은 ChatService가 담당, 여기서는 조회만)
     - 도구 결과는 현재 턴의 것만 포함
     """
-    lines = ["## 최근 대화"]
+    lines = []
+
+    summary = get_conversation_context_manager().get_summary("counseling", session_id)
+    if summary:
+        lines.append("## 이전 대화 요약")
+        lines.append(summary)
+        lines.append("")
+
+    lines.append("## 최근 대화")
 
-    recent_messages = []
-    for msg in messages[-3:]:
+    conversation = []
+    for msg in messages:
         if isinstance(msg, dict):
             role = msg.get("role")
             content = msg.get("content", "")
@@ -150,11 +165,11 @@ def format_conversation_for_reasoning(messages: list, tool_history: list) -> str
             continue
 
         if content:
-            role_label = "학생" if role == "user" else "AI"
-            recent_messages.append(f"{role_label}: {content}")
+            conversation.append({"role": role, "content": content})
 
-    for msg in recent_messages:
-        lines.append(msg)
+    for msg in select_recent(conversation, REASONING_CONTEXT_TOKENS, max_messages=3):
+        role_label = "학생" if msg["role"] == "user" else "AI"
+        lines.append(f"{role_label}: {msg['content']}")
 
     if tool_history:
         lines.append("\n" + "━" * 40)
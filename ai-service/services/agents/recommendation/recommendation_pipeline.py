@@ -1,6 +1,6 @@
 import json
 import logging
-from langchain_openai import ChatOpenAI
+from services.common.llm_clients import get_chat_model
 from langchain_core.messages import SystemMessage, HumanMessage
 from typing import Any, Dict, Optional
 
@@ -10,7 +10,7 @@ def generate_ai_reasons(user_summary, items, item_type="직업"):
     GPT-4o-mini를 사용하여 각 추천 항목에 대한 개인화된 추천 사유를 생성합니다.
     """
     try:
-        llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.7)
+        llm = get_chat_model(model="gpt-4o-mini", temperature=0.7)
 
         # Prepare item list string
         item_list_str = ""
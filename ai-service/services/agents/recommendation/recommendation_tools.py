@@ -3,13 +3,15 @@ from services.vector.pinecone_service import PineconeVectorService
 from services.db.job_repository import JobRepository
 from services.db.major_repository import MajorRepository
 import os
-from openai import OpenAI
+from services.common.llm_clients import get_openai_client
 import numpy as np
+from services.service_registry import lazy_service
 
-pinecone = PineconeVectorService()
-job_repo = JobRepository()
-major_repo = MajorRepository()
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# 외부 클라이언트는 처음 사용할 때 생성 (import 시점에 Pinecone/Supabase/OpenAI 연결 안 함)
+pinecone = lazy_service("recommendation.pinecone", PineconeVectorService)
+job_repo = lazy_service("recommendation.job_repo", JobRepository)
+major_repo = lazy_service("recommendation.major_repo", MajorRepository)
+client = lazy_service("recommendation.openai", get_openai_client)
 
 from pydantic import BaseModel, ConfigDict
 from typing import List, Dict, Any, Optional
@@ -0,0 +1,259 @@
+"""
+에이전트 외부 도구 결과 캐시 (web_search, 멘토링 세션, 학습 경로, 성향 분석 단계 결과)
+같은 검색어/조회가 여러 사용자에게서 반복되므로 결과를 도구별 TTL 동안 공유합니다.
+
+- Redis에 저장해 여러 워커가 공유 (Redis 없으면 인메모리)
+- single-flight: 같은 키의 동시 조회는 하나만 실행하고 나머지는 결과를 기다림
+- 성공 결과만 캐시 (오류/결과 없음은 다음 호출에서 다시 조회)
+- 외부 호출용 HTTP 클라이언트는 이벤트 루프별로 하나를 공유 (keep-alive 커넥션 풀)
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import httpx
+import redis
+
+from services.common.metrics import get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+# 도구별 캐시 유지 시간 (초)
+TOOL_CACHE_TTLS = {
+    "web_search": int(os.getenv("WEB_SEARCH_CACHE_TTL", 6 * 60 * 60)),
+    "mentoring_sessions": int(os.getenv("MENTORING_SESSIONS_CACHE_TTL", 60)),
+    "learning_paths": int(os.getenv("LEARNING_PATHS_CACHE_TTL", 30)),
+    # 성향 분석 파이프라인 단계 결과 (입력이 같으면 결과도 같으므로 길게 유지)
+    "personality_summary": int(os.getenv("PERSONALITY_STAGE_CACHE_TTL", 7 * 24 * 60 * 60)),
+    "personality_bigfive": int(os.getenv("PERSONALITY_STAGE_CACHE_TTL", 7 * 24 * 60 * 60)),
+    # 세션별 누적 요약 (다음 실행에서 새 메시지만 요약에 반영)
+    "personality_running_summary": int(os.getenv("PERSONALITY_RUNNING_SUMMARY_TTL", 30 * 24 * 60 * 60)),
+}
+
+TOOL_HTTP_TIMEOUT = float(os.getenv("AGENT_TOOL_HTTP_TIMEOUT", 10))
+
+_http_lock = threading.Lock()
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def get_tool_http_client() -> httpx.AsyncClient:
+    """현재 이벤트 루프의 공유 HTTP 클라이언트 (커넥션은 생성한 루프에서만 사용 가능)"""
+    loop = asyncio.get_running_loop()
+    with _http_lock:
+        client = _http_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=TOOL_HTTP_TIMEOUT,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60),
+            )
+            _http_clients[loop] = client
+        return client
+
+
+class ToolResultCache:
+    """도구 결과 캐시 (Redis + 인메모리 폴백, single-flight)"""
+
+    KEY_PREFIX = "agent_tool_cache"
+
+    def __init__(self, ttls: Dict[str, int] = None, local_cache_size: int = 500, use_redis: bool = True):
+        self.ttls = {**TOOL_CACHE_TTLS, **(ttls or {})}
+        self.local_cache_size = local_cache_size
+        self.redis_client = None
+        self.enabled = False
+
+        self._lock = threading.Lock()
+        self._local: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        # (이벤트 루프, 키) → 진행 중인 조회
+        self._inflight: Dict[Tuple[int, str], asyncio.Future] = {}
+        self._stats = {"hits": 0, "misses": 0, "coalesced": 0, "errors": 0}
+
+        if use_redis:
+            redis_host = os.getenv("REDIS_HOST", "localhost")
+            redis_port = int(os.getenv("REDIS_PORT", 6379))
+            redis_db = int(os.getenv("REDIS_DB", 0))
+
+            try:
+                self.redis_client = redis.Redis(
+                    host=redis_host,
+                    port=redis_port,
+                    db=redis_db,
+                    decode_responses=True,
+                    socket_timeout=5,
+                    socket_connect_timeout=5
+                )
+                self.redis_client.ping()
+                self.enabled = True
+                print(f"[ToolResultCache] Redis 연결 성공: {redis_host}:{redis_port}")
+            except Exception as e:
+                print(f"[ToolResultCache] Redis 연결 실패 (인메모리 캐시 사용): {e}")
+                self.redis_client = None
+
+    def _key(self, tool: str, params: Dict[str, Any]) -> str:
+        raw = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+        return f"{self.KEY_PREFIX}:{tool}:{hashlib.sha1(raw.encode()).hexdigest()}"
+
+    async def get_or_fetch(
+        self,
+        tool: str,
+        params: Dict[str, Any],
+        fetch: Callable[[], Awaitable[Any]],
+        is_cacheable: Callable[[Any], bool] = None
+    ) -> Any:
+        """
+        캐시된 결과 반환, 없으면 fetch 실행 후 저장
+
+        Args:
+            tool: 도구(캐시 구분) 이름 - TTL 조회에 사용
+            params: 캐시 키를 만들 입력값
+            fetch: 실제 조회 코루틴 함수
+            is_cacheable: 결과 저장 여부 (기본: 항상 저장)
+        """
+        key = self._key(tool, params)
+        found, value = self._get_local(key)
+        if not found and self.enabled:
+            # 동기 Redis 조회는 스레드에서 (루프를 공유하는 다른 에이전트를 막지 않도록)
+            found, value = await asyncio.to_thread(self._get_redis, key)
+        if found:
+            self._count("hits")
+            return value
+
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        with self._lock:
+            inflight = self._inflight.get(flight_key)
+            if inflight is None:
+                future = loop.create_future()
+                self._inflight[flight_key] = future
+        if inflight is not None:
+            self._count("coalesced")
+            await asyncio.wait({inflight})
+            if inflight.cancelled():
+                # 먼저 시작한 조회가 취소됨 → 직접 다시 조회
+                return await self.get_or_fetch(tool, params, fetch, is_cacheable)
+            return inflight.result()
+
+        self._count("misses")
+        try:
+            value = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # 기다리는 쪽이 없어도 경고가 나지 않도록
+            raise
+        else:
+            if is_cacheable is None or is_cacheable(value):
+                ttl = self.ttls.get(tool, 60)
+                self._set_local(key, value, ttl)
+                if self.enabled:
+                    await asyncio.to_thread(self._set_redis, key, value, ttl)
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(flight_key, None)
+
+    def get(self, tool: str, params: Dict[str, Any]) -> Optional[Any]:
+        """캐시된 값 조회 (없으면 None)"""
+        found, value = self._get(self._key(tool, params))
+        return value if found else None
+
+    def set(self, tool: str, params: Dict[str, Any], value: Any):
+        """도구 TTL로 값 저장"""
+        self._set(self._key(tool, params), value, self.ttls.get(tool, 60))
+
+    def _get(self, key: str) -> Tuple[bool, Any]:
+        found, value = self._get_local(key)
+        if not found and self.enabled:
+            found, value = self._get_redis(key)
+        return found, value
+
+    def _get_local(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is not None:
+                if entry[0] >= time.monotonic():
+                    self._local.move_to_end(key)
+                    return True, entry[1]
+                del self._local[key]
+        return False, None
+
+    def _get_redis(self, key: str) -> Tuple[bool, Any]:
+        try:
+            raw = self.redis_client.get(key)
+            if raw is not None:
+                value = json.loads(raw)
+                ttl = self.redis_client.ttl(key)
+                if ttl and ttl > 0:
+                    self._set_local(key, value, ttl)
+                return True, value
+        except Exception as e:
+            self._count("errors")
+            logger.warning(f"[ToolResultCache] Redis 조회 실패: {e}")
+        return False, None
+
+    def _set(self, key: str, value: Any, ttl: int):
+        self._set_local(key, value, ttl)
+        if self.enabled:
+            self._set_redis(key, value, ttl)
+
+    def _set_redis(self, key: str, value: Any, ttl: int):
+        if ttl <= 0:
+            return
+        try:
+            self.redis_client.setex(key, ttl, json.dumps(value, ensure_ascii=False, default=str))
+        except Exception as e:
+            self._count("errors")
+            logger.warning(f"[ToolResultCache] Redis 저장 실패: {e}")
+
+    def _set_local(self, key: str, value: Any, ttl: int):
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._local[key] = (time.monotonic() + ttl, value)
+            self._local.move_to_end(key)
+            while len(self._local) > self.local_cache_size:
+                self._local.popitem(last=False)
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "local_entries": len(self._local), "redis": self.enabled}
+
+
+# 싱글톤 인스턴스
+_tool_result_cache: Optional[ToolResultCache] = None
+
+
+def get_tool_result_cache() -> ToolResultCache:
+    """도구 결과 캐시 싱글톤"""
+    global _tool_result_cache
+    if _tool_result_cache is None:
+        _tool_result_cache = ToolResultCache()
+    return _tool_result_cache
+
+
+def _collect_tool_cache_metrics():
+    """/metrics 수집기 - 도구 결과 캐시 적중률 (캐시가 만들어진 뒤에만)"""
+    if _tool_result_cache is None:
+        return []
+    stats = _tool_result_cache.stats()
+    registry = get_metrics_registry()
+    families = registry.cache_families("tool_result", stats["hits"], stats["misses"])
+    coalesced = registry.family("cache_coalesced_total", "counter", "진행 중인 조회에 합류한 요청 수 (single-flight)")
+    families.append(coalesced.add(stats["coalesced"], cache="tool_result"))
+    return families
+
+
+get_metrics_registry().register_collector("tool_result_cache", _collect_tool_cache_metrics)
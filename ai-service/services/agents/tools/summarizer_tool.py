@@ -1,12 +1,19 @@
-import asyncio
 import json
 from typing import Any, Dict, List, Mapping, Sequence, Union
 
-from openai import OpenAI
+from services.common.llm_clients import get_async_openai_client
 
 
 ConversationHistory = Union[str, Sequence[Mapping[str, Any]]]
 
+SUMMARY_SCHEMA = """{
+  "summary": "짧은 요약",
+  "strengths": ["강점1", "강점2"],
+  "risks": ["위험1", "위험2"],
+  "goals": ["목표1", "목표2"],
+  "values": ["가치1", "가치2"]
+}"""
+
 
 class SummarizerTool:
     """
@@ -14,6 +21,8 @@ class SummarizerTool:
     """
 
     name = "personality_conversation_summarizer"
+    # Bump when the prompts change so cached summaries are not reused.
+    prompt_version = "1"
     description = (
         "Summarizes the coaching conversation and survey answers into a concise persona "
         "summary along with strengths, risks, goals, and core values."
@@ -46,7 +55,7 @@ class SummarizerTool:
     }
 
     def __init__(self, model: str = "gpt-4o-mini") -> None:
-        self.client = OpenAI()
+        self.client = get_async_openai_client()
         self.model = model
 
     def definition(self) -> Dict[str, Any]:
@@ -84,17 +93,67 @@ class SummarizerTool:
 {profile_block}
 
 아래 JSON 스키마를 반드시 따르세요:
-{{
-  "summary": "짧은 요약",
-  "strengths": ["강점1", "강점2"],
-  "risks": ["위험1", "위험2"],
-  "goals": ["목표1", "목표2"],
-  "values": ["가치1", "가치2"]
-}}
+{SUMMARY_SCHEMA}
+"""
+        return await self._complete(prompt)
+
+    async def run_incremental(
+        self,
+        *,
+        previous_summary: Mapping[str, Any],
+        new_messages: ConversationHistory,
+        survey_data: Mapping[str, Any] | None = None,
+        user_profile: Mapping[str, Any] | None = None,
+    ) -> Dict[str, Any]:
+        """
+        Updates a previous summary with only the messages that arrived since it was made.
+        """
+        previous_block = json.dumps(dict(previous_summary), ensure_ascii=False, indent=2)
+        formatted_history = self._format_history(new_messages)
+        survey_block = self._format_structured_block("Survey Data", survey_data or {})
+        profile_block = self._format_structured_block("Existing Profile", user_profile or {})
+
+        prompt = f"""
+다음은 지금까지의 진로 상담 대화를 요약한 결과와, 그 이후에 새로 이어진 대화입니다.
+기존 요약의 내용을 유지하면서 새 대화에서 드러난 심리와 동기, 위험 신호를 반영해 요약을 갱신하세요.
+기존 요약과 새 대화가 충돌하면 새 대화를 우선하세요.
+
+기존 요약:
+{previous_block}
+
+새 대화 내용:
+{formatted_history}
+
+설문 요약:
+{survey_block}
+
+기존 프로필:
+{profile_block}
+
+아래 JSON 스키마를 반드시 따르세요:
+{SUMMARY_SCHEMA}
 """
+        return await self._complete(prompt)
+
+    def normalize_history(self, history: ConversationHistory) -> List[Dict[str, str]]:
+        """
+        Canonical message list used for cache keys and incremental prefix checks.
+        """
+        if not history:
+            return []
+        if isinstance(history, str):
+            return [{"role": "transcript", "content": history.strip()}] if history.strip() else []
+
+        messages: List[Dict[str, str]] = []
+        for message in history:
+            role = (message.get("role") or message.get("speaker") or "user").strip()
+            content = str(message.get("content") or message.get("message") or "").strip()
+            if content:
+                messages.append({"role": role.lower(), "content": content})
+        return messages
 
-        response = await asyncio.to_thread(
-            self.client.chat.completions.create,
+    async def _complete(self, prompt: str) -> Dict[str, Any]:
+        response = await self.client.chat.completions.create(
             model=self.model,
             temperature=0.2,
             messages=[
@@ -1,5 +1,5 @@
 import os
-from openai import OpenAI
+from services.common.llm_clients import get_async_openai_client
 from dotenv import load_dotenv
 from config import settings
 
@@ -11,7 +11,8 @@ class BigFiveService:
         api_key = os.getenv('OPENAI_API_KEY')
         if not api_key:
             raise RuntimeError('OPENAI_API_KEY 필요')
-        self.client = OpenAI(api_key=api_key)
+        # 비동기 메서드에서 호출하므로 비동기 클라이언트 사용 (이벤트 루프를 막지 않음)
+        self.client = get_async_openai_client()
         self.model = settings.OPENAI_MODEL
 
     async def analyze_bigfive(self, document: str):
@@ -34,7 +35,7 @@ class BigFiveService:
 ---
 '''
 
-        resp = self.client.chat.completions.create(
+        resp = await self.client.chat.completions.create(
             model=self.model,
             messages=[
                 {"role": "system", "content": "당신은 Big Five 성향 분석 전문가입니다."},
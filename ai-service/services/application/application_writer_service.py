@@ -7,7 +7,7 @@ import os
 import json
 import logging
 from typing import Dict, List, Optional, Any
-from openai import OpenAI
+from services.common.llm_clients import get_openai_client
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +16,7 @@ class ApplicationWriterService:
     """AI-powered application writing assistant"""
 
     def __init__(self):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = get_openai_client()
         self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 
     async def generate_cover_letter(
@@ -1,19 +1,60 @@
 """
 진로 분석 서비스
 대화 내용을 기반으로 감정, 성향, 흥미를 분석하고 진로를 추천합니다.
+
+분석 단계는 의존 관계 그래프로 실행됩니다.
+- 1단계 (대화 내용만 필요, 동시 실행): 감정 / 성향 / 흥미
+- 2단계 (1단계 결과 필요, 동시 실행): 종합 분석 / 진로 추천
+단계별 타임아웃을 넘기거나 실패한 단계는 기본값으로 채워 부분 결과를 반환합니다.
 """
+import asyncio
 import json
-from typing import List, Optional
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from services.openai_service import OpenAIService
 from services.database_service import DatabaseService
 
+logger = logging.getLogger(__name__)
+
+# 분석용 OpenAI 호출 전용 스레드 풀 (기본 executor를 다른 작업과 나눠 쓰지 않도록)
+ANALYSIS_MAX_WORKERS = int(os.getenv("ANALYSIS_MAX_WORKERS", 8))
+ANALYSIS_STAGE_TIMEOUT = float(os.getenv("ANALYSIS_STAGE_TIMEOUT", 60))
+
+_analysis_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_analysis_executor() -> ThreadPoolExecutor:
+    global _analysis_executor
+    if _analysis_executor is None:
+        _analysis_executor = ThreadPoolExecutor(max_workers=ANALYSIS_MAX_WORKERS, thread_name_prefix="career-analysis")
+    return _analysis_executor
+
+
+@dataclass
+class AnalysisStage:
+    """분석 그래프의 단계 하나"""
+    name: str
+    run: Callable[[Dict[str, Any]], Awaitable[Any]]  # 이전 단계 결과 → 이 단계 결과
+    fallback: Callable[[], Any]  # 실패/시간 초과 시 사용할 기본값
+    depends_on: Tuple[str, ...] = ()
+
 
 class CareerAnalysisService:
     """진로 분석 서비스"""
     
-    def __init__(self, openai_service: OpenAIService, db_service: Optional[DatabaseService] = None):
+    def __init__(
+        self,
+        openai_service: OpenAIService,
+        db_service: Optional[DatabaseService] = None,
+        stage_timeout: float = ANALYSIS_STAGE_TIMEOUT
+    ):
         self.openai_service = openai_service
         self.db_service = db_service or DatabaseService()
+        self.stage_timeout = stage_timeout
     
     async def analyze_session(
         self, 
@@ -28,36 +69,52 @@ class CareerAnalysisService:
             conversation_history: 대화 내용
         
         Returns:
-            분석 결과 딕셔너리
+            분석 결과 딕셔너리 (단계별 소요 시간 / 실패 단계 포함)
         """
-        # 감정 분석
-        emotion_analysis = await self.analyze_emotion(conversation_history)
-        
-        # 성향 분석
-        personality_analysis = await self.analyze_personality(conversation_history)
-        
-        # 흥미 분석
-        interest_analysis = await self.analyze_interest(conversation_history)
-        
-        # 종합 분석
-        comprehensive_analysis = await self.generate_comprehensive_analysis(
-            emotion_analysis, personality_analysis, interest_analysis
-        )
-        
-        # 진로 추천
-        career_recommendations = await self.generate_career_recommendations(
-            emotion_analysis, personality_analysis, interest_analysis
-        )
+        stages = [
+            # 감정 / 성향 / 흥미 분석 (대화 내용만 필요)
+            AnalysisStage("emotion", lambda _: self.analyze_emotion(conversation_history),
+                          lambda: self._parse_emotion_analysis("")),
+            AnalysisStage("personality", lambda _: self.analyze_personality(conversation_history),
+                          lambda: self._parse_personality_analysis("")),
+            AnalysisStage("interest", lambda _: self.analyze_interest(conversation_history),
+                          lambda: self._parse_interest_analysis("")),
+            # 종합 분석 / 진로 추천 (위 세 결과 필요)
+            AnalysisStage("comprehensive", lambda r: self.generate_comprehensive_analysis(
+                r["emotion"], r["personality"], r["interest"]
+            ), lambda: "종합 분석을 생성하지 못했습니다. 잠시 후 다시 시도해주세요.",
+                depends_on=("emotion", "personality", "interest")),
+            AnalysisStage("recommendations", lambda r: self.generate_career_recommendations(
+                r["emotion"], r["personality"], r["interest"]
+            ), lambda: [], depends_on=("emotion", "personality", "interest")),
+        ]
+
+        started = time.monotonic()
+        results, timings, failed = await self._run_stages(stages)
+        timings["total"] = round(time.monotonic() - started, 3)
+
+        if len(failed) == len(stages):
+            raise Exception(f"모든 분석 단계가 실패했습니다: {failed[stages[0].name]}")
 
         analysis_result = {
             "sessionId": session_id,
-            "emotion": emotion_analysis,
-            "personality": personality_analysis,
-            "interest": interest_analysis,
-            "comprehensiveAnalysis": comprehensive_analysis,
-            "recommendedCareers": career_recommendations
+            "emotion": results["emotion"],
+            "personality": results["personality"],
+            "interest": results["interest"],
+            "comprehensiveAnalysis": results["comprehensive"],
+            "recommendedCareers": results["recommendations"],
+            "stageTimings": timings,
+            "partial": bool(failed),
+            "failedStages": list(failed),
         }
+        logger.info(f"[CareerAnalysisService] 분석 완료 (sessionId={session_id}, timings={timings}"
+                    f"{', failed=' + str(list(failed)) if failed else ''})")
         
+        # 일부 단계가 기본값으로 채워진 결과는 저장하지 않음 (나중에 읽을 때 실제 분석과 구분할 수 없으므로)
+        if failed:
+            logger.info(f"[CareerAnalysisService] 부분 결과라 저장하지 않음 (sessionId={session_id})")
+            return analysis_result
+
         # DB 저장
         try:
             self.db_service.save_career_analysis(
@@ -65,11 +122,56 @@ class CareerAnalysisService:
                 user_id=None,
                 analysis_data=analysis_result
             )
-            print(f"[CareerAnalysisService] 분석 결과 저장 완료 (sessionId={session_id})")
+            logger.info(f"[CareerAnalysisService] 분석 결과 저장 완료 (sessionId={session_id})")
         except Exception as e:
-            print(f"[CareerAnalysisService] 분석 결과 저장 실패 (sessionId={session_id}): {e}")
+            logger.warning(f"[CareerAnalysisService] 분석 결과 저장 실패 (sessionId={session_id}): {e}")
         
         return analysis_result
+
+    async def _run_stages(
+        self, stages: List[AnalysisStage]
+    ) -> Tuple[Dict[str, Any], Dict[str, float], Dict[str, str]]:
+        """
+        분석 그래프 실행 - 의존 단계가 끝나는 즉시 다음 단계 시작
+
+        Returns:
+            (단계별 결과, 단계별 소요 시간(초), 실패 단계 → 오류 메시지)
+        """
+        results: Dict[str, Any] = {}
+        timings: Dict[str, float] = {}
+        failed: Dict[str, str] = {}
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run(stage: AnalysisStage):
+            # 의존 단계는 실패해도 기본값을 남기므로 예외 없이 끝남
+            await asyncio.gather(*(tasks[name] for name in stage.depends_on))
+            stage_started = time.monotonic()
+            try:
+                results[stage.name] = await asyncio.wait_for(stage.run(results), timeout=self.stage_timeout)
+            except asyncio.TimeoutError:
+                failed[stage.name] = f"시간 초과 ({self.stage_timeout:.0f}초)"
+                results[stage.name] = stage.fallback()
+            except Exception as e:
+                failed[stage.name] = str(e)
+                results[stage.name] = stage.fallback()
+            timings[stage.name] = round(time.monotonic() - stage_started, 3)
+            if stage.name in failed:
+                logger.warning(f"[CareerAnalysisService] {stage.name} 단계 실패 (기본값 사용): {failed[stage.name]}")
+
+        for stage in stages:
+            tasks[stage.name] = asyncio.create_task(run(stage))
+        await asyncio.gather(*tasks.values())
+        return results, timings, failed
+
+    async def _call_openai(self, messages: List[Dict[str, str]], analysis_type: str) -> str:
+        """동기 OpenAI 호출을 분석 전용 스레드 풀에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_analysis_executor(),
+            self.openai_service.get_analysis,
+            messages,
+            analysis_type
+        )
     
     async def analyze_emotion(self, conversation_history: str) -> dict:
         """감정 분석"""
@@ -92,15 +194,7 @@ class CareerAnalysisService:
             {"role": "user", "content": prompt}
         ]
         
-        # 동기 함수를 비동기로 실행
-        import asyncio
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None, 
-            self.openai_service.get_analysis, 
-            messages, 
-            "emotion"
-        )
+        response = await self._call_openai(messages, "emotion")
         return self._parse_emotion_analysis(response)
     
     async def analyze_personality(self, conversation_history: str) -> dict:
@@ -133,14 +227,7 @@ class CareerAnalysisService:
             {"role": "user", "content": prompt}
         ]
         
-        import asyncio
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            self.openai_service.get_analysis,
-            messages,
-            "personality"
-        )
+        response = await self._call_openai(messages, "personality")
         return self._parse_personality_analysis(response)
 
     def _parse_personality_analysis(self, response: str) -> dict:
@@ -202,14 +289,7 @@ class CareerAnalysisService:
             {"role": "user", "content": prompt}
         ]
         
-        import asyncio
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            self.openai_service.get_analysis,
-            messages,
-            "interest"
-        )
+        response = await self._call_openai(messages, "interest")
         return self._parse_interest_analysis(response)
     
     async def generate_comprehensive_analysis(
@@ -235,14 +315,7 @@ class CareerAnalysisService:
             {"role": "user", "content": prompt}
         ]
         
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            self.openai_service.get_analysis,
-            messages,
-            "comprehensive"
-        )
+        return await self._call_openai(messages, "comprehensive")
     
     async def generate_career_recommendations(
         self, 
@@ -276,14 +349,7 @@ class CareerAnalysisService:
             {"role": "user", "content": prompt}
         ]
         
-        import asyncio
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            self.openai_service.get_analysis,
-            messages,
-            "career_recommendation"
-        )
+        response = await self._call_openai(messages, "career_recommendation")
         return self._parse_career_recommendations(response)
     
     # JSON 파싱 헬퍼 메서드들
@@ -5,11 +5,13 @@ ReAct 에이전트와 연동하여 도구 기반 응답도 지원합니다.
 """
 import asyncio
 import logging
-from typing import List, Dict, Optional, Any
-from langchain_openai import ChatOpenAI
+import os
+from typing import AsyncIterator, List, Dict, Optional, Any
+from services.common.llm_clients import get_chat_model
 from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
 
 from services.agents import route_message, should_use_agent
+from services.conversation_context import get_conversation_context_manager
 from config import settings
 
 logger = logging.getLogger(__name__)
@@ -20,14 +22,17 @@ class ChatService:
 
     def __init__(self, api_key: str, model: str = None):
         model = model or settings.OPENAI_MODEL
-        self.llm = ChatOpenAI(
-            api_key=api_key,
+        self.llm = get_chat_model(
             model=model,
             temperature=0.7,
             max_completion_tokens=1000  # 응답 생성을 위한 충분한 토큰
         )
         # 기존 agent_integration 제거됨 - ReAct 에이전트가 대체
 
+        # 대화 이력 토큰 예산 (초과분은 세션 요약으로 대체)
+        self.context_manager = get_conversation_context_manager()
+        self.context_max_tokens = int(os.getenv("COUNSELING_CONTEXT_TOKENS", 2500))
+
     async def generate_response(
         self,
         session_id: str,
@@ -54,6 +59,7 @@ class ChatService:
             dict: {"message": str}  # 상담 응답만 반환
         """
         counseling_message = await self._generate_counseling_response(
+            session_id=session_id,
             user_message=user_message,
             current_stage=current_stage,
             conversation_history=conversation_history,
@@ -125,6 +131,7 @@ class ChatService:
         current_stage: str,
         conversation_history: List[Dict[str, str]],
         survey_data: Optional[Dict] = None,
+        session_id: Optional[str] = None,
     ) -> str:
         """
         기본 LLM을 사용한 감정적 상담 응답 생성
@@ -134,24 +141,9 @@ class ChatService:
         """
         logger.info(f"[Counseling] 응답 생성 시작: '{user_message[:30]}...'")
 
-        # 단계별 시스템 프롬프트 생성
-        system_prompt = self._build_system_prompt(current_stage, survey_data)
-
-        # 대화 이력을 LangChain 메시지 형식으로 변환
-        messages = [SystemMessage(content=system_prompt)]
-
-        # 최근 대화 이력 추가 (최대 10개)
-        for msg in conversation_history[-10:]:
-            role = msg.get("role", "").upper()
-            content = msg.get("content", "")
-
-            if role == "USER":
-                messages.append(HumanMessage(content=content))
-            elif role == "ASSISTANT":
-                messages.append(AIMessage(content=content))
-
-        # 현재 사용자 메시지 추가
-        messages.append(HumanMessage(content=user_message))
+        messages = await self._build_counseling_messages(
+            user_message, current_stage, conversation_history, survey_data, session_id
+        )
 
         logger.info(f"[Counseling] LLM 호출: {len(messages)}개 메시지")
 
@@ -178,6 +170,81 @@ class ChatService:
             logger.error(f"[Counseling] LLM 호출 실패: {e}")
             return "죄송해요, 잠시 오류가 발생했어요. 다시 말해줄래?"
     
+    async def stream_counseling_response(
+        self,
+        session_id: str,
+        user_message: str,
+        current_stage: str,
+        conversation_history: List[Dict[str, str]],
+        survey_data: Optional[Dict] = None,
+    ) -> AsyncIterator[str]:
+        """
+        상담 응답 스트리밍 (토큰 조각 단위로 반환)
+        _generate_counseling_response와 같은 프롬프트를 사용합니다.
+        """
+        logger.info(f"[Counseling] 스트리밍 응답 시작: '{user_message[:30]}...'")
+
+        messages = await self._build_counseling_messages(
+            user_message, current_stage, conversation_history, survey_data, session_id
+        )
+
+        has_content = False
+        try:
+            async for chunk in self.llm.astream(messages):
+                if chunk.content:
+                    has_content = True
+                    yield chunk.content
+        except Exception as e:
+            logger.error(f"[Counseling] 스트리밍 LLM 호출 실패: {e}")
+            if not has_content:
+                yield "죄송해요, 잠시 오류가 발생했어요. 다시 말해줄래?"
+            return
+
+        # 빈 응답 처리
+        if not has_content:
+            logger.warning("[Counseling] LLM이 빈 스트리밍 응답 반환!")
+            yield "안녕! 오늘 어떤 이야기를 나눠볼까?"
+
+    async def _build_counseling_messages(
+        self,
+        user_message: str,
+        current_stage: str,
+        conversation_history: List[Dict[str, str]],
+        survey_data: Optional[Dict] = None,
+        session_id: Optional[str] = None,
+    ) -> list:
+        """시스템 프롬프트 + 이전 대화 (토큰 예산 이내, 요약 포함) + 현재 메시지"""
+        # 단계별 시스템 프롬프트 생성
+        system_prompt = self._build_system_prompt(current_stage, survey_data)
+
+        # 대화 이력을 LangChain 메시지 형식으로 변환
+        messages = [SystemMessage(content=system_prompt)]
+
+        # 최근 대화 이력 추가 (토큰 예산 이내, 이전 대화는 요약으로 대체)
+        window = await asyncio.to_thread(
+            self.context_manager.build,
+            "counseling",
+            session_id,
+            conversation_history,
+            self.context_max_tokens,
+        )
+        if window.summary:
+            messages.append(SystemMessage(content=f"이전 상담 내용 요약:\n{window.summary}"))
+
+        for msg in window.messages:
+            role = msg.get("role", "").upper()
+            content = msg.get("content", "")
+
+            if role == "USER":
+                messages.append(HumanMessage(content=content))
+            elif role == "ASSISTANT":
+                messages.append(AIMessage(content=content))
+
+        # 현재 사용자 메시지 추가
+        messages.append(HumanMessage(content=user_message))
+
+        return messages
+
     def _build_system_prompt(self, current_stage: str, survey_data: Optional[Dict] = None) -> str:
         """현재 단계에 맞는 시스템 프롬프트 생성"""
         base_prompt = """
@@ -3,8 +3,9 @@
 """
 import os
 import json
-from typing import Dict, Any, List, Optional, Tuple
-from openai import OpenAI
+import logging
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from services.common.llm_clients import get_openai_client
 from services.database_service import DatabaseService
 
 # 프롬프트 import
@@ -27,22 +28,34 @@ from .tools import (
 
 # RAG 서비스 import (FAQ 유사도 검색용)
 from services.chatbot.rag import RagEmbeddingService, RagSearchService
+from services.chatbot.shared.faq_matcher import get_faq_matcher
+from services.conversation_context import get_conversation_context_manager
+from .tool_executor import ToolExecutor
+
+logger = logging.getLogger(__name__)
 
 
 class AssistantService:
     """회원용 챗봇 비서 - Function Calling + FAQ 유사도 매칭"""
 
     def __init__(self):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = get_openai_client()
         self.model = os.getenv("OPENAI_MODEL", "gpt-5-mini")
 
         # RAG 서비스 (FAQ 질문 유사도 검색용)
         self.embedding_service = RagEmbeddingService()
         self.search_service = RagSearchService()
 
+        # 인메모리 FAQ 인덱스 (키워드 역색인 + 사전 계산 임베딩)
+        self.faq_matcher = get_faq_matcher()
+
         # FAQ 유사도 임계값 (0.7 이상이면 FAQ 매칭)
         self.FAQ_THRESHOLD = 0.7
 
+        # 이전 대화 토큰 예산 (초과분은 세션 요약으로 대체)
+        self.context_manager = get_conversation_context_manager()
+        self.CONTEXT_MAX_TOKENS = int(os.getenv("ASSISTANT_CONTEXT_TOKENS", 2000))
+
         # Tool 레지스트리 (함수명 -> tool 매핑)
         self.tool_registry = {
             "get_mentoring_bookings": mentoring_tool,
@@ -58,6 +71,9 @@ class AssistantService:
             "get_job_details": job_details_tool
         }
 
+        # 도구 실행기 (동시 실행 + 요청 단위 공통 조회 메모 + 사용자별 결과 캐시)
+        self.tool_executor = ToolExecutor(self.tool_registry)
+
         # OpenAI Function Calling 스키마 (tools에서 자동 로드)
         self.tools = [
             mentoring_tool.TOOL_SCHEMA,
@@ -76,8 +92,7 @@ class AssistantService:
     def execute_function(self, function_name: str, arguments: Dict[str, Any], db: DatabaseService = None) -> str:
         """함수 실행 - Tool Registry에서 찾아서 실행"""
         if function_name in self.tool_registry:
-            tool = self.tool_registry[function_name]
-            result = tool.execute(**arguments, db=db)
+            result = self.tool_executor.execute(function_name, arguments, db=db)
             return json.dumps(result, ensure_ascii=False, default=str)
 
         return json.dumps({"error": f"Unknown function: {function_name}"}, ensure_ascii=False)
@@ -89,8 +104,8 @@ class AssistantService:
 
         tool = self.tool_registry[function_name]
 
-        # 함수 실행
-        result = tool.execute(user_id=user_id, db=db)
+        # 함수 실행 (캐시 사용)
+        result = self.tool_executor.execute(function_name, {"user_id": user_id}, db=db)
 
         # format_result 함수가 있으면 사용, 없으면 JSON 반환
         if hasattr(tool, 'format_result'):
@@ -100,54 +115,16 @@ class AssistantService:
 
     def search_faq_by_keywords(self, message: str, db: DatabaseService = None) -> Tuple[Optional[str], Optional[str], float]:
         """
-        키워드 기반 FAQ 검색 (벡터 검색 전 1차 필터)
+        키워드 기반 FAQ 검색 (벡터 검색 전 1차 필터, 인메모리 키워드 역색인 사용)
 
         Returns:
             (function_name, faq_question, score) 또는 (None, None, 0)
         """
         try:
-            if db is None:
-                db = DatabaseService()
-
-            # assistant FAQ 중 keywords가 있는 것들 조회
-            query = """
-                SELECT id, question, function_name, keywords
-                FROM faq
-                WHERE user_type = 'assistant'
-                  AND is_active = true
-                  AND keywords IS NOT NULL
-                  AND array_length(keywords, 1) > 0
-            """
-            faqs = db.execute_query(query)
-
-            if not faqs:
-                return None, None, 0
-
-            message_lower = message.lower()
-            best_match = None
-            best_score = 0
-
-            for faq in faqs:
-                keywords = faq.get('keywords') or []
-                if not keywords:
-                    continue
-
-                # 키워드 매칭 점수 계산
-                matched_count = 0
-                for keyword in keywords:
-                    if keyword.lower() in message_lower:
-                        matched_count += 1
-
-                if matched_count > 0:
-                    # 매칭된 키워드 비율을 점수로
-                    score = matched_count / len(keywords)
-                    if score > best_score:
-                        best_score = score
-                        best_match = faq
-
-            # 최소 20% 이상 매칭되면 성공
-            if best_match and best_score >= 0.2:
-                return best_match['function_name'], best_match['question'], best_score
+            self.faq_matcher.ensure_loaded(db)
+            faq, score = self.faq_matcher.match_keywords(message, user_type="assistant", min_score=0.2)
+            if faq:
+                return faq.get('function_name'), faq.get('question'), score
 
             return None, None, 0
 
@@ -167,8 +144,17 @@ class AssistantService:
             if function_name:
                 return function_name, faq_question, keyword_score + 0.5  # 키워드 매칭은 보너스 점수
 
-            # 2. 키워드 매칭 실패 시 벡터 유사도 검색
-            vector = self.embedding_service.embed(message)
+            # 2. 키워드 매칭 실패 시 벡터 유사도 검색 (사전 계산된 FAQ 임베딩과 비교)
+            if self.faq_matcher.has_embeddings:
+                faq, score = self.faq_matcher.match_semantic(
+                    message, user_type="assistant", threshold=self.FAQ_THRESHOLD
+                )
+                if faq:
+                    return faq.get("function_name"), faq.get("question", ""), score
+                return None, None, 0
+
+            # FAQ 임베딩이 없으면 Pinecone 검색으로 폴백
+            vector = self.faq_matcher.embed(message).tolist()
             matches = self.search_service.search(vector, user_type="assistant", top_k=1)
 
             if matches and len(matches) > 0:
@@ -186,7 +172,7 @@ class AssistantService:
         except Exception as e:
             return None, None, 0
 
-    def chat(self, user_id: int, message: str, conversation_history: List[Dict[str, str]] = None, db: DatabaseService = None, function_name: str = None) -> str:
+    def chat(self, user_id: int, message: str, conversation_history: List[Dict[str, str]] = None, db: DatabaseService = None, function_name: str = None, session_id: str = None) -> str:
         """
         회원용 챗봇 비서 - FAQ 직접 호출 + Function Calling 폴백
 
@@ -199,40 +185,23 @@ class AssistantService:
         try:
             # ========== 0. function_name 직접 전달된 경우 바로 실행 ==========
             if function_name and function_name in self.tool_registry:
-                print(f"[AssistantService] FAQ 버튼 직접 호출: {function_name}")
+                logger.debug(f"[AssistantService] FAQ 버튼 직접 호출: {function_name}")
                 result = self.execute_and_format(function_name, user_id, db)
                 return result
 
             # ========== 1. FAQ 검색 (키워드 → 벡터 순서) ==========
             matched_function, faq_question, score = self.search_faq(message, db)
 
-            # 디버그 로그
-            print(f"[AssistantService] 메시지: {message}")
-            print(f"[AssistantService] FAQ 매칭 결과: function={matched_function}, question={faq_question}, score={score}")
+            logger.debug(f"[AssistantService] FAQ 매칭 결과: function={matched_function}, question={faq_question}, score={score}")
 
             # ========== 2. FAQ 매칭 & function_name 있으면 직접 실행 ==========
             if matched_function and matched_function in self.tool_registry:
-                print(f"[AssistantService] FAQ 직접 실행: {matched_function}")
+                logger.debug(f"[AssistantService] FAQ 직접 실행: {matched_function}")
                 result = self.execute_and_format(matched_function, user_id, db)
                 return result
 
             # ========== 3. FAQ 매칭 안됨 → OpenAI Function Calling ==========
-            messages = []
-
-            # 시스템 메시지 항상 추가
-            messages.append({
-                "role": "system",
-                "content": get_member_system_prompt(user_id)
-            })
-
-            # 이전 대화 내역 추가 (있는 경우)
-            if conversation_history:
-                for msg in conversation_history:
-                    if msg.get("role") != "system":
-                        messages.append(msg)
-
-            # 사용자 메시지 추가
-            messages.append({"role": "user", "content": message})
+            messages = self._build_chat_messages(user_id, message, conversation_history, session_id)
 
             # OpenAI API 호출 (Function Calling)
             response = self.client.chat.completions.create(
@@ -249,23 +218,10 @@ class AssistantService:
             if tool_calls:
                 messages.append(response_message)
 
-                for tool_call in tool_calls:
-                    func_name = tool_call.function.name
-                    function_args = json.loads(tool_call.function.arguments)
-
-                    # user_id 자동 추가
-                    if "user_id" not in function_args:
-                        function_args["user_id"] = user_id
-
-                    # 함수 실행
-                    function_response = self.execute_function(func_name, function_args, db=db)
-
-                    messages.append({
-                        "tool_call_id": tool_call.id,
-                        "role": "tool",
-                        "name": func_name,
-                        "content": function_response
-                    })
+                # 도구 호출 동시 실행
+                messages.extend(self._execute_tool_calls(
+                    [(call.id, call.function.name, call.function.arguments) for call in tool_calls], user_id, db
+                ))
 
                 # 함수 결과를 포함하여 다시 API 호출
                 second_response = self.client.chat.completions.create(
@@ -279,4 +235,132 @@ class AssistantService:
             return response_message.content
 
         except Exception as e:
-            return f"죄송합니다. 오류가 발생했습니다: {str(e)}"
\ No newline at end of file
+            return f"죄송합니다. 오류가 발생했습니다: {str(e)}"
+
+    def chat_stream(self, user_id: int, message: str, conversation_history: List[Dict[str, str]] = None, db: DatabaseService = None, function_name: str = None, session_id: str = None) -> Iterator[str]:
+        """
+        chat()의 스트리밍 버전 (응답을 조각 단위로 반환)
+
+        FAQ 직접 실행 결과는 한 번에, OpenAI 응답은 토큰 단위로 반환합니다.
+        도구 호출이 있으면 도구 실행 후 두 번째 응답을 스트리밍합니다.
+        """
+        try:
+            # ========== 0~2. FAQ 버튼 / FAQ 매칭 → 직접 실행 ==========
+            if function_name and function_name in self.tool_registry:
+                logger.debug(f"[AssistantService] FAQ 버튼 직접 호출: {function_name}")
+                yield self.execute_and_format(function_name, user_id, db)
+                return
+
+            matched_function, faq_question, score = self.search_faq(message, db)
+            logger.debug(f"[AssistantService] FAQ 매칭 결과: function={matched_function}, question={faq_question}, score={score}")
+
+            if matched_function and matched_function in self.tool_registry:
+                logger.debug(f"[AssistantService] FAQ 직접 실행: {matched_function}")
+                yield self.execute_and_format(matched_function, user_id, db)
+                return
+
+            # ========== 3. OpenAI Function Calling (스트리밍) ==========
+            messages = self._build_chat_messages(user_id, message, conversation_history, session_id)
+
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                tools=self.tools,
+                tool_choice="auto",
+                stream=True
+            )
+
+            # 도구 호출은 조각으로 나뉘어 오므로 index별로 모음
+            tool_calls: Dict[int, Dict[str, str]] = {}
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                if delta.content:
+                    yield delta.content
+                for call in delta.tool_calls or []:
+                    entry = tool_calls.setdefault(call.index, {"id": "", "name": "", "arguments": ""})
+                    if call.id:
+                        entry["id"] = call.id
+                    if call.function and call.function.name:
+                        entry["name"] += call.function.name
+                    if call.function and call.function.arguments:
+                        entry["arguments"] += call.function.arguments
+
+            if not tool_calls:
+                return
+
+            calls = [tool_calls[index] for index in sorted(tool_calls)]
+            messages.append({
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {"id": call["id"], "type": "function", "function": {"name": call["name"], "arguments": call["arguments"]}}
+                    for call in calls
+                ]
+            })
+            messages.extend(self._execute_tool_calls(
+                [(call["id"], call["name"], call["arguments"]) for call in calls], user_id, db
+            ))
+
+            # 함수 결과를 포함하여 다시 API 호출 (스트리밍)
+            second_stream = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                stream=True
+            )
+            for chunk in second_stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            yield f"죄송합니다. 오류가 발생했습니다: {str(e)}"
+
+    def _build_chat_messages(self, user_id: int, message: str, conversation_history: List[Dict[str, str]] = None, session_id: str = None) -> List[Dict[str, Any]]:
+        """시스템 프롬프트 + 이전 대화 (토큰 예산 이내) + 사용자 메시지"""
+        messages = []
+
+        # 시스템 메시지 항상 추가
+        messages.append({
+            "role": "system",
+            "content": get_member_system_prompt(user_id)
+        })
+
+        # 이전 대화 내역 추가 (토큰 예산 이내 최근 대화 + 이전 대화 요약)
+        if conversation_history:
+            window = self.context_manager.build(
+                "assistant", session_id, conversation_history, self.CONTEXT_MAX_TOKENS
+            )
+            if window.summary:
+                messages.append({
+                    "role": "system",
+                    "content": f"이전 대화 요약:\n{window.summary}"
+                })
+            messages.extend(window.messages)
+
+        # 사용자 메시지 추가
+        messages.append({"role": "user", "content": message})
+        return messages
+
+    def _execute_tool_calls(self, tool_calls: List[Tuple[str, str, str]], user_id: int, db: DatabaseService = None) -> List[Dict[str, Any]]:
+        """도구 호출 목록 (id, 함수명, 인자 JSON) 동시 실행 → 호출 순서대로 tool 메시지"""
+        calls = []
+        for _, func_name, arguments in tool_calls:
+            function_args = json.loads(arguments or "{}")
+
+            # user_id 자동 추가
+            if "user_id" not in function_args:
+                function_args["user_id"] = user_id
+            calls.append((func_name, function_args))
+
+        results = self.tool_executor.execute_many(calls, db=db)
+
+        return [
+            {
+                "tool_call_id": tool_call_id,
+                "role": "tool",
+                "name": func_name,
+                "content": json.dumps(result, ensure_ascii=False, default=str)
+            }
+            for (tool_call_id, func_name, _), result in zip(tool_calls, results)
+        ]
@@ -0,0 +1,202 @@
+"""
+챗봇 비서 도구 실행기
+OpenAI가 한 번에 여러 tool_calls를 반환하면 순서대로 하나씩 실행하던 방식을 대체합니다.
+
+- 독립적인 도구 호출은 공유 스레드 풀에서 동시에 실행 (결과 순서는 호출 순서 유지)
+- 요청 단위 메모: 같은 요청 안에서 여러 도구가 쓰는 공통 조회(최신 진로 분석, 프로필)는 한 번만 실행
+- 사용자별 도구 결과 캐시: 같은 사용자의 같은 도구/인자 호출은 짧은 TTL 동안 재사용
+  (진로 분석 저장 / 에이전트 멘토링 예약 시 해당 사용자 캐시 삭제, 다른 프로세스나 백엔드에서 바뀐 데이터는 TTL로 반영)
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from services.database_service import DatabaseService
+
+logger = logging.getLogger(__name__)
+
+_current_memo: ContextVar[Optional["RequestMemo"]] = ContextVar("assistant_request_memo", default=None)
+
+
+class RequestMemo:
+    """요청 하나 동안 공유되는 공통 조회 결과 (동시 실행 도구 간 중복 조회 방지)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values: Dict[Hashable, Any] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._values:
+                self.hits += 1
+                return self._values[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # 같은 키를 동시에 요청하면 하나만 조회하고 나머지는 결과를 기다림
+        with key_lock:
+            with self._lock:
+                if key in self._values:
+                    self.hits += 1
+                    return self._values[key]
+            value = loader()
+            with self._lock:
+                self._values[key] = value
+                self.misses += 1
+            return value
+
+
+def memoized(key: Hashable, loader: Callable[[], Any]) -> Any:
+    """현재 요청 메모에서 조회 (도구 실행기 밖에서 호출되면 그대로 조회)"""
+    memo = _current_memo.get()
+    if memo is None:
+        return loader()
+    return memo.get_or_load(key, loader)
+
+
+class AssistantToolResultCache:
+    """사용자별 챗봇 비서 도구 결과 캐시 (TTL + 최대 항목 수)"""
+
+    def __init__(
+        self,
+        ttl_seconds: float = float(os.getenv("ASSISTANT_TOOL_CACHE_TTL", 60)),
+        max_entries: int = int(os.getenv("ASSISTANT_TOOL_CACHE_SIZE", 1000))
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(user_id: Any, function_name: str, arguments: Dict[str, Any]) -> Tuple:
+        args = {k: v for k, v in arguments.items() if k not in ("user_id", "db")}
+        return (str(user_id), function_name, json.dumps(args, sort_keys=True, ensure_ascii=False, default=str))
+
+    def get(self, key: Tuple) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def set(self, key: Tuple, value: Any):
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: Any):
+        """사용자 데이터가 바뀌었을 때 (진로 분석 저장, 멘토링 예약) 해당 사용자 캐시 삭제"""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == str(user_id)]:
+                del self._entries[key]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+# 싱글톤 인스턴스 (쓰기 경로에서 무효화할 수 있도록 프로세스 전체가 공유)
+_assistant_tool_cache: Optional[AssistantToolResultCache] = None
+
+
+def get_assistant_tool_cache() -> AssistantToolResultCache:
+    """챗봇 비서 도구 결과 캐시 싱글톤"""
+    global _assistant_tool_cache
+    if _assistant_tool_cache is None:
+        _assistant_tool_cache = AssistantToolResultCache()
+    return _assistant_tool_cache
+
+
+def _is_cacheable(result: Any) -> bool:
+    """조회 실패/미완료 안내 결과는 캐시하지 않음 (분석 완료 직후 바로 반영되도록)"""
+    return not (isinstance(result, dict) and result.get("success") is False)
+
+
+class ToolExecutor:
+    """도구 호출 실행 (동시 실행 + 요청 메모 + 결과 캐시)"""
+
+    def __init__(
+        self,
+        tool_registry: Dict[str, Any],
+        max_workers: int = int(os.getenv("ASSISTANT_TOOL_WORKERS", 4)),
+        cache: Optional[AssistantToolResultCache] = None
+    ):
+        self.tool_registry = tool_registry
+        self.cache = cache or get_assistant_tool_cache()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="assistant-tool")
+
+    def execute(self, function_name: str, arguments: Dict[str, Any], db: DatabaseService = None) -> Any:
+        """도구 하나 실행 (캐시 사용) → 도구 원본 결과"""
+        tool = self.tool_registry.get(function_name)
+        if tool is None:
+            return {"error": f"Unknown function: {function_name}"}
+
+        key = AssistantToolResultCache.make_key(arguments.get("user_id"), function_name, arguments)
+        found, cached = self.cache.get(key)
+        if found:
+            return cached
+
+        if _current_memo.get() is None:
+            # 단독 호출(FAQ 직접 실행 등)도 공통 조회 메모를 사용
+            return copy_context().run(self._execute_with_memo, tool, key, arguments, db)
+        return self._run_tool(tool, key, arguments, db)
+
+    def _execute_with_memo(self, tool, key: Tuple, arguments: Dict[str, Any], db: DatabaseService) -> Any:
+        _current_memo.set(RequestMemo())
+        return self._run_tool(tool, key, arguments, db)
+
+    def _run_tool(self, tool, key: Tuple, arguments: Dict[str, Any], db: DatabaseService) -> Any:
+        result = tool.execute(**arguments, db=db)
+        if _is_cacheable(result):
+            self.cache.set(key, result)
+        return result
+
+    def execute_many(self, calls: List[Tuple[str, Dict[str, Any]]], db: DatabaseService = None) -> List[Any]:
+        """
+        여러 도구 호출을 동시에 실행
+
+        Args:
+            calls: (함수명, 인자) 목록
+            db: DatabaseService 인스턴스 (연결은 스레드별로 관리됨)
+
+        Returns:
+            호출 순서대로 도구 결과 (실패한 호출은 {"error": ...})
+        """
+        memo = RequestMemo()
+
+        def run(function_name: str, arguments: Dict[str, Any]) -> Any:
+            _current_memo.set(memo)
+            try:
+                return self.execute(function_name, arguments, db=db)
+            except Exception as e:
+                logger.warning(f"[ToolExecutor] 도구 실행 실패: {function_name} - {e}")
+                return {"error": f"{function_name} 실행 중 오류가 발생했습니다: {str(e)}"}
+
+        if len(calls) == 1:
+            return [copy_context().run(run, *calls[0])]
+
+        # 각 호출은 자기 컨텍스트 복사본에서 실행 (요청 메모는 공유)
+        futures = [self._pool.submit(copy_context().run, run, name, args) for name, args in calls]
+        results = [future.result() for future in futures]
+        if memo.hits:
+            logger.debug(f"[ToolExecutor] 도구 {len(calls)}개 동시 실행, 공통 조회 재사용 {memo.hits}회")
+        return results
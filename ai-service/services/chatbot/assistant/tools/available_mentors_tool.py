@@ -1,9 +1,13 @@
 """
 승인된 멘토 조회 Tool - 멘토 목록 및 상세 정보 조회
 """
+import logging
 import json
 from typing import Dict, Any, List
 from services.database_service import DatabaseService
+from .shared_queries import get_latest_career_analysis
+
+logger = logging.getLogger(__name__)
 
 
 TOOL_SCHEMA = {
@@ -65,17 +69,9 @@ def execute(user_id: int, job_field: str = None, db: DatabaseService = None, **k
             mentors = db.execute_query(query, (f"%{job_field}%",))
         else:
             # 1. 사용자의 진로분석 결과에서 추천 직업 가져오기
-            analysis_query = """
-                SELECT ca.recommended_careers
-                FROM career_analyses ca
-                JOIN career_sessions cs ON ca.session_id = cs.id
-                WHERE cs.user_id = %s
-                ORDER BY ca.analyzed_at DESC
-                LIMIT 1
-            """
-            analysis_results = db.execute_query(analysis_query, (str(user_id),))
+            analysis = get_latest_career_analysis(user_id, db)
 
-            if not analysis_results or len(analysis_results) == 0:
+            if not analysis:
                 return {
                     "success": False,
                     "need_analysis": True,
@@ -83,7 +79,7 @@ def execute(user_id: int, job_field: str = None, db: DatabaseService = None, **k
                 }
 
             # JSON 파싱
-            recommended_careers = analysis_results[0].get('recommended_careers', [])
+            recommended_careers = analysis.get('recommended_careers') or []
             if isinstance(recommended_careers, str):
                 try:
                     recommended_careers = json.loads(recommended_careers)
@@ -162,7 +158,7 @@ def execute(user_id: int, job_field: str = None, db: DatabaseService = None, **k
         }
 
     except Exception as e:
-        print(f"멘토 조회 오류: {str(e)}")
+        logger.error(f"[AssistantTool] 멘토 조회 오류: {e}")
         return {
             "success": False,
             "message": f"멘토 조회 중 오류가 발생했습니다: {str(e)}"
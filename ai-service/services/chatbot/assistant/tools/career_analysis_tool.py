@@ -1,8 +1,12 @@
 """
 진로 분석 Tool - 사용자의 진로 분석 결과 조회
 """
+import logging
 from typing import Dict, Any, Optional
 from services.database_service import DatabaseService
+from .shared_queries import get_latest_career_analysis
+
+logger = logging.getLogger(__name__)
 
 
 # OpenAI Function Calling 스키마
@@ -41,38 +45,15 @@ def execute(user_id: int, db: DatabaseService = None, **kwargs) -> Dict[str, Any
         if db is None:
             db = DatabaseService()
 
-        # SQL 쿼리 - career_analyses 테이블과 career_sessions 테이블을 조인하여 최신 분석 결과 조회
-        # JPA 컬럼명: camelCase -> DB 컬럼명: snake_case
-        query = """
-            SELECT
-                ca.id,
-                ca.analyzed_at,
-                ca.comprehensive_analysis,
-                ca.emotion_analysis,
-                ca.emotion_score,
-                ca.interest_analysis,
-                ca.interest_areas,
-                ca.personality_analysis,
-                ca.personality_type,
-                ca.recommended_careers
-            FROM career_analyses ca
-            JOIN career_sessions cs ON ca.session_id = cs.id
-            WHERE cs.user_id = %s
-            ORDER BY ca.analyzed_at DESC
-            LIMIT 1
-        """
-
-        # user_id는 String 타입
-        results = db.execute_query(query, (str(user_id),))
-
-        if not results or len(results) == 0:
+        # 최신 분석 결과 조회 (같은 요청의 다른 도구와 공유)
+        analysis = get_latest_career_analysis(user_id, db)
+
+        if not analysis:
             return {
                 "success": False,
                 "message": "아직 진로 분석을 진행하지 않으셨네요! 진로 분석을 진행하시면 결과를 조회할 수 있어요."
             }
 
-        analysis = results[0]
-
         # JSON 필드 파싱 (PostgreSQL JSONB 또는 TEXT 형식)
         import json
 
@@ -94,7 +75,7 @@ def execute(user_id: int, db: DatabaseService = None, **kwargs) -> Dict[str, Any
         }
 
     except Exception as e:
-        print(f"진로 분석 조회 오류: {str(e)}")
+        logger.error(f"[AssistantTool] 진로 분석 조회 오류: {e}")
         # user_id 컬럼이 없을 경우를 대비한 안내
         if "Unknown column 'user_id'" in str(e):
              return {
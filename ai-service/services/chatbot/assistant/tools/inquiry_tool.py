@@ -1,9 +1,12 @@
 """
 문의 Tool - 사용자 문의 내역 조회
 """
+import logging
 from typing import Dict, Any, List
 from services.database_service import DatabaseService
 
+logger = logging.getLogger(__name__)
+
 
 # OpenAI Function Calling 스키마
 TOOL_SCHEMA = {
@@ -83,9 +86,7 @@ def execute(
         return inquiries if inquiries else []
 
     except Exception as e:
-        print(f"문의 내역 조회 오류: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"[AssistantTool] 문의 내역 조회 오류: {e}")
         return []
 
 
@@ -1,10 +1,14 @@
 """
 직업 상세 정보 Tool - 직업별 급여, 역량, 자격증 조회
 """
+import logging
 from typing import Dict, Any, List
 from services.database_service import DatabaseService
+from .shared_queries import get_latest_career_analysis
 import json
 
+logger = logging.getLogger(__name__)
+
 
 TOOL_SCHEMA = {
     "type": "function",
@@ -65,18 +69,9 @@ def execute(user_id: int, job_name: str = None, db: DatabaseService = None, **kw
                 job['job_name'] = job_name
         else:
             # 1. 사용자 추천 직업 가져오기
-            query = """
-                SELECT
-                    ca.recommended_careers
-                FROM career_analyses ca
-                JOIN career_sessions cs ON ca.session_id = cs.id
-                WHERE cs.user_id = %s
-                ORDER BY ca.analyzed_at DESC
-                LIMIT 1
-            """
-            results = db.execute_query(query, (str(user_id),))
+            analysis = get_latest_career_analysis(user_id, db)
 
-            if not results or len(results) == 0:
+            if not analysis:
                 return {
                     "success": False,
                     "need_analysis": True,
@@ -84,7 +79,7 @@ def execute(user_id: int, job_name: str = None, db: DatabaseService = None, **kw
                 }
 
             # JSON 파싱
-            recommended_careers = results[0].get('recommended_careers', [])
+            recommended_careers = analysis.get('recommended_careers') or []
             if isinstance(recommended_careers, str):
                 try:
                     recommended_careers = json.loads(recommended_careers)
@@ -165,7 +160,7 @@ def execute(user_id: int, job_name: str = None, db: DatabaseService = None, **kw
         }
 
     except Exception as e:
-        print(f"직업 정보 조회 오류: {str(e)}")
+        logger.error(f"[AssistantTool] 직업 정보 조회 오류: {e}")
         return {
             "success": False,
             "message": f"직업 정보 조회 중 오류가 발생했습니다: {str(e)}"
@@ -3,6 +3,7 @@
 """
 from typing import Dict, Any, List, Optional
 from services.database_service import DatabaseService
+from .shared_queries import get_latest_career_analysis
 import asyncio
 
 
@@ -53,18 +54,10 @@ def execute(
         # 키워드가 없으면 진로 분석 결과에서 추천 직업을 가져옴
         if not keywords:
             try:
-                career_query = """
-                    SELECT ca.recommended_careers
-                    FROM career_analyses ca
-                    JOIN career_sessions cs ON ca.session_id = cs.id
-                    WHERE cs.user_id = %s
-                    ORDER BY ca.analyzed_at DESC
-                    LIMIT 1
-                """
-                career_result = db.execute_query(career_query, (str(user_id),))
-
-                if career_result and len(career_result) > 0:
-                    recommended_careers = career_result[0].get("recommended_careers")
+                analysis = get_latest_career_analysis(user_id, db)
+
+                if analysis:
+                    recommended_careers = analysis.get("recommended_careers")
 
                     if recommended_careers:
                         # JSON 파싱
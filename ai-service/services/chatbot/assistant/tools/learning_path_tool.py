@@ -1,9 +1,12 @@
 """
 학습 경로 및 진행 현황 Tool - 사용자의 학습 경로/로드맵 및 진행 현황 조회
 """
+import logging
 from typing import Dict, Any, List
 from services.database_service import DatabaseService
 
+logger = logging.getLogger(__name__)
+
 
 # OpenAI Function Calling 스키마
 TOOL_SCHEMA = {
@@ -73,7 +76,7 @@ def execute(user_id: int, db: DatabaseService = None, **kwargs) -> Dict[str, Any
         }
 
     except Exception as e:
-        print(f"학습 조회 오류: {str(e)}")
+        logger.error(f"[AssistantTool] 학습 조회 오류: {e}")
         return {
             "success": False,
             "message": f"학습 조회 중 오류가 발생했습니다: {str(e)}"
@@ -1,9 +1,12 @@
 """
 멘토링 Tool - 멘토링 예약 조회 기능
 """
+import logging
 from typing import Dict, Any, List, Optional
 from services.database_service import DatabaseService
 
+logger = logging.getLogger(__name__)
+
 
 # OpenAI Function Calling 스키마
 TOOL_SCHEMA = {
@@ -102,7 +105,7 @@ def execute(user_id: int, status: Optional[str] = None, db: DatabaseService = No
         return bookings if bookings else []
 
     except Exception as e:
-        print(f"멘토링 예약 조회 오류: {str(e)}")
+        logger.error(f"[AssistantTool] 멘토링 예약 조회 오류: {e}")
         return []
 
 
@@ -1,9 +1,12 @@
 """
 결제 내역 Tool - 사용자의 결제 내역 조회
 """
+import logging
 from typing import Dict, Any, List
 from services.database_service import DatabaseService
 
+logger = logging.getLogger(__name__)
+
 
 # OpenAI Function Calling 스키마
 TOOL_SCHEMA = {
@@ -72,7 +75,7 @@ def execute(user_id: int, db: DatabaseService = None, **kwargs) -> Dict[str, Any
         }
 
     except Exception as e:
-        print(f"결제 내역 조회 오류: {str(e)}")
+        logger.error(f"[AssistantTool] 결제 내역 조회 오류: {e}")
         return {
             "success": False,
             "message": f"결제 내역 조회 중 오류가 발생했습니다: {str(e)}"
@@ -2,10 +2,13 @@
 성격 검사 Tool - BigFive 및 MBTI 결과 조회
 profile_analysis 테이블에서 성격 분석 결과를 가져옵니다.
 """
+import logging
 from typing import Dict, Any, Optional
 from services.database_service import DatabaseService
 import json
 
+logger = logging.getLogger(__name__)
+
 
 # OpenAI Function Calling 스키마
 TOOL_SCHEMA = {
@@ -134,9 +137,7 @@ def execute(
         }
 
     except Exception as e:
-        print(f"성격 분석 결과 조회 오류: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"[AssistantTool] 성격 분석 결과 조회 오류: {e}")
         return {
             "success": False,
             "message": f"성격 분석 결과 조회 중 오류가 발생했습니다: {str(e)}"
@@ -172,13 +173,11 @@ def format_result(data: Dict[str, Any]) -> str:
 
     # Big Five 성격 특성
     personality = results.get("personality")
-    print(f"[DEBUG format_result] personality: {personality}")
     if personality and isinstance(personality, dict):
         response += "### 📊 Big Five 성격 특성\n\n"
 
         # bigFive 또는 traits 키가 있는 경우 (백엔드에서 bigFive로 저장)
         traits = personality.get("bigFive") or personality.get("traits") or personality
-        print(f"[DEBUG format_result] traits: {traits}")
         if isinstance(traits, dict):
             trait_labels = {
                 "openness": "개방성",
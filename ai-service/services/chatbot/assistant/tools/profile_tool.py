@@ -1,8 +1,12 @@
 """
 프로필 Tool - 사용자 프로필 정보 조회
 """
+import logging
 from typing import Dict, Any
 from services.database_service import DatabaseService
+from .shared_queries import get_user_profile
+
+logger = logging.getLogger(__name__)
 
 
 # OpenAI Function Calling 스키마
@@ -41,56 +45,22 @@ def execute(user_id: int, db: DatabaseService = None, **kwargs) -> Dict[str, Any
         if db is None:
             db = DatabaseService()
 
-        # 사용자 기본 정보 조회
-        user_query = """
-            SELECT
-                user_id,
-                username,
-                name,
-                email,
-                phone,
-                birth,
-                role,
-                remaining_sessions,
-                created_at
-            FROM users
-            WHERE user_id = %s AND is_active = TRUE
-        """
-        user_result = db.execute_query(user_query, (user_id,))
-
-        if not user_result or len(user_result) == 0:
+        # 사용자 기본 정보 + 프로필 상세 정보 조회 (users, user_profiles 테이블)
+        data = get_user_profile(user_id, db)
+
+        if not data:
             return {
                 "success": False,
                 "message": "프로필 정보를 찾을 수 없습니다."
             }
 
-        user = user_result[0]
-
-        # 프로필 상세 정보 조회 (user_profiles 테이블)
-        profile_query = """
-            SELECT
-                personality,
-                values,
-                interests,
-                updated_at
-            FROM user_profiles
-            WHERE user_id = %s
-            ORDER BY updated_at DESC
-            LIMIT 1
-        """
-        profile_result = db.execute_query(profile_query, (user_id,))
-        profile = profile_result[0] if profile_result else None
-
         return {
             "success": True,
-            "data": {
-                "user": user,
-                "profile": profile
-            }
+            "data": data
         }
 
     except Exception as e:
-        print(f"프로필 조회 오류: {str(e)}")
+        logger.error(f"[AssistantTool] 프로필 조회 오류: {e}")
         return {
             "success": False,
             "message": f"프로필 조회 중 오류가 발생했습니다: {str(e)}"
@@ -1,9 +1,13 @@
 """
 추천 시스템 Tool - 직업/학과 추천 (간단 요약)
 """
+import logging
 import json
 from typing import Dict, Any, List, Optional
 from services.database_service import DatabaseService
+from .shared_queries import get_latest_career_analysis
+
+logger = logging.getLogger(__name__)
 
 
 # OpenAI Function Calling 스키마
@@ -47,27 +51,14 @@ def execute(
             db = DatabaseService()
 
         # 진로 분석 결과에서 추천 직업 조회
-        query = """
-            SELECT
-                ca.recommended_careers,
-                ca.interest_areas,
-                ca.personality_type
-            FROM career_analyses ca
-            JOIN career_sessions cs ON ca.session_id = cs.id
-            WHERE cs.user_id = %s
-            ORDER BY ca.analyzed_at DESC
-            LIMIT 1
-        """
-        results = db.execute_query(query, (str(user_id),))
-
-        if not results or len(results) == 0:
+        analysis = get_latest_career_analysis(user_id, db)
+
+        if not analysis:
             return {
                 "success": False,
                 "message": "아직 진로 분석을 진행하지 않으셨네요! 진로 분석을 먼저 진행해주세요."
             }
 
-        analysis = results[0]
-
         # JSON 필드 파싱
         recommended_careers = analysis.get('recommended_careers', [])
         if isinstance(recommended_careers, str):
@@ -93,7 +84,7 @@ def execute(
         }
 
     except Exception as e:
-        print(f"추천 조회 오류: {str(e)}")
+        logger.error(f"[AssistantTool] 추천 조회 오류: {e}")
         return {
             "success": False,
             "message": f"추천 조회 중 오류가 발생했습니다: {str(e)}"
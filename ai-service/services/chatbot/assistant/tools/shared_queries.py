@@ -0,0 +1,91 @@
+"""
+여러 Tool이 공통으로 사용하는 조회
+같은 요청 안에서는 도구 실행기의 요청 메모를 통해 한 번만 조회됩니다.
+"""
+from typing import Any, Dict, Optional
+
+from services.database_service import DatabaseService
+from ..tool_executor import memoized
+
+
+def get_latest_career_analysis(user_id: int, db: DatabaseService) -> Optional[Dict[str, Any]]:
+    """
+    사용자의 최신 진로 분석 결과 (career_analyses JOIN career_sessions)
+
+    Returns:
+        분석 행 복사본 (JSON 필드는 원본 그대로) 또는 None
+    """
+    def load():
+        # JPA 컬럼명: camelCase -> DB 컬럼명: snake_case
+        query = """
+            SELECT
+                ca.id,
+                ca.analyzed_at,
+                ca.comprehensive_analysis,
+                ca.emotion_analysis,
+                ca.emotion_score,
+                ca.interest_analysis,
+                ca.interest_areas,
+                ca.personality_analysis,
+                ca.personality_type,
+                ca.recommended_careers
+            FROM career_analyses ca
+            JOIN career_sessions cs ON ca.session_id = cs.id
+            WHERE cs.user_id = %s
+            ORDER BY ca.analyzed_at DESC
+            LIMIT 1
+        """
+        # user_id는 String 타입
+        results = db.execute_query(query, (str(user_id),))
+        return results[0] if results else None
+
+    row = memoized(("career_analysis", str(user_id)), load)
+    # 도구마다 JSON 필드를 파싱해 덮어쓰므로 복사본 반환
+    return dict(row) if row else None
+
+
+def get_user_profile(user_id: int, db: DatabaseService) -> Optional[Dict[str, Any]]:
+    """
+    사용자 기본 정보 + 최신 프로필 상세 (users, user_profiles)
+
+    Returns:
+        {"user": ..., "profile": ...} 또는 None (활성 사용자가 아닌 경우)
+    """
+    def load():
+        user_query = """
+            SELECT
+                user_id,
+                username,
+                name,
+                email,
+                phone,
+                birth,
+                role,
+                remaining_sessions,
+                created_at
+            FROM users
+            WHERE user_id = %s AND is_active = TRUE
+        """
+        user_result = db.execute_query(user_query, (user_id,))
+        if not user_result:
+            return None
+
+        profile_query = """
+            SELECT
+                personality,
+                values,
+                interests,
+                updated_at
+            FROM user_profiles
+            WHERE user_id = %s
+            ORDER BY updated_at DESC
+            LIMIT 1
+        """
+        profile_result = db.execute_query(profile_query, (user_id,))
+        return {
+            "user": user_result[0],
+            "profile": profile_result[0] if profile_result else None
+        }
+
+    data = memoized(("user_profile", str(user_id)), load)
+    return dict(data) if data else None
@@ -1,14 +1,60 @@
 import os
-from openai import OpenAI
-from typing import List, Dict, Any
+from services.common.llm_clients import get_openai_client
+from typing import List, Dict, Any, Iterator, Optional
+
+# 참고 정보(FAQ)가 없을 때의 고정 답변
+OUT_OF_SCOPE_ANSWER = "죄송하지만, DreamPath 서비스 관련 질문 외에는 답변할 수 없습니다. DreamPath와 관련된 질문이나 도움이 필요하시면 언제든지 말씀해 주세요!"
 
 
 class RagAnswerService:
     def __init__(self):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = get_openai_client()
 
     def generate_answer(self, question: str, matches: List[Dict[str, Any]]) -> str:
         """FAQ 전용 답변 생성 메서드"""
+        prompt = self._build_prompt(question, matches)
+
+        # FAQ가 없으면 무조건 범위 외 메시지 반환
+        if prompt is None:
+            return OUT_OF_SCOPE_ANSWER
+
+        try:
+            response = self.client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "user", "content": prompt}
+                ]
+            )
+            return response.choices[0].message.content
+
+        except Exception as e:
+            raise RuntimeError(f"GPT 답변 생성 실패: {str(e)}")
+
+    def stream_answer(self, question: str, matches: List[Dict[str, Any]]) -> Iterator[str]:
+        """generate_answer의 스트리밍 버전 (토큰 조각 단위로 반환)"""
+        prompt = self._build_prompt(question, matches)
+
+        if prompt is None:
+            yield OUT_OF_SCOPE_ANSWER
+            return
+
+        try:
+            stream = self.client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "user", "content": prompt}
+                ],
+                stream=True
+            )
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            raise RuntimeError(f"GPT 답변 생성 실패: {str(e)}")
+
+    def _build_prompt(self, question: str, matches: List[Dict[str, Any]]) -> Optional[str]:
+        """검색된 FAQ로 프롬프트 구성 (참고 정보가 없으면 None)"""
 
         # FAQ 형식으로 context 생성
         context = []
@@ -23,9 +69,8 @@ class RagAnswerService:
             elif "text" in metadata:
                 context.append(f"- {metadata['text']}\n")
 
-        # FAQ가 없으면 무조건 범위 외 메시지 반환
         if not context or len(context) == 0:
-            return "죄송하지만, DreamPath 서비스 관련 질문 외에는 답변할 수 없습니다. DreamPath와 관련된 질문이나 도움이 필요하시면 언제든지 말씀해 주세요!"
+            return None
 
         context_str = "\n".join(context)
 
@@ -66,14 +111,4 @@ User Question: {question}
 
 Answer (FAQ 정보를 기반으로 자연스럽게 답변):"""
 
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
-            return response.choices[0].message.content
-
-        except Exception as e:
-            raise RuntimeError(f"GPT 답변 생성 실패: {str(e)}")
+        return prompt
@@ -1,11 +1,11 @@
 import os
-from openai import OpenAI
+from services.common.llm_clients import get_openai_client
 from typing import List
 
 
 class RagEmbeddingService:
     def __init__(self):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = get_openai_client()
 
     def embed(self, text: str) -> List[float]:
         """텍스트를 임베딩 벡터로 변환"""
@@ -17,3 +17,16 @@ class RagEmbeddingService:
             return response.data[0].embedding
         except Exception as e:
             raise RuntimeError(f"임베딩 생성 실패: {str(e)}")
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """여러 텍스트를 한 번의 API 호출로 임베딩"""
+        if not texts:
+            return []
+        try:
+            response = self.client.embeddings.create(
+                model="text-embedding-3-small",
+                input=texts
+            )
+            return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+        except Exception as e:
+            raise RuntimeError(f"임베딩 생성 실패: {str(e)}")
@@ -1,3 +1,4 @@
 from .faq_service import FaqService
+from .faq_matcher import FaqMatcher, get_faq_matcher
 
-__all__ = ["FaqService"]
\ No newline at end of file
+__all__ = ["FaqService", "FaqMatcher", "get_faq_matcher"]
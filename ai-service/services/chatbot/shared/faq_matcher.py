@@ -0,0 +1,320 @@
+"""
+FAQ 인메모리 매처 (공통)
+활성 FAQ 전체를 메모리에 올려두고 채팅 메시지마다 DB 조회 없이 매칭합니다.
+- 정규화된 질문 텍스트 (부분 일치)
+- 키워드 역색인 (assistant FAQ 키워드 매칭)
+- 사전 계산된 임베딩 행렬 (NumPy, 코사인 유사도)
+FAQ 생성/수정/삭제 시 faq_router에서 refresh()를 (이벤트 루프 밖 스레드에서) 호출하고,
+TTL 만료 시에는 백그라운드에서 다시 로드하는 동안 기존 인덱스로 매칭합니다.
+"""
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from services.database_service import DatabaseService
+
+logger = logging.getLogger(__name__)
+
+
+# 사용자 타입별 조회 가능한 FAQ user_type
+USER_TYPE_SCOPES = {
+    "guest": ("guest", "both"),
+    "member": ("member", "both"),
+    "assistant": ("assistant",),
+}
+
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING_PUNCT = re.compile(r"[\s?!.~]+$")
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """소문자 + 공백 정리 + 끝 문장부호 제거"""
+    if not text:
+        return ""
+    text = _WHITESPACE.sub(" ", text.lower()).strip()
+    return _TRAILING_PUNCT.sub("", text)
+
+
+class _FaqIndex:
+    """한 시점의 FAQ 스냅샷 (생성 후 변경하지 않음)"""
+
+    def __init__(self, faqs: List[Dict[str, Any]], embeddings: Optional[np.ndarray]):
+        self.faqs = faqs
+        self.questions = [normalize_text(faq.get("question")) for faq in faqs]
+        self.user_types = np.array([faq.get("user_type") or "guest" for faq in faqs])
+        self.embeddings = embeddings  # (N, D), 행마다 L2 정규화
+
+        # 키워드 역색인: 정규화 키워드 → FAQ 인덱스 목록
+        self.keyword_index: Dict[str, List[int]] = {}
+        self.keyword_counts: Dict[int, int] = {}
+        for i, faq in enumerate(faqs):
+            keywords = [normalize_text(k) for k in (faq.get("keywords") or []) if normalize_text(k)]
+            if not keywords:
+                continue
+            self.keyword_counts[i] = len(keywords)
+            for keyword in keywords:
+                self.keyword_index.setdefault(keyword, []).append(i)
+
+
+class FaqMatcher:
+    """FAQ 인메모리 매처"""
+
+    def __init__(
+        self,
+        embedding_service=None,
+        ttl_seconds: float = float(os.getenv("FAQ_INDEX_TTL", 300)),
+        embedding_cache_size: int = 1024
+    ):
+        self._embedding_service = embedding_service
+        self.ttl_seconds = ttl_seconds  # 다른 프로세스에서 수정된 FAQ 반영 주기
+        self.embedding_cache_size = embedding_cache_size
+
+        self._index: Optional[_FaqIndex] = None
+        self._loaded_at = 0.0
+        self._load_lock = threading.Lock()
+        self._cache_lock = threading.Lock()
+        # 텍스트 해시 → 임베딩 (FAQ 임베딩 재사용 + 메시지 임베딩 캐시)
+        self._faq_vectors: Dict[str, np.ndarray] = {}
+        self._message_vectors: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+    @property
+    def embedding_service(self):
+        if self._embedding_service is None:
+            from services.chatbot.rag import RagEmbeddingService
+            self._embedding_service = RagEmbeddingService()
+        return self._embedding_service
+
+    # ------------------------------------------------------------------
+    # 로딩
+    # ------------------------------------------------------------------
+
+    def ensure_loaded(self, db: DatabaseService = None):
+        """
+        인덱스가 없으면 로드 (최초 1회만 기다림 - 보통 서버 시작 시 워밍업에서 끝남)
+        TTL이 지났으면 백그라운드 스레드에서 다시 로드하고, 새 인덱스가 준비될 때까지 기존 인덱스로 매칭
+        """
+        if self._is_fresh():
+            return
+
+        if self._index is not None:
+            self.refresh_in_background(db)
+            return
+
+        with self._load_lock:
+            # 락을 기다리는 동안 다른 스레드가 이미 로드했으면 건너뜀
+            if self._index is None:
+                self._load(db)
+
+    def refresh(self, db: DatabaseService = None):
+        """DB에서 활성 FAQ를 다시 읽어 인덱스 재구성 (FAQ 변경 직후 호출, TTL과 관계없이 항상 로드)"""
+        with self._load_lock:
+            self._load(db)
+
+    def refresh_in_background(self, db: DatabaseService = None) -> bool:
+        """
+        백그라운드 스레드에서 인덱스 재구성 (이미 다시 로드하는 중이면 아무것도 하지 않음)
+
+        Returns:
+            새로 로드를 시작했으면 True
+        """
+        if not self._load_lock.acquire(blocking=False):
+            return False
+
+        def reload():
+            try:
+                if not self._is_fresh():
+                    self._load(db)
+            except Exception as e:
+                # 실패하면 기존 인덱스를 계속 사용하고 다음 요청에서 다시 시도
+                logger.warning(f"[FaqMatcher] FAQ 인덱스 갱신 실패 (기존 인덱스 사용): {e}")
+            finally:
+                self._load_lock.release()
+
+        threading.Thread(target=reload, name="faq-index-reload", daemon=True).start()
+        return True
+
+    def _is_fresh(self) -> bool:
+        return self._index is not None and time.monotonic() - self._loaded_at < self.ttl_seconds
+
+    def _load(self, db: Optional[DatabaseService]):
+        """활성 FAQ로 인덱스 재구성 (변경된 FAQ만 임베딩, _load_lock 안에서 호출)"""
+        if db is None:
+            db = DatabaseService()
+
+        faqs = db.execute_query("""
+            SELECT * FROM faq
+            WHERE is_active = true
+            ORDER BY priority DESC, id ASC
+        """) or []
+
+        self._index = _FaqIndex(faqs, self._build_embeddings(faqs))
+        self._loaded_at = time.monotonic()
+        logger.info(f"[FaqMatcher] FAQ 인덱스 로드 완료: {len(faqs)}개")
+
+    @staticmethod
+    def _embedding_text(faq: Dict[str, Any]) -> str:
+        """임베딩용 텍스트 (faq_router.upload_to_pinecone과 동일: question + keywords)"""
+        keywords = faq.get("keywords") or []
+        keywords_str = " ".join(keywords) if isinstance(keywords, list) else str(keywords)
+        return f"{faq.get('question', '')} {keywords_str}".strip()
+
+    def _build_embeddings(self, faqs: List[Dict[str, Any]]) -> Optional[np.ndarray]:
+        if not faqs:
+            return None
+
+        texts = [self._embedding_text(faq) for faq in faqs]
+        keys = [_text_key(text) for text in texts]
+        missing = [(key, text) for key, text in zip(keys, texts) if key not in self._faq_vectors]
+
+        try:
+            if missing:
+                vectors = self.embedding_service.embed_batch([text for _, text in missing])
+                for (key, _), vector in zip(missing, vectors):
+                    self._faq_vectors[key] = _normalize(vector)
+        except Exception as e:
+            # 임베딩 실패 시 텍스트/키워드 매칭만 사용
+            logger.warning(f"[FaqMatcher] FAQ 임베딩 생성 실패 (텍스트 매칭만 사용): {e}")
+            return None
+
+        # 삭제된 FAQ 임베딩 정리
+        self._faq_vectors = {key: self._faq_vectors[key] for key in keys}
+        return np.vstack([self._faq_vectors[key] for key in keys])
+
+    # ------------------------------------------------------------------
+    # 매칭
+    # ------------------------------------------------------------------
+
+    def match_text(self, message: str, user_type: str = "guest") -> Optional[Dict[str, Any]]:
+        """
+        질문 텍스트 매칭 (완전 일치 또는 서로 포함 관계, 우선순위 순)
+        FaqService.search_faq의 기존 매칭 규칙과 동일합니다.
+        """
+        index = self._index
+        message_norm = normalize_text(message)
+        if index is None or not message_norm:
+            return None
+
+        scopes = USER_TYPE_SCOPES.get(user_type, USER_TYPE_SCOPES["guest"])
+        for faq, question in zip(index.faqs, index.questions):
+            if faq.get("user_type") not in scopes or not question:
+                continue
+            if question == message_norm or question in message_norm or message_norm in question:
+                return faq
+        return None
+
+    def match_keywords(
+        self,
+        message: str,
+        user_type: str = "assistant",
+        min_score: float = 0.2
+    ) -> Tuple[Optional[Dict[str, Any]], float]:
+        """
+        키워드 역색인 매칭: 메시지에 포함된 키워드 비율이 가장 높은 FAQ
+
+        Returns:
+            (faq, score) 또는 (None, 0)
+        """
+        index = self._index
+        message_norm = normalize_text(message)
+        if index is None or not message_norm:
+            return None, 0
+
+        scopes = USER_TYPE_SCOPES.get(user_type, (user_type,))
+        matched: Dict[int, int] = {}
+        for keyword, faq_ids in index.keyword_index.items():
+            if keyword in message_norm:
+                for i in faq_ids:
+                    matched[i] = matched.get(i, 0) + 1
+
+        best, best_score = None, 0.0
+        for i in sorted(matched):
+            faq = index.faqs[i]
+            if faq.get("user_type") not in scopes:
+                continue
+            score = matched[i] / index.keyword_counts[i]
+            if score > best_score:
+                best, best_score = faq, score
+
+        if best is not None and best_score >= min_score:
+            return best, best_score
+        return None, 0
+
+    def match_semantic(
+        self,
+        message: str,
+        user_type: str = "guest",
+        threshold: float = 0.7
+    ) -> Tuple[Optional[Dict[str, Any]], float]:
+        """
+        임베딩 코사인 유사도 매칭 (메시지 임베딩은 캐시)
+
+        Returns:
+            (faq, score) 또는 (None, 0)
+        """
+        index = self._index
+        if index is None or index.embeddings is None or not message:
+            return None, 0
+
+        scopes = USER_TYPE_SCOPES.get(user_type, (user_type,))
+        mask = np.isin(index.user_types, scopes)
+        if not mask.any():
+            return None, 0
+
+        scores = index.embeddings @ self.embed(message)
+        scores = np.where(mask, scores, -1.0)
+        best = int(np.argmax(scores))
+        score = float(scores[best])
+
+        if score >= threshold:
+            return index.faqs[best], score
+        return None, 0
+
+    @property
+    def has_embeddings(self) -> bool:
+        return self._index is not None and self._index.embeddings is not None
+
+    def embed(self, text: str) -> np.ndarray:
+        """메시지 임베딩 (LRU 캐시, L2 정규화)"""
+        key = _text_key(normalize_text(text))
+        with self._cache_lock:
+            vector = self._message_vectors.get(key)
+            if vector is not None:
+                self._message_vectors.move_to_end(key)
+                return vector
+
+        vector = _normalize(self.embedding_service.embed(text))
+
+        with self._cache_lock:
+            self._message_vectors[key] = vector
+            while len(self._message_vectors) > self.embedding_cache_size:
+                self._message_vectors.popitem(last=False)
+        return vector
+
+
+def _text_key(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _normalize(vector) -> np.ndarray:
+    array = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(array)
+    return array / norm if norm > 0 else array
+
+
+# 싱글톤 인스턴스
+_faq_matcher: Optional[FaqMatcher] = None
+
+
+def get_faq_matcher() -> FaqMatcher:
+    """FAQ 매처 싱글톤"""
+    global _faq_matcher
+    if _faq_matcher is None:
+        _faq_matcher = FaqMatcher()
+    return _faq_matcher
@@ -0,0 +1,181 @@
+"""
+공유 LLM 클라이언트 레지스트리
+호출마다 ChatOpenAI(및 내부 HTTP 클라이언트/커넥션 풀)를 새로 만들지 않고,
+같은 설정의 모델은 하나의 인스턴스와 keep-alive 커넥션 풀을 재사용합니다.
+
+- 비동기 HTTP 클라이언트는 이벤트 루프마다 따로 둠 (커넥션은 생성한 루프에서만 사용 가능)
+  → 메인 루프와 에이전트 실행기 루프가 각자 풀을 가짐
+- 동기 HTTP 클라이언트는 프로세스 전체에서 하나를 공유
+- 모든 HTTP 클라이언트는 LLM 게이트웨이 트랜스포트를 거침 (동시성 / 레이트 리밋 / 재시도는 게이트웨이가 담당)
+  → SDK 자체 재시도는 끔 (max_retries=0)
+- OpenAI SDK 직접 사용처는 get_openai_client / get_async_openai_client로 같은 경로를 공유
+"""
+import asyncio
+import os
+import threading
+import weakref
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+from langchain_openai import ChatOpenAI
+from openai import AsyncOpenAI, OpenAI
+
+from services.common.llm_gateway import LANE_HEADER, get_llm_gateway
+
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", 20))
+LLM_MAX_KEEPALIVE = int(os.getenv("LLM_MAX_KEEPALIVE", 10))
+LLM_KEEPALIVE_EXPIRY = float(os.getenv("LLM_KEEPALIVE_EXPIRY", 60))
+LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", 60))
+
+_lock = threading.Lock()
+_sync_client: Optional[httpx.Client] = None
+# 이벤트 루프 → (비동기 HTTP 클라이언트, 모델 캐시)
+_loop_registries: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[httpx.AsyncClient, Dict[Tuple, ChatOpenAI]]]" = weakref.WeakKeyDictionary()
+# 이벤트 루프 밖(동기 호출)에서 만든 모델
+_sync_models: Dict[Tuple, ChatOpenAI] = {}
+# 레인별 OpenAI SDK 클라이언트 (비동기 클라이언트는 트랜스포트가 루프별 커넥션 풀을 두므로 루프 간 공유 가능)
+_openai_clients: Dict[Tuple[str, Optional[str]], Any] = {}
+_shared_async_client: Optional[httpx.AsyncClient] = None
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=LLM_MAX_CONNECTIONS,
+        max_keepalive_connections=LLM_MAX_KEEPALIVE,
+        keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+    )
+
+
+def _get_sync_client() -> httpx.Client:
+    global _sync_client
+    if _sync_client is None:
+        _sync_client = httpx.Client(
+            transport=get_llm_gateway().sync_transport(_limits()),
+            timeout=LLM_TIMEOUT_SECONDS,
+        )
+    return _sync_client
+
+
+def _new_async_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=get_llm_gateway().async_transport(_limits()),
+        timeout=LLM_TIMEOUT_SECONDS,
+    )
+
+
+def _get_shared_async_client() -> httpx.AsyncClient:
+    global _shared_async_client
+    if _shared_async_client is None:
+        _shared_async_client = _new_async_client()
+    return _shared_async_client
+
+
+def _api_key() -> Optional[str]:
+    # 가짜 백엔드는 키 없이도 동작
+    return os.getenv("OPENAI_API_KEY") or (None if get_llm_gateway().backend is None else "fake")
+
+
+def _lane_headers(lane: Optional[str]) -> Optional[Dict[str, str]]:
+    return {LANE_HEADER: lane} if lane else None
+
+
+def _model_key(model: str, temperature: float, kwargs: Dict[str, Any]) -> Tuple:
+    return (model, temperature, tuple(sorted((k, repr(v)) for k, v in kwargs.items())))
+
+
+def get_chat_model(model: str = None, temperature: float = 0, lane: str = None, **kwargs) -> ChatOpenAI:
+    """
+    설정별 공유 ChatOpenAI 인스턴스
+
+    Args:
+        model: 모델명 (기본값: OPENAI_MODEL 환경 변수)
+        temperature: 샘플링 온도
+        lane: 게이트웨이 레인 (기본값: interactive, llm_lane() 블록이 있으면 그쪽이 우선)
+        **kwargs: ChatOpenAI 추가 설정 (max_completion_tokens 등)
+    """
+    model = model or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+    kwargs.setdefault("max_retries", 0)
+    if lane:
+        kwargs["default_headers"] = {**(kwargs.get("default_headers") or {}), **_lane_headers(lane)}
+    key = _model_key(model, temperature, kwargs)
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    with _lock:
+        sync_client = _get_sync_client()
+        if loop is None:
+            # 루프 밖에서 만든 모델도 나중에 비동기로 호출될 수 있으므로 루프 공용 클라이언트 연결
+            models = _sync_models
+            async_client = _get_shared_async_client()
+        else:
+            registry = _loop_registries.get(loop)
+            if registry is None:
+                registry = (_new_async_client(), {})
+                _loop_registries[loop] = registry
+            async_client, models = registry
+
+        llm = models.get(key)
+        if llm is None:
+            llm = ChatOpenAI(
+                api_key=_api_key(),
+                model=model,
+                temperature=temperature,
+                http_client=sync_client,
+                http_async_client=async_client,
+                **kwargs,
+            )
+            models[key] = llm
+        return llm
+
+
+def get_openai_client(lane: str = None) -> OpenAI:
+    """
+    게이트웨이를 거치는 공유 OpenAI(동기) 클라이언트
+
+    Args:
+        lane: 게이트웨이 레인 (기본값: interactive, 야간 배치 / 적재 스크립트는 "batch")
+    """
+    key = ("sync", lane)
+    with _lock:
+        client = _openai_clients.get(key)
+        if client is None:
+            client = OpenAI(
+                api_key=_api_key(),
+                http_client=_get_sync_client(),
+                max_retries=0,
+                default_headers=_lane_headers(lane),
+            )
+            _openai_clients[key] = client
+        return client
+
+
+def get_async_openai_client(lane: str = None) -> AsyncOpenAI:
+    """게이트웨이를 거치는 공유 AsyncOpenAI 클라이언트 (여러 이벤트 루프에서 사용 가능)"""
+    key = ("async", lane)
+    with _lock:
+        client = _openai_clients.get(key)
+        if client is None:
+            client = AsyncOpenAI(
+                api_key=_api_key(),
+                http_client=_get_shared_async_client(),
+                max_retries=0,
+                default_headers=_lane_headers(lane),
+            )
+            _openai_clients[key] = client
+        return client
+
+
+def close_llm_clients():
+    """서버 종료 시 호출 - 동기 커넥션 풀 정리 (비동기 풀은 각 루프와 함께 정리됨)"""
+    global _sync_client, _shared_async_client
+    with _lock:
+        if _sync_client is not None:
+            _sync_client.close()
+            _sync_client = None
+        _sync_models.clear()
+        _loop_registries.clear()
+        _openai_clients.clear()
+        _shared_async_client = None
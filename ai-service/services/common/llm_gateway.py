@@ -0,0 +1,905 @@
+"""
+LLM 게이트웨이
+OpenAI SDK 클라이언트와 LangChain ChatOpenAI가 모두 이 게이트웨이의 HTTP 트랜스포트를 거치므로
+프로세스 전체의 OpenAI 호출 동시성 / 레이트 리밋을 한 곳에서 관리합니다.
+
+- 우선순위 레인: interactive(채팅, 사용자 요청) / batch(야간 추천 계산, 적재 스크립트)
+  batch는 동시 실행 수가 작고, 모델 예산이 일정 비율(LLM_GATEWAY_BATCH_RESERVE) 아래로 내려가거나
+  같은 모델에 interactive 대기 요청이 있으면 양보
+- 모델별 토큰 버킷: 분당 요청 수 / 분당 토큰 수, 응답 헤더(x-ratelimit-*)로 한도와 잔량 보정
+- 429 / 5xx: retry-after 헤더와 연속 실패 횟수에 따른 지수 백오프 후 재시도 (429는 모델 전체 일시 정지)
+- 호출별 타임아웃: 대기열 대기 + 요청 시간이 레인별 제한을 넘지 않음
+- 레인별 대기 시간 / 토큰 사용량 통계 (stats, /metrics에는 dreampath_llm_* 로 노출)
+- 호출마다 llm span (이름은 모델, 대기열 대기 + 재시도 포함, 스트리밍은 응답 헤더 수신까지)
+- LLM_GATEWAY_BACKEND=fake 이면 실제 API 대신 로컬 가짜 백엔드(FakeLLMBackend)로 응답 (테스트 / 벤치마크용)
+
+레인 지정: 클라이언트 기본값(get_openai_client(lane="batch")) 또는 with llm_lane("batch"): 블록
+"""
+import asyncio
+import contextvars
+import hashlib
+import json
+import logging
+import math
+import os
+import random
+import re
+import threading
+import time
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+
+from services.common.metrics import get_metrics_registry, span
+
+logger = logging.getLogger(__name__)
+
+LANE_INTERACTIVE = "interactive"
+LANE_BATCH = "batch"
+LANE_HEADER = "x-llm-lane"
+
+LLM_GATEWAY_BACKEND = os.getenv("LLM_GATEWAY_BACKEND", "openai")
+DEFAULT_RPM = int(os.getenv("LLM_GATEWAY_DEFAULT_RPM", 500))
+DEFAULT_TPM = int(os.getenv("LLM_GATEWAY_DEFAULT_TPM", 200000))
+# max_tokens 지정이 없는 요청의 응답 토큰 추정치
+DEFAULT_COMPLETION_TOKENS = int(os.getenv("LLM_GATEWAY_DEFAULT_COMPLETION_TOKENS", 512))
+MAX_RETRIES = int(os.getenv("LLM_GATEWAY_MAX_RETRIES", 3))
+BACKOFF_BASE_SECONDS = float(os.getenv("LLM_GATEWAY_BACKOFF_BASE", 1.0))
+BACKOFF_MAX_SECONDS = float(os.getenv("LLM_GATEWAY_BACKOFF_MAX", 60.0))
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+_POLL_INTERVAL = 0.05
+
+_current_lane: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("llm_lane", default=None)
+
+
+@contextmanager
+def llm_lane(lane: str):
+    """블록 안의 LLM 호출을 지정한 레인으로 보냄 (클라이언트 기본 레인보다 우선)"""
+    token = _current_lane.set(lane)
+    try:
+        yield
+    finally:
+        _current_lane.reset(token)
+
+
+class LLMGatewayTimeout(httpx.PoolTimeout):
+    """레인 타임아웃 안에 실행 슬롯 / 레이트 리밋 예산을 얻지 못함 (SDK에서는 APITimeoutError)"""
+
+
+@dataclass
+class LaneConfig:
+    max_concurrency: int
+    timeout_seconds: float
+    # 모델 예산이 이 비율 아래면 대기 (상위 레인 몫으로 남겨 둠)
+    budget_reserve: float = 0.0
+    # 낮을수록 우선 - 상위 레인 대기 요청이 있으면 양보
+    priority: int = 0
+
+
+def default_lanes() -> Dict[str, LaneConfig]:
+    return {
+        LANE_INTERACTIVE: LaneConfig(
+            max_concurrency=int(os.getenv("LLM_GATEWAY_INTERACTIVE_CONCURRENCY", 32)),
+            timeout_seconds=float(os.getenv("LLM_GATEWAY_INTERACTIVE_TIMEOUT", 60)),
+            priority=0,
+        ),
+        LANE_BATCH: LaneConfig(
+            max_concurrency=int(os.getenv("LLM_GATEWAY_BATCH_CONCURRENCY", 4)),
+            timeout_seconds=float(os.getenv("LLM_GATEWAY_BATCH_TIMEOUT", 300)),
+            budget_reserve=float(os.getenv("LLM_GATEWAY_BATCH_RESERVE", 0.2)),
+            priority=1,
+        ),
+    }
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """레이트 리밋 헤더 시간 파싱 ("1.5", "20ms", "6m0s", "1h2m3.5s") → 초"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = re.findall(r"(\d+(?:\.\d+)?)(ms|s|m|h)", value)
+    if not parts:
+        return None
+    scale = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+    return sum(float(number) * scale[unit] for number, unit in parts)
+
+
+def _header_int(headers: httpx.Headers, name: str) -> Optional[int]:
+    try:
+        return int(float(headers[name])) if name in headers else None
+    except ValueError:
+        return None
+
+
+def retry_after_seconds(headers: httpx.Headers) -> Optional[float]:
+    """응답 헤더가 알려주는 재시도 대기 시간"""
+    if "retry-after-ms" in headers:
+        delay = parse_duration(headers["retry-after-ms"])
+        return delay / 1000 if delay is not None else None
+    for name in ("retry-after", "x-ratelimit-reset-requests", "x-ratelimit-reset-tokens"):
+        delay = parse_duration(headers.get(name))
+        if delay is not None:
+            return delay
+    return None
+
+
+def input_tokens(body: Dict[str, Any]) -> int:
+    """입력 토큰 추정 (글자 수 / 4)"""
+    chars = 0
+    for message in body.get("messages") or []:
+        content = message.get("content")
+        if isinstance(content, str):
+            chars += len(content)
+        elif isinstance(content, list):
+            chars += sum(len(part.get("text", "")) for part in content if isinstance(part, dict))
+    inputs = body.get("input")
+    if isinstance(inputs, str):
+        chars += len(inputs)
+    elif isinstance(inputs, list):
+        chars += sum(len(item) for item in inputs if isinstance(item, str))
+
+    return math.ceil(chars / 4)
+
+
+def estimate_tokens(body: Dict[str, Any]) -> int:
+    """요청 토큰 추정 (입력 + 최대 응답 토큰) - OpenAI 레이트 리미터와 같은 방식"""
+    tokens = input_tokens(body)
+    if "messages" in body:
+        tokens += body.get("max_completion_tokens") or body.get("max_tokens") or DEFAULT_COMPLETION_TOKENS
+    return max(tokens, 1)
+
+
+class TokenBucket:
+    """분당 한도 토큰 버킷 (capacity = 분당 한도, 초당 capacity / 60 씩 충전)"""
+
+    def __init__(self, per_minute: int, clock: Callable[[], float]):
+        self.capacity = float(per_minute)
+        self.level = float(per_minute)
+        self._clock = clock
+        self._updated = clock()
+
+    def _refill(self):
+        now = self._clock()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.capacity / 60)
+        self._updated = now
+
+    def available(self) -> float:
+        self._refill()
+        return self.level
+
+    def wait_time(self, amount: float) -> float:
+        """amount 만큼 쓸 수 있을 때까지 남은 시간 (한도보다 큰 요청은 버킷이 가득 찰 때까지)"""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) * 60 / self.capacity
+
+    def take(self, amount: float):
+        self._refill()
+        self.level -= amount
+
+    def sync(self, limit: Optional[int], remaining: Optional[int]):
+        """서버가 알려준 한도 / 잔량 반영 (잔량은 더 적을 때만 따름)"""
+        self._refill()
+        if limit:
+            self.capacity = float(limit)
+        if remaining is not None:
+            self.level = min(self.level, float(remaining))
+
+
+class _ModelBudget:
+    def __init__(self, rpm: int, tpm: int, clock: Callable[[], float]):
+        self.requests = TokenBucket(rpm, clock)
+        self.tokens = TokenBucket(tpm, clock)
+        self.blocked_until = 0.0
+        self.consecutive_failures = 0
+        self.waiting: Dict[int, int] = {}
+
+
+class _LaneStats:
+    def __init__(self):
+        self.requests = 0
+        self.in_flight = 0
+        self.waiting = 0
+        self.rate_limited = 0
+        self.retries = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.total_tokens = 0
+        self.queue_waits = deque(maxlen=1000)
+
+    def snapshot(self) -> Dict[str, Any]:
+        waits = sorted(self.queue_waits)
+
+        def percentile(ratio):
+            return round(waits[min(len(waits) - 1, int(len(waits) * ratio))] * 1000, 1) if waits else None
+
+        return {
+            "requests": self.requests,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "rate_limited": self.rate_limited,
+            "retries": self.retries,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "tokens": {
+                "prompt": self.prompt_tokens,
+                "completion": self.completion_tokens,
+                "total": self.total_tokens,
+            },
+            "queue_wait_ms": {"p50": percentile(0.5), "p95": percentile(0.95), "max": percentile(1.0)},
+        }
+
+
+@dataclass
+class _Call:
+    lane: str
+    model: str
+    tokens: int
+    stream: bool
+    deadline: float
+
+
+class _Ticket:
+    def __init__(self, call: _Call):
+        self.call = call
+        self.released = False
+
+
+class LLMGateway:
+    """OpenAI 호출 스케줄러 (스레드 / 이벤트 루프 공용, 상태는 하나의 락으로 보호)"""
+
+    def __init__(
+        self,
+        lanes: Optional[Dict[str, LaneConfig]] = None,
+        default_rpm: int = DEFAULT_RPM,
+        default_tpm: int = DEFAULT_TPM,
+        model_limits: Optional[Dict[str, Dict[str, int]]] = None,
+        max_retries: int = MAX_RETRIES,
+        backoff_base: float = BACKOFF_BASE_SECONDS,
+        backoff_max: float = BACKOFF_MAX_SECONDS,
+        backend: Optional["FakeLLMBackend"] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.lanes = lanes or default_lanes()
+        self.default_rpm = default_rpm
+        self.default_tpm = default_tpm
+        self.model_limits = model_limits or {}
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.backend = backend
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._models: Dict[str, _ModelBudget] = {}
+        self._stats = {lane: _LaneStats() for lane in self.lanes}
+
+    # ----- 트랜스포트 -----
+
+    def sync_transport(self, limits: Optional[httpx.Limits] = None) -> "GatewayTransport":
+        inner = self.backend or httpx.HTTPTransport(limits=limits or httpx.Limits())
+        return GatewayTransport(self, inner)
+
+    def async_transport(self, limits: Optional[httpx.Limits] = None) -> "AsyncGatewayTransport":
+        if self.backend is not None:
+            return AsyncGatewayTransport(self, lambda: self.backend)
+        return AsyncGatewayTransport(self, lambda: httpx.AsyncHTTPTransport(limits=limits or httpx.Limits()))
+
+    # ----- 요청 분류 -----
+
+    def resolve_lane(self, request: httpx.Request) -> str:
+        header_lane = request.headers.get(LANE_HEADER)
+        if header_lane is not None:
+            del request.headers[LANE_HEADER]
+        lane = _current_lane.get() or header_lane or LANE_INTERACTIVE
+        return lane if lane in self.lanes else LANE_INTERACTIVE
+
+    def begin(self, request: httpx.Request) -> _Call:
+        lane = self.resolve_lane(request)
+        body: Dict[str, Any] = {}
+        if request.headers.get("content-type", "").startswith("application/json"):
+            try:
+                body = json.loads(request.read() or b"{}")
+            except Exception:
+                body = {}
+        return _Call(
+            lane=lane,
+            model=str(body.get("model") or "unknown"),
+            tokens=estimate_tokens(body),
+            stream=bool(body.get("stream")),
+            deadline=self._clock() + self.lanes[lane].timeout_seconds,
+        )
+
+    def remaining(self, call: _Call) -> float:
+        return call.deadline - self._clock()
+
+    # ----- 예산 -----
+
+    def _budget(self, model: str) -> _ModelBudget:
+        budget = self._models.get(model)
+        if budget is None:
+            limits = self.model_limits.get(model, {})
+            budget = _ModelBudget(limits.get("rpm", self.default_rpm), limits.get("tpm", self.default_tpm), self._clock)
+            self._models[model] = budget
+        return budget
+
+    def _try_acquire(self, call: _Call) -> float:
+        """슬롯 / 예산을 얻으면 0, 아니면 다시 시도할 때까지 기다릴 시간"""
+        config = self.lanes[call.lane]
+        stats = self._stats[call.lane]
+        budget = self._budget(call.model)
+
+        if stats.in_flight >= config.max_concurrency:
+            return _POLL_INTERVAL
+        now = self._clock()
+        if now < budget.blocked_until:
+            return budget.blocked_until - now
+        if any(count > 0 for priority, count in budget.waiting.items() if priority < config.priority):
+            return _POLL_INTERVAL
+
+        reserve = config.budget_reserve
+        wait = max(
+            budget.requests.wait_time(1 + reserve * budget.requests.capacity),
+            budget.tokens.wait_time(call.tokens + reserve * budget.tokens.capacity),
+        )
+        if wait > 0:
+            return wait
+
+        budget.requests.take(1)
+        budget.tokens.take(call.tokens)
+        stats.in_flight += 1
+        stats.requests += 1
+        return 0.0
+
+    def _enter_queue(self, call: _Call):
+        priority = self.lanes[call.lane].priority
+        budget = self._budget(call.model)
+        budget.waiting[priority] = budget.waiting.get(priority, 0) + 1
+        self._stats[call.lane].waiting += 1
+
+    def _leave_queue(self, call: _Call, started: float, acquired: bool):
+        priority = self.lanes[call.lane].priority
+        budget = self._budget(call.model)
+        budget.waiting[priority] -= 1
+        stats = self._stats[call.lane]
+        stats.waiting -= 1
+        if acquired:
+            stats.queue_waits.append(self._clock() - started)
+        else:
+            stats.timeouts += 1
+        self._cond.notify_all()
+
+    def acquire(self, call: _Call, request: httpx.Request) -> _Ticket:
+        """동기 대기 (스레드)"""
+        started = self._clock()
+        with self._cond:
+            self._enter_queue(call)
+            acquired = False
+            try:
+                while True:
+                    wait = self._try_acquire(call)
+                    if wait <= 0:
+                        acquired = True
+                        return _Ticket(call)
+                    remaining = self.remaining(call)
+                    if remaining <= 0:
+                        raise LLMGatewayTimeout(f"LLM 게이트웨이 대기 시간 초과 ({call.lane})", request=request)
+                    self._cond.wait(min(wait, remaining))
+            finally:
+                self._leave_queue(call, started, acquired)
+
+    async def acquire_async(self, call: _Call, request: httpx.Request) -> _Ticket:
+        """비동기 대기 (이벤트 루프를 막지 않도록 락은 짧게만 잡고 sleep으로 대기)"""
+        started = self._clock()
+        with self._cond:
+            self._enter_queue(call)
+        acquired = False
+        try:
+            while True:
+                with self._cond:
+                    wait = self._try_acquire(call)
+                if wait <= 0:
+                    acquired = True
+                    return _Ticket(call)
+                remaining = self.remaining(call)
+                if remaining <= 0:
+                    raise LLMGatewayTimeout(f"LLM 게이트웨이 대기 시간 초과 ({call.lane})", request=request)
+                await asyncio.sleep(min(wait, remaining, _POLL_INTERVAL * 4))
+        finally:
+            with self._cond:
+                self._leave_queue(call, started, acquired)
+
+    def release(self, ticket: _Ticket, response: Optional[httpx.Response] = None, usage: Optional[Dict[str, int]] = None) -> float:
+        """
+        슬롯 반환 + 응답 헤더 / 사용량 반영
+        Returns: 재시도 전 이 호출이 추가로 기다릴 시간 (5xx / 연결 오류 백오프)
+        """
+        if ticket.released:
+            return 0.0
+        ticket.released = True
+        call = ticket.call
+        delay = 0.0
+
+        with self._cond:
+            stats = self._stats[call.lane]
+            budget = self._budget(call.model)
+            stats.in_flight -= 1
+
+            if usage:
+                used = usage.get("total_tokens") or 0
+                stats.prompt_tokens += usage.get("prompt_tokens") or 0
+                stats.completion_tokens += usage.get("completion_tokens") or 0
+                stats.total_tokens += used
+                # 추정치와 실제 사용량 차이 정산
+                budget.tokens.take(used - call.tokens)
+
+            if response is not None:
+                headers = response.headers
+                budget.requests.sync(
+                    _header_int(headers, "x-ratelimit-limit-requests"),
+                    _header_int(headers, "x-ratelimit-remaining-requests"),
+                )
+                budget.tokens.sync(
+                    _header_int(headers, "x-ratelimit-limit-tokens"),
+                    _header_int(headers, "x-ratelimit-remaining-tokens"),
+                )
+
+            status = response.status_code if response is not None else None
+            if status in RETRY_STATUSES or status is None:
+                budget.consecutive_failures += 1
+                # 서버가 알려준 대기 시간(없으면 기본값)에서 시작해 연속 실패마다 2배
+                hinted = retry_after_seconds(response.headers) if response is not None else None
+                backoff = (hinted or self.backoff_base) * 2 ** (budget.consecutive_failures - 1)
+                backoff = min(self.backoff_max, backoff) * random.uniform(1.0, 1.2)
+                if status == 429:
+                    stats.rate_limited += 1
+                    # 모델 전체 일시 정지 - 다른 요청도 같은 한도에 걸리므로
+                    budget.blocked_until = max(budget.blocked_until, self._clock() + backoff)
+                else:
+                    stats.errors += 1
+                    delay = backoff
+            else:
+                budget.consecutive_failures = 0
+                if status is not None and status >= 400:
+                    stats.errors += 1
+
+            self._cond.notify_all()
+        return delay
+
+    def should_retry(self, call: _Call, attempt: int, response: Optional[httpx.Response]) -> bool:
+        if attempt >= self.max_retries or self.remaining(call) <= 0:
+            return False
+        return response is None or response.status_code in RETRY_STATUSES
+
+    def count_retry(self, call: _Call):
+        with self._cond:
+            self._stats[call.lane].retries += 1
+
+    # ----- 관측 -----
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            now = self._clock()
+            return {
+                "backend": "fake" if self.backend is not None else "openai",
+                "lanes": {lane: stats.snapshot() for lane, stats in self._stats.items()},
+                "models": {
+                    model: {
+                        "requests_per_minute": int(budget.requests.capacity),
+                        "requests_available": int(budget.requests.available()),
+                        "tokens_per_minute": int(budget.tokens.capacity),
+                        "tokens_available": int(budget.tokens.available()),
+                        "blocked_for_seconds": round(max(0.0, budget.blocked_until - now), 3),
+                        "consecutive_failures": budget.consecutive_failures,
+                    }
+                    for model, budget in self._models.items()
+                },
+            }
+
+
+def _apply_deadline(request: httpx.Request, remaining: float):
+    """요청 타임아웃을 호출의 남은 시간 이내로 제한"""
+    timeout = dict(request.extensions.get("timeout") or {})
+    for key in ("connect", "read", "write", "pool"):
+        current = timeout.get(key)
+        timeout[key] = remaining if current is None else min(current, remaining)
+    request.extensions["timeout"] = timeout
+
+
+def _usage_from(response: httpx.Response) -> Optional[Dict[str, int]]:
+    try:
+        usage = response.json().get("usage")
+    except (ValueError, AttributeError):
+        return None
+    return usage if isinstance(usage, dict) else None
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    """
+    스트리밍 응답은 본문을 끝까지 읽거나 닫을 때 슬롯 반환
+    닫지 않고 버린 스트림도 GC될 때 반환 (on_close가 이 스트림을 참조하면 GC되지 않음 - _stream_release 참고)
+    """
+
+    def __init__(self, inner, on_close: Callable[[], None]):
+        self._inner = inner
+        self._on_close = weakref.finalize(self, on_close)  # 한 번만 실행됨
+
+    def __iter__(self):
+        yield from self._inner
+        self._on_close()
+
+    def close(self):
+        try:
+            self._inner.close()
+        finally:
+            self._on_close()
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    def __init__(self, inner, on_close: Callable[[], None]):
+        self._inner = inner
+        self._on_close = weakref.finalize(self, on_close)
+
+    async def __aiter__(self):
+        async for chunk in self._inner:
+            yield chunk
+        self._on_close()
+
+    async def aclose(self):
+        try:
+            await self._inner.aclose()
+        finally:
+            self._on_close()
+
+
+def _stream_release(gateway: LLMGateway, ticket: _Ticket, response: httpx.Response) -> Callable[[], None]:
+    """
+    스트림 종료 시 슬롯 반환 콜백
+    응답 대신 상태 코드 / 헤더만 담은 사본을 넘김 (응답 → 스트림 참조가 남으면 버려진 스트림이 GC되지 않음)
+    """
+    snapshot = httpx.Response(response.status_code, headers=response.headers)
+    return lambda: gateway.release(ticket, snapshot)
+
+
+class GatewayTransport(httpx.BaseTransport):
+    """동기 httpx 트랜스포트 - 요청마다 게이트웨이 슬롯을 얻고, 429 / 5xx는 백오프 후 재시도"""
+
+    def __init__(self, gateway: LLMGateway, inner: httpx.BaseTransport):
+        self._gateway = gateway
+        self._inner = inner
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        call = self._gateway.begin(request)
+        # 대기열 대기 + 재시도를 포함한 호출 전체를 span 하나로 기록
+        with span("llm", call.model, lane=call.lane, stream=call.stream) as active:
+            response = self._send(call, request)
+            if active is not None:
+                active.attributes["status_code"] = response.status_code
+                if response.status_code >= 400:
+                    active.status = "error"
+            return response
+
+    def _send(self, call: _Call, request: httpx.Request) -> httpx.Response:
+        gateway = self._gateway
+        attempt = 0
+        while True:
+            ticket = gateway.acquire(call, request)
+            _apply_deadline(request, gateway.remaining(call))
+            try:
+                response = self._inner.handle_request(request)
+            except httpx.TransportError:
+                delay = gateway.release(ticket)
+                if not gateway.should_retry(call, attempt, None):
+                    raise
+                attempt += 1
+                gateway.count_retry(call)
+                time.sleep(min(delay, max(0.0, gateway.remaining(call))))
+                continue
+            except BaseException:
+                gateway.release(ticket)
+                raise
+
+            if response.status_code in RETRY_STATUSES and gateway.should_retry(call, attempt, response):
+                response.read()
+                response.close()
+                delay = gateway.release(ticket, response)
+                attempt += 1
+                gateway.count_retry(call)
+                time.sleep(min(delay, max(0.0, gateway.remaining(call))))
+                continue
+
+            if call.stream and response.status_code < 400:
+                response.stream = _ReleasingStream(response.stream, _stream_release(gateway, ticket, response))
+                return response
+
+            response.read()
+            gateway.release(ticket, response, _usage_from(response) if response.status_code < 400 else None)
+            return response
+
+    def close(self):
+        if self._inner is not self._gateway.backend:
+            self._inner.close()
+
+
+class AsyncGatewayTransport(httpx.AsyncBaseTransport):
+    """
+    비동기 httpx 트랜스포트
+    실제 커넥션 풀은 이벤트 루프마다 따로 두므로, 하나의 클라이언트를 여러 루프에서 공유해도 안전
+    """
+
+    def __init__(self, gateway: LLMGateway, inner_factory: Callable[[], httpx.AsyncBaseTransport]):
+        self._gateway = gateway
+        self._inner_factory = inner_factory
+        self._lock = threading.Lock()
+        self._inners: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncBaseTransport]" = weakref.WeakKeyDictionary()
+
+    def _inner(self) -> httpx.AsyncBaseTransport:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            inner = self._inners.get(loop)
+            if inner is None:
+                inner = self._inner_factory()
+                self._inners[loop] = inner
+            return inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        call = self._gateway.begin(request)
+        # 대기열 대기 + 재시도를 포함한 호출 전체를 span 하나로 기록
+        with span("llm", call.model, lane=call.lane, stream=call.stream) as active:
+            response = await self._send_async(call, request)
+            if active is not None:
+                active.attributes["status_code"] = response.status_code
+                if response.status_code >= 400:
+                    active.status = "error"
+            return response
+
+    async def _send_async(self, call: _Call, request: httpx.Request) -> httpx.Response:
+        gateway = self._gateway
+        inner = self._inner()
+        attempt = 0
+        while True:
+            ticket = await gateway.acquire_async(call, request)
+            _apply_deadline(request, gateway.remaining(call))
+            try:
+                response = await inner.handle_async_request(request)
+            except httpx.TransportError:
+                delay = gateway.release(ticket)
+                if not gateway.should_retry(call, attempt, None):
+                    raise
+                attempt += 1
+                gateway.count_retry(call)
+                await asyncio.sleep(min(delay, max(0.0, gateway.remaining(call))))
+                continue
+            except BaseException:
+                gateway.release(ticket)
+                raise
+
+            if response.status_code in RETRY_STATUSES and gateway.should_retry(call, attempt, response):
+                await response.aread()
+                await response.aclose()
+                delay = gateway.release(ticket, response)
+                attempt += 1
+                gateway.count_retry(call)
+                await asyncio.sleep(min(delay, max(0.0, gateway.remaining(call))))
+                continue
+
+            if call.stream and response.status_code < 400:
+                response.stream = _AsyncReleasingStream(response.stream, _stream_release(gateway, ticket, response))
+                return response
+
+            await response.aread()
+            gateway.release(ticket, response, _usage_from(response) if response.status_code < 400 else None)
+            return response
+
+    async def aclose(self):
+        with self._lock:
+            inners = list(self._inners.values())
+            self._inners.clear()
+        for inner in inners:
+            if inner is not self._gateway.backend:
+                await inner.aclose()
+
+
+class _ChunkStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """SSE 이벤트를 하나씩 흘려보내는 스트림 (실제 서버처럼 미리 읽히지 않음)"""
+
+    def __init__(self, chunks: List[bytes]):
+        self._chunks = chunks
+
+    def __iter__(self):
+        yield from self._chunks
+
+    async def __aiter__(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+class FakeLLMBackend(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    로컬 가짜 OpenAI 백엔드 (chat/completions, embeddings)
+    지연 시간, 서버 측 분당 요청 한도(x-ratelimit-* 헤더 + 429), 강제 429 주입을 흉내 냄
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        responder: Optional[Callable[[Dict[str, Any]], str]] = None,
+        rpm_limit: Optional[int] = None,
+        embedding_dim: Optional[int] = None,
+    ):
+        self.latency = latency
+        self.responder = responder or self._default_responder
+        self.rpm_limit = rpm_limit
+        self.embedding_dim = embedding_dim
+        self.requests: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._forced_429: List[float] = []
+        self._window: deque = deque()
+
+    @staticmethod
+    def _default_responder(body: Dict[str, Any]) -> str:
+        messages = body.get("messages") or [{}]
+        last = messages[-1].get("content") or ""
+        return f"가짜 응답: {str(last)[:50]}"
+
+    def fail_next(self, count: int = 1, retry_after: float = 0.05):
+        """다음 count개 요청에 429 응답"""
+        with self._lock:
+            self._forced_429.extend([retry_after] * count)
+
+    # ----- 응답 생성 -----
+
+    def _rate_limit(self) -> Dict[str, Any]:
+        """(429 여부, 재시도 대기, 응답 헤더)"""
+        with self._lock:
+            if self._forced_429:
+                return {"limited": True, "retry_after": self._forced_429.pop(0), "headers": {}}
+            if not self.rpm_limit:
+                return {"limited": False, "headers": {}}
+            now = time.monotonic()
+            while self._window and now - self._window[0] >= 60:
+                self._window.popleft()
+            headers = {"x-ratelimit-limit-requests": str(self.rpm_limit)}
+            if len(self._window) >= self.rpm_limit:
+                headers["x-ratelimit-remaining-requests"] = "0"
+                return {"limited": True, "retry_after": 60 - (now - self._window[0]), "headers": headers}
+            self._window.append(now)
+            headers["x-ratelimit-remaining-requests"] = str(self.rpm_limit - len(self._window))
+            return {"limited": False, "headers": headers}
+
+    def _embedding(self, text: str, dim: int) -> List[float]:
+        values = []
+        seed = text.encode()
+        while len(values) < dim:
+            seed = hashlib.sha256(seed).digest()
+            values.extend((byte - 127.5) / 127.5 for byte in seed)
+        return values[:dim]
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        try:
+            body = json.loads(request.read() or b"{}")
+        except Exception:
+            body = {}
+        with self._lock:
+            self.requests.append(body)
+
+        limit = self._rate_limit()
+        if limit["limited"]:
+            headers = {**limit["headers"], "retry-after-ms": str(int(limit["retry_after"] * 1000))}
+            return httpx.Response(
+                429, headers=headers, request=request,
+                json={"error": {"message": "Rate limit reached (fake)", "type": "requests", "code": "rate_limit_exceeded"}},
+            )
+
+        model = body.get("model") or "gpt-4o-mini"
+        prompt_tokens = max(1, input_tokens(body))
+
+        if request.url.path.endswith("/embeddings"):
+            inputs = body.get("input")
+            inputs = [inputs] if isinstance(inputs, str) else list(inputs or [])
+            dim = self.embedding_dim or body.get("dimensions") or (3072 if "large" in model else 1536)
+            payload = {
+                "object": "list",
+                "model": model,
+                "data": [{"object": "embedding", "index": i, "embedding": self._embedding(str(text), dim)}
+                         for i, text in enumerate(inputs)],
+                "usage": {"prompt_tokens": prompt_tokens, "total_tokens": prompt_tokens},
+            }
+            return httpx.Response(200, headers=limit["headers"], json=payload, request=request)
+
+        content = self.responder(body)
+        completion_tokens = max(1, math.ceil(len(content) / 4))
+        usage = {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                 "total_tokens": prompt_tokens + completion_tokens}
+        created = int(time.time())
+
+        if body.get("stream"):
+            chunks = [
+                {"id": "chatcmpl-fake", "object": "chat.completion.chunk", "created": created, "model": model,
+                 "choices": [{"index": 0, "delta": {"role": "assistant", "content": content}, "finish_reason": None}]},
+                {"id": "chatcmpl-fake", "object": "chat.completion.chunk", "created": created, "model": model,
+                 "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]},
+            ]
+            events = [f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode() for chunk in chunks]
+            events.append(b"data: [DONE]\n\n")
+            headers = {**limit["headers"], "content-type": "text/event-stream"}
+            return httpx.Response(200, headers=headers, stream=_ChunkStream(events), request=request)
+
+        payload = {
+            "id": "chatcmpl-fake",
+            "object": "chat.completion",
+            "created": created,
+            "model": model,
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": usage,
+        }
+        return httpx.Response(200, headers=limit["headers"], json=payload, request=request)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self.latency:
+            time.sleep(self.latency)
+        return self._respond(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._respond(request)
+
+
+# 싱글톤 인스턴스
+_gateway: Optional[LLMGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_llm_gateway() -> LLMGateway:
+    """LLM 게이트웨이 싱글톤 (LLM_GATEWAY_BACKEND=fake 이면 가짜 백엔드 사용)"""
+    global _gateway
+    with _gateway_lock:
+        if _gateway is None:
+            backend = None
+            if LLM_GATEWAY_BACKEND == "fake":
+                backend = FakeLLMBackend(latency=float(os.getenv("LLM_FAKE_LATENCY", 0.05)))
+            _gateway = LLMGateway(backend=backend)
+            logger.info(f"[LLMGateway] 초기화 완료 (backend={'fake' if backend else 'openai'})")
+        return _gateway
+
+
+def _collect_gateway_metrics():
+    """/metrics 수집기 - 게이트웨이가 만들어진 뒤에만 레인 / 모델 상태를 내보냄"""
+    if _gateway is None:
+        return []
+    registry = get_metrics_registry()
+    stats = _gateway.stats()
+    requests = registry.family("llm_requests_total", "counter", "게이트웨이를 거친 LLM 요청 수 (재시도 제외)")
+    events = registry.family("llm_gateway_events_total", "counter", "레이트 리밋 / 재시도 / 타임아웃 / 오류 횟수")
+    tokens = registry.family("llm_tokens_total", "counter", "LLM 토큰 사용량")
+    in_flight = registry.family("llm_in_flight", "gauge", "실행 중인 LLM 요청 수")
+    waiting = registry.family("llm_queue_waiting", "gauge", "슬롯을 기다리는 LLM 요청 수")
+    available = registry.family("llm_budget_available", "gauge", "모델별 남은 분당 레이트 리밋 예산")
+    for lane, lane_stats in stats["lanes"].items():
+        requests.add(lane_stats["requests"], lane=lane)
+        for event in ("rate_limited", "retries", "timeouts", "errors"):
+            events.add(lane_stats[event], lane=lane, event=event)
+        for token_type, value in lane_stats["tokens"].items():
+            tokens.add(value, lane=lane, type=token_type)
+        in_flight.add(lane_stats["in_flight"], lane=lane)
+        waiting.add(lane_stats["waiting"], lane=lane)
+    for model, budget in stats["models"].items():
+        available.add(budget["requests_available"], model=model, resource="requests")
+        available.add(budget["tokens_available"], model=model, resource="tokens")
+    return [requests, events, tokens, in_flight, waiting, available]
+
+
+get_metrics_registry().register_collector("llm_gateway", _collect_gateway_metrics)
@@ -0,0 +1,215 @@
+"""
+구조화 로깅 (레코드 하나 = JSON 한 줄)
+
+- 호출 스레드 / 이벤트 루프는 레코드를 큐에 넣기만 하고, stdout 출력은 전용 스레드(QueueListener)가 담당
+  큐가 가득 차면 기다리지 않고 버림 (버린 수는 /metrics dreampath_log_records_dropped_total)
+- 레코드마다 trace_id(요청 단위, MetricsMiddleware가 시작한 span)와 log_context로 묶은 값(task_id 등) 포함
+- 모듈별 레벨: LOG_LEVELS="services.web_crawler_service=WARNING,services.agents=DEBUG"
+- DEBUG 샘플링: LOG_DEBUG_SAMPLING="services.web_crawler_service=0.1" (해당 모듈 DEBUG 레코드 10%만 출력)
+  호출 단위로는 logger.debug(..., extra={"sample_rate": 0.01})
+- LOG_FORMAT=text 이면 사람이 읽는 한 줄 형식 (로컬 개발용)
+
+사용:
+    logger = logging.getLogger(__name__)
+    with log_context(task_id=task_id):
+        logger.info("추천 계산 완료", extra={"saved": 12})
+"""
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+from services.common.metrics import current_trace_id, get_metrics_registry
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json").lower()
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", 10000))
+# 에이전트 / 채팅 로그는 기존처럼 DEBUG까지 (LOG_LEVELS로 덮어쓰기 가능)
+DEFAULT_MODULE_LEVELS = "services.agents=DEBUG,services.chat_service=DEBUG"
+
+# LogRecord 기본 속성 - 나머지는 extra로 넘어온 구조화 필드
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "trace_id", "context"}
+
+_log_context: ContextVar[Dict[str, Any]] = ContextVar("log_context", default={})
+
+_records_dropped = get_metrics_registry().counter(
+    "log_records_dropped", "로그 큐가 가득 차서 버린 레코드 수", ("logger",)
+)
+_records_sampled_out = get_metrics_registry().counter(
+    "log_records_sampled_out", "DEBUG 샘플링으로 건너뛴 레코드 수", ("logger",)
+)
+
+
+@contextmanager
+def log_context(**fields):
+    """블록 안의 로그 레코드에 필드 추가 (task_id, run_id 등 - 중첩 시 바깥 값과 합쳐짐)"""
+    token = _log_context.set({**_log_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
+def parse_module_settings(value: Optional[str]) -> Dict[str, str]:
+    """"a.b=DEBUG, c=0.1" → {"a.b": "DEBUG", "c": "0.1"} (형식이 틀린 항목은 무시)"""
+    settings = {}
+    for item in (value or "").split(","):
+        name, sep, setting = item.partition("=")
+        if sep and name.strip() and setting.strip():
+            settings[name.strip()] = setting.strip()
+    return settings
+
+
+def _match_prefix(name: str, table: Dict[str, Any]) -> Optional[Any]:
+    """로거 이름과 가장 길게 일치하는 모듈 설정 (services.agents → services.agents.career_agent)"""
+    while name:
+        if name in table:
+            return table[name]
+        name = name.rpartition(".")[0]
+    return None
+
+
+class ContextFilter(logging.Filter):
+    """호출한 쪽 컨텍스트(trace_id, log_context 필드)를 레코드에 고정 - 큐 너머 출력 스레드에서는 알 수 없으므로"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.trace_id = current_trace_id()
+        record.context = _log_context.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """INFO 미만 레코드를 모듈별 비율(또는 extra의 sample_rate)만큼만 통과"""
+
+    def __init__(self, rates: Optional[Dict[str, float]] = None):
+        super().__init__()
+        self.rates = rates or {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.INFO:
+            return True
+        rate = getattr(record, "sample_rate", None)
+        if rate is None:
+            rate = _match_prefix(record.name, self.rates)
+        if rate is None or rate >= 1.0 or random.random() < rate:
+            return True
+        _records_sampled_out.inc(logger=record.name)
+        return False
+
+
+class JsonFormatter(logging.Formatter):
+    """ts / level / logger / message / trace_id + 컨텍스트 필드 + extra 필드를 JSON 한 줄로"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        trace_id = getattr(record, "trace_id", None)
+        if trace_id:
+            payload["trace_id"] = trace_id
+        payload.update(getattr(record, "context", None) or {})
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and key != "sample_rate":
+                payload[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exc_info"] = record.exc_text
+        if record.stack_info:
+            payload["stack_info"] = record.stack_info
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """로컬 개발용 한 줄 형식 (trace_id / 컨텍스트 필드는 뒤에 key=value)"""
+
+    def __init__(self):
+        super().__init__("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        fields = dict(getattr(record, "context", None) or {})
+        if getattr(record, "trace_id", None):
+            fields["trace_id"] = record.trace_id
+        if fields:
+            line += " | " + " ".join(f"{key}={value}" for key, value in fields.items())
+        return line
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """큐가 가득 차면 기다리지 않고 버리는 QueueHandler (예외 정보는 여기서 문자열로 만들어 프레임을 붙잡지 않음)"""
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            _records_dropped.inc(logger=record.name)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+# 싱글톤 인스턴스
+_listener: Optional[QueueListener] = None
+_lock = threading.Lock()
+
+
+def configure_logging(stream=None) -> QueueListener:
+    """
+    루트 로거를 큐 기반 구조화 로깅으로 설정 (여러 번 호출해도 한 번만 적용)
+    기존 루트 핸들러(basicConfig 등)는 제거하고, 출력은 QueueListener 스레드에서만 수행
+    """
+    global _listener
+    with _lock:
+        if _listener is not None:
+            return _listener
+
+        output = logging.StreamHandler(stream or sys.stdout)
+        output.setFormatter(TextFormatter() if LOG_FORMAT == "text" else JsonFormatter())
+
+        handler = NonBlockingQueueHandler(queue.Queue(maxsize=LOG_QUEUE_SIZE))
+        handler.addFilter(SamplingFilter({
+            name: float(rate) for name, rate in parse_module_settings(os.getenv("LOG_DEBUG_SAMPLING")).items()
+        }))
+        handler.addFilter(ContextFilter())
+
+        root = logging.getLogger()
+        for existing in list(root.handlers):
+            root.removeHandler(existing)
+        root.addHandler(handler)
+        root.setLevel(LOG_LEVEL)
+
+        levels = parse_module_settings(DEFAULT_MODULE_LEVELS)
+        levels.update(parse_module_settings(os.getenv("LOG_LEVELS")))
+        for name, level in levels.items():
+            logging.getLogger(name).setLevel(level.upper())
+
+        _listener = QueueListener(handler.queue, output, respect_handler_level=True)
+        _listener.start()
+        return _listener
+
+
+def shutdown_logging():
+    """남은 레코드를 모두 출력하고 출력 스레드 종료 (서버 종료 시 호출)"""
+    global _listener
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
@@ -0,0 +1,583 @@
+"""
+요청 / 외부 호출 지표 + 경량 트레이싱
+Prometheus 텍스트 형식(/metrics)으로 내보내며, 운영에서 항상 켜 둘 수 있도록 기록 경로를 가볍게 유지합니다.
+
+- Counter / Gauge / Histogram: 라벨 조합별 값만 락 안에서 갱신 (히스토그램은 버킷 인덱스 bisect 한 번)
+- 수집기(register_collector): 캐시 적중 수, 게이트웨이 / 스케줄러 상태처럼 이미 다른 곳에서 세고 있는 값은
+  스크레이프 시점에 읽어서 내보냄 (요청 경로에는 비용 없음)
+- span / traced: 외부 호출(db, llm, pinecone, supabase, crawler)과 LangGraph 노드 실행 시간을
+  dreampath_span_duration_seconds{kind, name, status}로 기록하고, 같은 요청 안의 span은 하나의 trace로 묶음
+- MetricsMiddleware: 라우트 템플릿(/api/items/{id}) 기준 요청 수 / 지연 시간 / 처리 중 요청 수,
+  W3C traceparent 헤더를 이어받아 응답에 x-trace-id로 돌려줌
+
+METRICS_ENABLED=false 이면 기록을 건너뜀 (엔드포인트는 빈 값 노출)
+"""
+import asyncio
+import functools
+import logging
+import os
+import random
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() != "false"
+TRACE_BUFFER_SIZE = int(os.getenv("TRACE_BUFFER_SIZE", 2000))
+METRIC_PREFIX = "dreampath_"
+
+# 초 단위 - 짧은 DB 조회부터 긴 LLM / 크롤링 호출까지
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_TRACEPARENT = re.compile(r"^[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+
+# =========================================
+# 지표
+# =========================================
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def percentile(sorted_values: Sequence[float], q: float, default: Optional[float] = 0.0) -> Optional[float]:
+    """정렬된 최근 측정값의 백분위수 (q: 0~1, 소수 셋째 자리 반올림, 값이 없으면 default)"""
+    if not sorted_values:
+        return default
+    return round(sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q))], 3)
+
+
+@dataclass
+class MetricFamily:
+    """스크레이프 시점 수집값 (samples: (이름 접미사, 라벨, 값))"""
+    name: str
+    kind: str
+    documentation: str
+    samples: List[Tuple[str, Dict[str, str], float]] = field(default_factory=list)
+
+    def add(self, value: float, suffix: str = "", **labels):
+        self.samples.append((suffix, {k: str(v) for k, v in labels.items()}, value))
+        return self
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], Any] = {}
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _labels(self, key: Tuple[str, ...]) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def collect(self) -> MetricFamily:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels):
+        if not METRICS_ENABLED:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def collect(self) -> MetricFamily:
+        # 텍스트 형식 0.0.4는 HELP / TYPE에도 _total이 붙은 이름을 씀
+        family = MetricFamily(self.name + "_total", self.kind, self.documentation)
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            family.samples.append(("", self._labels(key), value))
+        return family
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def collect(self) -> MetricFamily:
+        family = MetricFamily(self.name, self.kind, self.documentation)
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            family.samples.append(("", self._labels(key), value))
+        return family
+
+
+class _HistogramState:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        if not METRICS_ENABLED:
+            return
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = _HistogramState(len(self.buckets) + 1)
+            state.counts[index] += 1
+            state.sum += value
+            state.count += 1
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return state.count if state else 0
+
+    def collect(self) -> MetricFamily:
+        family = MetricFamily(self.name, self.kind, self.documentation)
+        with self._lock:
+            items = [(key, list(state.counts), state.sum, state.count) for key, state in self._values.items()]
+        for key, counts, total, count in items:
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                family.samples.append(("_bucket", {**labels, "le": _format_value(bound)}, cumulative))
+            family.samples.append(("_sum", labels, total))
+            family.samples.append(("_count", labels, count))
+        return family
+
+
+class MetricsRegistry:
+    """지표 / 수집기 모음 + Prometheus 텍스트 렌더링"""
+
+    def __init__(self, prefix: str = METRIC_PREFIX):
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: Dict[str, Callable[[], Iterable[MetricFamily]]] = {}
+
+    def _get_or_create(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs) -> Any:
+        full_name = self.prefix + name
+        with self._lock:
+            metric = self._metrics.get(full_name)
+            if metric is None:
+                metric = self._metrics[full_name] = cls(full_name, documentation, labelnames, **kwargs)
+            elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"지표 정의 충돌: {full_name}")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def register_collector(self, name: str, collector: Callable[[], Iterable[MetricFamily]]):
+        """스크레이프 때 호출할 수집기 등록 (같은 이름이면 교체)"""
+        with self._lock:
+            self._collectors[name] = collector
+
+    def family(self, name: str, kind: str, documentation: str) -> MetricFamily:
+        """수집기에서 쓸 빈 MetricFamily (접두사 포함 이름)"""
+        return MetricFamily(self.prefix + name, kind, documentation)
+
+    def cache_families(self, cache: str, hits: int, misses: int) -> List[MetricFamily]:
+        """캐시 적중 / 미스 누적 수 + 적중률 (캐시마다 같은 이름으로 내보내 cache 라벨로 구분)"""
+        requests = self.family("cache_requests_total", "counter", "캐시 조회 수 (result=hit|miss)")
+        requests.add(hits, cache=cache, result="hit").add(misses, cache=cache, result="miss")
+        ratio = self.family("cache_hit_ratio", "gauge", "프로세스 시작 이후 캐시 적중률")
+        ratio.add(round(hits / (hits + misses), 4) if hits + misses else 0.0, cache=cache)
+        return [requests, ratio]
+
+    def collect(self) -> List[MetricFamily]:
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors.items())
+        families: Dict[str, MetricFamily] = {}
+
+        def merge(family: MetricFamily):
+            # 여러 수집기가 같은 이름(예: cache_requests_total)을 내보내면 하나의 HELP / TYPE 아래로 합침
+            existing = families.get(family.name)
+            if existing is None:
+                families[family.name] = MetricFamily(family.name, family.kind, family.documentation, list(family.samples))
+            else:
+                existing.samples.extend(family.samples)
+
+        for metric in metrics:
+            merge(metric.collect())
+        for name, collector in collectors:
+            try:
+                for family in collector():
+                    if family.samples:
+                        merge(family)
+            except Exception as e:
+                # 수집기 하나가 실패해도 나머지 지표는 내보냄
+                logger.warning(f"[Metrics] 수집기 실패 ({name}): {e}")
+        return list(families.values())
+
+    def render(self) -> str:
+        lines = []
+        for family in self.collect():
+            lines.append(f"# HELP {family.name} {_escape(family.documentation)}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+            for suffix, labels, value in family.samples:
+                lines.append(f"{family.name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+# =========================================
+# 트레이싱
+# =========================================
+
+class Span:
+    """실행 구간 하나 (trace_id / parent_id로 요청 안의 호출 관계를 복원)"""
+
+    __slots__ = ("trace_id", "span_id", "parent_id", "kind", "name", "attributes", "started_at", "_started", "duration", "status")
+
+    def __init__(self, kind: str, name: str, trace_id: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.trace_id = trace_id
+        self.span_id = _new_id(64)
+        self.parent_id = parent_id
+        self.kind = kind
+        self.name = name
+        self.attributes = attributes
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+        self.duration = 0.0
+        self.status = "ok"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "kind": self.kind,
+            "name": self.name,
+            "status": self.status,
+            "started_at": self.started_at,
+            "duration_ms": round(self.duration * 1000, 3),
+            "attributes": self.attributes,
+        }
+
+
+def _new_id(bits: int) -> str:
+    return format(random.getrandbits(bits), f"0{bits // 4}x")
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("metrics_current_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def current_trace_id() -> Optional[str]:
+    active = _current_span.get()
+    return active.trace_id if active else None
+
+
+class TraceRecorder:
+    """최근 종료된 span 보관 (고정 크기 링 버퍼)"""
+
+    def __init__(self, max_spans: int = TRACE_BUFFER_SIZE):
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+
+    def record(self, finished: Span):
+        self._spans.append(finished)
+
+    def spans(self, trace_id: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        snapshot = list(self._spans)
+        if trace_id:
+            snapshot = [s for s in snapshot if s.trace_id == trace_id]
+        return [s.to_dict() for s in snapshot[-limit:]]
+
+    def clear(self):
+        self._spans.clear()
+
+
+class span:
+    """
+    실행 구간 측정 (동기 / 비동기 코드 모두 with 블록으로 사용)
+
+        with span("db", "execute_query"):
+            ...
+    """
+
+    __slots__ = ("kind", "name", "attributes", "trace_id", "parent_id", "observe", "_span", "_token")
+
+    def __init__(
+        self,
+        kind: str,
+        name: str,
+        trace_id: Optional[str] = None,
+        parent_id: Optional[str] = None,
+        observe: bool = True,
+        **attributes
+    ):
+        self.kind = kind
+        self.name = name
+        self.attributes = attributes
+        self.trace_id = trace_id
+        self.parent_id = parent_id
+        # False면 trace에만 남기고 span 히스토그램에는 기록하지 않음 (요청 루트 span은 http_* 지표가 따로 있음)
+        self.observe = observe
+        self._span: Optional[Span] = None
+        self._token = None
+
+    def __enter__(self) -> Optional[Span]:
+        if not METRICS_ENABLED:
+            return None
+        parent = _current_span.get()
+        if self.trace_id:
+            trace_id, parent_id = self.trace_id, self.parent_id
+        elif parent is not None:
+            trace_id, parent_id = parent.trace_id, parent.span_id
+        else:
+            trace_id, parent_id = _new_id(128), None
+        self._span = Span(self.kind, self.name, trace_id, parent_id, self.attributes)
+        self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb):
+        active = self._span
+        if active is None:
+            return False
+        _current_span.reset(self._token)
+        active.duration = time.perf_counter() - active._started
+        if exc_type is not None and active.status == "ok":
+            active.status = "error"
+        if self.observe:
+            _span_duration.observe(active.duration, kind=active.kind, name=active.name, status=active.status)
+        _recorder.record(active)
+        return False
+
+
+def traced(kind: str, name: Optional[str] = None):
+    """함수 실행을 span으로 감싸는 데코레이터 (코루틴 함수도 지원, 이름 기본값은 함수 이름)"""
+
+    def decorator(func):
+        span_name = name or func.__name__
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(kind, span_name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(kind, span_name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+class _TracedProxy:
+    """외부 SDK 객체의 지정 메서드만 span으로 감싸는 프록시 (나머지 속성은 그대로 위임)"""
+
+    def __init__(self, target: Any, kind: str, methods: Sequence[str]):
+        self._target = target
+        self._kind = kind
+        self._methods = frozenset(methods)
+        self._wrapped: Dict[str, Callable] = {}
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._target, name)
+        if name not in self._methods or not callable(attr):
+            return attr
+        wrapped = self._wrapped.get(name)
+        if wrapped is None:
+            wrapped = self._wrapped[name] = traced(self._kind, name)(attr)
+        return wrapped
+
+
+def instrument(target: Any, kind: str, methods: Sequence[str]) -> Any:
+    """target의 methods 호출을 kind span으로 기록하는 프록시 반환 (target이 None이면 None)"""
+    if target is None or not METRICS_ENABLED:
+        return target
+    return _TracedProxy(target, kind, methods)
+
+
+class TracedAsyncTransport(httpx.AsyncBaseTransport):
+    """httpx 비동기 트랜스포트 래퍼 - 요청 하나를 span 하나로 기록 (상태 코드는 속성으로 남김)"""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, kind: str, name: str):
+        self._inner = inner
+        self._kind = kind
+        self._name = name
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        with span(self._kind, self._name, host=request.url.host) as active:
+            response = await self._inner.handle_async_request(request)
+            if active is not None:
+                active.attributes["status_code"] = response.status_code
+                if response.status_code >= 400:
+                    active.status = "error"
+            return response
+
+    async def aclose(self):
+        await self._inner.aclose()
+
+
+# =========================================
+# ASGI 미들웨어
+# =========================================
+
+def parse_traceparent(value: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """W3C traceparent → (trace_id, parent span_id), 형식이 맞지 않으면 (None, None)"""
+    match = _TRACEPARENT.match((value or "").strip().lower())
+    if not match or match.group(1) == "0" * 32:
+        return None, None
+    return match.group(1), match.group(2)
+
+
+def route_template(scope: Dict[str, Any]) -> str:
+    """매칭된 라우트의 경로 템플릿 (매칭 실패 시 unmatched - 임의 경로로 라벨이 늘어나지 않도록)"""
+    route = scope.get("route")
+    if route is None:
+        return "unmatched"
+    return getattr(route, "path_format", None) or getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """요청 수 / 지연 시간 / 처리 중 요청 수 + 요청 단위 루트 span (순수 ASGI - 스트리밍 응답도 그대로 통과)"""
+
+    def __init__(self, app, registry: Optional[MetricsRegistry] = None):
+        self.app = app
+        registry = registry or get_metrics_registry()
+        self.requests = registry.counter("http_requests", "HTTP 요청 수", ("method", "route", "status"))
+        self.latency = registry.histogram(
+            "http_request_duration_seconds", "HTTP 요청 처리 시간 (응답 본문 전송 완료까지)", ("method", "route")
+        )
+        self.in_flight = registry.gauge("http_requests_in_flight", "처리 중인 HTTP 요청 수")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        trace_id, parent_id = parse_traceparent(headers.get(b"traceparent", b"").decode("latin-1"))
+        status_code = 500
+        method = scope.get("method", "GET")
+
+        self.in_flight.inc()
+        started = time.perf_counter()
+        root = span("http", "request", trace_id=trace_id, parent_id=parent_id, observe=False, method=method)
+        active = root.__enter__()
+
+        async def send_with_trace(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message = {
+                    **message,
+                    "headers": list(message.get("headers") or []) + [(b"x-trace-id", active.trace_id.encode())],
+                }
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_trace)
+        except BaseException:
+            status_code = 500
+            raise
+        finally:
+            route = route_template(scope)
+            active.name = route
+            active.attributes["status_code"] = status_code
+            if status_code >= 500:
+                active.status = "error"
+            root.__exit__(None, None, None)
+            self.in_flight.dec()
+            self.requests.inc(method=method, route=route, status=status_code)
+            self.latency.observe(time.perf_counter() - started, method=method, route=route)
+
+
+# 싱글톤 인스턴스
+_registry = MetricsRegistry()
+_recorder = TraceRecorder()
+_span_duration = _registry.histogram(
+    "span_duration_seconds", "외부 호출 / 그래프 노드 실행 시간", ("kind", "name", "status")
+)
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    return _registry
+
+
+def get_trace_recorder() -> TraceRecorder:
+    return _recorder
@@ -5,7 +5,7 @@ import os
 import json
 import re
 from typing import List, Dict
-from openai import OpenAI
+from services.common.llm_clients import get_openai_client
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -21,7 +21,7 @@ class OpenAIService:
             self.client = None
             self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
         else:
-            self.client = OpenAI(api_key=api_key)
+            self.client = get_openai_client()
             self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
     
     def get_analysis(
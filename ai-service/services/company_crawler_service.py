@@ -6,10 +6,13 @@ from typing import List, Dict, Optional
 import httpx
 from bs4 import BeautifulSoup
 import asyncio
+import logging
 import re
 from services.database_service import DatabaseService
 from services.selenium_crawler_service import SeleniumCrawlerService
 
+logger = logging.getLogger(__name__)
+
 
 class CompanyCrawlerService:
     """기업정보 크롤링 서비스"""
@@ -62,7 +65,7 @@ class CompanyCrawlerService:
                         return csn_match.group(1)
 
         except Exception as e:
-            print(f"[사람인] httpx로 csn 추출 중 오류: {str(e)}")
+            logger.warning(f"[사람인] httpx로 csn 추출 중 오류: {str(e)}")
 
         return None
 
@@ -99,7 +102,7 @@ class CompanyCrawlerService:
                         return title_match.group(1)
 
         except Exception as e:
-            print(f"[사람인] httpx로 회사명 추출 중 오류: {str(e)}")
+            logger.warning(f"[사람인] httpx로 회사명 추출 중 오류: {str(e)}")
 
         return None
 
@@ -213,12 +216,12 @@ class CompanyCrawlerService:
             저장된 기업 수
         """
         if not companies:
-            print("[기업정보] 저장할 기업정보가 없습니다.")
+            logger.info("[기업정보] 저장할 기업정보가 없습니다.")
             return 0
 
-        print(f"[기업정보] {len(companies)}개 기업 정보 저장 시작...")
+        logger.info(f"[기업정보] {len(companies)}개 기업 정보 저장 시작...")
         saved_count = self.db_service.save_company_info(site_name, companies)
-        print(f"[기업정보] {saved_count}개 기업 정보 저장 완료!")
+        logger.info(f"[기업정보] {saved_count}개 기업 정보 저장 완료!")
 
         return saved_count
 
@@ -314,7 +317,7 @@ class CompanyCrawlerService:
                     return result
 
         except Exception as e:
-            print(f"[원티드] 기업 상세 정보 크롤링 실패 (job_id: {job_id}): {str(e)}")
+            logger.warning(f"[원티드] 기업 상세 정보 크롤링 실패 (job_id: {job_id}): {str(e)}")
 
         return {}
 
@@ -365,7 +368,7 @@ class CompanyCrawlerService:
                             break
 
                 if not company_link:
-                    print(f"[잡코리아] 기업 링크를 찾을 수 없음: {job_url}")
+                    logger.debug(f"[잡코리아] 기업 링크를 찾을 수 없음: {job_url}")
                     return {}
 
                 company_href = company_link.get('href', '')
@@ -396,7 +399,7 @@ class CompanyCrawlerService:
                                 company_url = f"https://www.jobkorea.co.kr/Recruit/Co_Read/C/{company_id}"
 
                 if not company_url:
-                    print(f"[잡코리아] 기업 URL 파싱 실패: {company_href}")
+                    logger.warning(f"[잡코리아] 기업 URL 파싱 실패: {company_href}")
                     return {}
 
                 # 기업 상세 페이지 크롤링
@@ -578,7 +581,7 @@ class CompanyCrawlerService:
                     return result
 
         except Exception as e:
-            print(f"[잡코리아] 기업 상세 정보 크롤링 실패 (job_url: {job_url}): {str(e)}")
+            logger.warning(f"[잡코리아] 기업 상세 정보 크롤링 실패 (job_url: {job_url}): {str(e)}")
 
         return {}
 
@@ -599,35 +602,35 @@ class CompanyCrawlerService:
             actual_csn = company_id
             if company_id and company_id.startswith('rec_'):
                 rec_id = company_id.replace('rec_', '')
-                print(f"[사람인] rec_idx {rec_id}에서 csn 추출 시도...")
+                logger.debug(f"[사람인] rec_idx {rec_id}에서 csn 추출 시도...")
 
                 # 먼저 httpx로 채용공고 페이지에서 csn 추출 시도 (빠름)
                 if job_url:
-                    print(f"[사람인] 채용공고 페이지에서 csn 추출 시도: {job_url}")
+                    logger.debug(f"[사람인] 채용공고 페이지에서 csn 추출 시도: {job_url}")
                     actual_csn = await self._extract_csn_from_job_page(job_url)
                     if actual_csn:
-                        print(f"[사람인] 채용공고 페이지에서 csn 추출 성공: {actual_csn}")
+                        logger.debug(f"[사람인] 채용공고 페이지에서 csn 추출 성공: {actual_csn}")
 
                 # httpx로 실패하면 Selenium 사용 (느림)
                 if not actual_csn or actual_csn.startswith('rec_'):
-                    print(f"[사람인] Selenium으로 csn 추출 시도...")
+                    logger.debug(f"[사람인] Selenium으로 csn 추출 시도...")
                     try:
                         selenium_service = self._get_selenium_service()
                         actual_csn = selenium_service.get_saramin_company_csn(rec_id)
 
                         if actual_csn:
-                            print(f"[사람인] Selenium으로 csn 추출 성공: {actual_csn}")
+                            logger.debug(f"[사람인] Selenium으로 csn 추출 성공: {actual_csn}")
                         else:
-                            print(f"[사람인] Selenium으로 csn 추출 실패")
+                            logger.warning(f"[사람인] Selenium으로 csn 추출 실패")
                             return {}
                     except Exception as e:
-                        print(f"[사람인] Selenium 사용 중 오류: {str(e)}")
+                        logger.warning(f"[사람인] Selenium 사용 중 오류: {str(e)}")
                         return {}
 
             # CSN이 없으면 기업 상세 페이지 크롤링 불가
             # 대신 채용공고 페이지에서 추출할 수 있는 정보 반환
             if not actual_csn or actual_csn.startswith('rec_'):
-                print(f"[사람인] csn 추출 실패, 채용공고 페이지에서 기본 정보만 추출: {actual_csn}")
+                logger.warning(f"[사람인] csn 추출 실패, 채용공고 페이지에서 기본 정보만 추출: {actual_csn}")
 
                 # 채용공고 페이지에서 기본 정보 추출
                 if job_url:
@@ -658,12 +661,12 @@ class CompanyCrawlerService:
 
                                 return result
                     except Exception as e:
-                        print(f"[사람인] 채용공고 페이지에서 정보 추출 실패: {str(e)}")
+                        logger.warning(f"[사람인] 채용공고 페이지에서 정보 추출 실패: {str(e)}")
 
                 return {}
 
             company_url = f"https://www.saramin.co.kr/zf_user/company-info/view?csn={actual_csn}"
-            print(f"[사람인] 회사 페이지 크롤링: {company_url}")
+            logger.debug(f"[사람인] 회사 페이지 크롤링: {company_url}")
 
             async with httpx.AsyncClient(headers=self.headers, timeout=30.0, follow_redirects=True) as client:
                 response = await client.get(company_url)
@@ -758,7 +761,7 @@ class CompanyCrawlerService:
                     )
                     if company_name_elem:
                         result['company_name'] = company_name_elem.get_text(strip=True)
-                        print(f"[사람인] 회사명 추출: {result['company_name']}")
+                        logger.debug(f"[사람인] 회사명 추출: {result['company_name']}")
 
                     # 회사 소개
                     intro_section = soup.find('div', class_='company_intro')
@@ -778,7 +781,7 @@ class CompanyCrawlerService:
                     return result
 
         except Exception as e:
-            print(f"[사람인] 기업 상세 정보 크롤링 실패 (company_id: {company_id}): {str(e)}")
+            logger.warning(f"[사람인] 기업 상세 정보 크롤링 실패 (company_id: {company_id}): {str(e)}")
 
         return {}
 
@@ -812,7 +815,7 @@ class CompanyCrawlerService:
                         # 원티드 API로 상세 정보 가져오기
                         details = await self.crawl_wanted_company_detail(job_id)
                         enriched_company.update(details)
-                        print(f"[원티드] {company.get('company_name')} 상세 정보 추가")
+                        logger.debug(f"[원티드] {company.get('company_name')} 상세 정보 추가")
                         await asyncio.sleep(0.5)  # Rate limiting
 
                 elif site_name in ['jobkorea', '잡코리아']:
@@ -821,7 +824,7 @@ class CompanyCrawlerService:
                     if job_url:
                         details = await self.crawl_jobkorea_company_detail(job_url)
                         enriched_company.update(details)
-                        print(f"[잡코리아] {company.get('company_name')} 상세 정보 추가")
+                        logger.debug(f"[잡코리아] {company.get('company_name')} 상세 정보 추가")
                         await asyncio.sleep(1.0)  # Rate limiting (더 느리게)
 
                 elif site_name in ['saramin', '사람인']:
@@ -832,11 +835,11 @@ class CompanyCrawlerService:
 
                     # 회사명이 "회사명 미상"이면 채용공고 페이지에서 추출 시도
                     if job_url and ('회사명 미상' in company_name or not company_name):
-                        print(f"[사람인] 회사명 추출 시도: {job_url}")
+                        logger.debug(f"[사람인] 회사명 추출 시도: {job_url}")
                         extracted_name = await self._extract_company_name_from_job_page(job_url)
                         if extracted_name:
                             enriched_company['company_name'] = extracted_name
-                            print(f"[사람인] 회사명 추출 성공: {extracted_name}")
+                            logger.debug(f"[사람인] 회사명 추출 성공: {extracted_name}")
 
                     if company_id:
                         details = await self.crawl_saramin_company_detail(
@@ -849,11 +852,11 @@ class CompanyCrawlerService:
                         if details.get('company_name'):
                             enriched_company['company_name'] = details['company_name']
 
-                        print(f"[사람인] {enriched_company.get('company_name') or company_id} 상세 정보 추가")
+                        logger.debug(f"[사람인] {enriched_company.get('company_name') or company_id} 상세 정보 추가")
                         await asyncio.sleep(1.0)  # Rate limiting (더 느리게)
 
             except Exception as e:
-                print(f"기업 정보 보강 실패 ({company.get('company_name')}): {str(e)}")
+                logger.warning(f"기업 정보 보강 실패 ({company.get('company_name')}): {str(e)}")
 
             enriched.append(enriched_company)
 
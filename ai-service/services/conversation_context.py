@@ -0,0 +1,439 @@
+"""
+대화 컨텍스트 관리 (토큰 예산 기반 윈도우 + 세션별 누적 요약)
+세션이 길어져도 LLM에 보내는 프롬프트 토큰이 일정하게 유지되도록
+최근 대화는 토큰 예산 안에서 그대로 보내고, 예산을 벗어난 이전 대화는 요약으로 대체합니다.
+
+    [누적 요약] + [최근 N턴 (토큰 예산 이내)] + [현재 메시지]
+
+- 예산을 넘으면 하한선(LOW_WATERMARK)까지 한 번에 밀어내고 요약 → 매 턴마다 요약 호출하지 않음
+- 요약은 세션별로 Redis에 저장 (연결 실패 시 인메모리), 이미 요약한 구간은 다시 요약하지 않음
+  (요약 경계는 메시지 id가 있으면 id로, 없으면 경계 직전 두 메시지의 해시로 찾음)
+- AssistantService, ChatService, IdentityAnalysisService, 커리어 에이전트가 함께 사용합니다.
+"""
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - langchain-openai 설치 시 함께 설치됨
+    tiktoken = None
+
+
+# 예산 초과 시 최근 대화를 예산의 이 비율까지 줄이고 나머지를 요약
+LOW_WATERMARK = 0.6
+
+# 메시지마다 붙는 role/구분자 토큰 (OpenAI chat 포맷 기준 근사치)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+SUMMARY_SYSTEM_PROMPT = """당신은 대화 요약 도우미입니다.
+기존 요약과 새로 밀려난 대화를 합쳐 하나의 요약으로 갱신하세요.
+
+규칙:
+- 사용자가 밝힌 사실(관심사, 경험, 가치관, 목표, 고민)과 이미 안내한 내용을 빠짐없이 남기세요.
+- 이후 대화에서 "그거", "아까 말한 것" 같은 지시어를 해석할 수 있도록 구체적으로 쓰세요.
+- 인사말이나 반복되는 내용은 생략하세요.
+- {max_tokens} 토큰 이내의 한국어 평문으로만 응답하세요."""
+
+_ROLE_LABELS = {
+    "user": "사용자",
+    "assistant": "AI",
+}
+
+# 문자열 대화 기록("학생: ...\n\n상담사: ...")의 화자 표기
+_TRANSCRIPT_ROLES = {
+    "학생": "user",
+    "사용자": "user",
+    "user": "user",
+    "상담사": "assistant",
+    "ai": "assistant",
+    "assistant": "assistant",
+}
+_TRANSCRIPT_SPEAKER = re.compile(r"^(학생|사용자|상담사|USER|ASSISTANT|user|assistant|AI)\s*:\s?", re.MULTILINE)
+
+
+# ----------------------------------------------------------------------
+# 토큰 계산
+# ----------------------------------------------------------------------
+
+_encoding = None
+_encoding_failed = False
+
+
+def _get_encoding():
+    global _encoding, _encoding_failed
+    if _encoding is None and not _encoding_failed:
+        try:
+            _encoding = tiktoken.get_encoding("o200k_base")
+        except Exception:
+            # tiktoken 미설치 또는 인코딩 파일 다운로드 불가 (오프라인)
+            _encoding_failed = True
+    return _encoding
+
+
+def count_tokens(text: Optional[str]) -> int:
+    """텍스트 토큰 수 (tiktoken 사용 불가 시 문자 기반 근사치)"""
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    # 영문은 약 4자당 1토큰, 한글 등 비ASCII 문자는 약 1자당 1토큰
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return ascii_chars // 4 + (len(text) - ascii_chars) + 1
+
+
+def message_tokens(message: Dict[str, str]) -> int:
+    return count_tokens(message.get("content")) + MESSAGE_OVERHEAD_TOKENS
+
+
+def normalize_role(role: Optional[str]) -> str:
+    """USER/ASSISTANT/학생/상담사 등 다양한 role 표기를 user/assistant로 통일"""
+    return _TRANSCRIPT_ROLES.get((role or "").strip().lower(), _TRANSCRIPT_ROLES.get((role or "").strip(), "user"))
+
+
+# ----------------------------------------------------------------------
+# 문자열 대화 기록 변환
+# ----------------------------------------------------------------------
+
+def parse_transcript(text: Optional[str]) -> List[Dict[str, str]]:
+    """"학생: ...\\n\\n상담사: ..." 형식의 대화 기록을 메시지 목록으로 변환"""
+    if not text or not text.strip():
+        return []
+
+    matches = list(_TRANSCRIPT_SPEAKER.finditer(text))
+    if not matches:
+        return [{"role": "user", "content": text.strip()}]
+
+    messages = []
+    preamble = text[:matches[0].start()].strip()
+    if preamble:
+        messages.append({"role": "user", "content": preamble})
+
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        content = text[match.end():end].strip()
+        if content:
+            messages.append({"role": normalize_role(match.group(1)), "content": content})
+    return messages
+
+
+def render_transcript(
+    messages: List[Dict[str, str]],
+    user_label: str = "학생",
+    assistant_label: str = "상담사"
+) -> str:
+    """메시지 목록을 "학생: ...\\n\\n상담사: ..." 형식으로 변환 (백엔드 대화 기록 형식과 동일)"""
+    lines = []
+    for msg in messages:
+        label = user_label if normalize_role(msg.get("role")) == "user" else assistant_label
+        lines.append(f"{label}: {msg.get('content', '')}")
+    return "\n\n".join(lines)
+
+
+# ----------------------------------------------------------------------
+# 컨텍스트 윈도우
+# ----------------------------------------------------------------------
+
+@dataclass
+class ConversationWindow:
+    """LLM에 보낼 대화 컨텍스트"""
+    summary: str = ""
+    messages: List[Dict[str, str]] = field(default_factory=list)  # 원본 role 그대로 유지
+    dropped: int = 0  # 윈도우에서 제외된 (요약으로 대체된) 메시지 수
+
+    @property
+    def tokens(self) -> int:
+        return count_tokens(self.summary) + sum(message_tokens(m) for m in self.messages)
+
+    def to_text(self, user_label: str = "학생", assistant_label: str = "상담사") -> str:
+        """요약 + 최근 대화를 하나의 문자열로 (분석용 프롬프트)"""
+        recent = render_transcript(self.messages, user_label, assistant_label)
+        if not self.summary:
+            return recent
+        return f"[이전 대화 요약]\n{self.summary}\n\n[최근 대화]\n{recent}"
+
+
+def select_recent(
+    messages: List[Dict[str, str]],
+    max_tokens: int,
+    min_messages: int = 1,
+    max_messages: Optional[int] = None
+) -> List[Dict[str, str]]:
+    """토큰 예산 안에 들어가는 최근 메시지 (최소 min_messages개는 항상 포함)"""
+    selected: List[Dict[str, str]] = []
+    total = 0
+    for msg in reversed(messages):
+        if max_messages is not None and len(selected) >= max_messages:
+            break
+        tokens = message_tokens(msg)
+        if len(selected) >= min_messages and total + tokens > max_tokens:
+            break
+        selected.append(msg)
+        total += tokens
+    return list(reversed(selected))
+
+
+def _fingerprint(messages: List[Dict[str, str]]) -> str:
+    """요약 경계 식별용: 경계 직전 두 메시지의 해시"""
+    text = "\x1f".join(f"{normalize_role(m.get('role'))}:{m.get('content', '')}" for m in messages[-2:])
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class ConversationContextManager:
+    """세션별 누적 요약 + 토큰 예산 기반 최근 대화 윈도우"""
+
+    KEY_PREFIX = "conversation_context"
+
+    def __init__(
+        self,
+        summarizer: Optional[Callable[[str, List[Dict[str, str]]], str]] = None,
+        summary_max_tokens: int = int(os.getenv("CONVERSATION_SUMMARY_MAX_TOKENS", 400)),
+        ttl_seconds: int = int(os.getenv("CONVERSATION_SUMMARY_TTL", 7 * 24 * 60 * 60)),
+        local_cache_size: int = 1000,
+        use_redis: bool = True
+    ):
+        self._summarizer = summarizer
+        self._client = None
+        self.summary_max_tokens = summary_max_tokens
+        self.ttl_seconds = ttl_seconds
+        self.local_cache_size = local_cache_size
+        self.redis_client = None
+        self.enabled = False
+
+        # 같은 세션 요약이 동시에 두 번 생성되지 않도록 (프로세스 내)
+        self._locks = [threading.Lock() for _ in range(64)]
+        self._local_lock = threading.Lock()
+        self._local: "OrderedDict[str, Dict[str, str]]" = OrderedDict()
+
+        if use_redis:
+            redis_host = os.getenv("REDIS_HOST", "localhost")
+            redis_port = int(os.getenv("REDIS_PORT", 6379))
+            redis_db = int(os.getenv("REDIS_DB", 0))
+
+            try:
+                self.redis_client = redis.Redis(
+                    host=redis_host,
+                    port=redis_port,
+                    db=redis_db,
+                    decode_responses=True,
+                    socket_timeout=5,
+                    socket_connect_timeout=5
+                )
+                self.redis_client.ping()
+                self.enabled = True
+                logger.info(f"[ConversationContext] Redis 연결 성공: {redis_host}:{redis_port}")
+            except Exception as e:
+                logger.warning(f"[ConversationContext] Redis 연결 실패 (인메모리 요약 사용): {e}")
+                self.redis_client = None
+
+    # ------------------------------------------------------------------
+    # 윈도우 생성
+    # ------------------------------------------------------------------
+
+    def build(
+        self,
+        scope: str,
+        session_id: Optional[str],
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        min_recent: int = 2
+    ) -> ConversationWindow:
+        """
+        대화 기록으로 컨텍스트 윈도우 생성 (필요하면 밀려난 대화를 요약에 반영)
+
+        Args:
+            scope: 요약 저장 구분 (assistant / counseling / identity 등)
+            session_id: 세션 ID (없으면 요약 없이 최근 대화만 자름)
+            messages: 시간순 대화 기록 [{"role", "content", "id"(선택)}] (현재 메시지 제외)
+                id는 증가하는 메시지 ID (DB PK 등) - 반환되는 윈도우 메시지에서는 빠짐
+            max_tokens: 요약 + 최근 대화 토큰 예산
+            min_recent: 예산과 관계없이 항상 포함할 최근 메시지 수
+        """
+        messages = [
+            m for m in (messages or [])
+            if m.get("content") and (m.get("role") or "").lower() != "system"
+        ]
+        ids = [m.get("id") for m in messages]
+        messages = [{k: v for k, v in m.items() if k != "id"} if "id" in m else m for m in messages]
+        if not session_id:
+            recent = select_recent(messages, max_tokens, min_recent)
+            return ConversationWindow("", recent, len(messages) - len(recent))
+
+        key = self._key(scope, session_id)
+        with self._locks[int(hashlib.md5(key.encode()).hexdigest(), 16) % len(self._locks)]:
+            state = self._load(key)
+            summary = state.get("summary", "")
+            start = self._find_boundary(messages, ids, state)
+            if start is None:
+                # 요약 경계를 찾을 수 없음 (대화가 수정/교체됨) → 저장된 요약을 버리고 처음부터
+                summary, start = "", 0
+            pending = messages[start:]
+
+            summary_budget = min(count_tokens(summary), max_tokens // 2)
+            budget = max_tokens - summary_budget
+            tokens = [message_tokens(m) for m in pending]
+            if sum(tokens) <= budget:
+                return ConversationWindow(summary, pending, start)
+
+            # 예산 초과: 하한선까지 최근 대화를 남기고 나머지는 요약으로 이동
+            target = int(budget * LOW_WATERMARK)
+            keep_from, kept = len(pending), 0
+            while keep_from > 0:
+                next_tokens = tokens[keep_from - 1]
+                if len(pending) - keep_from >= min_recent and kept + next_tokens > target:
+                    break
+                keep_from -= 1
+                kept += next_tokens
+
+            evicted = pending[:keep_from]
+            if evicted:
+                new_summary = self._summarize(summary, evicted)
+                if new_summary is not None:
+                    summary = new_summary
+                    end = start + keep_from
+                    state = {
+                        "summary": summary,
+                        "boundary": _fingerprint(messages[:end]),
+                        "updated_at": str(int(time.time()))
+                    }
+                    if ids[end - 1] is not None:
+                        state["boundary_id"] = str(ids[end - 1])
+                    self._save(key, state)
+                # 요약 실패 시 경계를 옮기지 않음 → 다음 턴에 다시 요약 시도
+
+            return ConversationWindow(summary, pending[keep_from:], start + keep_from)
+
+    def get_summary(self, scope: str, session_id: Optional[str]) -> str:
+        """저장된 누적 요약 (요약 생성 없이 조회만)"""
+        if not session_id:
+            return ""
+        return self._load(self._key(scope, session_id)).get("summary", "")
+
+    def clear(self, scope: str, session_id: str):
+        """세션 요약 삭제"""
+        key = self._key(scope, session_id)
+        with self._local_lock:
+            self._local.pop(key, None)
+        if self.enabled:
+            try:
+                self.redis_client.delete(key)
+            except Exception as e:
+                logger.warning(f"[ConversationContext] 요약 삭제 실패: {key}, {e}")
+
+    @staticmethod
+    def _find_boundary(
+        messages: List[Dict[str, str]], ids: List[Optional[Any]], state: Dict[str, str]
+    ) -> Optional[int]:
+        """
+        이미 요약된 구간의 끝 위치
+
+        메시지 id가 숫자면 경계 id 이하 메시지 수 (경계가 조회 구간보다 오래됐으면 0 → 전부 미요약),
+        아니면 경계 해시를 뒤에서부터 찾음 (찾지 못하면 None → 저장된 요약을 쓸 수 없음)
+        """
+        boundary_id = state.get("boundary_id")
+        if boundary_id and ids and all(i is not None for i in ids):
+            try:
+                boundary_num = int(boundary_id)
+                return sum(1 for i in ids if int(i) <= boundary_num)
+            except (TypeError, ValueError):
+                pass  # UUID 등 순서를 비교할 수 없는 id → 해시로 찾음
+
+        boundary = state.get("boundary")
+        if not boundary:
+            return 0
+        for end in range(len(messages), 0, -1):
+            if _fingerprint(messages[:end]) == boundary:
+                return end
+        return None
+
+    # ------------------------------------------------------------------
+    # 요약
+    # ------------------------------------------------------------------
+
+    def _summarize(self, summary: str, evicted: List[Dict[str, str]]) -> Optional[str]:
+        try:
+            if self._summarizer is not None:
+                return self._summarizer(summary, evicted)
+            return self._summarize_with_llm(summary, evicted)
+        except Exception as e:
+            logger.warning(f"[ConversationContext] 대화 요약 실패 (최근 대화만 사용): {e}")
+            return None
+
+    def _summarize_with_llm(self, summary: str, evicted: List[Dict[str, str]]) -> str:
+        if self._client is None:
+            from services.common.llm_clients import get_openai_client
+            self._client = get_openai_client()
+
+        conversation = "\n".join(
+            f"{_ROLE_LABELS[normalize_role(m.get('role'))]}: {m.get('content', '')}" for m in evicted
+        )
+        response = self._client.chat.completions.create(
+            model=os.getenv("CONVERSATION_SUMMARY_MODEL", os.getenv("OPENAI_MODEL", "gpt-5-mini")),
+            messages=[
+                {"role": "system", "content": SUMMARY_SYSTEM_PROMPT.format(max_tokens=self.summary_max_tokens)},
+                {"role": "user", "content": f"[기존 요약]\n{summary or '(없음)'}\n\n[새 대화]\n{conversation}"}
+            ]
+        )
+        new_summary = (response.choices[0].message.content or "").strip()
+        if not new_summary:
+            raise ValueError("빈 요약 응답")
+        return new_summary
+
+    # ------------------------------------------------------------------
+    # 저장소
+    # ------------------------------------------------------------------
+
+    def _key(self, scope: str, session_id: str) -> str:
+        return f"{self.KEY_PREFIX}:{scope}:{session_id}"
+
+    def _load(self, key: str) -> Dict[str, str]:
+        if self.enabled:
+            try:
+                return self.redis_client.hgetall(key) or {}
+            except Exception as e:
+                logger.warning(f"[ConversationContext] 요약 조회 실패: {key}, {e}")
+        with self._local_lock:
+            state = self._local.get(key)
+            if state is not None:
+                self._local.move_to_end(key)
+            return dict(state or {})
+
+    def _save(self, key: str, state: Dict[str, str]):
+        if self.enabled:
+            try:
+                pipe = self.redis_client.pipeline()
+                pipe.delete(key)  # 이전 경계 필드가 남지 않도록 통째로 교체
+                pipe.hset(key, mapping=state)
+                pipe.expire(key, self.ttl_seconds)
+                pipe.execute()
+                return
+            except Exception as e:
+                logger.warning(f"[ConversationContext] 요약 저장 실패 (인메모리 저장): {key}, {e}")
+        with self._local_lock:
+            self._local[key] = state
+            self._local.move_to_end(key)
+            while len(self._local) > self.local_cache_size:
+                self._local.popitem(last=False)
+
+
+# 싱글톤 인스턴스
+_context_manager: Optional[ConversationContextManager] = None
+
+
+def get_conversation_context_manager() -> ConversationContextManager:
+    """대화 컨텍스트 관리자 싱글톤"""
+    global _context_manager
+    if _context_manager is None:
+        _context_manager = ConversationContextManager()
+    return _context_manager
@@ -0,0 +1,239 @@
+"""
+일일 채용공고 크롤링 파이프라인
+사이트(호스트)별로 독립된 예산 안에서 동시에 크롤링하고,
+사이트 결과가 도착하는 즉시 기업정보 보강과 증분 추천 계산으로 넘깁니다.
+
+    crawl:wanted   ──▶ enrich:wanted
+          └──────────▶ recommend:wanted ─┐
+    crawl:saramin  ──▶ enrich:saramin    │ (추천 계산은 도착 순서대로 직렬 처리)
+          └──────────▶ recommend:saramin ◀┘ ...
+
+실행 결과에는 단계별 소요 시간과 임계 경로(critical path)가 포함됩니다.
+"""
+import asyncio
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SiteBudget:
+    """사이트(호스트)별 크롤링 예산"""
+    request_delay_seconds: float = 2.0  # 같은 호스트에 대한 요청 간 최소 간격
+    timeout_seconds: float = 3 * 60 * 60  # 사이트 크롤링 최대 시간
+
+
+@dataclass
+class CrawlSite:
+    """크롤링 대상 사이트"""
+    key: str
+    name: str
+    url: str
+    budget: SiteBudget
+
+
+DEFAULT_SITES: List[CrawlSite] = [
+    CrawlSite("wanted", "원티드", "https://www.wanted.co.kr", SiteBudget(request_delay_seconds=2.0)),
+    CrawlSite("saramin", "사람인", "https://www.saramin.co.kr", SiteBudget(request_delay_seconds=2.0)),
+    CrawlSite("jobkorea", "잡코리아", "https://www.jobkorea.co.kr", SiteBudget(request_delay_seconds=2.0)),
+]
+
+
+class CrawlPipeline:
+    """사이트별 크롤링 → 기업정보 보강 / 증분 추천 계산 파이프라인"""
+
+    def __init__(
+        self,
+        sites: Optional[List[CrawlSite]] = None,
+        crawler_factory: Optional[Callable[[CrawlSite], Any]] = None,
+        calculator=None,
+        run_id: Optional[str] = None
+    ):
+        self.sites = sites or DEFAULT_SITES
+        self.crawler_factory = crawler_factory or self._default_crawler
+        self.calculator = calculator
+        # 실행마다 고유 ID (같은 날 재실행 / 놓친 실행 보충 시에도 새 공고의 추천이 다시 계산되도록)
+        self.run_id = run_id or f"{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:6]}"
+        self.stages: List[Dict[str, Any]] = []
+        self._started_at = 0.0
+
+    @staticmethod
+    def _default_crawler(site: CrawlSite):
+        from services.web_crawler_service import WebCrawlerService
+        # 사이트마다 별도 인스턴스 → 요청 간격(last_request_time)이 호스트별로 관리됨
+        return WebCrawlerService(request_delay_seconds=site.budget.request_delay_seconds)
+
+    async def run(self) -> Dict[str, Any]:
+        """파이프라인 실행"""
+        self._started_at = time.monotonic()
+        self.stages = []
+
+        recommend_queue: asyncio.Queue = asyncio.Queue()
+        recommend_task = asyncio.create_task(self._recommendation_stage(recommend_queue))
+
+        site_results = await asyncio.gather(
+            *[self._run_site(site, recommend_queue) for site in self.sites]
+        )
+        await recommend_queue.put(None)
+        recommendations = await recommend_task
+
+        report = {
+            "success": True,
+            "run_id": self.run_id,
+            "total_seconds": round(time.monotonic() - self._started_at, 1),
+            "sites": {site.key: result for site, result in zip(self.sites, site_results)},
+            "recommendations": recommendations,
+            "stages": self.stages,
+            "critical_path": self.critical_path()
+        }
+
+        logger.info(f"[크롤링 파이프라인] 완료 - 총 {report['total_seconds']}초, "
+              f"임계 경로: {' → '.join(report['critical_path'])}")
+        for stage in self.stages:
+            logger.info(f"[크롤링 파이프라인]   {stage['name']:<20} "
+                  f"+{stage['start_offset']:>7.1f}s  {stage['duration']:>7.1f}s  "
+                  f"{'OK' if stage['success'] else 'FAIL'}")
+        return report
+
+    async def _run_site(self, site: CrawlSite, recommend_queue: asyncio.Queue) -> Dict[str, Any]:
+        """사이트 하나: 크롤링 후 기업정보 보강, 새 공고는 추천 단계로 전달"""
+        crawler = self.crawler_factory(site)
+
+        crawl_result = await self._stage(
+            f"crawl:{site.key}",
+            [],
+            asyncio.wait_for(
+                crawler.crawl_job_site(
+                    site_name=site.name,
+                    site_url=site.url,
+                    search_keyword=None,
+                    max_results=0,  # 0 = 전체 크롤링
+                    force_refresh=True,
+                    enrich_companies=False  # 아래 enrich 단계에서 처리
+                ),
+                timeout=site.budget.timeout_seconds
+            )
+        )
+
+        if not crawl_result or not crawl_result.get("success"):
+            error = (crawl_result or {}).get("error", "알 수 없는 오류")
+            logger.warning(f"[크롤링 파이프라인] {site.name} 크롤링 실패 - {error}")
+            return {"success": False, "error": error}
+
+        job_listings = crawl_result.get("jobListings", [])
+        # force_refresh라 jobListings는 수집한 전체 공고 → DB에 새로 저장된 공고만 추천 재계산 대상
+        new_listings = _unique_listings(crawl_result.get("newJobListings", []))
+        logger.info(f"[크롤링 파이프라인] {site.name} 크롤링 완료 - {len(job_listings)}개 수집, 신규 {len(new_listings)}개")
+
+        # 추천 계산은 사이트 결과가 도착하는 즉시 시작 (기업정보 보강과 동시 진행)
+        if new_listings:
+            await recommend_queue.put((site, new_listings, f"crawl:{site.key}"))
+
+        saved_companies = 0
+        company_service = getattr(crawler, "company_service", None)
+        if company_service and job_listings:
+            saved_companies = await self._stage(
+                f"enrich:{site.key}",
+                [f"crawl:{site.key}"],
+                company_service.crawl_and_save_companies_from_jobs(
+                    site_name=site.key,
+                    job_listings=job_listings
+                )
+            ) or 0
+
+        return {
+            "success": True,
+            "totalResults": len(job_listings),
+            "newResults": len(new_listings),
+            "savedToDatabase": crawl_result.get("savedToDatabase", 0),
+            "savedCompanies": saved_companies
+        }
+
+    async def _recommendation_stage(self, queue: asyncio.Queue) -> Dict[str, Any]:
+        """도착한 사이트 공고와 관련된 사용자만 추천을 다시 계산 (도착 순서대로 직렬 처리)"""
+        summary = {"processed_users": 0, "failed_users": 0, "total_recommendations": 0}
+        previous_stage: Optional[str] = None
+
+        while True:
+            item = await queue.get()
+            if item is None:
+                return summary
+
+            site, job_listings, crawl_stage = item
+            if self.calculator is None:
+                from services.job_recommendation_calculator import JobRecommendationCalculator
+                self.calculator = JobRecommendationCalculator()
+
+            stage_name = f"recommend:{site.key}"
+            depends_on = [crawl_stage] + ([previous_stage] if previous_stage else [])
+            result = await self._stage(
+                stage_name,
+                depends_on,
+                self.calculator.recalculate_for_new_jobs(
+                    job_listings,
+                    run_id=f"{self.run_id}-{site.key}"
+                )
+            ) or {}
+            previous_stage = stage_name
+
+            summary["processed_users"] += result.get("processed_users", 0)
+            summary["failed_users"] += result.get("failed_users", 0)
+            summary["total_recommendations"] += result.get("total_recommendations", 0)
+
+    async def _stage(self, name: str, depends_on: List[str], awaitable: Awaitable) -> Any:
+        """단계 실행 + 소요 시간 기록 (실패해도 파이프라인은 계속 진행)"""
+        start = time.monotonic()
+        success = True
+        try:
+            return await awaitable
+        except asyncio.TimeoutError:
+            success = False
+            logger.warning(f"[크롤링 파이프라인] {name} 예산 시간 초과")
+            return None
+        except Exception as e:
+            success = False
+            logger.error(f"[크롤링 파이프라인] {name} 오류 - {str(e)}")
+            return None
+        finally:
+            end = time.monotonic()
+            self.stages.append({
+                "name": name,
+                "depends_on": depends_on,
+                "start_offset": round(start - self._started_at, 2),
+                "end_offset": round(end - self._started_at, 2),
+                "duration": round(end - start, 2),
+                "success": success
+            })
+
+    def critical_path(self) -> List[str]:
+        """가장 늦게 끝난 단계에서 의존 관계를 거슬러 올라간 경로"""
+        if not self.stages:
+            return []
+
+        by_name = {stage["name"]: stage for stage in self.stages}
+        current = max(self.stages, key=lambda stage: stage["end_offset"])
+        path = [current["name"]]
+        while current["depends_on"]:
+            deps = [by_name[dep] for dep in current["depends_on"] if dep in by_name]
+            if not deps:
+                break
+            current = max(deps, key=lambda stage: stage["end_offset"])
+            path.append(current["name"])
+        return list(reversed(path))
+
+
+def _unique_listings(job_listings: List[Dict]) -> List[Dict]:
+    """순서를 유지하며 같은 공고(id 또는 URL 기준) 중복 제거"""
+    seen = set()
+    result = []
+    for job in job_listings:
+        key = job.get("id") or job.get("job_id") or job.get("url") or id(job)
+        if key not in seen:
+            seen.add(key)
+            result.append(job)
+    return result
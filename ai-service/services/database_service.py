@@ -4,11 +4,16 @@ MySQL/PostgreSQL 데이터베이스 연결 및 채용 공고 저장/조회 기
 """
 import os
 import json
+import logging
 import threading
 from typing import List, Dict, Optional
 from datetime import datetime
 from contextlib import contextmanager
 
+from services.common.metrics import traced
+
+logger = logging.getLogger(__name__)
+
 # DB 타입에 따라 다른 드라이버 사용
 DB_TYPE = os.getenv('DB_TYPE', 'mysql').lower()
 
@@ -58,7 +63,7 @@ class DatabaseService:
                  self._ensure_job_details_table(conn)
         except Exception as e:
              # Already printed inside or negligible if connection fails here (will fail later)
-             print(f"Table creation check error: {e}")
+             logger.error(f"Table creation check error: {e}")
 
     def cleanup(self):
         """연결 정리용 스텁"""
@@ -200,7 +205,7 @@ class DatabaseService:
                             ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='채용 공고 정보'
                         """)
                     conn.commit()
-                    print("job_listings 테이블이 생성되었습니다.")
+                    logger.info("job_listings 테이블이 생성되었습니다.")
 
                 # company_info 테이블 생성
                 self._ensure_company_info_table(conn)
@@ -215,7 +220,7 @@ class DatabaseService:
                 # career_analyses & job_recommendations 테이블 생성
                 self._ensure_career_analysis_tables(conn)
         except Exception as e:
-            print(f"테이블 생성 확인 중 오류 발생: {str(e)}")
+            logger.error(f"테이블 생성 확인 중 오류 발생: {str(e)}")
             # 테이블 생성 실패해도 계속 진행 (이미 존재할 수 있음)
 
     def _ensure_company_info_table(self, conn):
@@ -306,10 +311,10 @@ class DatabaseService:
                         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='기업 정보'
                     """)
                 conn.commit()
-                print("company_info 테이블이 생성되었습니다.")
+                logger.info("company_info 테이블이 생성되었습니다.")
             else:
                 # 테이블이 이미 존재하는 경우, 새 컬럼 추가 (ALTER TABLE)
-                print("company_info 테이블이 이미 존재합니다. 새 컬럼을 추가합니다...")
+                logger.info("company_info 테이블이 이미 존재합니다. 새 컬럼을 추가합니다...")
                 if USE_POSTGRES:
                     # PostgreSQL: ADD COLUMN IF NOT EXISTS
                     try:
@@ -318,9 +323,9 @@ class DatabaseService:
                         cursor.execute("ALTER TABLE company_info ADD COLUMN IF NOT EXISTS ceo_name VARCHAR(100)")
                         cursor.execute("ALTER TABLE company_info ADD COLUMN IF NOT EXISTS capital VARCHAR(100)")
                         conn.commit()
-                        print("✓ 새 컬럼 추가 완료 (company_type, revenue, ceo_name, capital)")
+                        logger.info("✓ 새 컬럼 추가 완료 (company_type, revenue, ceo_name, capital)")
                     except Exception as alter_error:
-                        print(f"컬럼 추가 중 오류 (무시 가능): {str(alter_error)}")
+                        logger.warning(f"컬럼 추가 중 오류 (무시 가능): {str(alter_error)}")
                 else:
                     # MySQL: 컬럼 존재 여부 확인 후 추가
                     new_columns = [
@@ -339,13 +344,13 @@ class DatabaseService:
                             col_result = cursor.fetchone()
                             if col_result['count'] == 0:
                                 cursor.execute(f"ALTER TABLE company_info ADD COLUMN {col_name} {col_def}")
-                                print(f"✓ 컬럼 추가: {col_name}")
+                                logger.info(f"✓ 컬럼 추가: {col_name}")
                         except Exception as alter_error:
-                            print(f"컬럼 {col_name} 추가 중 오류 (무시 가능): {str(alter_error)}")
+                            logger.warning(f"컬럼 {col_name} 추가 중 오류 (무시 가능): {str(alter_error)}")
                     conn.commit()
             cursor.close()
         except Exception as e:
-            print(f"company_info 테이블 생성 중 오류: {str(e)}")
+            logger.error(f"company_info 테이블 생성 중 오류: {str(e)}")
 
     def _ensure_job_details_table(self, conn):
         """job_details 테이블 생성"""
@@ -401,9 +406,9 @@ class DatabaseService:
                         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='직업 상세 정보'
                     """)
                 conn.commit()
-                print("job_details 테이블이 생성되었습니다.")
+                logger.info("job_details 테이블이 생성되었습니다.")
         except Exception as e:
-            print(f"job_details 테이블 생성 중 오류: {str(e)}")
+            logger.error(f"job_details 테이블 생성 중 오류: {str(e)}")
     def _ensure_major_details_table(self, conn):
         """major_details 테이블 생성"""
         try:
@@ -458,9 +463,9 @@ class DatabaseService:
                         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='학과 상세 정보'
                     """)
                 conn.commit()
-                print("major_details 테이블이 생성되었습니다.")
+                logger.info("major_details 테이블이 생성되었습니다.")
         except Exception as e:
-            print(f"major_details 테이블 생성 중 오류: {str(e)}")
+            logger.error(f"major_details 테이블 생성 중 오류: {str(e)}")
 
 
     def save_job_details(self, details: Dict) -> bool:
@@ -544,7 +549,7 @@ class DatabaseService:
                 return True
                 
         except Exception as e:
-            print(f"직업 상세 정보 저장 실패 (ID: {details.get('job_id')}): {str(e)}")
+            logger.error(f"직업 상세 정보 저장 실패 (ID: {details.get('job_id')}): {str(e)}")
             return False
     def save_major_details(self, details: Dict) -> bool:
         """
@@ -624,7 +629,7 @@ class DatabaseService:
                 return True
                 
         except Exception as e:
-            print(f"학과 상세 정보 저장 실패 (ID: {details.get('major_id')}): {str(e)}")
+            logger.error(f"학과 상세 정보 저장 실패 (ID: {details.get('major_id')}): {str(e)}")
             return False
 
 
@@ -633,7 +638,8 @@ class DatabaseService:
         site_name: str,
         site_url: str,
         job_listings: List[Dict],
-        search_keyword: Optional[str] = None
+        search_keyword: Optional[str] = None,
+        inserted: Optional[List[Dict]] = None
     ) -> int:
         """
         채용 공고를 데이터베이스에 저장합니다.
@@ -644,6 +650,7 @@ class DatabaseService:
             site_url: 사이트 URL
             job_listings: 채용 공고 리스트
             search_keyword: 검색 키워드 (선택)
+            inserted: 전달하면 실제로 새로 INSERT된 공고를 이 리스트에 추가 (선택)
         
         Returns:
             저장된 공고 수
@@ -695,7 +702,7 @@ class DatabaseService:
                     """)
                     if not cursor.fetchone():
                         cursor.execute("ALTER TABLE job_listings ADD COLUMN tech_stack TEXT")
-                        print("✓ tech_stack 컬럼 추가됨")
+                        logger.info("✓ tech_stack 컬럼 추가됨")
 
                     cursor.execute("""
                         SELECT column_name FROM information_schema.columns
@@ -703,7 +710,7 @@ class DatabaseService:
                     """)
                     if not cursor.fetchone():
                         cursor.execute("ALTER TABLE job_listings ADD COLUMN required_skills TEXT")
-                        print("✓ required_skills 컬럼 추가됨")
+                        logger.info("✓ required_skills 컬럼 추가됨")
 
                     cursor.execute("""
                         SELECT column_name FROM information_schema.columns
@@ -711,7 +718,7 @@ class DatabaseService:
                     """)
                     if not cursor.fetchone():
                         cursor.execute("ALTER TABLE job_listings ADD COLUMN applicant_count INTEGER DEFAULT 0")
-                        print("✓ applicant_count 컬럼 추가됨")
+                        logger.info("✓ applicant_count 컬럼 추가됨")
 
                     cursor.execute("""
                         SELECT column_name FROM information_schema.columns
@@ -719,7 +726,7 @@ class DatabaseService:
                     """)
                     if not cursor.fetchone():
                         cursor.execute("ALTER TABLE job_listings ADD COLUMN preferred_majors TEXT")
-                        print("✓ preferred_majors 컬럼 추가됨")
+                        logger.info("✓ preferred_majors 컬럼 추가됨")
 
                     cursor.execute("""
                         SELECT column_name FROM information_schema.columns
@@ -727,7 +734,7 @@ class DatabaseService:
                     """)
                     if not cursor.fetchone():
                         cursor.execute("ALTER TABLE job_listings ADD COLUMN deadline TEXT")
-                        print("✓ deadline 컬럼 추가됨")
+                        logger.info("✓ deadline 컬럼 추가됨")
 
                     cursor.execute("""
                         SELECT column_name FROM information_schema.columns
@@ -735,7 +742,7 @@ class DatabaseService:
                     """)
                     if not cursor.fetchone():
                         cursor.execute("ALTER TABLE job_listings ADD COLUMN work_location TEXT")
-                        print("✓ work_location 컬럼 추가됨")
+                        logger.info("✓ work_location 컬럼 추가됨")
 
                     cursor.execute("""
                         SELECT column_name FROM information_schema.columns
@@ -743,7 +750,7 @@ class DatabaseService:
                     """)
                     if not cursor.fetchone():
                         cursor.execute("ALTER TABLE job_listings ADD COLUMN salary TEXT")
-                        print("✓ salary 컬럼 추가됨")
+                        logger.info("✓ salary 컬럼 추가됨")
 
                     cursor.execute("""
                         SELECT column_name FROM information_schema.columns
@@ -751,10 +758,10 @@ class DatabaseService:
                     """)
                     if not cursor.fetchone():
                         cursor.execute("ALTER TABLE job_listings ADD COLUMN core_competencies TEXT")
-                        print("✓ core_competencies 컬럼 추가됨")
+                        logger.info("✓ core_competencies 컬럼 추가됨")
                     conn.commit()
                 except Exception as col_error:
-                    print(f"컬럼 추가 중 오류 (무시 가능): {col_error}")
+                    logger.warning(f"컬럼 추가 중 오류 (무시 가능): {col_error}")
 
                 # 3단계: 새 공고만 INSERT
                 insert_sql = """
@@ -869,19 +876,22 @@ class DatabaseService:
                         ))
                         conn.commit()  # 각 INSERT 후 즉시 커밋
                         saved_count += 1
+                        if inserted is not None:
+                            inserted.append(job)
                     except Exception as e:
                         conn.rollback()  # 에러 발생 시 rollback
-                        print(f"채용 공고 저장 실패: {job}, 에러: {str(e)}")
+                        logger.warning(
+                            "채용 공고 저장 실패",
+                            extra={"job_id": job.get("id"), "title": job.get("title"), "error": str(e)}
+                        )
                         continue
-                print(f"[DEBUG] Commit completed. Saved={saved_count}, Skipped={skipped_count}")
-                print(f"[DEBUG] Connected to: {self.db_config['host']}, DB: {self.db_config['database']}")
-                if saved_count > 0:
-                    print(f"{saved_count}개의 새로운 채용 공고가 데이터베이스에 저장되었습니다.")
-                if skipped_count > 0:
-                    print(f"{skipped_count}개의 채용 공고는 이미 존재하여 건너뛰었습니다.")
+                logger.info(
+                    f"채용 공고 저장 완료: 신규 {saved_count}개, 기존 {skipped_count}개 건너뜀",
+                    extra={"site_name": site_name, "saved": saved_count, "skipped": skipped_count}
+                )
                 
         except Exception as e:
-            print(f"데이터베이스 저장 중 오류 발생: {str(e)}")
+            logger.error(f"데이터베이스 저장 중 오류 발생: {str(e)}")
             raise e
         
         return saved_count
@@ -943,7 +953,7 @@ class DatabaseService:
                 return list(results)
                 
         except Exception as e:
-            print(f"데이터베이스 조회 중 오류 발생: {str(e)}")
+            logger.error(f"데이터베이스 조회 중 오류 발생: {str(e)}")
             return []
     
     def count_job_listings(
@@ -986,7 +996,7 @@ class DatabaseService:
                 return result['count'] if result else 0
                 
         except Exception as e:
-            print(f"데이터베이스 카운트 조회 중 오류 발생: {str(e)}")
+            logger.error(f"데이터베이스 카운트 조회 중 오류 발생: {str(e)}")
             return 0
 
     def save_company_info(
@@ -1131,28 +1141,25 @@ class DatabaseService:
 
                         saved_count += 1
                     except Exception as e:
-                        print(f"기업 정보 저장 실패 ({company.get('company_name')}): {str(e)}")
+                        logger.warning(f"기업 정보 저장 실패 ({company.get('company_name')}): {str(e)}")
                         skipped_count += 1
                         continue
 
                 conn.commit()
                 cursor.close()
 
-                print(f"[DEBUG] Commit completed. Saved={saved_count}, Skipped={skipped_count}")
-
-                if saved_count > 0:
-                    print(f"{saved_count}개의 기업 정보가 데이터베이스에 저장되었습니다.")
-                if skipped_count > 0:
-                    print(f"{skipped_count}개의 기업 정보 저장 중 오류가 발생했습니다.")
+                logger.info(
+                    f"기업 정보 저장 완료: {saved_count}개 저장, {skipped_count}개 실패",
+                    extra={"saved": saved_count, "failed": skipped_count}
+                )
 
                 return saved_count
 
         except Exception as e:
-            print(f"기업 정보 저장 중 오류 발생: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"기업 정보 저장 중 오류 발생: {str(e)}")
             return 0
 
+    @traced("db")
     def execute_query(self, query: str, params: tuple = None):
         """
         SQL 쿼리 실행 (SELECT 전용)
@@ -1183,9 +1190,10 @@ class DatabaseService:
                 return results
 
         except Exception as e:
-            print(f"쿼리 실행 실패: {str(e)}")
+            logger.error(f"쿼리 실행 실패: {str(e)}")
             raise e
 
+    @traced("db")
     def execute_update(self, query: str, params: tuple = None):
         """
         SQL 쿼리 실행 (INSERT, UPDATE, DELETE 전용)
@@ -1210,7 +1218,7 @@ class DatabaseService:
                 return cursor.rowcount
 
         except Exception as e:
-            print(f"쿼리 실행 실패: {str(e)}")
+            logger.error(f"쿼리 실행 실패: {str(e)}")
             raise e
 
     def get_conversation_history_by_user_id(self, user_id: str, limit: int = 100) -> str:
@@ -1219,7 +1227,7 @@ class DatabaseService:
 
         Args:
             user_id: 사용자 ID
-            limit: 최대 메시지 수
+            limit: 최대 메시지 수 (가장 최근 메시지부터)
 
         Returns:
             대화 기록 문자열 (role: content 형식)
@@ -1229,13 +1237,18 @@ class DatabaseService:
                 cursor = conn.cursor()
 
                 # career_sessions와 chat_messages 조인하여 조회
+                # 가장 최근 limit개를 시간순으로 (오래된 앞부분은 세션 요약이 대신함)
                 query = """
-                    SELECT cm.role, cm.content, cm.timestamp
-                    FROM chat_messages cm
-                    INNER JOIN career_sessions cs ON cm.session_id = cs.id
-                    WHERE cs.user_id = %s
-                    ORDER BY cm.timestamp ASC
-                    LIMIT %s
+                    SELECT role, content, timestamp
+                    FROM (
+                        SELECT cm.role, cm.content, cm.timestamp
+                        FROM chat_messages cm
+                        INNER JOIN career_sessions cs ON cm.session_id = cs.id
+                        WHERE cs.user_id = %s
+                        ORDER BY cm.timestamp DESC
+                        LIMIT %s
+                    ) recent
+                    ORDER BY timestamp ASC
                 """
                 cursor.execute(query, (user_id, limit))
                 results = cursor.fetchall()
@@ -1258,7 +1271,7 @@ class DatabaseService:
                 return "\n".join(conversation_lines)
 
         except Exception as e:
-            print(f"대화 기록 조회 실패: {str(e)}")
+            logger.error(f"대화 기록 조회 실패: {str(e)}")
             return ""
 
     def get_conversation_history_by_session_id(self, session_id: str, limit: int = 100) -> str:
@@ -1267,7 +1280,7 @@ class DatabaseService:
         
         Args:
             session_id: 세션 UUID (예: "3adaf543-e2ce-4dd2-8254-6be2f0f56a3c")
-            limit: 최대 메시지 수
+            limit: 최대 메시지 수 (가장 최근 메시지부터)
         
         Returns:
             대화 기록 문자열 (role: content 형식)
@@ -1277,13 +1290,18 @@ class DatabaseService:
                 cursor = conn.cursor()
 
                 # career_sessions와 chat_messages 조인하여 조회
+                # 가장 최근 limit개를 시간순으로 (오래된 앞부분은 세션 요약이 대신함)
                 query = """
-                    SELECT cm.role, cm.content, cm.timestamp
-                    FROM chat_messages cm
-                    INNER JOIN career_sessions cs ON cm.session_id = cs.id
-                    WHERE cs.session_id = %s
-                    ORDER BY cm.timestamp ASC
-                    LIMIT %s
+                    SELECT role, content, timestamp
+                    FROM (
+                        SELECT cm.role, cm.content, cm.timestamp
+                        FROM chat_messages cm
+                        INNER JOIN career_sessions cs ON cm.session_id = cs.id
+                        WHERE cs.session_id = %s
+                        ORDER BY cm.timestamp DESC
+                        LIMIT %s
+                    ) recent
+                    ORDER BY timestamp ASC
                 """
                 cursor.execute(query, (session_id, limit))
                 results = cursor.fetchall()
@@ -1301,7 +1319,7 @@ class DatabaseService:
                 return "\n".join(conversation_lines)
 
         except Exception as e:
-            print(f"대화 기록 조회 실패 (sessionId: {session_id}): {str(e)}")
+            logger.error(f"대화 기록 조회 실패 (sessionId: {session_id}): {str(e)}")
             return ""
 
     def _ensure_career_analysis_tables(self, conn):
@@ -1382,7 +1400,7 @@ class DatabaseService:
             conn.commit()
 
         except Exception as e:
-            print(f"커리어 분석 테이블 생성 중 오류 (무시 가능): {str(e)}")
+            logger.warning(f"커리어 분석 테이블 생성 중 오류 (무시 가능): {str(e)}")
     
     def save_career_analysis(self, session_identifier: str, user_id: Optional[str], analysis_data: Dict) -> bool:
         """career_analyses 테이블에 분석 결과를 저장하거나 갱신합니다."""
@@ -1535,14 +1553,19 @@ class DatabaseService:
                 )
 
                 if resolved_user_id:
-                    print(
+                    logger.info(
                         f"[DB] career_analyses 저장 완료 (session_id={session_identifier}, user_id={resolved_user_id})"
                     )
                 else:
-                    print(f"[DB] career_analyses 저장 완료 (session_id={session_identifier})")
+                    logger.info(f"[DB] career_analyses 저장 완료 (session_id={session_identifier})")
 
-                return True
+            # 커밋 후 챗봇 비서가 캐시해 둔 이전 분석 결과를 버림
+            if resolved_user_id:
+                from services.chatbot.assistant.tool_executor import get_assistant_tool_cache
+                get_assistant_tool_cache().invalidate_user(resolved_user_id)
+
+            return True
 
         except Exception as e:
-            print(f"[DB] career_analyses 저장 실패: {e}")
+            logger.error(f"[DB] career_analyses 저장 실패: {e}")
             raise e
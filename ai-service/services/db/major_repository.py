@@ -1,4 +1,5 @@
 from services.db.supabase_client import SupabaseClient
+from services.common.metrics import traced
 import json
 
 
@@ -6,6 +7,7 @@ class MajorRepository:
     def __init__(self):
         self.client = SupabaseClient().client
 
+    @traced("supabase")
     def get_major_details_by_ids(self, major_ids):
         if not major_ids:
             return []
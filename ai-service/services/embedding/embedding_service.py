@@ -1,6 +1,6 @@
 import os
 from typing import List
-from openai import OpenAI
+from services.common.llm_clients import get_openai_client
 from services.vector.pinecone_service import PineconeVectorService
 
 
@@ -11,7 +11,7 @@ class EmbeddingService:
             raise RuntimeError("OPENAI_API_KEY 환경 변수가 설정되어야 합니다.")
 
         # 🔥 인스턴스 변수로 client 생성 (중요)
-        self.client = OpenAI(api_key=api_key)
+        self.client = get_openai_client()
         self.model = "text-embedding-3-large"
         self.vector = PineconeVectorService()
         self.dimension = 3072  # text-embedding-3-large 차원
@@ -3,11 +3,13 @@
 LangChain을 사용하여 실시간 정체성 분석을 수행합니다.
 """
 import json
+import os
 import asyncio
 from typing import Dict, Optional
-from langchain_openai import ChatOpenAI
+from services.common.llm_clients import get_chat_model
 from langchain_core.messages import HumanMessage, SystemMessage
 from services.database_service import DatabaseService
+from services.conversation_context import get_conversation_context_manager, parse_transcript
 from config import settings
 
 
@@ -16,14 +18,17 @@ class IdentityAnalysisService:
 
     def __init__(self, api_key: str, model: str = None):
         model = model or settings.OPENAI_MODEL
-        self.llm = ChatOpenAI(
-            api_key=api_key,
+        self.llm = get_chat_model(
             model=model,
             temperature=1,
             max_completion_tokens=2000
         )
         self._db_service = None
 
+        # 분석용 대화 토큰 예산 (초과분은 세션 요약으로 대체)
+        self.context_manager = get_conversation_context_manager()
+        self.context_max_tokens = int(os.getenv("IDENTITY_CONTEXT_TOKENS", 6000))
+
     def _get_db_service(self) -> DatabaseService:
         """DatabaseService 싱글톤"""
         if self._db_service is None:
@@ -34,14 +39,24 @@ class IdentityAnalysisService:
         """
         현재 세션의 대화 기록만 반환합니다.
         (이전 세션의 대화는 포함하지 않음 - 새 상담 시 정체성 초기화를 위해)
+        토큰 예산을 넘는 앞부분 대화는 세션 요약으로 대체합니다.
         """
         # 이전 세션 대화 조회 비활성화 - 새 상담마다 정체성을 새로 시작
-        return conversation_history
+        messages = parse_transcript(conversation_history)
+        if not messages:
+            return conversation_history or ""
+
+        window = self.context_manager.build(
+            "identity", session_id, messages, self.context_max_tokens
+        )
+        if not window.dropped:
+            return conversation_history
+        return window.to_text()
     
     async def assess_clarity(self, conversation_history: str, session_id: Optional[str] = None) -> Dict:
         """
         정체성 명확도를 평가합니다.
-        session_id가 있으면 해당 세션의 전체 대화 기록으로 분석합니다.
+        session_id(상담 세션 ID)가 있으면 예산을 넘는 앞부분 대화를 해당 세션 요약으로 대체합니다.
 
         Returns:
             {
@@ -50,7 +65,7 @@ class IdentityAnalysisService:
             }
         """
         # sessionId가 있으면 전체 대화 기록 포함
-        full_history = self._get_full_conversation(conversation_history, session_id)
+        full_history = await asyncio.to_thread(self._get_full_conversation, conversation_history, session_id)
         system_prompt = """
 대화 내용을 분석하여 학생의 진로 정체성이 얼마나 명확해졌는지 평가하세요.
 
@@ -84,7 +99,7 @@ JSON 형식으로만 응답하세요:
     async def extract_identity(self, conversation_history: str, session_id: Optional[str] = None) -> Dict:
         """
         정체성 특징을 추출합니다.
-        session_id가 있으면 해당 세션의 전체 대화 기록으로 분석합니다.
+        session_id(상담 세션 ID)가 있으면 예산을 넘는 앞부분 대화를 해당 세션 요약으로 대체합니다.
 
         Returns:
             {
@@ -96,7 +111,7 @@ JSON 형식으로만 응답하세요:
             }
         """
         # sessionId가 있으면 전체 대화 기록 포함
-        full_history = self._get_full_conversation(conversation_history, session_id)
+        full_history = await asyncio.to_thread(self._get_full_conversation, conversation_history, session_id)
 
         system_prompt = """
 대화에서 드러난 학생의 정체성 특징을 추출하세요.
@@ -196,7 +211,7 @@ JSON 형식으로만 응답하세요:
     ) -> Dict:
         """
         현재 단계에서 다음 단계로 넘어갈 준비가 되었는지 평가합니다.
-        session_id가 있으면 해당 세션의 전체 대화 기록으로 분석합니다.
+        session_id(상담 세션 ID)가 있으면 예산을 넘는 앞부분 대화를 해당 세션 요약으로 대체합니다.
 
         Returns:
             {
@@ -206,7 +221,7 @@ JSON 형식으로만 응답하세요:
             }
         """
         # sessionId가 있으면 전체 대화 기록 포함
-        full_history = self._get_full_conversation(conversation_history, session_id)
+        full_history = await asyncio.to_thread(self._get_full_conversation, conversation_history, session_id)
 
         system_prompt = f"""
 현재 대화 단계: {current_stage}
@@ -14,7 +14,8 @@ PROJECT_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, '..', '..'))
 if PROJECT_ROOT not in sys.path:
     sys.path.append(PROJECT_ROOT)
 
-from openai import OpenAI
+from services.common.llm_clients import get_openai_client
+from services.common.llm_gateway import LANE_BATCH
 
 from config import settings
 from services.ingest.careernet_client import CareerNetClient
@@ -24,7 +25,7 @@ from services.vector.supabase_vector_repository import SupabaseVectorRepository
 from services.rag.pinecone_vector_service import PineconeVectorService
 
 # OpenAI client (API key must be set in env)
-_openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+_openai_client = get_openai_client(lane=LANE_BATCH)
 
 class NCSFallbackIngest:
     """Generate NCS-like data from CareerNet data using LLM and store it."""
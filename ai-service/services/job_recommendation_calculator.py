@@ -5,13 +5,17 @@ AI를 활용하여 직업명에서 관련 채용공고 검색 키워드를 생
 """
 import asyncio
 import json
+import logging
 import os
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
-from openai import OpenAI
+from services.common.llm_clients import get_openai_client
+from services.common.llm_gateway import LANE_BATCH, llm_lane
 from services.database_service import DatabaseService
 from services.recommendation_lock import get_recommendation_lock
 
+logger = logging.getLogger(__name__)
+
 
 class JobRecommendationCalculator:
     """채용공고 추천 미리 계산 서비스"""
@@ -19,84 +23,39 @@ class JobRecommendationCalculator:
     def __init__(self):
         self.db = DatabaseService()
         self.lock = get_recommendation_lock()
-        self.openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.openai_client = get_openai_client(lane=LANE_BATCH)
         self.keyword_cache = {}  # AI 생성 키워드 캐시
 
     async def calculate_all_user_recommendations(
         self,
         batch_size: int = 10,
-        max_recommendations: int = 50
+        max_recommendations: int = 50,
+        run_id: Optional[str] = None
     ) -> Dict:
         """
         모든 사용자의 채용공고 추천을 계산합니다.
+        Redis 작업 큐 기반 배치 러너에 위임하여 여러 워커가 사용자를 나눠 처리하고,
+        재시작 시 체크포인트부터 이어서 처리합니다.
 
         Args:
-            batch_size: 동시 처리할 사용자 수
+            batch_size: 초기 동시 처리 사용자 수 (이후 지연 시간에 따라 자동 조절)
             max_recommendations: 사용자당 최대 추천 공고 수
+            run_id: 이어서 처리할 배치 실행 ID (기본값: 새 실행 - 같은 날 재실행해도 전체를 다시 계산)
 
         Returns:
             실행 결과 통계
         """
-        print("[JobRecommendationCalculator] 추천 계산 시작...")
-
-        # 1. 커리어 분석이 완료된 활성 사용자 조회
-        users = self._get_active_users_with_career_analysis()
-        if not users:
-            print("[JobRecommendationCalculator] 처리할 사용자가 없습니다.")
-            return {
-                "success": True,
-                "total_users": 0,
-                "processed_users": 0,
-                "failed_users": 0,
-                "total_recommendations": 0
-            }
-
-        print(f"[JobRecommendationCalculator] {len(users)}명의 사용자 발견")
-
-        # 2. 배치 단위로 사용자 처리
-        total_processed = 0
-        total_failed = 0
-        total_recommendations = 0
+        from services.recommendation_batch_runner import RecommendationBatchRunner
 
-        for i in range(0, len(users), batch_size):
-            batch = users[i:i + batch_size]
-            print(f"[JobRecommendationCalculator] 배치 {i // batch_size + 1} 처리 중 ({len(batch)}명)...")
-
-            # 병렬 처리
-            tasks = [
-                self.calculate_user_recommendations(
-                    user_id=user["user_id"],
-                    max_recommendations=max_recommendations
-                )
-                for user in batch
-            ]
-
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # 결과 집계
-            for result in results:
-                if isinstance(result, Exception):
-                    print(f"[JobRecommendationCalculator] 오류: {result}")
-                    total_failed += 1
-                elif result and result.get("success"):
-                    total_processed += 1
-                    total_recommendations += result.get("saved_count", 0)
-                else:
-                    total_failed += 1
-
-            # API 부하 방지를 위한 대기
-            if i + batch_size < len(users):
-                await asyncio.sleep(2)
-
-        print(f"[JobRecommendationCalculator] 완료: {total_processed}명 성공, {total_failed}명 실패, 총 {total_recommendations}개 추천")
-
-        return {
-            "success": True,
-            "total_users": len(users),
-            "processed_users": total_processed,
-            "failed_users": total_failed,
-            "total_recommendations": total_recommendations
-        }
+        runner = RecommendationBatchRunner(
+            calculator=self,
+            run_id=run_id,
+            initial_concurrency=batch_size,
+            max_recommendations=max_recommendations
+        )
+        # 야간 배치의 모든 LLM 호출(워커 태스크 / 스레드 포함)은 batch 레인 → 채팅 등 실시간 요청에 양보
+        with llm_lane(LANE_BATCH):
+            return await runner.run()
 
     async def calculate_user_recommendations(
         self,
@@ -106,6 +65,7 @@ class JobRecommendationCalculator:
         """
         특정 사용자의 채용공고 추천을 계산합니다.
         job_recommendations 테이블의 직업명을 기반으로 job_listings에서 채용공고를 검색합니다.
+        DB/OpenAI 호출이 동기 방식이므로 별도 스레드에서 실행합니다.
 
         Args:
             user_id: 사용자 ID
@@ -114,21 +74,33 @@ class JobRecommendationCalculator:
         Returns:
             계산 결과
         """
+        return await asyncio.to_thread(
+            self.calculate_user_recommendations_blocking,
+            user_id,
+            max_recommendations
+        )
+
+    def calculate_user_recommendations_blocking(
+        self,
+        user_id: int,
+        max_recommendations: int = 50
+    ) -> Dict:
+        """특정 사용자의 채용공고 추천 계산 (동기, 워커 스레드용)"""
         try:
             # 🔒 분산 락 획득 (Race Condition 방지)
             with self.lock.acquire(user_id=user_id, timeout=300):
-                print(f"[JobRecommendationCalculator] 사용자 {user_id} 추천 계산 중... (락 획득)")
+                logger.debug(f"[JobRecommendationCalculator] 사용자 {user_id} 추천 계산 중... (락 획득)")
 
                 # 1. 사용자 프로필 + 직업 추천 데이터 조회
                 career_analysis = self._get_user_career_analysis(user_id)
                 if not career_analysis:
-                    print(f"[JobRecommendationCalculator] 사용자 {user_id}의 프로필 분석 데이터가 없습니다.")
+                    logger.debug(f"[JobRecommendationCalculator] 사용자 {user_id}의 프로필 분석 데이터가 없습니다.")
                     return {"success": False, "error": "No profile analysis"}
 
                 # 2. 추천 직업 목록 확인
                 recommended_careers = career_analysis.get("recommendedCareers", [])
                 if not recommended_careers:
-                    print(f"[JobRecommendationCalculator] 사용자 {user_id}의 추천 직업이 없습니다.")
+                    logger.debug(f"[JobRecommendationCalculator] 사용자 {user_id}의 추천 직업이 없습니다.")
                     return {"success": False, "error": "No job recommendations"}
 
                 # 3. 직업명 기반으로 채용공고 검색
@@ -140,12 +112,12 @@ class JobRecommendationCalculator:
                 )
 
                 if not recommendations:
-                    print(f"[JobRecommendationCalculator] 사용자 {user_id}의 채용공고 검색 결과가 없습니다.")
+                    logger.debug(f"[JobRecommendationCalculator] 사용자 {user_id}의 채용공고 검색 결과가 없습니다.")
                     return {"success": True, "saved_count": 0}
 
                 # 4. DB에 저장
                 saved_count = self._save_recommendations(user_id, recommendations)
-                print(f"[JobRecommendationCalculator] 사용자 {user_id}: {saved_count}개 추천 저장 완료")
+                logger.info(f"[JobRecommendationCalculator] 사용자 {user_id}: {saved_count}개 추천 저장 완료")
 
                 return {
                     "success": True,
@@ -156,16 +128,14 @@ class JobRecommendationCalculator:
 
         except TimeoutError as e:
             # 락 획득 실패 (다른 작업이 실행 중)
-            print(f"[JobRecommendationCalculator] 사용자 {user_id} 추천 계산 스킵 (이미 실행 중): {e}")
+            logger.debug(f"[JobRecommendationCalculator] 사용자 {user_id} 추천 계산 스킵 (이미 실행 중): {e}")
             return {
                 "success": False,
                 "error": "Already in progress",
                 "skipped": True
             }
         except Exception as e:
-            print(f"[JobRecommendationCalculator] 사용자 {user_id} 추천 계산 실패: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.warning(f"[JobRecommendationCalculator] 사용자 {user_id} 추천 계산 실패: {e}", exc_info=True)
             return {"success": False, "error": str(e)}
 
     def _search_job_listings_by_careers(
@@ -263,13 +233,11 @@ class JobRecommendationCalculator:
             # 매칭 점수 기준 정렬
             recommendations.sort(key=lambda x: x.get("matchScore", 0), reverse=True)
 
-            print(f"[JobRecommendationCalculator] 사용자 {user_id}: 총 {len(recommendations)}개 채용공고 검색됨 (중복 제거됨)")
+            logger.debug(f"[JobRecommendationCalculator] 사용자 {user_id}: 총 {len(recommendations)}개 채용공고 검색됨 (중복 제거됨)")
             return recommendations[:max_recommendations]
 
         except Exception as e:
-            print(f"[JobRecommendationCalculator] 채용공고 검색 실패: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"[JobRecommendationCalculator] 채용공고 검색 실패: {e}")
             return []
 
     def _extract_keywords(self, career_name: str) -> List[str]:
@@ -279,7 +247,7 @@ class JobRecommendationCalculator:
         """
         # 캐시 확인
         if career_name in self.keyword_cache:
-            print(f"[AI KeywordGen] '{career_name}' → 캐시된 키워드 사용")
+            logger.debug(f"[AI KeywordGen] '{career_name}' → 캐시된 키워드 사용")
             return self.keyword_cache[career_name]
 
         try:
@@ -289,14 +257,14 @@ class JobRecommendationCalculator:
             if keywords:
                 # 캐시에 저장
                 self.keyword_cache[career_name] = keywords
-                print(f"[AI KeywordGen] '{career_name}' → AI 생성 키워드: {keywords}")
+                logger.debug(f"[AI KeywordGen] '{career_name}' → AI 생성 키워드: {keywords}")
                 return keywords
             else:
                 # AI 실패 시 기본 키워드 반환
                 return self._get_fallback_keywords(career_name)
 
         except Exception as e:
-            print(f"[AI KeywordGen] AI 키워드 생성 실패: {e}")
+            logger.warning(f"[AI KeywordGen] AI 키워드 생성 실패: {e}")
             return self._get_fallback_keywords(career_name)
 
     def _generate_keywords_with_ai(self, career_name: str) -> List[str]:
@@ -337,7 +305,7 @@ class JobRecommendationCalculator:
             return keywords[:10]
 
         except Exception as e:
-            print(f"[AI KeywordGen] OpenAI API 호출 실패: {e}")
+            logger.warning(f"[AI KeywordGen] OpenAI API 호출 실패: {e}")
             return []
 
     def _get_fallback_keywords(self, career_name: str) -> List[str]:
@@ -350,22 +318,89 @@ class JobRecommendationCalculator:
             if len(word) >= 2 and word not in keywords:
                 keywords.append(word)
 
-        print(f"[AI KeywordGen] '{career_name}' → 폴백 키워드: {keywords}")
+        logger.debug(f"[AI KeywordGen] '{career_name}' → 폴백 키워드: {keywords}")
         return keywords[:5]
 
-    async def recalculate_for_new_jobs(self, job_listing_ids: List[int]) -> Dict:
+    async def recalculate_for_new_jobs(
+        self,
+        job_listings: List[Dict],
+        run_id: Optional[str] = None
+    ) -> Dict:
         """
-        새로운 채용공고가 추가되었을 때, 모든 사용자에 대해 해당 공고 추천 여부를 계산합니다.
+        새로운 채용공고가 추가되었을 때, 해당 공고와 관련된 사용자만 추천을 다시 계산합니다.
 
         Args:
-            job_listing_ids: 새로 추가된 채용공고 ID 리스트
+            job_listings: 새로 수집된 채용공고 리스트 (title, description 포함)
+            run_id: 이어서 처리할 배치 실행 ID (기본값: 새 실행, 같은 ID로 재실행 시 체크포인트부터 이어서 처리)
 
         Returns:
             계산 결과
         """
-        # TODO: 구현 필요 (선택적 기능)
-        # 새 공고가 추가되면 모든 사용자에게 해당 공고를 추천할지 간단히 판단
-        pass
+        from services.recommendation_batch_runner import RecommendationBatchRunner
+
+        affected_users = await asyncio.to_thread(self.find_users_affected_by_jobs, job_listings)
+        logger.info(f"[JobRecommendationCalculator] 새 공고 {len(job_listings)}개 → 영향 받는 사용자 {len(affected_users)}명")
+
+        if not affected_users:
+            return {
+                "success": True,
+                "total_users": 0,
+                "processed_users": 0,
+                "failed_users": 0,
+                "total_recommendations": 0
+            }
+
+        runner = RecommendationBatchRunner(
+            calculator=self,
+            run_id=run_id,
+            load_user_ids=lambda: affected_users
+        )
+        return await runner.run()
+
+    def find_users_affected_by_jobs(self, job_listings: List[Dict]) -> List[int]:
+        """
+        추천 직업의 검색 키워드가 새 공고의 제목/설명에 등장하는 사용자를 찾습니다.
+        (_search_job_listings_by_careers의 ILIKE 검색과 같은 기준)
+        """
+        posting_text = "\n".join(
+            f"{job.get('title') or ''} {job.get('description') or ''}" for job in job_listings
+        ).lower()
+        if not posting_text.strip():
+            return []
+
+        users = self._get_active_users_with_career_analysis()
+        user_ids = [user["user_id"] for user in users]
+        if not user_ids:
+            return []
+
+        try:
+            placeholders = ", ".join(["%s"] * len(user_ids))
+            rows = self.db.execute_query(
+                f"SELECT user_id, job_name FROM job_recommendations WHERE user_id IN ({placeholders})",
+                tuple(user_ids)
+            )
+        except Exception as e:
+            logger.error(f"[JobRecommendationCalculator] 추천 직업 조회 실패: {e}")
+            return user_ids
+
+        matched_careers: Dict[str, bool] = {}
+        affected = []
+        seen = set()
+        for row in rows:
+            user_id = row.get("user_id")
+            career_name = row.get("job_name")
+            if not career_name or user_id in seen:
+                continue
+
+            if career_name not in matched_careers:
+                matched_careers[career_name] = any(
+                    keyword.lower() in posting_text for keyword in self._extract_keywords(career_name)
+                )
+            if matched_careers[career_name]:
+                seen.add(user_id)
+                affected.append(user_id)
+
+        return affected
 
     def _get_active_users_with_career_analysis(self) -> List[Dict]:
         """커리어 분석이 완료된 활성 사용자 조회"""
@@ -382,7 +417,7 @@ class JobRecommendationCalculator:
             """
             return self.db.execute_query(query)
         except Exception as e:
-            print(f"[JobRecommendationCalculator] 사용자 조회 실패: {e}")
+            logger.error(f"[JobRecommendationCalculator] 사용자 조회 실패: {e}")
             return []
 
     def _get_user_career_analysis(self, user_id: int) -> Optional[Dict]:
@@ -398,11 +433,11 @@ class JobRecommendationCalculator:
             profile_results = self.db.execute_query(profile_query, (user_id,))
 
             if not profile_results:
-                print(f"[JobRecommendationCalculator] 사용자 {user_id}의 프로필 분석 데이터가 없습니다.")
+                logger.debug(f"[JobRecommendationCalculator] 사용자 {user_id}의 프로필 분석 데이터가 없습니다.")
                 return None
 
             analysis = profile_results[0]
-            print(f"[JobRecommendationCalculator] 프로필 분석 데이터 조회 성공: user_id={user_id}")
+            logger.debug(f"[JobRecommendationCalculator] 프로필 분석 데이터 조회 성공: user_id={user_id}")
 
             # 2. job_recommendations 테이블에서 추천 직업 조회
             job_rec_query = """
@@ -416,7 +451,7 @@ class JobRecommendationCalculator:
 
             recommended_careers = []
             if job_results:
-                print(f"[JobRecommendationCalculator] 사용자 {user_id}의 추천 직업 {len(job_results)}개 조회됨")
+                logger.debug(f"[JobRecommendationCalculator] 사용자 {user_id}의 추천 직업 {len(job_results)}개 조회됨")
                 for job in job_results:
                     recommended_careers.append({
                         "careerName": job.get("job_name"),
@@ -426,7 +461,7 @@ class JobRecommendationCalculator:
                         "description": job.get("description")
                     })
             else:
-                print(f"[JobRecommendationCalculator] 사용자 {user_id}의 추천 직업이 없습니다.")
+                logger.debug(f"[JobRecommendationCalculator] 사용자 {user_id}의 추천 직업이 없습니다.")
 
             # JSON 필드 파싱
             personality = self._parse_json_field(analysis.get("personality")) or {}
@@ -453,9 +488,7 @@ class JobRecommendationCalculator:
             }
 
         except Exception as e:
-            print(f"[JobRecommendationCalculator] 프로필 분석 조회 실패: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"[JobRecommendationCalculator] 프로필 분석 조회 실패: {e}")
             return None
 
     def _parse_json_field(self, field_value) -> any:
@@ -523,16 +556,14 @@ class JobRecommendationCalculator:
                         saved_count += 1
 
                     except Exception as e:
-                        print(f"[JobRecommendationCalculator] 추천 저장 실패 (job_id={rec.get('id')}): {e}")
+                        logger.warning(f"[JobRecommendationCalculator] 추천 저장 실패 (job_id={rec.get('id')}): {e}")
                         continue
 
                 conn.commit()
                 return saved_count
 
         except Exception as e:
-            print(f"[JobRecommendationCalculator] DB 저장 실패: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"[JobRecommendationCalculator] DB 저장 실패: {e}")
             return 0
 
     def cleanup_old_recommendations(self, days: int = 30) -> int:
@@ -544,7 +575,7 @@ class JobRecommendationCalculator:
             """
             return self.db.execute_update(query, (days,))
         except Exception as e:
-            print(f"[JobRecommendationCalculator] 오래된 데이터 정리 실패: {e}")
+            logger.error(f"[JobRecommendationCalculator] 오래된 데이터 정리 실패: {e}")
             return 0
 
 
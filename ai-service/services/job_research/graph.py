@@ -3,34 +3,44 @@ LangGraph 워크플로우 정의
 """
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, Dict, Any
 from langgraph.graph import StateGraph, END
 
+from services.common.metrics import traced
+
 from .state import JobResearchState
-from .nodes import crawl_jobs, analyze_jobs, generate_report
+from .nodes import crawl_jobs, analyze_jobs, generate_report, lookup_report
 
 
 def create_job_research_graph() -> StateGraph:
     """
     채용 리서치 그래프 생성
 
-    워크플로우:
-    1. crawl_jobs: 채용 공고 수집 (DB 또는 크롤링)
-    2. analyze_jobs: 데이터 분석 (기술 스택, 자격증, 경력 등)
-    3. generate_report: MD 리포트 생성
+    워크플로우 (모든 노드는 비동기):
+    1. crawl_jobs: 채용 공고 수집 (DB 또는 크롤링) + 공고 스냅샷 지문
+    2. lookup_report: 같은 키워드 + 같은 공고로 만든 리포트가 있으면 바로 종료
+    3. analyze_jobs: 데이터 분석 (기술 스택, 자격증, 경력 등 - 공고가 그대로면 이전 분석 재사용)
+    4. generate_report: MD 리포트 생성
     """
     # 그래프 생성
     workflow = StateGraph(JobResearchState)
 
-    # 노드 추가
-    workflow.add_node("crawl", crawl_jobs)
-    workflow.add_node("analyze", analyze_jobs)
-    workflow.add_node("report", generate_report)
+    # 노드 추가 (노드마다 langgraph span 기록)
+    workflow.add_node("crawl", traced("langgraph", "job_research.crawl")(crawl_jobs))
+    workflow.add_node("lookup_report", traced("langgraph", "job_research.lookup_report")(lookup_report))
+    workflow.add_node("analyze", traced("langgraph", "job_research.analyze")(analyze_jobs))
+    workflow.add_node("report", traced("langgraph", "job_research.report")(generate_report))
 
-    # 엣지 정의 (순차 실행)
+    # 엣지 정의
     workflow.set_entry_point("crawl")
-    workflow.add_edge("crawl", "analyze")
+    workflow.add_edge("crawl", "lookup_report")
+    workflow.add_conditional_edges(
+        "lookup_report",
+        lambda state: "cached" if state.get("report_cached") else "analyze",
+        {"cached": END, "analyze": "analyze"}
+    )
     workflow.add_edge("analyze", "report")
     workflow.add_edge("report", END)
 
@@ -49,6 +59,30 @@ def get_graph():
     return _graph
 
 
+def _initial_state(keyword: str, user_id: Optional[int]) -> JobResearchState:
+    return {
+        "keyword": keyword,
+        "user_id": user_id,
+        "job_postings": [],
+        "crawl_errors": [],
+        "tech_stack_analysis": [],
+        "certifications": [],
+        "salary_analysis": {},
+        "experience_distribution": {},
+        "company_stats": {},
+        "ai_insights": "",
+        "strategy_recommendations": [],
+        "report_markdown": "",
+        "report_path": "",
+        "created_at": datetime.now().isoformat(),
+        "total_postings": 0,
+        "sites_crawled": [],
+        "postings_fingerprint": "",
+        "analysis_cached": False,
+        "report_cached": False
+    }
+
+
 async def run_job_research(
     keyword: str,
     user_id: Optional[int] = None
@@ -72,35 +106,16 @@ async def run_job_research(
     try:
         graph = get_graph()
 
-        # 초기 상태
-        initial_state: JobResearchState = {
-            "keyword": keyword,
-            "user_id": user_id,
-            "job_postings": [],
-            "crawl_errors": [],
-            "tech_stack_analysis": [],
-            "certifications": [],
-            "salary_analysis": {},
-            "experience_distribution": {},
-            "company_stats": {},
-            "ai_insights": "",
-            "strategy_recommendations": [],
-            "report_markdown": "",
-            "report_path": "",
-            "created_at": datetime.now().isoformat(),
-            "total_postings": 0,
-            "sites_crawled": []
-        }
-
-        # 그래프 실행
-        result = await asyncio.to_thread(graph.invoke, initial_state)
+        # 그래프 실행 (노드가 비동기라 이벤트 루프를 막지 않음)
+        result = await graph.ainvoke(_initial_state(keyword, user_id))
 
         return {
             "success": True,
             "report_path": result.get("report_path", ""),
             "report_markdown": result.get("report_markdown", ""),
             "total_postings": result.get("total_postings", 0),
-            "keyword": keyword
+            "keyword": keyword,
+            "cached": bool(result.get("report_cached"))
         }
 
     except Exception as e:
@@ -127,46 +142,13 @@ def run_job_research_sync(
         리서치 결과
     """
     try:
-        graph = get_graph()
-
-        # 초기 상태
-        initial_state: JobResearchState = {
-            "keyword": keyword,
-            "user_id": user_id,
-            "job_postings": [],
-            "crawl_errors": [],
-            "tech_stack_analysis": [],
-            "certifications": [],
-            "salary_analysis": {},
-            "experience_distribution": {},
-            "company_stats": {},
-            "ai_insights": "",
-            "strategy_recommendations": [],
-            "report_markdown": "",
-            "report_path": "",
-            "created_at": datetime.now().isoformat(),
-            "total_postings": 0,
-            "sites_crawled": []
-        }
-
-        # 그래프 실행
-        result = graph.invoke(initial_state)
-
-        return {
-            "success": True,
-            "report_path": result.get("report_path", ""),
-            "report_markdown": result.get("report_markdown", ""),
-            "total_postings": result.get("total_postings", 0),
-            "keyword": keyword
-        }
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(run_job_research(keyword, user_id))
 
-    except Exception as e:
-        import traceback
-        return {
-            "success": False,
-            "error": str(e),
-            "traceback": traceback.format_exc()
-        }
+    # 이벤트 루프 안에서 호출된 경우 (동기 도구 등) 별도 스레드의 루프에서 실행
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, run_job_research(keyword, user_id)).result()
 
 
 # CLI 테스트용
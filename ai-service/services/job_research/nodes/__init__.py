@@ -4,6 +4,6 @@ LangGraph 노드 정의
 
 from .crawl_node import crawl_jobs
 from .analyze_node import analyze_jobs
-from .report_node import generate_report
+from .report_node import generate_report, lookup_report
 
-__all__ = ["crawl_jobs", "analyze_jobs", "generate_report"]
+__all__ = ["crawl_jobs", "analyze_jobs", "generate_report", "lookup_report"]
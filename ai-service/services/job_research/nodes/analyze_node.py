@@ -2,14 +2,14 @@
 분석 노드 - 채용 공고 데이터 분석
 """
 
-import os
 import json
 from pathlib import Path
 from typing import Dict, Any, List
 from collections import Counter
-from openai import OpenAI
 from ..state import JobResearchState
+from ..store import get_analysis_cache
 from config import settings
+from services.common.llm_clients import get_chat_model
 
 
 def load_prompt(prompt_name: str) -> str:
@@ -112,10 +112,10 @@ def extract_certifications(job_postings: List[Dict]) -> List[Dict]:
     return certifications
 
 
-def get_ai_insights(state: JobResearchState) -> str:
-    """OpenAI를 사용한 AI 인사이트 생성"""
+async def get_ai_insights(state: JobResearchState) -> str:
+    """OpenAI를 사용한 AI 인사이트 생성 (공유 LLM 클라이언트, 비동기)"""
     try:
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        llm = get_chat_model(model=settings.OPENAI_MODEL, temperature=1)
         prompt_template = load_prompt("analyze")
 
         # 데이터 준비
@@ -143,13 +143,8 @@ def get_ai_insights(state: JobResearchState) -> str:
             company_data=company_data or "데이터 없음"
         )
 
-        response = client.chat.completions.create(
-            model=settings.OPENAI_MODEL,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=1
-        )
-
-        return response.choices[0].message.content
+        response = await llm.ainvoke(prompt)
+        return response.content
 
     except Exception as e:
         return json.dumps({
@@ -160,11 +155,20 @@ def get_ai_insights(state: JobResearchState) -> str:
         })
 
 
-def analyze_jobs(state: JobResearchState) -> Dict[str, Any]:
+async def analyze_jobs(state: JobResearchState) -> Dict[str, Any]:
     """
     채용 공고 분석 노드
+    같은 키워드의 공고 스냅샷이 바뀌지 않았으면 이전 분석 결과(AI 인사이트 포함)를 재사용
     """
     job_postings = state.get("job_postings", [])
+    fingerprint = state.get("postings_fingerprint")
+    cacheable = bool(fingerprint) and not state.get("crawl_errors")
+
+    cache = get_analysis_cache()
+    if cacheable:
+        cached = cache.get(state["keyword"], fingerprint)
+        if cached is not None:
+            return {**cached, "analysis_cached": True}
 
     # 기술 스택 분석
     tech_stack_analysis = analyze_tech_stack(job_postings)
@@ -196,7 +200,11 @@ def analyze_jobs(state: JobResearchState) -> Dict[str, Any]:
 
     # AI 인사이트 생성
     temp_state = {**state, **updated_state}
-    ai_insights = get_ai_insights(temp_state)
+    ai_insights = await get_ai_insights(temp_state)
     updated_state["ai_insights"] = ai_insights
 
-    return updated_state
+    # AI 인사이트 생성에 실패한 결과는 캐시하지 않음
+    if cacheable and "분석 중 오류 발생" not in ai_insights:
+        cache.set(state["keyword"], fingerprint, updated_state)
+
+    return {**updated_state, "analysis_cached": False}
@@ -3,17 +3,74 @@
 현재는 DB에서 데이터를 가져오고, 추후 실제 크롤링으로 확장
 """
 
+import asyncio
 import json
+import threading
 from datetime import datetime
 from typing import Dict, Any
 from ..state import JobResearchState
+from ..store import postings_fingerprint
 
+# 리서치마다 새 연결을 만들지 않도록 공유 (연결은 DatabaseService가 스레드별로 관리)
+_db_service = None
+_db_lock = threading.Lock()
 
-def crawl_jobs(state: JobResearchState) -> Dict[str, Any]:
+
+def _get_db_service():
+    """DatabaseService 싱글톤"""
+    global _db_service
+    with _db_lock:
+        if _db_service is None:
+            from services.database_service import DatabaseService
+            _db_service = DatabaseService()
+    return _db_service
+
+
+def _build_query() -> str:
+    """최근 7일 공고 중 키워드가 제목/설명에 포함된 공고 (DB 방언별)"""
+    from services.database_service import USE_POSTGRES
+
+    if USE_POSTGRES:
+        match, recent = "(title ILIKE %s OR description ILIKE %s)", "crawled_at >= NOW() - INTERVAL '7 days'"
+    else:
+        # MySQL 기본 collation은 대소문자 구분 없음
+        match, recent = "(title LIKE %s OR description LIKE %s)", "crawled_at >= NOW() - INTERVAL 7 DAY"
+
+    # 최근 공고만 먼저 거른 뒤(crawled_at 인덱스) 키워드 비교
+    return f"""
+        SELECT id, title, company, location, url, description,
+               site_name, tech_stack, required_skills, crawled_at
+        FROM job_listings
+        WHERE {recent}
+        AND {match}
+        ORDER BY crawled_at DESC
+        LIMIT 100
+    """
+
+
+def _parse_list(value) -> list:
+    if value and isinstance(value, str):
+        try:
+            return json.loads(value)
+        except Exception:
+            return [value]
+    return value or []
+
+
+def _fetch_postings(keyword: str) -> list:
+    pattern = f"%{keyword}%"
+    rows = _get_db_service().execute_query(_build_query(), (pattern, pattern))
+    columns = ("id", "title", "company", "location", "url", "description",
+               "site_name", "tech_stack", "required_skills", "crawled_at")
+    # DictCursor / 튜플 결과 모두 지원
+    return [row if isinstance(row, dict) else dict(zip(columns, row)) for row in rows or []]
+
+
+async def crawl_jobs(state: JobResearchState) -> Dict[str, Any]:
     """
     채용 공고 크롤링/수집 노드
 
-    현재: DB에서 기존 데이터 조회
+    현재: DB에서 기존 데이터 조회 (블로킹 DB 호출은 스레드에서 실행)
     TODO: 실제 크롤러 구현 (원티드, 사람인, 잡코리아)
     """
     keyword = state["keyword"]
@@ -21,69 +78,42 @@ def crawl_jobs(state: JobResearchState) -> Dict[str, Any]:
     crawl_errors = []
     sites_crawled = []
 
-    db = None
     try:
-        # DB에서 채용 공고 조회
-        from services.database_service import DatabaseService
-        db = DatabaseService()
-
-        query = """
-            SELECT id, title, company, location, url, description,
-                   site_name, tech_stack, required_skills, crawled_at
-            FROM job_listings
-            WHERE (title ILIKE %s OR description ILIKE %s)
-            AND crawled_at >= NOW() - INTERVAL '7 days'
-            ORDER BY crawled_at DESC
-            LIMIT 100
-        """
-        pattern = f"%{keyword}%"
-        results = db.execute_query(query, (pattern, pattern))
-
-        for row in results:
-            tech_stack = row[7]
-            if tech_stack and isinstance(tech_stack, str):
-                try:
-                    tech_stack = json.loads(tech_stack)
-                except:
-                    tech_stack = [tech_stack] if tech_stack else []
-
-            required_skills = row[8]
-            if required_skills and isinstance(required_skills, str):
-                try:
-                    required_skills = json.loads(required_skills)
-                except:
-                    required_skills = [required_skills] if required_skills else []
+        rows = await asyncio.to_thread(_fetch_postings, keyword)
+
+        for row in rows:
+            crawled_at = row.get("crawled_at")
+            site = row.get("site_name") or "unknown"
 
             job_postings.append({
-                "id": str(row[0]),
-                "title": row[1] or "",
-                "company": row[2] or "",
-                "location": row[3],
-                "url": row[4] or "",
-                "description": row[5] or "",
-                "site_name": row[6] or "unknown",
-                "tech_stack": tech_stack or [],
-                "required_skills": required_skills or [],
+                "id": str(row.get("id")),
+                "title": row.get("title") or "",
+                "company": row.get("company") or "",
+                "location": row.get("location"),
+                "url": row.get("url") or "",
+                "description": row.get("description") or "",
+                "site_name": site,
+                "tech_stack": _parse_list(row.get("tech_stack")),
+                "required_skills": _parse_list(row.get("required_skills")),
                 "experience": None,
                 "salary": None,
-                "crawled_at": row[9].isoformat() if row[9] else datetime.now().isoformat()
+                "crawled_at": (
+                    crawled_at.isoformat() if isinstance(crawled_at, datetime)
+                    else str(crawled_at or datetime.now().isoformat())
+                )
             })
 
             # 사이트별 집계
-            site = row[6] or "unknown"
             if site not in sites_crawled:
                 sites_crawled.append(site)
 
     except Exception as e:
         crawl_errors.append(f"DB 조회 오류: {str(e)}")
-    finally:
-        # DB 연결 정리 (연결 누수 방지)
-        if db:
-            db.cleanup()
 
     return {
         "job_postings": job_postings,
         "crawl_errors": crawl_errors,
         "sites_crawled": sites_crawled,
-        "total_postings": len(job_postings)
+        "total_postings": len(job_postings),
+        "postings_fingerprint": postings_fingerprint(job_postings)
     }
@@ -2,13 +2,14 @@
 리포트 노드 - MD 파일 생성
 """
 
-import os
+import asyncio
 import json
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
-from openai import OpenAI
+from typing import Dict, Any, Optional
 from ..state import JobResearchState
+from ..store import get_report_cache, get_report_store
 
 
 def load_prompt(prompt_name: str) -> str:
@@ -215,33 +216,49 @@ def generate_markdown_report(state: JobResearchState) -> str:
 
 
 def save_report(report: str, keyword: str) -> str:
-    """리포트를 MD 파일로 저장"""
-    output_dir = Path(__file__).parent.parent / "output"
-    output_dir.mkdir(exist_ok=True)
-
-    date_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-    safe_keyword = keyword.replace(" ", "_").replace("/", "_")
-    filename = f"{safe_keyword}_{date_str}.md"
-    filepath = output_dir / filename
+    """리포트를 MD 파일로 저장 (개수 / 용량 / 보관 기간 제한 저장소)"""
+    return get_report_store().save(report, keyword)
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(report)
 
-    return str(filepath)
+def lookup_cached_report(state: JobResearchState) -> Optional[Dict[str, Any]]:
+    """같은 키워드 + 같은 공고 스냅샷으로 만든 리포트가 있으면 반환 (파일이 정리됐으면 없음으로 처리)"""
+    fingerprint = state.get("postings_fingerprint")
+    if not fingerprint or state.get("crawl_errors"):
+        return None
+    cached = get_report_cache().get(state["keyword"], fingerprint)
+    if cached is None or not os.path.exists(cached["report_path"]):
+        return None
+    return cached
 
 
-def generate_report(state: JobResearchState) -> Dict[str, Any]:
+async def generate_report(state: JobResearchState) -> Dict[str, Any]:
     """
     리포트 생성 노드
     """
     # 마크다운 리포트 생성
     report_markdown = generate_markdown_report(state)
 
-    # 파일 저장
-    report_path = save_report(report_markdown, state["keyword"])
+    # 파일 저장 (블로킹 파일 I/O는 스레드에서)
+    report_path = await asyncio.to_thread(save_report, report_markdown, state["keyword"])
 
-    return {
+    result = {
         "report_markdown": report_markdown,
         "report_path": report_path,
         "created_at": datetime.now().isoformat()
     }
+
+    fingerprint = state.get("postings_fingerprint")
+    if fingerprint and not state.get("crawl_errors"):
+        get_report_cache().set(state["keyword"], fingerprint, result)
+
+    return {**result, "report_cached": False}
+
+
+async def lookup_report(state: JobResearchState) -> Dict[str, Any]:
+    """
+    리포트 캐시 조회 노드 (적중하면 분석 / 리포트 생성 생략)
+    """
+    cached = lookup_cached_report(state)
+    if cached is None:
+        return {"report_cached": False}
+    return {**cached, "report_cached": True}
@@ -66,3 +66,8 @@ class JobResearchState(TypedDict):
     created_at: str
     total_postings: int
     sites_crawled: List[str]
+
+    # 캐시 (공고 스냅샷 지문이 같으면 분석 / 리포트 재사용)
+    postings_fingerprint: str
+    analysis_cached: bool
+    report_cached: bool
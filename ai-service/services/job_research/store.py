@@ -0,0 +1,172 @@
+"""
+채용 리서치 캐시 / 리포트 저장소
+
+- 공고 스냅샷 지문: 조회된 공고의 (id, crawled_at) 해시 → 공고가 바뀌지 않았는지 판단
+- ResearchCache: (정규화 키워드, 공고 지문) → 분석 결과 / 리포트 (TTL + 최대 항목 수)
+- ReportStore: MD 리포트 파일을 개수 / 용량 / 보관 기간 안에서만 유지
+"""
+import hashlib
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from services.common.metrics import get_metrics_registry
+
+# 분석 결과는 공고가 그대로면 하루, 리포트(생성일 표시)는 6시간 재사용
+ANALYSIS_CACHE_TTL = int(os.getenv("JOB_RESEARCH_ANALYSIS_TTL", 24 * 60 * 60))
+REPORT_CACHE_TTL = int(os.getenv("JOB_RESEARCH_REPORT_TTL", 6 * 60 * 60))
+
+REPORT_MAX_FILES = int(os.getenv("JOB_RESEARCH_REPORT_MAX_FILES", 100))
+REPORT_MAX_BYTES = int(os.getenv("JOB_RESEARCH_REPORT_MAX_BYTES", 50 * 1024 * 1024))
+REPORT_MAX_AGE_SECONDS = int(os.getenv("JOB_RESEARCH_REPORT_MAX_AGE", 7 * 24 * 60 * 60))
+
+
+def normalize_keyword(keyword: str) -> str:
+    """캐시 키용 키워드 정규화 (대소문자 / 공백 차이 무시)"""
+    return re.sub(r"\s+", " ", (keyword or "").strip().lower())
+
+
+def postings_fingerprint(job_postings: List[Dict[str, Any]]) -> str:
+    """공고 스냅샷 지문 (같은 공고 집합이면 같은 값)"""
+    items = sorted(f"{job.get('id')}@{job.get('crawled_at')}" for job in job_postings)
+    return hashlib.sha256("\n".join(items).encode()).hexdigest()[:24]
+
+
+class ResearchCache:
+    """(정규화 키워드, 공고 지문) → 값 캐시 (TTL + 최대 항목 수)"""
+
+    def __init__(self, ttl_seconds: int, max_entries: int = 200):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, keyword: str, fingerprint: str) -> Optional[Any]:
+        key = (normalize_keyword(keyword), fingerprint)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, keyword: str, fingerprint: str, value: Any):
+        key = (normalize_keyword(keyword), fingerprint)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class ReportStore:
+    """
+    MD 리포트 파일 저장소
+    저장할 때마다 보관 기간이 지난 파일을 지우고, 개수 / 총 용량 상한을 넘으면 오래된 파일부터 삭제
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        max_files: int = REPORT_MAX_FILES,
+        max_bytes: int = REPORT_MAX_BYTES,
+        max_age_seconds: int = REPORT_MAX_AGE_SECONDS
+    ):
+        self.directory = Path(directory)
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+
+    def save(self, report: str, keyword: str) -> str:
+        """리포트 저장 후 파일 경로 반환"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        date_str = datetime.now().strftime("%Y%m%d_%H%M%S")
+        safe_keyword = keyword.replace(" ", "_").replace("/", "_")
+        filepath = self.directory / f"{safe_keyword}_{date_str}.md"
+
+        with self._lock:
+            with open(filepath, "w", encoding="utf-8") as f:
+                f.write(report)
+            self._prune(keep=filepath)
+
+        return str(filepath)
+
+    def _prune(self, keep: Path):
+        files = []
+        for path in self.directory.glob("*.md"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort(key=lambda item: item[0])
+
+        now = time.time()
+        total_bytes = sum(size for _, size, _ in files)
+        remaining = len(files)
+        for mtime, size, path in files:
+            if path == keep:
+                continue
+            expired = now - mtime > self.max_age_seconds
+            if not expired and remaining <= self.max_files and total_bytes <= self.max_bytes:
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            remaining -= 1
+            total_bytes -= size
+
+    def stats(self) -> Dict[str, Any]:
+        files = list(self.directory.glob("*.md")) if self.directory.exists() else []
+        return {"files": len(files), "bytes": sum(p.stat().st_size for p in files)}
+
+
+# 싱글톤 인스턴스
+_analysis_cache = ResearchCache(ANALYSIS_CACHE_TTL)
+_report_cache = ResearchCache(REPORT_CACHE_TTL)
+_report_store: Optional[ReportStore] = None
+
+
+def get_analysis_cache() -> ResearchCache:
+    return _analysis_cache
+
+
+def get_report_cache() -> ResearchCache:
+    return _report_cache
+
+
+def get_report_store() -> ReportStore:
+    """리포트 저장소 싱글톤 (services/job_research/output)"""
+    global _report_store
+    if _report_store is None:
+        _report_store = ReportStore(Path(__file__).parent / "output")
+    return _report_store
+
+
+def _collect_research_cache_metrics():
+    """/metrics 수집기 - 분석 / 리포트 캐시 적중률"""
+    registry = get_metrics_registry()
+    return (
+        registry.cache_families("job_research_analysis", _analysis_cache.hits, _analysis_cache.misses)
+        + registry.cache_families("job_research_report", _report_cache.hits, _report_cache.misses)
+    )
+
+
+get_metrics_registry().register_collector("job_research_cache", _collect_research_cache_metrics)
@@ -6,7 +6,7 @@ import os
 import json
 import httpx
 from typing import List, Dict, Optional
-from openai import OpenAI
+from services.common.llm_clients import get_openai_client
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -97,7 +97,7 @@ class JobSiteService:
             self.client = None
             self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
         else:
-            self.client = OpenAI(api_key=api_key)
+            self.client = get_openai_client()
             self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
     
     def recommend_job_sites(
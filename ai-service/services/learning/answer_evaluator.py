@@ -1,21 +1,98 @@
 """
 답안 채점 서비스
 GPT를 사용하여 답안 자동 채점 및 피드백 생성
+
+- 빈 답안 / 모범답안과 같은 답안(정규화 후 비교)은 LLM 없이 채점
+- 채점 결과는 (문제 해시, 정규화 답안 해시) 키로 캐시
+- evaluate_answers(): 한 제출의 여러 답안을 구조화된 JSON 호출 하나로 채점 (여러 배치는 제한된 동시 실행)
 """
+import asyncio
+import hashlib
 import json
-from typing import Dict, Any
-from openai import AsyncOpenAI
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+from services.common.llm_clients import get_async_openai_client
 import os
 
+# 한 번의 LLM 호출로 채점할 최대 답안 수 / 동시에 보낼 배치 수
+GRADE_BATCH_SIZE = int(os.getenv("ANSWER_GRADE_BATCH_SIZE", 5))
+GRADE_MAX_CONCURRENCY = int(os.getenv("ANSWER_GRADE_MAX_CONCURRENCY", 3))
+
+
+def normalize_answer(text: Optional[str]) -> str:
+    """비교용 답안 정규화 (전각/반각, 대소문자, 공백, 끝 문장부호 차이 무시)"""
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    text = re.sub(r"\s+", " ", text).strip()
+    return text.rstrip(".。!?;")
+
+
+class GradeCache:
+    """(문제 해시, 정규화 답안 해시) → 채점 결과 캐시 (TTL + 최대 항목 수)"""
+
+    def __init__(
+        self,
+        ttl_seconds: int = int(os.getenv("ANSWER_GRADE_CACHE_TTL", 7 * 24 * 60 * 60)),
+        max_entries: int = int(os.getenv("ANSWER_GRADE_CACHE_SIZE", 10000))
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(
+        question_type: str,
+        question_text: str,
+        correct_answer: str,
+        max_score: int,
+        user_answer: str
+    ) -> Tuple[str, str]:
+        question = json.dumps(
+            [question_type, (question_text or "").strip(), (correct_answer or "").strip(), max_score],
+            ensure_ascii=False
+        )
+        return (
+            hashlib.sha256(question.encode()).hexdigest(),
+            hashlib.sha256(normalize_answer(user_answer).encode()).hexdigest()
+        )
+
+    def get(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return dict(entry[1])
+
+    def set(self, key: Tuple[str, str], result: Dict[str, Any]):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, dict(result))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+# 라우터마다 서비스 인스턴스가 따로 있으므로 캐시는 프로세스 단위로 공유
+_grade_cache = GradeCache()
+
 
 class AnswerEvaluatorService:
-    def __init__(self):
+    def __init__(self, grade_cache: GradeCache = None):
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다")
 
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = get_async_openai_client()
         self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+        self.grade_cache = grade_cache or _grade_cache
+        self.stats = {"llm_calls": 0, "short_circuited": 0, "cache_hits": 0, "llm_graded": 0}
 
     async def evaluate_answer(
         self,
@@ -38,17 +115,95 @@ class AnswerEvaluatorService:
         Returns:
             {"score": int, "feedback": str}
         """
+        results = await self.evaluate_answers([{
+            "question_type": question_type,
+            "question_text": question_text,
+            "user_answer": user_answer,
+            "correct_answer": correct_answer,
+            "max_score": max_score,
+        }])
+        return {"score": results[0]["score"], "feedback": results[0]["feedback"]}
+
+    async def evaluate_answers(self, answers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        한 제출의 답안 일괄 채점
+
+        Args:
+            answers: [{"question_type", "question_text", "user_answer", "correct_answer", "max_score"}, ...]
+
+        Returns:
+            입력 순서대로 [{"score": int, "feedback": str, "source": "rule" | "cache" | "llm" | "error"}, ...]
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(answers)
+        pending: List[int] = []
+        keys: Dict[int, Tuple[str, str]] = {}
+
+        for i, item in enumerate(answers):
+            rule_result = self._short_circuit(item)
+            if rule_result is not None:
+                self.stats["short_circuited"] += 1
+                results[i] = {**rule_result, "source": "rule"}
+                continue
+
+            keys[i] = GradeCache.make_key(
+                item["question_type"], item["question_text"], item["correct_answer"],
+                item["max_score"], item["user_answer"]
+            )
+            cached = self.grade_cache.get(keys[i])
+            if cached is not None:
+                self.stats["cache_hits"] += 1
+                results[i] = {**cached, "source": "cache"}
+            else:
+                pending.append(i)
+
+        if pending:
+            # 같은 제출 안의 중복 답안은 한 번만 채점
+            unique: Dict[Tuple[str, str], int] = {}
+            for i in pending:
+                unique.setdefault(keys[i], i)
+            to_grade = list(unique.values())
+
+            semaphore = asyncio.Semaphore(GRADE_MAX_CONCURRENCY)
+
+            async def run_batch(batch: List[int]) -> Dict[int, Dict[str, Any]]:
+                async with semaphore:
+                    return await self._grade_batch([(i, answers[i]) for i in batch])
+
+            batches = [to_grade[i:i + GRADE_BATCH_SIZE] for i in range(0, len(to_grade), GRADE_BATCH_SIZE)]
+            graded: Dict[int, Dict[str, Any]] = {}
+            for batch_result in await asyncio.gather(*(run_batch(b) for b in batches)):
+                graded.update(batch_result)
+
+            for index, result in graded.items():
+                self.grade_cache.set(keys[index], result)
+            self.stats["llm_graded"] += len(graded)
+
+            for i in pending:
+                result = graded.get(unique[keys[i]])
+                if result is not None:
+                    results[i] = {**result, "source": "llm"}
+                else:
+                    # 실패한 채점은 캐시하지 않음 (다음 제출에서 다시 채점)
+                    results[i] = {"score": 0, "feedback": "채점 중 오류가 발생했습니다.", "source": "error"}
+
+        return results
+
+    def _short_circuit(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """LLM 없이 채점 가능한 경우 (MCQ, 빈 답안, 모범답안과 같은 답안)"""
+        user_answer = item.get("user_answer") or ""
+        correct_answer = item.get("correct_answer") or ""
+        max_score = item["max_score"]
+
         # MCQ는 직접 비교
-        if question_type == "MCQ":
+        if item["question_type"] == "MCQ":
             return self._evaluate_mcq(user_answer, correct_answer, max_score)
 
-        # 나머지는 AI 채점
-        return await self._evaluate_with_ai(
-            question_text,
-            user_answer,
-            correct_answer,
-            max_score
-        )
+        normalized = normalize_answer(user_answer)
+        if not normalized:
+            return {"score": 0, "feedback": "답안이 비어 있습니다. 답안을 작성한 뒤 다시 제출해주세요."}
+        if normalized == normalize_answer(correct_answer):
+            return {"score": max_score, "feedback": "모범답안과 일치합니다. 잘하셨습니다!"}
+        return None
 
     def _evaluate_mcq(
         self,
@@ -67,14 +222,86 @@ class AnswerEvaluatorService:
             )
         }
 
+    async def _grade_batch(self, items: List[Tuple[int, Dict[str, Any]]]) -> Dict[int, Dict[str, Any]]:
+        """답안 여러 개를 한 번의 JSON 응답으로 채점 → {입력 인덱스: 결과} (실패한 답안은 빠짐)"""
+        if len(items) == 1:
+            index, item = items[0]
+            result = await self._evaluate_with_ai(
+                item["question_text"], item["user_answer"], item["correct_answer"], item["max_score"]
+            )
+            return {index: result} if result is not None else {}
+
+        sections = "\n\n".join(
+            f"""### 답안 ID: {n}
+## 문제
+{item["question_text"]}
+
+## 모범답안
+{item["correct_answer"]}
+
+## 학생 답안
+{item["user_answer"]}
+
+만점: {item["max_score"]}점"""
+            for n, (_, item) in enumerate(items)
+        )
+
+        prompt = f"""다음 답안들을 각각 채점해주세요.
+
+{sections}
+
+## 채점 기준
+- 정확성: 모범답안과의 일치도
+- 완성도: 답변의 상세함
+- 실용성: 실제 적용 가능성
+
+## JSON 형식 출력 (모든 답안 ID에 대해)
+{{
+  "results": [
+    {{"id": 답안 ID, "score": 0-만점, "feedback": "상세한 피드백 (장점, 개선점)"}}
+  ]
+}}"""
+
+        try:
+            self.stats["llm_calls"] += 1
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": "공정하고 친절한 교육 평가자"},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=1,
+                response_format={"type": "json_object"}
+            )
+            data = json.loads(response.choices[0].message.content)
+        except Exception as e:
+            print(f"AI 일괄 채점 실패: {e}")
+            return {}
+
+        graded = {}
+        for entry in data.get("results", []) if isinstance(data, dict) else []:
+            try:
+                n = int(entry["id"])
+                score = int(entry.get("score", 0))
+            except (KeyError, TypeError, ValueError):
+                continue
+            if not 0 <= n < len(items):
+                continue
+            index, item = items[n]
+            graded[index] = {
+                "score": max(0, min(score, item["max_score"])),
+                "feedback": entry.get("feedback", "채점 완료")
+            }
+        return graded
+
     async def _evaluate_with_ai(
         self,
         question_text: str,
         user_answer: str,
         correct_answer: str,
         max_score: int
-    ) -> Dict[str, Any]:
-        """AI 기반 채점"""
+    ) -> Optional[Dict[str, Any]]:
+        """AI 기반 채점 (실패 시 None)"""
         prompt = f"""답안을 채점해주세요.
 
 ## 문제
@@ -100,6 +327,7 @@ class AnswerEvaluatorService:
 }}"""
 
         try:
+            self.stats["llm_calls"] += 1
             response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=[
@@ -120,7 +348,4 @@ class AnswerEvaluatorService:
 
         except Exception as e:
             print(f"AI 채점 실패: {e}")
-            return {
-                "score": 0,
-                "feedback": "채점 중 오류가 발생했습니다."
-            }
+            return None
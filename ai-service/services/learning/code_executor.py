@@ -1,17 +1,27 @@
 """
 코드 실행 서비스
-Judge0 API를 사용하여 다양한 언어의 코드 실행
+Judge0 API 또는 로컬 격리 실행기(LocalCodeExecutor)로 다양한 언어의 코드 실행
+
+백엔드 선택: CODE_EXECUTOR_BACKEND=judge0(기본) | local
+local은 사용자 코드를 이 프로세스의 컨테이너 안에서 실행하므로 명시적으로 지정할 때만 사용합니다.
+별도의 비특권 컨테이너에서만 켜고, root라면 LOCAL_EXEC_UID를 지정해야 합니다 (local_executor 참고).
 """
+import asyncio
 import httpx
 import base64
 import os
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+
+from services.learning.local_executor import LocalCodeExecutor, get_local_executor, outputs_match
 
 
 class CodeExecutorService:
-    def __init__(self):
+    def __init__(self, local_executor: Optional[LocalCodeExecutor] = None):
         self.judge0_url = "https://judge0-ce.p.rapidapi.com"
         self.rapidapi_key = os.getenv("RAPIDAPI_KEY", "")
+        self.backend = "local" if os.getenv("CODE_EXECUTOR_BACKEND") == "local" else "judge0"
+        self.local_executor = local_executor or (get_local_executor() if self.backend == "local" else None)
+        self._http_client: Optional[httpx.AsyncClient] = None
         self.headers = {
             "Content-Type": "application/json",
             "X-RapidAPI-Key": self.rapidapi_key,
@@ -49,15 +59,14 @@ class CodeExecutorService:
                 "memory": int
             }
         """
+        if self.backend == "local":
+            return await self.local_executor.execute(code, language, stdin)
+
         if not self.rapidapi_key:
-            # Judge0 없이 로컬 실행 (JavaScript만)
-            if language == "javascript":
-                return await self._execute_javascript_locally(code, stdin)
-            else:
-                return {
-                    "status": {"id": 0, "description": "Error"},
-                    "stderr": "Judge0 API 키가 설정되지 않았습니다."
-                }
+            return {
+                "status": {"id": 0, "description": "Error"},
+                "stderr": "Judge0 API 키가 설정되지 않았습니다."
+            }
 
         language_id = self.language_ids.get(language)
         if not language_id:
@@ -71,36 +80,36 @@ class CodeExecutorService:
             source_code_b64 = base64.b64encode(code.encode()).decode()
             stdin_b64 = base64.b64encode(stdin.encode()).decode() if stdin else ""
 
-            # 코드 제출
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.judge0_url}/submissions?wait=true",
-                    headers=self.headers,
-                    json={
-                        "source_code": source_code_b64,
-                        "language_id": language_id,
-                        "stdin": stdin_b64
-                    },
-                    timeout=30.0
-                )
-
-                if response.status_code != 200 and response.status_code != 201:
-                    return {
-                        "status": {"id": 0, "description": "Error"},
-                        "stderr": f"Judge0 API 오류: {response.status_code}"
-                    }
-
-                result = response.json()
-
-                # Base64 디코딩
-                if result.get("stdout"):
-                    result["stdout"] = base64.b64decode(result["stdout"]).decode()
-                if result.get("stderr"):
-                    result["stderr"] = base64.b64decode(result["stderr"]).decode()
-                if result.get("compile_output"):
-                    result["compile_output"] = base64.b64decode(result["compile_output"]).decode()
-
-                return result
+            # 코드 제출 (연결 재사용)
+            if self._http_client is None:
+                self._http_client = httpx.AsyncClient(timeout=30.0)
+            response = await self._http_client.post(
+                f"{self.judge0_url}/submissions?wait=true",
+                headers=self.headers,
+                json={
+                    "source_code": source_code_b64,
+                    "language_id": language_id,
+                    "stdin": stdin_b64
+                }
+            )
+
+            if response.status_code != 200 and response.status_code != 201:
+                return {
+                    "status": {"id": 0, "description": "Error"},
+                    "stderr": f"Judge0 API 오류: {response.status_code}"
+                }
+
+            result = response.json()
+
+            # Base64 디코딩
+            if result.get("stdout"):
+                result["stdout"] = base64.b64decode(result["stdout"]).decode()
+            if result.get("stderr"):
+                result["stderr"] = base64.b64decode(result["stderr"]).decode()
+            if result.get("compile_output"):
+                result["compile_output"] = base64.b64decode(result["compile_output"]).decode()
+
+            return result
 
         except Exception as e:
             print(f"코드 실행 실패: {e}")
@@ -109,19 +118,43 @@ class CodeExecutorService:
                 "stderr": str(e)
             }
 
-    async def _execute_javascript_locally(
+    async def run_tests(
         self,
         code: str,
-        stdin: str
+        language: str,
+        test_cases: List[Dict[str, str]]
     ) -> Dict[str, Any]:
         """
-        JavaScript 로컬 실행 (폴백)
-        실제로는 실행하지 않고, 성공 메시지만 반환
+        제출 코드의 테스트 케이스 일괄 실행
+
+        Args:
+            code: 실행할 코드
+            language: 언어 (javascript, python, java, cpp)
+            test_cases: [{"stdin": str, "expected_output": str}, ...]
+
+        Returns:
+            {"status", "compile_output", "results": [케이스별 결과 + passed], "passed": int, "total": int}
         """
+        if self.backend == "local":
+            return await self.local_executor.run_tests(code, language, test_cases)
+
+        # Judge0: 케이스마다 제출 (동시 4개)
+        semaphore = asyncio.Semaphore(4)
+
+        async def run_case(case: Dict[str, str]) -> Dict[str, Any]:
+            async with semaphore:
+                result = await self.execute_code(code, language, case.get("stdin", ""))
+            if "expected_output" in case:
+                accepted = (result.get("status") or {}).get("id") == 3
+                result["passed"] = accepted and outputs_match(result.get("stdout") or "", case["expected_output"])
+            return result
+
+        results = await asyncio.gather(*(run_case(case) for case in test_cases))
+        failed = next((r["status"] for r in results if (r.get("status") or {}).get("id") != 3), None)
         return {
-            "status": {"id": 3, "description": "Accepted"},
-            "stdout": "(Judge0 없이는 실제 실행 불가)",
-            "stderr": "",
-            "time": "0.0",
-            "memory": 0
+            "status": failed or {"id": 3, "description": "Accepted"},
+            "compile_output": next((r.get("compile_output") for r in results if r.get("compile_output")), ""),
+            "results": list(results),
+            "passed": sum(1 for r in results if r.get("passed")),
+            "total": len(test_cases),
         }
@@ -0,0 +1,556 @@
+"""
+로컬 코드 실행기 (Judge0 대체 백엔드)
+python / javascript / java / cpp 코드를 서버 안에서 격리된 하위 프로세스로 실행
+
+- 격리: 실행마다 비운 작업 디렉터리, 최소 환경 변수, 새 세션(프로세스 그룹 단위 종료),
+  rlimit(CPU 시간, 주소 공간, 출력 파일 크기, 열린 파일 수, 프로세스 수), 실행 UID/GID 변경
+  (컴파일 단계도 같은 UID/GID와 컴파일용 제한으로 실행 - #include로 서버 파일을 읽거나 컴파일러로 호스트 자원을 소진하지 않도록)
+- 제한: 실행별 CPU / 메모리 / 벽시계 시간 제한
+- 컴파일 캐시: (언어, 컴파일 옵션, 소스) 해시 → 컴파일 결과 디렉터리 (같은 소스는 한 번만 컴파일)
+- 작업자 풀: 고정 개수의 작업자 스레드(작업 디렉터리 미리 생성) + 대기열 상한 (초과 시 즉시 거절)
+- run_tests(): 한 제출의 테스트 케이스를 한 번 컴파일 후 같은 작업자에서 일괄 실행
+
+결과 형식은 Judge0 응답과 같습니다 ({"status": {"id", "description"}, "stdout", "stderr", ...}).
+
+주의: rlimit과 UID 변경만으로는 네트워크 / 파일 시스템이 격리되지 않습니다.
+API 서버 컨테이너가 아닌 별도의 비특권 컨테이너(비밀 값 없는 환경 변수, 네트워크 차단)에서만 사용하고,
+root로 실행할 때는 LOCAL_EXEC_UID(실행 전용 사용자)를 반드시 지정해야 합니다 (없으면 생성 거부).
+"""
+import asyncio
+import hashlib
+import os
+import pwd
+import resource
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+# Judge0 상태 ID
+STATUS_ACCEPTED = {"id": 3, "description": "Accepted"}
+STATUS_WRONG_ANSWER = {"id": 4, "description": "Wrong Answer"}
+STATUS_TIME_LIMIT = {"id": 5, "description": "Time Limit Exceeded"}
+STATUS_COMPILE_ERROR = {"id": 6, "description": "Compilation Error"}
+STATUS_RUNTIME_ERROR = {"id": 11, "description": "Runtime Error (NZEC)"}
+STATUS_RUNTIME_SIGNAL = {"id": 12, "description": "Runtime Error (Other)"}
+STATUS_INTERNAL_ERROR = {"id": 13, "description": "Internal Error"}
+
+# 출력은 이 크기까지만 저장 (초과 시 프로세스가 SIGXFSZ로 종료)
+MAX_OUTPUT_BYTES = int(os.getenv("LOCAL_EXEC_MAX_OUTPUT_BYTES", 64 * 1024))
+
+
+@dataclass
+class ExecutionLimits:
+    """실행별 제한"""
+    cpu_seconds: float = float(os.getenv("LOCAL_EXEC_CPU_SECONDS", 2))
+    wall_seconds: float = float(os.getenv("LOCAL_EXEC_WALL_SECONDS", 5))
+    memory_mb: int = int(os.getenv("LOCAL_EXEC_MEMORY_MB", 256))
+    compile_seconds: float = float(os.getenv("LOCAL_EXEC_COMPILE_SECONDS", 20))
+    compile_memory_mb: int = int(os.getenv("LOCAL_EXEC_COMPILE_MEMORY_MB", 1024))
+    compile_output_mb: int = int(os.getenv("LOCAL_EXEC_COMPILE_OUTPUT_MB", 64))
+    # RLIMIT_NPROC은 UID 전체의 프로세스(스레드) 수에 적용되므로 실행 전용 UID를 쓸 때만 의미가 정확함
+    max_processes: int = int(os.getenv("LOCAL_EXEC_MAX_PROCESSES", 128))
+
+
+@dataclass
+class LanguageSpec:
+    """
+    언어별 실행 방법
+    - compile: 컴파일 명령 (없으면 소스를 그대로 실행)
+    - run: 실행 명령 ({dir} = 소스/컴파일 결과 디렉터리, {memory_mb} = 메모리 제한)
+    - limit_address_space: RLIMIT_AS 적용 여부 (JVM / V8은 가상 주소를 크게 예약하므로 런타임 옵션으로 제한)
+    """
+    source_file: str
+    run: List[str]
+    compile: Optional[List[str]] = None
+    limit_address_space: bool = True
+    env: Dict[str, str] = field(default_factory=dict)
+
+
+LANGUAGES: Dict[str, LanguageSpec] = {
+    "python": LanguageSpec(
+        source_file="main.py",
+        run=[sys.executable, "-I", "-B", "{dir}/main.py"],
+    ),
+    "javascript": LanguageSpec(
+        source_file="main.js",
+        run=["node", "--max-old-space-size={memory_mb}", "{dir}/main.js"],
+        limit_address_space=False,
+    ),
+    "java": LanguageSpec(
+        source_file="Main.java",
+        compile=["javac", "-J-Xmx256m", "-encoding", "UTF-8", "-d", "{dir}", "{dir}/Main.java"],
+        run=["java", "-Xmx{memory_mb}m", "-Xss64m", "-XX:+UseSerialGC", "-cp", "{dir}", "Main"],
+        limit_address_space=False,
+    ),
+    "cpp": LanguageSpec(
+        source_file="main.cpp",
+        compile=["g++", "-O2", "-std=c++17", "-pipe", "-o", "{dir}/main", "{dir}/main.cpp"],
+        run=["{dir}/main"],
+    ),
+}
+
+
+def _format(command: List[str], directory: str, limits: ExecutionLimits) -> List[str]:
+    return [part.format(dir=directory, memory_mb=limits.memory_mb) for part in command]
+
+
+def _read_output(path: str) -> str:
+    try:
+        with open(path, "rb") as f:
+            return f.read(MAX_OUTPUT_BYTES).decode("utf-8", errors="replace")
+    except FileNotFoundError:
+        return ""
+
+
+def _peak_rss_kb(pid: int) -> int:
+    """실행 중인 프로세스의 최대 RSS (KB, /proc 기준 - 읽을 수 없으면 0)"""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+def outputs_match(actual: str, expected: str) -> bool:
+    """줄 끝 공백 / 마지막 빈 줄 차이는 무시하고 출력 비교"""
+    def lines(text: str) -> List[str]:
+        return [line.rstrip() for line in (text or "").replace("\r\n", "\n").rstrip().split("\n")]
+    return lines(actual) == lines(expected)
+
+
+class CompileCache:
+    """
+    컴파일 결과 캐시 (디스크)
+    {root}/{해시}/ 에 소스와 컴파일 결과를 두고, 같은 소스는 다시 컴파일하지 않음
+    컴파일 실패도 결정적이므로 compile_output과 함께 캐시
+    """
+
+    def __init__(self, root: str, max_entries: int = int(os.getenv("LOCAL_EXEC_COMPILE_CACHE_SIZE", 200))):
+        self.root = root
+        self.max_entries = max_entries
+        os.makedirs(root, exist_ok=True)
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(language: str, spec: LanguageSpec, code: str) -> str:
+        material = "\0".join([language, " ".join(spec.compile or []), code])
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    def get_or_compile(self, key: str, compile_fn) -> Dict[str, Any]:
+        """
+        Returns:
+            {"dir": 결과 디렉터리, "ok": bool, "compile_output": str, "cached": bool}
+        """
+        directory = os.path.join(self.root, key)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            entry = self._load(directory)
+            if entry is not None:
+                self.hits += 1
+                os.utime(directory)
+                return {**entry, "cached": True}
+
+            self.misses += 1
+            building = tempfile.mkdtemp(prefix=f".{key[:12]}-", dir=self.root)
+            ok, compile_output = compile_fn(building)
+            with open(os.path.join(building, ".status"), "w", encoding="utf-8") as f:
+                f.write("ok\n" if ok else "error\n")
+                f.write(compile_output)
+            shutil.rmtree(directory, ignore_errors=True)
+            os.rename(building, directory)
+            self._prune()
+            return {"dir": directory, "ok": ok, "compile_output": compile_output, "cached": False}
+
+    def _load(self, directory: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(os.path.join(directory, ".status"), encoding="utf-8") as f:
+                status, _, compile_output = f.read().partition("\n")
+        except FileNotFoundError:
+            return None
+        return {"dir": directory, "ok": status == "ok", "compile_output": compile_output}
+
+    def _prune(self):
+        entries = [
+            os.path.join(self.root, name) for name in os.listdir(self.root) if not name.startswith(".")
+        ]
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=lambda path: os.path.getmtime(path))
+        for path in entries[:len(entries) - self.max_entries]:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+class LocalCodeExecutor:
+    """격리된 하위 프로세스로 코드를 실행하는 작업자 풀"""
+
+    def __init__(
+        self,
+        max_workers: int = int(os.getenv("LOCAL_EXEC_WORKERS", max(1, (os.cpu_count() or 2) // 2))),
+        max_queue: int = int(os.getenv("LOCAL_EXEC_QUEUE_SIZE", 32)),
+        limits: Optional[ExecutionLimits] = None,
+        work_root: Optional[str] = None,
+        run_as_uid: Optional[int] = int(os.getenv("LOCAL_EXEC_UID")) if os.getenv("LOCAL_EXEC_UID") else None,
+        run_as_gid: Optional[int] = int(os.getenv("LOCAL_EXEC_GID")) if os.getenv("LOCAL_EXEC_GID") else None,
+    ):
+        if run_as_uid is None and os.geteuid() == 0:
+            raise RuntimeError(
+                "로컬 코드 실행기를 root로 실행할 수 없습니다. "
+                "LOCAL_EXEC_UID에 실행 전용 비특권 사용자를 지정하세요."
+            )
+        self.limits = limits or ExecutionLimits()
+        self.max_workers = max_workers
+        self.run_as_uid = run_as_uid
+        self.run_as_gid = run_as_gid if run_as_gid is not None else _primary_gid(run_as_uid)
+        self.work_root = work_root or os.getenv(
+            "LOCAL_EXEC_WORK_DIR", os.path.join(tempfile.gettempdir(), "dreampath-code-exec")
+        )
+        os.makedirs(self.work_root, exist_ok=True)
+        if self.run_as_uid is not None:
+            # 실행 사용자가 작업자 / 컴파일 디렉터리까지 내려갈 수 있도록 (목록 조회는 불가)
+            os.chmod(self.work_root, os.stat(self.work_root).st_mode | 0o111)
+        self.compile_cache = CompileCache(os.path.join(self.work_root, "compiled"))
+
+        # 실행 중 + 대기 중인 제출 수 상한
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="code-exec")
+        self._local = threading.local()
+        self._available: Dict[str, bool] = {}
+        self.stats = {"runs": 0, "rejected": 0, "compiles": 0}
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+
+    def supports(self, language: str) -> bool:
+        """언어 지원 + 실행 도구 설치 여부"""
+        spec = LANGUAGES.get(language)
+        if spec is None:
+            return False
+        if language not in self._available:
+            # {dir}로 시작하는 명령은 컴파일 결과물이므로 확인 대상 아님
+            tools = [spec.run[0]] + ([spec.compile[0]] if spec.compile else [])
+            self._available[language] = all(shutil.which(tool) for tool in tools if "{" not in tool)
+        return self._available[language]
+
+    def warm_up(self) -> Dict[str, bool]:
+        """
+        작업자 스레드와 작업 디렉터리를 미리 만들고 언어별로 짧은 프로그램을 한 번씩 실행
+        (실행 도구 확인 + 런타임 파일을 페이지 캐시에 올림)
+        """
+        hello = {
+            "python": 'print("ok")',
+            "javascript": 'console.log("ok")',
+            "java": 'public class Main { public static void main(String[] a) { System.out.println("ok"); } }',
+            "cpp": '#include <cstdio>\nint main() { std::puts("ok"); }',
+        }
+        futures = {
+            language: self._pool.submit(self._run_submission, code, language, [{"stdin": ""}])
+            for language, code in hello.items() if self.supports(language)
+        }
+        return {
+            language: future.result()["results"][0]["stdout"].strip() == "ok"
+            for language, future in futures.items()
+        }
+
+    async def execute(self, code: str, language: str, stdin: str = "") -> Dict[str, Any]:
+        """코드 한 번 실행 → Judge0 형식 결과"""
+        result = await self._submit(code, language, [{"stdin": stdin}])
+        if "error" in result:
+            return result["error"]
+        return {**result["results"][0], "compile_output": result["compile_output"]}
+
+    async def run_tests(self, code: str, language: str, test_cases: List[Dict[str, str]]) -> Dict[str, Any]:
+        """
+        테스트 케이스 일괄 실행 (한 번 컴파일, 같은 작업자에서 순서대로 실행)
+
+        Args:
+            test_cases: [{"stdin": str, "expected_output": str}, ...]
+
+        Returns:
+            {"status", "compile_output", "results": [...], "passed": int, "total": int}
+        """
+        result = await self._submit(code, language, test_cases)
+        if "error" in result:
+            return {**result["error"], "results": [], "passed": 0, "total": len(test_cases)}
+
+        passed = 0
+        for case, case_result in zip(test_cases, result["results"]):
+            if "expected_output" not in case:
+                continue
+            ok = case_result["status"]["id"] == STATUS_ACCEPTED["id"] and outputs_match(
+                case_result["stdout"], case["expected_output"]
+            )
+            if not ok and case_result["status"]["id"] == STATUS_ACCEPTED["id"]:
+                case_result["status"] = STATUS_WRONG_ANSWER
+            case_result["passed"] = ok
+            passed += ok
+
+        return {
+            "status": result["status"],
+            "compile_output": result["compile_output"],
+            "results": result["results"],
+            "passed": passed,
+            "total": len(test_cases),
+        }
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+
+    async def _submit(self, code: str, language: str, test_cases: List[Dict[str, str]]) -> Dict[str, Any]:
+        if language not in LANGUAGES:
+            return {"error": {"status": STATUS_INTERNAL_ERROR, "stderr": f"지원하지 않는 언어: {language}"}}
+        if not self.supports(language):
+            return {"error": {"status": STATUS_INTERNAL_ERROR, "stderr": f"{language} 실행 환경이 설치되지 않았습니다."}}
+        if not self._slots.acquire(blocking=False):
+            self.stats["rejected"] += 1
+            return {"error": {"status": STATUS_INTERNAL_ERROR, "stderr": "실행 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요."}}
+
+        try:
+            future = self._pool.submit(self._run_submission, code, language, test_cases)
+            return await asyncio.wrap_future(future)
+        finally:
+            self._slots.release()
+
+    def _worker_dir(self) -> str:
+        """작업자 스레드별 실행 디렉터리 (처음 한 번 생성, 실행마다 비움)"""
+        directory = getattr(self._local, "directory", None)
+        if directory is None:
+            directory = tempfile.mkdtemp(prefix="worker-", dir=self.work_root)
+            if self.run_as_uid is not None:
+                os.chmod(directory, 0o777)
+            self._local.directory = directory
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            shutil.rmtree(path, ignore_errors=True) if os.path.isdir(path) else os.unlink(path)
+        return directory
+
+    def _run_submission(self, code: str, language: str, test_cases: List[Dict[str, str]]) -> Dict[str, Any]:
+        spec = LANGUAGES[language]
+        try:
+            artifact = self._prepare(code, language, spec)
+        except Exception as e:
+            return {"error": {"status": STATUS_INTERNAL_ERROR, "stderr": str(e)}}
+
+        if not artifact["ok"]:
+            return {"error": {
+                "status": STATUS_COMPILE_ERROR,
+                "stdout": "",
+                "stderr": "",
+                "compile_output": artifact["compile_output"],
+                "time": "0.0",
+                "memory": 0,
+            }}
+
+        results = []
+        for case in test_cases:
+            self.stats["runs"] += 1
+            results.append(self._run_once(spec, artifact["dir"], case.get("stdin", "")))
+
+        overall = next(
+            (r["status"] for r in results if r["status"]["id"] != STATUS_ACCEPTED["id"]), STATUS_ACCEPTED
+        )
+        return {"status": overall, "compile_output": artifact["compile_output"], "results": results}
+
+    def _prepare(self, code: str, language: str, spec: LanguageSpec) -> Dict[str, Any]:
+        """소스 저장 + 컴파일 (컴파일 언어는 캐시 사용)"""
+        if spec.compile is None:
+            directory = self._worker_dir()
+            with open(os.path.join(directory, spec.source_file), "w", encoding="utf-8") as f:
+                f.write(code)
+            return {"dir": directory, "ok": True, "compile_output": ""}
+
+        def compile_fn(directory: str):
+            self.stats["compiles"] += 1
+            with open(os.path.join(directory, spec.source_file), "w", encoding="utf-8") as f:
+                f.write(code)
+            if self.run_as_uid is not None:
+                # 컴파일러(실행 사용자)가 결과물을 쓸 수 있도록 잠시 소유자를 넘김
+                os.chown(directory, self.run_as_uid, self.run_as_gid)
+            command = _format(spec.compile, directory, self.limits)
+            try:
+                completed = subprocess.run(
+                    command, cwd=directory, capture_output=True, timeout=self.limits.compile_seconds,
+                    env=self._child_env(directory, spec), start_new_session=True,
+                    preexec_fn=self._preexec(spec, compile=True), close_fds=True, **self._user_kwargs(),
+                )
+            except subprocess.TimeoutExpired:
+                return False, "컴파일 시간 초과"
+            finally:
+                if self.run_as_uid is not None:
+                    self._seal(directory)
+            output = (completed.stdout + completed.stderr).decode("utf-8", errors="replace")
+            return completed.returncode == 0, output.replace(directory + "/", "")
+
+        key = CompileCache.make_key(language, spec, code)
+        return self.compile_cache.get_or_compile(key, compile_fn)
+
+    def _child_env(self, directory: str, spec: LanguageSpec) -> Dict[str, str]:
+        return {
+            "PATH": os.environ.get("PATH", "/usr/bin:/bin"),
+            "HOME": directory,
+            "LANG": "C.UTF-8",
+            "PYTHONIOENCODING": "utf-8",
+            **spec.env,
+        }
+
+    def _user_kwargs(self) -> Dict[str, Any]:
+        """
+        실행 UID/GID (Popen이 exec 직전에 보조 그룹 → GID → UID 순서로 변경)
+        preexec_fn 안에서 setuid를 호출하지 않음 - 작업자 스레드 풀이 있는 프로세스에서는 안전하지 않음
+        """
+        if self.run_as_uid is None:
+            return {}
+        return {"user": self.run_as_uid, "group": self.run_as_gid, "extra_groups": []}
+
+    def _seal(self, directory: str):
+        """컴파일 결과 디렉터리를 서버 소유로 되돌림 (실행 중인 제출이 캐시된 결과물을 바꾸지 못하도록)"""
+        uid, gid = os.geteuid(), os.getegid()
+        for root, dirs, files in os.walk(directory):
+            for name in [root] + [os.path.join(root, entry) for entry in dirs + files]:
+                os.lchown(name, uid, gid)
+        os.chmod(directory, 0o755)
+
+    def _preexec(self, spec: LanguageSpec, compile: bool = False):
+        """자식 프로세스 rlimit (setrlimit만 호출 - 권한 변경은 _user_kwargs)"""
+        limits = self.limits
+        if compile:
+            cpu = max(1, int(limits.compile_seconds + 0.999))
+            memory = limits.compile_memory_mb * 1024 * 1024
+            output = limits.compile_output_mb * 1024 * 1024
+        else:
+            cpu = max(1, int(limits.cpu_seconds + 0.999))
+            memory = limits.memory_mb * 1024 * 1024
+            output = MAX_OUTPUT_BYTES
+        processes = limits.max_processes
+
+        def apply_limits():
+            resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu + 1))
+            if spec.limit_address_space:
+                resource.setrlimit(resource.RLIMIT_AS, (memory, memory))
+            resource.setrlimit(resource.RLIMIT_FSIZE, (output, output))
+            resource.setrlimit(resource.RLIMIT_NOFILE, (64, 64))
+            resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+            resource.setrlimit(resource.RLIMIT_NPROC, (processes, processes))
+
+        return apply_limits
+
+    def _run_once(self, spec: LanguageSpec, directory: str, stdin: str) -> Dict[str, Any]:
+        """한 번 실행 (stdin/stdout/stderr는 파일로 연결해 파이프 교착과 출력 폭주를 막음)"""
+        run_dir = tempfile.mkdtemp(prefix="run-", dir=self._worker_dir_root())
+        process = None
+        if self.run_as_uid is not None:
+            os.chmod(run_dir, 0o777)
+        stdin_path = os.path.join(run_dir, ".stdin")
+        stdout_path = os.path.join(run_dir, ".stdout")
+        stderr_path = os.path.join(run_dir, ".stderr")
+        with open(stdin_path, "w", encoding="utf-8") as f:
+            f.write(stdin or "")
+
+        command = _format(spec.run, directory, self.limits)
+        started = time.monotonic()
+        timed_out = False
+        try:
+            with open(stdin_path, "rb") as fin, open(stdout_path, "wb") as fout, open(stderr_path, "wb") as ferr:
+                process = subprocess.Popen(
+                    command, cwd=run_dir, stdin=fin, stdout=fout, stderr=ferr,
+                    env=self._child_env(run_dir, spec), start_new_session=True,
+                    preexec_fn=self._preexec(spec), close_fds=True, **self._user_kwargs(),
+                )
+            deadline = started + self.limits.wall_seconds
+            peak_kb = 0
+            while True:
+                pid, wait_status, usage = os.wait4(process.pid, os.WNOHANG)
+                if pid:
+                    break
+                peak_kb = max(peak_kb, _peak_rss_kb(process.pid))
+                if time.monotonic() > deadline:
+                    timed_out = True
+                    os.killpg(process.pid, signal.SIGKILL)
+                    pid, wait_status, usage = os.wait4(process.pid, 0)
+                    break
+                time.sleep(0.005)
+            process.returncode = os.waitstatus_to_exitcode(wait_status)
+        except Exception as e:
+            shutil.rmtree(run_dir, ignore_errors=True)
+            return {"status": STATUS_INTERNAL_ERROR, "stdout": "", "stderr": str(e), "time": "0.0", "memory": 0}
+        finally:
+            # 자식이 남긴 프로세스까지 정리
+            if process is not None:
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+
+        cpu_time = usage.ru_utime + usage.ru_stime
+        stdout = _read_output(stdout_path)
+        stderr = _read_output(stderr_path).replace(run_dir + "/", "").replace(directory + "/", "")
+        shutil.rmtree(run_dir, ignore_errors=True)
+
+        exit_code = process.returncode
+        killed_by = -exit_code if exit_code < 0 else None
+        if timed_out or killed_by == signal.SIGXCPU or cpu_time > self.limits.cpu_seconds:
+            status = STATUS_TIME_LIMIT
+        elif killed_by is not None:
+            status = STATUS_RUNTIME_SIGNAL
+            stderr = stderr or f"signal {signal.Signals(killed_by).name}"
+        elif exit_code != 0:
+            status = STATUS_RUNTIME_ERROR
+        else:
+            status = STATUS_ACCEPTED
+
+        return {
+            "status": status,
+            "stdout": stdout,
+            "stderr": stderr,
+            "time": f"{cpu_time:.3f}",
+            "wall_time": f"{time.monotonic() - started:.3f}",
+            # fork 직후 부모 프로세스의 RSS가 ru_maxrss에 남으므로, 실행 중 관측한 최대 RSS를 우선 사용 (KB)
+            "memory": peak_kb or usage.ru_maxrss,
+            "exit_code": exit_code,
+        }
+
+    def _worker_dir_root(self) -> str:
+        return getattr(self._local, "directory", None) or self._worker_dir()
+
+
+def _primary_gid(uid: Optional[int]) -> Optional[int]:
+    """실행 사용자의 기본 그룹 (passwd에 없는 UID면 UID와 같은 값)"""
+    if uid is None:
+        return None
+    try:
+        return pwd.getpwuid(uid).pw_gid
+    except KeyError:
+        return uid
+
+
+# 싱글톤 인스턴스
+_local_executor: Optional[LocalCodeExecutor] = None
+_local_executor_lock = threading.Lock()
+
+
+def get_local_executor() -> LocalCodeExecutor:
+    """로컬 코드 실행기 싱글톤"""
+    global _local_executor
+    with _local_executor_lock:
+        if _local_executor is None:
+            _local_executor = LocalCodeExecutor()
+    return _local_executor
@@ -0,0 +1,402 @@
+"""
+학습 문제 은행
+(분야, 주차, 난이도)별로 미리 생성해 둔 문제를 바로 제공하고, 재고는 백그라운드에서 보충합니다.
+
+- 저장: Redis 해시 question_bank:{주차}:{난이도}:{분야} (문제 ID → 문제 JSON), Redis 없으면 인메모리
+- 사용자별로 이미 본 문제는 제외 (question_bank:seen:{사용자}:{은행 키} 집합)
+- 사용자가 아직 안 본 재고가 하한(워터마크) 아래로 내려가면 백그라운드에서 문제 생성 (은행별 하나만 실행)
+- 거의 같은 문제(정규화 후 문자 3-gram 유사도)는 은행에 추가하지 않음
+- 재고가 모자라면 기존처럼 바로 생성해서 응답 (생성된 문제는 은행에도 추가)
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import statistics
+import threading
+import time
+import unicodedata
+from collections import OrderedDict, deque
+from typing import Any, Dict, FrozenSet, List, Optional, Set
+
+import redis
+
+from services.common.metrics import get_metrics_registry
+from services.learning.question_generator import QuestionGeneratorService
+
+logger = logging.getLogger(__name__)
+
+# 사용자 기준 남은 재고가 이 수 아래면 보충 / 한 번에 생성할 문제 수 / 은행별 최대 문제 수
+LOW_WATERMARK = int(os.getenv("QUESTION_BANK_LOW_WATERMARK", 10))
+REFILL_BATCH = int(os.getenv("QUESTION_BANK_REFILL_BATCH", 10))
+MAX_BANK_SIZE = int(os.getenv("QUESTION_BANK_MAX_SIZE", 200))
+# 이 유사도 이상이면 같은 문제로 봄
+DUPLICATE_THRESHOLD = float(os.getenv("QUESTION_BANK_DUPLICATE_THRESHOLD", 0.85))
+SEEN_TTL_SECONDS = int(os.getenv("QUESTION_BANK_SEEN_TTL", 180 * 24 * 60 * 60))
+
+
+def _normalize(text: str) -> str:
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    return re.sub(r"[\s\W_]+", "", text)
+
+
+def _shingles(text: str, n: int = 3) -> Set[str]:
+    normalized = _normalize(text)
+    if len(normalized) <= n:
+        return {normalized}
+    return {normalized[i:i + n] for i in range(len(normalized) - n + 1)}
+
+
+def similarity(a: str, b: str) -> float:
+    """문제 텍스트 유사도 (정규화 후 문자 3-gram Jaccard)"""
+    sa, sb = _shingles(a), _shingles(b)
+    if not sa or not sb:
+        return 0.0
+    return len(sa & sb) / len(sa | sb)
+
+
+class _ShingleIndex:
+    """
+    3-gram 역색인 - 새 문제와 3-gram을 공유하는 기존 문제만 겹치는 수를 세어 Jaccard 계산
+    (기존 문제 전체와 하나씩 비교하지 않음)
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, List[int]] = {}
+        self._sizes: List[int] = []
+
+    def add(self, shingles: FrozenSet[str]):
+        doc = len(self._sizes)
+        self._sizes.append(len(shingles))
+        for shingle in shingles:
+            self._postings.setdefault(shingle, []).append(doc)
+
+    def max_similarity(self, shingles: FrozenSet[str]) -> float:
+        if not shingles:
+            return 0.0
+        overlaps: Dict[int, int] = {}
+        for shingle in shingles:
+            for doc in self._postings.get(shingle, ()):
+                overlaps[doc] = overlaps.get(doc, 0) + 1
+        return max(
+            (common / (len(shingles) + self._sizes[doc] - common) for doc, common in overlaps.items()),
+            default=0.0
+        )
+
+
+def question_id(question: Dict[str, Any]) -> str:
+    return hashlib.sha1(_normalize(question.get("question", "")).encode()).hexdigest()[:16]
+
+
+class QuestionBank:
+    """(분야, 주차, 난이도)별 문제 재고 + 백그라운드 보충"""
+
+    KEY_PREFIX = "question_bank"
+
+    def __init__(
+        self,
+        generator: QuestionGeneratorService,
+        low_watermark: int = LOW_WATERMARK,
+        refill_batch: int = REFILL_BATCH,
+        max_bank_size: int = MAX_BANK_SIZE,
+        use_redis: bool = True,
+        max_memory_users: int = 10000
+    ):
+        """
+        Args:
+            generator: 문제 생성기 (generate_questions / _get_difficulty 사용)
+        """
+        self.generator = generator
+        self.low_watermark = low_watermark
+        self.refill_batch = refill_batch
+        self.max_bank_size = max_bank_size
+        self.max_memory_users = max_memory_users
+        self.redis_client = None
+        self.enabled = False
+
+        self._lock = threading.Lock()
+        self._memory_banks: Dict[str, "OrderedDict[str, Dict[str, Any]]"] = {}
+        self._memory_seen: "OrderedDict[str, Set[str]]" = OrderedDict()
+        # 은행별 문제 3-gram (문제 ID → 3-gram, 중복 판단 시 매번 다시 계산하지 않도록)
+        self._bank_shingles: Dict[str, Dict[str, FrozenSet[str]]] = {}
+        self._refilling: Dict[str, asyncio.Task] = {}
+        self._refill_lags: deque = deque(maxlen=200)
+        self._stats = {
+            "hits": 0, "misses": 0, "refills": 0, "refill_errors": 0,
+            "generated": 0, "duplicates_dropped": 0,
+        }
+
+        if use_redis:
+            redis_host = os.getenv("REDIS_HOST", "localhost")
+            redis_port = int(os.getenv("REDIS_PORT", 6379))
+            redis_db = int(os.getenv("REDIS_DB", 0))
+
+            try:
+                self.redis_client = redis.Redis(
+                    host=redis_host,
+                    port=redis_port,
+                    db=redis_db,
+                    decode_responses=True,
+                    socket_timeout=5,
+                    socket_connect_timeout=5
+                )
+                self.redis_client.ping()
+                self.enabled = True
+                logger.info(f"[QuestionBank] Redis 연결 성공: {redis_host}:{redis_port}")
+            except Exception as e:
+                logger.warning(f"[QuestionBank] Redis 연결 실패 (인메모리 문제 은행 사용): {e}")
+                self.redis_client = None
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+
+    def bank_key(self, domain: str, week_number: int) -> str:
+        difficulty = self.generator._get_difficulty(week_number)
+        return f"{self.KEY_PREFIX}:{week_number}:{difficulty}:{(domain or '').strip().lower()}"
+
+    async def get_questions(
+        self,
+        domain: str,
+        week_number: int,
+        count: int = 5,
+        user_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        문제 제공 (재고에서 사용자가 안 본 문제를 우선 제공)
+        Redis 조회/저장과 중복 검사는 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+
+        Returns:
+            문제 리스트 (generate_questions와 같은 형식)
+        """
+        key = self.bank_key(domain, week_number)
+        stock, seen = await asyncio.gather(
+            asyncio.to_thread(self._load, key),
+            asyncio.to_thread(self._get_seen, user_id, key)
+        )
+        unseen = [qid for qid in stock if qid not in seen]
+
+        if len(unseen) >= count:
+            self._stats["hits"] += 1
+            picked = [stock[qid] for qid in random.sample(unseen, count)]
+        else:
+            # 재고 부족 - 모자란 수만큼만 바로 생성 (생성된 문제는 은행에도 추가)
+            self._stats["misses"] += 1
+            generated = await self.generator.generate_questions(domain, week_number, count - len(unseen))
+            self._stats["generated"] += len(generated)
+            added = await asyncio.to_thread(self._add, key, generated, stock)
+            picked = [stock[qid] for qid in unseen] + added
+            # 중복으로 빠진 문제라도 요청 수는 채움
+            for question in generated:
+                if len(picked) >= count:
+                    break
+                if question not in picked:
+                    picked.append(question)
+            picked = picked[:count]
+
+        await asyncio.to_thread(self._mark_seen, user_id, key, [question_id(q) for q in picked])
+
+        remaining = len(unseen) - len(picked)
+        if remaining < self.low_watermark and len(stock) < self.max_bank_size:
+            self._schedule_refill(key, domain, week_number)
+        return picked
+
+    async def prefill(self, domain: str, week_number: int) -> int:
+        """재고를 하한 이상으로 채움 (배포 직후 / 관리용)"""
+        key = self.bank_key(domain, week_number)
+        added = 0
+        while len(await asyncio.to_thread(self._load, key)) < self.low_watermark:
+            new = await self._refill(key, domain, week_number, time.monotonic())
+            if not new:
+                break
+            added += new
+        return added
+
+    def stats(self) -> Dict[str, Any]:
+        """적중률 / 보충 지연 / 은행별 재고"""
+        served = self._stats["hits"] + self._stats["misses"]
+        lags = list(self._refill_lags)
+        return {
+            **self._stats,
+            "hit_rate": round(self._stats["hits"] / served, 3) if served else 0.0,
+            "refills_in_flight": len(self._refilling),
+            "refill_lag_seconds": {
+                "last": round(lags[-1], 3) if lags else None,
+                "p50": round(statistics.median(lags), 3) if lags else None,
+                "p95": round(sorted(lags)[min(len(lags) - 1, int(len(lags) * 0.95))], 3) if lags else None,
+            },
+            "stock": self._stock_sizes(),
+            "backend": "redis" if self.enabled else "memory",
+        }
+
+    async def wait_for_refills(self):
+        """진행 중인 보충 완료 대기 (테스트 / 종료 시)"""
+        while self._refilling:
+            await asyncio.gather(*list(self._refilling.values()), return_exceptions=True)
+
+    # ------------------------------------------------------------------
+    # 보충
+    # ------------------------------------------------------------------
+
+    def _schedule_refill(self, key: str, domain: str, week_number: int):
+        if key in self._refilling:
+            return
+        task = asyncio.get_running_loop().create_task(self._refill(key, domain, week_number, time.monotonic()))
+        self._refilling[key] = task
+        task.add_done_callback(lambda _: self._refilling.pop(key, None))
+
+    async def _refill(self, key: str, domain: str, week_number: int, requested_at: float) -> int:
+        """문제 생성 → 중복 제거 후 은행에 추가 (추가된 수 반환)"""
+        try:
+            generated = await self.generator.generate_questions(domain, week_number, self.refill_batch)
+        except Exception as e:
+            self._stats["refill_errors"] += 1
+            logger.warning(f"[QuestionBank] 문제 보충 실패: {key}, {e}")
+            return 0
+
+        self._stats["generated"] += len(generated)
+        added = await asyncio.to_thread(lambda: self._add(key, generated, self._load(key)))
+        self._stats["refills"] += 1
+        self._refill_lags.append(time.monotonic() - requested_at)
+        return len(added)
+
+    def _add(self, key: str, questions: List[Dict[str, Any]], stock: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """거의 같은 문제를 제외하고 은행에 추가 (stock도 함께 갱신, 스레드에서 호출)"""
+        index = _ShingleIndex()
+        for shingles in self._stock_shingles(key, stock).values():
+            index.add(shingles)
+
+        added = []
+        for question in questions:
+            text = question.get("question", "")
+            if not text or len(stock) >= self.max_bank_size:
+                continue
+            shingles = frozenset(_shingles(text))
+            if index.max_similarity(shingles) >= DUPLICATE_THRESHOLD:
+                self._stats["duplicates_dropped"] += 1
+                continue
+            qid = question_id(question)
+            stock[qid] = question
+            index.add(shingles)
+            with self._lock:
+                self._bank_shingles.setdefault(key, {})[qid] = shingles
+            added.append(question)
+
+        if added:
+            self._save(key, added)
+        return added
+
+    def _stock_shingles(self, key: str, stock: Dict[str, Dict[str, Any]]) -> Dict[str, FrozenSet[str]]:
+        """재고 문제의 3-gram (처음 보는 문제만 계산, 재고에서 빠진 문제는 정리)"""
+        with self._lock:
+            cached = self._bank_shingles.get(key, {})
+            shingles = {qid: cached[qid] for qid in stock if qid in cached}
+        for qid, question in stock.items():
+            if qid not in shingles:
+                shingles[qid] = frozenset(_shingles(question.get("question", "")))
+        with self._lock:
+            self._bank_shingles[key] = dict(shingles)
+        return shingles
+
+    # ------------------------------------------------------------------
+    # 저장소 (Redis / 인메모리)
+    # ------------------------------------------------------------------
+
+    def _load(self, key: str) -> Dict[str, Dict[str, Any]]:
+        if self.enabled and self.redis_client:
+            try:
+                return {qid: json.loads(data) for qid, data in self.redis_client.hgetall(key).items()}
+            except Exception as e:
+                logger.warning(f"[QuestionBank] 재고 조회 실패: {key}, {e}")
+                return {}
+        with self._lock:
+            return dict(self._memory_banks.get(key, {}))
+
+    def _save(self, key: str, questions: List[Dict[str, Any]]):
+        mapping = {question_id(q): q for q in questions}
+        if self.enabled and self.redis_client:
+            try:
+                self.redis_client.hset(key, mapping={
+                    qid: json.dumps(q, ensure_ascii=False) for qid, q in mapping.items()
+                })
+            except Exception as e:
+                logger.warning(f"[QuestionBank] 재고 저장 실패: {key}, {e}")
+            return
+        with self._lock:
+            self._memory_banks.setdefault(key, OrderedDict()).update(mapping)
+
+    def _seen_key(self, user_id: str, key: str) -> str:
+        return f"{self.KEY_PREFIX}:seen:{user_id}:{key[len(self.KEY_PREFIX) + 1:]}"
+
+    def _get_seen(self, user_id: Optional[str], key: str) -> Set[str]:
+        if not user_id:
+            return set()
+        seen_key = self._seen_key(user_id, key)
+        if self.enabled and self.redis_client:
+            try:
+                return set(self.redis_client.smembers(seen_key))
+            except Exception:
+                return set()
+        with self._lock:
+            return set(self._memory_seen.get(seen_key, ()))
+
+    def _mark_seen(self, user_id: Optional[str], key: str, question_ids: List[str]):
+        if not user_id or not question_ids:
+            return
+        seen_key = self._seen_key(user_id, key)
+        if self.enabled and self.redis_client:
+            try:
+                pipe = self.redis_client.pipeline()
+                pipe.sadd(seen_key, *question_ids)
+                pipe.expire(seen_key, SEEN_TTL_SECONDS)
+                pipe.execute()
+            except Exception as e:
+                logger.warning(f"[QuestionBank] 풀이 기록 저장 실패: {seen_key}, {e}")
+            return
+        with self._lock:
+            self._memory_seen.setdefault(seen_key, set()).update(question_ids)
+            self._memory_seen.move_to_end(seen_key)
+            while len(self._memory_seen) > self.max_memory_users:
+                self._memory_seen.popitem(last=False)
+
+    def _stock_sizes(self) -> Dict[str, int]:
+        if self.enabled and self.redis_client:
+            try:
+                keys = [k for k in self.redis_client.scan_iter(f"{self.KEY_PREFIX}:*", count=200)
+                        if not k.startswith(f"{self.KEY_PREFIX}:seen:")]
+                return {k: self.redis_client.hlen(k) for k in keys}
+            except Exception:
+                return {}
+        with self._lock:
+            return {k: len(v) for k, v in self._memory_banks.items()}
+
+
+# 싱글톤 인스턴스
+_question_bank: Optional[QuestionBank] = None
+
+
+def get_question_bank() -> QuestionBank:
+    """문제 은행 싱글톤"""
+    global _question_bank
+    if _question_bank is None:
+        _question_bank = QuestionBank(QuestionGeneratorService())
+    return _question_bank
+
+
+def _collect_question_bank_metrics():
+    """/metrics 수집기 - 문제 은행 적중률 / 보충 횟수 (재고 조회는 Redis를 거치므로 제외)"""
+    if _question_bank is None:
+        return []
+    stats = _question_bank._stats
+    registry = get_metrics_registry()
+    families = registry.cache_families("question_bank", stats["hits"], stats["misses"])
+    refills = registry.family("question_bank_refills_total", "counter", "문제 은행 보충 실행 수")
+    refills.add(stats["refills"], result="ok").add(stats["refill_errors"], result="error")
+    families.append(refills)
+    return families
+
+
+get_metrics_registry().register_collector("question_bank", _collect_question_bank_metrics)
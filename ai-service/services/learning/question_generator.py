@@ -4,7 +4,7 @@ GPT를 사용하여 학습 문제 자동 생성
 """
 import json
 from typing import List, Dict, Any
-from openai import AsyncOpenAI
+from services.common.llm_clients import get_async_openai_client
 from config import settings
 
 
@@ -13,7 +13,7 @@ class QuestionGeneratorService:
         if not settings.OPENAI_API_KEY:
             raise ValueError("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다")
 
-        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        self.client = get_async_openai_client()
         self.model = settings.OPENAI_MODEL
 
     async def generate_questions(
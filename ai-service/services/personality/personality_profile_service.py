@@ -1,6 +1,6 @@
 import os
 import json
-from openai import OpenAI
+from services.common.llm_clients import get_async_openai_client
 
 from services.bigfive.bigfive_service import BigFiveService
 from services.mbti.mbti_service import MBTIService
@@ -13,7 +13,7 @@ class PersonalityProfileService:
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise RuntimeError("OPENAI_API_KEY 필요")
-        self.client = OpenAI(api_key=api_key)
+        self.client = get_async_openai_client()
         self.model = settings.OPENAI_MODEL
         self.bigfive = BigFiveService()
         self.mbti = MBTIService()
@@ -61,7 +61,7 @@ class PersonalityProfileService:
 }}
 """
 
-        completion = self.client.chat.completions.create(
+        completion = await self.client.chat.completions.create(
             model=self.model,
             messages=[
                 {"role": "system", "content": "당신은 성향 분석 전문가입니다."},
@@ -1,6 +1,7 @@
 import os
 from pinecone import Pinecone, ServerlessSpec
-from openai import OpenAI
+from services.common.llm_clients import get_openai_client
+from services.vector.pinecone_client import traced_index
 
 
 class PineconeVectorService:
@@ -12,7 +13,7 @@ class PineconeVectorService:
 
     def __init__(self):
         # OpenAI
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = get_openai_client()
 
         # Pinecone
         api_key = os.getenv("PINECONE_API_KEY")
@@ -36,7 +37,7 @@ class PineconeVectorService:
             # )
             pass
 
-        self.index = self.pc.Index(index_name)
+        self.index = traced_index(self.pc.Index(index_name))
 
     def embed_document(self, document: str):
         """
@@ -1,68 +1,163 @@
+import asyncio
+import hashlib
 import json
-from typing import List
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
 from services.common.openai_client import OpenAIService
 from config import settings
 
+# 한 번의 LLM 호출로 해석할 최대 직업 수 / 동시에 보낼 배치 수
+ENRICH_BATCH_SIZE = int(os.getenv("PROFILE_RAG_BATCH_SIZE", 10))
+ENRICH_MAX_CONCURRENCY = int(os.getenv("PROFILE_RAG_MAX_CONCURRENCY", 3))
+
+
+class ReasonCache:
+    """(사용자 문서 해시, 직업명) → 추천 이유 캐시 (TTL + 최대 항목 수)"""
+
+    def __init__(
+        self,
+        ttl_seconds: int = int(os.getenv("PROFILE_RAG_REASON_TTL", 24 * 60 * 60)),
+        max_entries: int = 5000
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, List[str]]]" = OrderedDict()
+
+    @staticmethod
+    def document_hash(user_document: str) -> str:
+        return hashlib.sha256((user_document or "").strip().encode()).hexdigest()
+
+    def get(self, doc_hash: str, job_name: str) -> Optional[List[str]]:
+        with self._lock:
+            entry = self._entries.get((doc_hash, job_name))
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[(doc_hash, job_name)]
+                return None
+            self._entries.move_to_end((doc_hash, job_name))
+            return entry[1]
+
+    def set(self, doc_hash: str, job_name: str, reasons: List[str]):
+        with self._lock:
+            self._entries[(doc_hash, job_name)] = (time.monotonic() + self.ttl_seconds, reasons)
+            self._entries.move_to_end((doc_hash, job_name))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+# 요청마다 서비스가 새로 만들어지므로 캐시는 프로세스 단위로 공유
+_reason_cache = ReasonCache()
+
 
 class ProfileRAGService:
 
-    def __init__(self, openai: OpenAIService):
+    def __init__(self, openai: OpenAIService, reason_cache: ReasonCache = None):
         self.openai = openai
         self.model = settings.OPENAI_MODEL
+        self.reason_cache = reason_cache or _reason_cache
 
     async def enrich_with_rag(self, job_matches: List[dict], user_document: str):
-
-        enriched = []
-
+        """
+        직업 매칭 결과에 추천 이유 추가
+        - 캐시에 없는 직업만 모아 배치 프롬프트 한 번으로 생성 (배치가 여러 개면 제한된 동시 실행)
+        - LLM 호출은 스레드에서 실행해 이벤트 루프를 막지 않음
+        """
+        doc_hash = ReasonCache.document_hash(user_document)
+
+        reasons_by_job: Dict[str, List[str]] = {}
+        missing: List[str] = []
         for match in job_matches:
-
             job_name = match.get('jobName')
-            score = match.get('score')
-
-            # 🔧 RAG 문서 (나중에 WorkNet API로 실제 문서 연결)
-            job_doc = f"""
-            직업명: {job_name}
-            이 직업의 핵심 업무는 문제 해결, 협업, 기술 이해입니다.
-            """
-
-            prompt = f"""
-            당신은 진로 추천 전문가입니다.
-
-            사용자 성향 설명:
-            {user_document}
-
-            직업 정보(RAG 문서):
-            {job_doc}
-
-            사용자에게 이 직업이 왜 맞는지, 핵심 이유 3개를 JSON 형태로 생성하세요.
-
-            JSON 형식:
-            {{
-                "jobName": "{job_name}",
-                "reasons": ["이유1", "이유2", "이유3"]
-            }}
-            """
-
-            resp = self.openai.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            raw = resp.choices[0].message.content
-
-            try:
-                # JSON만 추출
-                if "```json" in raw:
-                    raw = raw.split("```json")[1].split("```")[0].strip()
-                enriched_data = json.loads(raw)
-            except:
-                enriched_data = {"jobName": job_name, "reasons": ["추출 실패"]}
-
-            enriched.append({
-                "jobName": enriched_data.get("jobName", job_name),
-                "score": score,
-                "reasons": enriched_data.get("reasons", [])
-            })
-
-        return enriched
+            cached = self.reason_cache.get(doc_hash, job_name)
+            if cached is not None:
+                reasons_by_job[job_name] = cached
+            elif job_name not in missing:
+                missing.append(job_name)
+
+        if missing:
+            semaphore = asyncio.Semaphore(ENRICH_MAX_CONCURRENCY)
+
+            async def run_batch(batch: List[str]) -> Dict[str, List[str]]:
+                async with semaphore:
+                    return await asyncio.to_thread(self._generate_reasons, batch, user_document)
+
+            batches = [missing[i:i + ENRICH_BATCH_SIZE] for i in range(0, len(missing), ENRICH_BATCH_SIZE)]
+            for generated in await asyncio.gather(*(run_batch(b) for b in batches), return_exceptions=True):
+                if isinstance(generated, Exception):
+                    print(f"[ProfileRAGService] 추천 이유 생성 실패: {generated}")
+                    continue
+                for job_name, reasons in generated.items():
+                    self.reason_cache.set(doc_hash, job_name, reasons)
+                    reasons_by_job[job_name] = reasons
+
+        return [
+            {
+                "jobName": match.get('jobName'),
+                "score": match.get('score'),
+                "reasons": reasons_by_job.get(match.get('jobName'), ["추출 실패"])
+            }
+            for match in job_matches
+        ]
+
+    def _generate_reasons(self, job_names: List[str], user_document: str) -> Dict[str, List[str]]:
+        """직업 여러 개의 추천 이유를 한 번의 LLM 호출로 생성 → {직업명: 이유 목록}"""
+
+        # 🔧 RAG 문서 (나중에 WorkNet API로 실제 문서 연결)
+        job_docs = "\n".join(
+            f"- 직업명: {job_name}\n  이 직업의 핵심 업무는 문제 해결, 협업, 기술 이해입니다."
+            for job_name in job_names
+        )
+
+        prompt = f"""
+        당신은 진로 추천 전문가입니다.
+
+        사용자 성향 설명:
+        {user_document}
+
+        직업 정보(RAG 문서):
+        {job_docs}
+
+        각 직업마다 사용자에게 이 직업이 왜 맞는지, 핵심 이유 3개를 JSON 형태로 생성하세요.
+        직업명은 위에 주어진 그대로 사용하세요.
+
+        JSON 형식:
+        {{
+            "results": [
+                {{"jobName": "직업명", "reasons": ["이유1", "이유2", "이유3"]}}
+            ]
+        }}
+        """
+
+        resp = self.openai.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            response_format={"type": "json_object"}
+        )
+
+        raw = resp.choices[0].message.content or ""
+
+        try:
+            # JSON만 추출
+            if "```json" in raw:
+                raw = raw.split("```json")[1].split("```")[0].strip()
+            data = json.loads(raw)
+        except Exception:
+            return {}
+
+        items = data.get("results", []) if isinstance(data, dict) else data
+        generated = {}
+        for item in items if isinstance(items, list) else []:
+            if not isinstance(item, dict):
+                continue
+            job_name = item.get("jobName")
+            reasons = item.get("reasons")
+            # 요청한 직업명과 일치하는 결과만 사용 (응답에서 바뀐 이름은 캐시 키가 어긋남)
+            if job_name in job_names and isinstance(reasons, list) and reasons:
+                generated[job_name] = [str(r) for r in reasons]
+        return generated
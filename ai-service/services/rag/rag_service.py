@@ -1,6 +1,7 @@
 import os
-from openai import OpenAI
+from services.common.llm_clients import get_openai_client
 from pinecone import Pinecone
+from services.vector.pinecone_client import traced_index
 from dotenv import load_dotenv
 from config import settings
 
@@ -18,9 +19,9 @@ class RAGService:
         if not pine_key:
             raise RuntimeError("PINECONE_API_KEY 필요")
 
-        self.client = OpenAI(api_key=api_key)
+        self.client = get_openai_client()
         self.pc = Pinecone(api_key=pine_key)
-        self.index = self.pc.Index(index_name)
+        self.index = traced_index(self.pc.Index(index_name))
         self.model = settings.OPENAI_MODEL
 
     # -----------------------------
@@ -2,6 +2,7 @@ import os
 from pinecone import Pinecone
 from services.vector.supabase_vector_repository import SupabaseVectorRepository
 from services.rag.pinecone_vector_service import PineconeVectorService
+from services.vector.pinecone_client import traced_index
 
 class RecommendService:
 
@@ -18,7 +19,8 @@ class RecommendService:
             raise ValueError("PINECONE_API_KEY가 설정되지 않았습니다.")
         
         pc = Pinecone(api_key=api_key)
-        self.index = pc.Index(name=index_name, host=index_host) if index_host else pc.Index(index_name)
+        index = pc.Index(name=index_name, host=index_host) if index_host else pc.Index(index_name)
+        self.index = traced_index(index)
 
     def recommend_jobs(self, user_vector_id, top_k=10):
         """
@@ -0,0 +1,471 @@
+"""
+채용공고 추천 분산 배치 러너
+Redis 작업 큐로 사용자를 여러 워커 프로세스/노드에 분배하고,
+처리 완료 사용자를 체크포인트로 기록하여 재시작 시 이어서 처리합니다.
+
+실행마다 새 run_id를 발급하며, 기존 실행에 합류하거나 중단된 실행을 이어서 처리할 때만 run_id를 지정합니다.
+
+워커 추가 실행 (다른 프로세스/노드):
+    python -m services.recommendation_batch_runner --run-id 20251203-020000-1a2b3c --no-seed
+"""
+import argparse
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import redis
+
+from services.common.logging_config import log_context
+from services.common.metrics import percentile
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveConcurrency:
+    """
+    지연 시간 기반 AIMD 동시성 제어
+    - 사용자 1명 처리 지연(OpenAI + DB)이 목표 이하이면 동시성을 1씩 증가
+    - 목표를 넘거나 실패가 발생하면 동시성을 절반으로 감소
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        minimum: int = 1,
+        maximum: int = 20,
+        target_latency: float = 20.0,
+        smoothing: float = 0.3
+    ):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self.target_latency = target_latency
+        self.smoothing = smoothing
+        self.avg_latency: Optional[float] = None
+        self._successes_since_change = 0
+        self._last_decrease = 0.0
+
+    def record(self, latency: float, success: bool = True):
+        """처리 결과를 반영하여 동시성 한도 조절"""
+        if self.avg_latency is None:
+            self.avg_latency = latency
+        else:
+            self.avg_latency = self.smoothing * latency + (1 - self.smoothing) * self.avg_latency
+
+        if not success or self.avg_latency > self.target_latency:
+            # 연속 감소 방지: 직전 감소 이후 평균 지연 시간만큼은 유지
+            now = time.monotonic()
+            if now - self._last_decrease >= self.avg_latency:
+                self.limit = max(self.minimum, self.limit // 2)
+                self._last_decrease = now
+            self._successes_since_change = 0
+            return
+
+        # 현재 한도만큼 성공하면 1 증가 (RTT당 1 증가)
+        self._successes_since_change += 1
+        if self._successes_since_change >= self.limit:
+            self.limit = min(self.maximum, self.limit + 1)
+            self._successes_since_change = 0
+
+
+class RecommendationWorkQueue:
+    """
+    Redis 기반 추천 계산 작업 큐
+    - pending: 처리 대기 사용자 (list)
+    - processing:{worker_id}: 워커가 가져간 사용자 (list, 워커 장애 시 복구용)
+    - done / failed: 처리 완료 체크포인트 (set)
+    Redis 연결 실패 시 단일 프로세스용 인메모리 큐로 동작합니다.
+    """
+
+    KEY_PREFIX = "job_recommendation_batch"
+    RUN_TTL = 60 * 60 * 48  # 실행 데이터 보관 2일
+    HEARTBEAT_TTL = 120  # 워커 생존 신호 만료 (초)
+    SEED_LOCK_TTL = 300  # 작업 큐 채우기 잠금 만료 (초, 채우던 워커가 죽은 경우)
+    SEED_POLL_INTERVAL = 0.2
+
+    def __init__(self, run_id: str, use_redis: bool = True):
+        self.run_id = run_id
+        self.redis_client = None
+        self.enabled = False
+
+        if use_redis:
+            redis_host = os.getenv("REDIS_HOST", "localhost")
+            redis_port = int(os.getenv("REDIS_PORT", 6379))
+            redis_db = int(os.getenv("REDIS_DB", 0))
+
+            try:
+                self.redis_client = redis.Redis(
+                    host=redis_host,
+                    port=redis_port,
+                    db=redis_db,
+                    decode_responses=True,
+                    socket_timeout=5,
+                    socket_connect_timeout=5
+                )
+                self.redis_client.ping()
+                self.enabled = True
+            except Exception as e:
+                logger.warning(f"[RecommendationWorkQueue] Redis 연결 실패 (인메모리 모드): {e}")
+                self.redis_client = None
+
+        if not self.enabled:
+            self._pending: deque = deque()
+            self._processing: Dict[str, List[int]] = {}
+            self._done: set = set()
+            self._failed: set = set()
+            self._seeded = False
+
+    def _key(self, name: str) -> str:
+        return f"{self.KEY_PREFIX}:{self.run_id}:{name}"
+
+    def _processing_key(self, worker_id: str) -> str:
+        return self._key(f"processing:{worker_id}")
+
+    def _heartbeat_key(self, worker_id: str) -> str:
+        return self._key(f"heartbeat:{worker_id}")
+
+    def seed(self, load_user_ids: Callable[[], Iterable[int]]) -> int:
+        """
+        실행당 한 번만 작업 큐를 채웁니다.
+        이미 다른 워커가 채웠다면 아무것도 하지 않으며, 체크포인트(done)에 있는 사용자는 제외합니다.
+        다른 워커가 채우는 중이면 채워질 때까지 기다린 뒤 반환합니다 (빈 큐를 보고 바로 끝나지 않도록).
+
+        Returns:
+            큐에 추가한 사용자 수
+        """
+        if self.enabled:
+            if self.redis_client.exists(self._key("seeded")):
+                return 0
+            if not self.redis_client.set(self._key("seeding"), self.run_id, nx=True, ex=self.SEED_LOCK_TTL):
+                self._wait_until_seeded()
+                return 0
+
+            try:
+                done = self.redis_client.smembers(self._key("done"))
+                user_ids = [uid for uid in _unique(load_user_ids()) if str(uid) not in done]
+
+                # pending / meta를 모두 쓴 뒤 마지막에 seeded 표시 (한 트랜잭션)
+                pipe = self.redis_client.pipeline(transaction=True)
+                pipe.delete(self._key("pending"))
+                if user_ids:
+                    pipe.rpush(self._key("pending"), *user_ids)
+                pipe.expire(self._key("pending"), self.RUN_TTL)
+                pipe.hset(self._key("meta"), mapping={"total": len(user_ids), "seeded_at": time.time()})
+                pipe.expire(self._key("meta"), self.RUN_TTL)
+                pipe.set(self._key("seeded"), datetime.now().isoformat(), ex=self.RUN_TTL)
+                pipe.execute()
+                return len(user_ids)
+            finally:
+                self.redis_client.delete(self._key("seeding"))
+
+        if self._seeded:
+            return 0
+        self._seeded = True
+        user_ids = [uid for uid in _unique(load_user_ids()) if uid not in self._done]
+        self._pending.extend(user_ids)
+        return len(user_ids)
+
+    def _wait_until_seeded(self):
+        """다른 워커의 seed가 끝날 때까지 대기 (그 워커가 죽으면 잠금 만료까지만)"""
+        deadline = time.monotonic() + self.SEED_LOCK_TTL
+        while time.monotonic() < deadline:
+            if self.redis_client.exists(self._key("seeded")) or not self.redis_client.exists(self._key("seeding")):
+                return
+            time.sleep(self.SEED_POLL_INTERVAL)
+
+    def claim(self, worker_id: str) -> Optional[int]:
+        """대기 중인 사용자 하나를 워커의 processing 목록으로 원자적으로 이동"""
+        if self.enabled:
+            value = self.redis_client.lmove(
+                self._key("pending"), self._processing_key(worker_id), "LEFT", "RIGHT"
+            )
+            if value is None:
+                return None
+            self.redis_client.expire(self._processing_key(worker_id), self.RUN_TTL)
+            return int(value)
+
+        if not self._pending:
+            return None
+        user_id = self._pending.popleft()
+        self._processing.setdefault(worker_id, []).append(user_id)
+        return user_id
+
+    def ack(self, worker_id: str, user_id: int, success: bool):
+        """처리 완료 기록 (체크포인트)"""
+        target = "done" if success else "failed"
+
+        if self.enabled:
+            pipe = self.redis_client.pipeline()
+            pipe.lrem(self._processing_key(worker_id), 1, user_id)
+            pipe.sadd(self._key(target), user_id)
+            pipe.expire(self._key(target), self.RUN_TTL)
+            pipe.execute()
+            return
+
+        processing = self._processing.get(worker_id, [])
+        if user_id in processing:
+            processing.remove(user_id)
+        (self._done if success else self._failed).add(user_id)
+
+    def heartbeat(self, worker_id: str, metrics: Optional[Dict[str, Any]] = None):
+        """워커 생존 신호 + 처리량 지표 기록"""
+        if not self.enabled:
+            return
+
+        pipe = self.redis_client.pipeline()
+        pipe.set(self._heartbeat_key(worker_id), time.time(), ex=self.HEARTBEAT_TTL)
+        if metrics:
+            metrics_key = self._key(f"metrics:{worker_id}")
+            pipe.hset(metrics_key, mapping={k: v for k, v in metrics.items() if v is not None})
+            pipe.expire(metrics_key, self.RUN_TTL)
+        pipe.execute()
+
+    def recover_stale(self) -> int:
+        """
+        생존 신호가 끊긴 워커의 processing 목록을 pending으로 되돌립니다.
+        (워커 프로세스가 처리 도중 종료된 경우)
+
+        Returns:
+            복구된 사용자 수
+        """
+        if not self.enabled:
+            recovered = 0
+            for worker_id, user_ids in self._processing.items():
+                self._pending.extendleft(reversed(user_ids))
+                recovered += len(user_ids)
+            self._processing = {}
+            return recovered
+
+        recovered = 0
+        prefix = self._key("processing:")
+        for key in self.redis_client.scan_iter(match=f"{prefix}*"):
+            worker_id = key[len(prefix):]
+            if self.redis_client.exists(self._heartbeat_key(worker_id)):
+                continue
+            while self.redis_client.lmove(key, self._key("pending"), "RIGHT", "LEFT") is not None:
+                recovered += 1
+        return recovered
+
+    def progress(self) -> Dict[str, int]:
+        """실행 진행 현황"""
+        if self.enabled:
+            pipe = self.redis_client.pipeline()
+            pipe.llen(self._key("pending"))
+            pipe.scard(self._key("done"))
+            pipe.scard(self._key("failed"))
+            pipe.hget(self._key("meta"), "total")
+            pending, done, failed, total = pipe.execute()
+            return {
+                "total": int(total or 0),
+                "pending": pending,
+                "done": done,
+                "failed": failed
+            }
+
+        return {
+            "total": len(self._pending) + len(self._done) + len(self._failed)
+                     + sum(len(v) for v in self._processing.values()),
+            "pending": len(self._pending),
+            "done": len(self._done),
+            "failed": len(self._failed)
+        }
+
+
+class RecommendationBatchRunner:
+    """채용공고 추천 분산 배치 러너"""
+
+    def __init__(
+        self,
+        calculator=None,
+        queue: Optional[RecommendationWorkQueue] = None,
+        run_id: Optional[str] = None,
+        worker_id: Optional[str] = None,
+        initial_concurrency: int = 4,
+        max_concurrency: int = int(os.getenv("RECOMMENDATION_MAX_CONCURRENCY", 20)),
+        target_latency: float = float(os.getenv("RECOMMENDATION_TARGET_LATENCY", 20)),
+        max_recommendations: int = 50,
+        load_user_ids: Optional[Callable[[], Iterable[int]]] = None
+    ):
+        if calculator is None:
+            from services.job_recommendation_calculator import JobRecommendationCalculator
+            calculator = JobRecommendationCalculator()
+
+        self.calculator = calculator
+        # run_id 지정 = 기존 실행 이어서 처리 / 미지정 = 새 실행 (같은 날 재실행도 전체를 다시 계산)
+        self.run_id = run_id or new_run_id()
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.queue = queue or RecommendationWorkQueue(self.run_id)
+        self.run_id = self.queue.run_id
+        self.concurrency = AdaptiveConcurrency(
+            initial=initial_concurrency,
+            maximum=max_concurrency,
+            target_latency=target_latency
+        )
+        self.max_recommendations = max_recommendations
+        self.load_user_ids = load_user_ids
+
+        self._latencies: List[float] = []
+        self._processed = 0
+        self._failed = 0
+        self._skipped = 0
+        self._total_recommendations = 0
+        self._started_at: Optional[float] = None
+
+    async def run(self, seed: bool = True) -> Dict:
+        """
+        작업 큐가 빌 때까지 사용자 추천을 계산합니다.
+
+        Args:
+            seed: True면 (아직 채워지지 않은 경우) 활성 사용자로 작업 큐를 채움
+
+        Returns:
+            이 워커의 실행 결과 + 처리량 지표
+        """
+        self._started_at = time.monotonic()
+        logger.info(f"[RecommendationBatchRunner] 시작: run_id={self.run_id}, worker={self.worker_id}")
+
+        recovered = self.queue.recover_stale()
+        if recovered:
+            logger.info(f"[RecommendationBatchRunner] 중단된 워커 작업 {recovered}건 복구")
+
+        if seed:
+            # 사용자 조회(DB)와 다른 워커의 seed 대기는 블로킹이므로 스레드에서
+            seeded = await asyncio.to_thread(self.queue.seed, self._load_user_ids)
+            logger.info(f"[RecommendationBatchRunner] 작업 큐 등록: {seeded}명")
+
+        self.queue.heartbeat(self.worker_id, self.metrics())
+
+        in_flight = set()
+        while True:
+            while len(in_flight) < self.concurrency.limit:
+                user_id = self.queue.claim(self.worker_id)
+                if user_id is None:
+                    break
+                in_flight.add(asyncio.create_task(self._process_user(user_id)))
+
+            if not in_flight:
+                break
+
+            # 처리 중에도 생존 신호가 끊기지 않도록 주기적으로 깨어남
+            _, in_flight = await asyncio.wait(
+                in_flight,
+                timeout=self.queue.HEARTBEAT_TTL / 4,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            self.queue.heartbeat(self.worker_id, self.metrics())
+
+        metrics = self.metrics()
+        progress = self.queue.progress()
+        logger.info(f"[RecommendationBatchRunner] 완료: {self._processed}명 성공, {self._failed}명 실패, "
+              f"{self._skipped}명 스킵, {metrics['throughput_per_min']:.1f}명/분, "
+              f"p95={metrics['latency_p95']}s (전체 진행: {progress})")
+
+        return {
+            "success": True,
+            "run_id": self.run_id,
+            "worker_id": self.worker_id,
+            "total_users": progress["total"],
+            "processed_users": self._processed,
+            "failed_users": self._failed,
+            "skipped_users": self._skipped,
+            "total_recommendations": self._total_recommendations,
+            "progress": progress,
+            "metrics": metrics
+        }
+
+    async def _process_user(self, user_id: int):
+        """사용자 1명 처리 (분산 락은 calculator 내부의 RecommendationLock 사용)"""
+        start = time.monotonic()
+        try:
+            # to_thread는 컨텍스트를 복사하므로 계산 중 로그에도 run_id / user_id가 남음
+            with log_context(run_id=self.run_id, user_id=user_id):
+                result = await asyncio.to_thread(
+                    self.calculator.calculate_user_recommendations_blocking,
+                    user_id,
+                    self.max_recommendations
+                )
+        except Exception as e:
+            logger.warning(f"[RecommendationBatchRunner] 사용자 {user_id} 처리 오류: {e}")
+            result = {"success": False, "error": str(e)}
+
+        latency = time.monotonic() - start
+        success = bool(result and result.get("success"))
+        skipped = bool(result and result.get("skipped"))
+
+        if success:
+            self._processed += 1
+            self._total_recommendations += result.get("saved_count", 0)
+        elif skipped:
+            # 다른 워커가 같은 사용자를 처리 중 → 그쪽 결과를 체크포인트로 간주
+            self._skipped += 1
+        else:
+            self._failed += 1
+
+        if not skipped:
+            self._latencies.append(latency)
+            self.concurrency.record(latency, success)
+
+        self.queue.ack(self.worker_id, user_id, success or skipped)
+
+    def _load_user_ids(self) -> List[int]:
+        if self.load_user_ids is not None:
+            return list(self.load_user_ids())
+        users = self.calculator._get_active_users_with_career_analysis()
+        return [user["user_id"] for user in users]
+
+    def metrics(self) -> Dict[str, Any]:
+        """처리량 지표"""
+        elapsed = time.monotonic() - self._started_at if self._started_at else 0.0
+        completed = self._processed + self._failed + self._skipped
+        latencies = sorted(self._latencies)
+
+        return {
+            "elapsed_seconds": round(elapsed, 2),
+            "completed": completed,
+            "processed": self._processed,
+            "failed": self._failed,
+            "skipped": self._skipped,
+            "throughput_per_min": round(completed / elapsed * 60, 2) if elapsed > 0 else 0.0,
+            "latency_avg": round(sum(latencies) / len(latencies), 3) if latencies else None,
+            "latency_p50": percentile(latencies, 0.5, default=None),
+            "latency_p95": percentile(latencies, 0.95, default=None),
+            "concurrency": self.concurrency.limit
+        }
+
+
+def new_run_id() -> str:
+    """실행마다 고유한 배치 실행 ID (시각 + 임의 접미사)"""
+    return f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+
+def _unique(user_ids: Iterable[int]) -> List[int]:
+    """순서를 유지하며 중복 제거"""
+    seen = set()
+    result = []
+    for user_id in user_ids:
+        if user_id not in seen:
+            seen.add(user_id)
+            result.append(user_id)
+    return result
+
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="채용공고 추천 배치 워커")
+    parser.add_argument("--run-id", default=None, help="이어서 처리할 배치 실행 ID (기본값: 새 실행)")
+    parser.add_argument("--no-seed", action="store_true", help="작업 큐를 채우지 않고 처리만 수행")
+    parser.add_argument("--concurrency", type=int, default=4, help="초기 동시 처리 사용자 수")
+    args = parser.parse_args()
+    if args.no_seed and not args.run_id:
+        parser.error("--no-seed는 합류할 실행의 --run-id와 함께 사용해야 합니다")
+
+    runner = RecommendationBatchRunner(run_id=args.run_id, initial_concurrency=args.concurrency)
+    print(asyncio.run(runner.run(seed=not args.no_seed)))
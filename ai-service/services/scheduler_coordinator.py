@@ -0,0 +1,302 @@
+"""
+스케줄러 작업 조정 (Redis lease 기반 리더 선출)
+uvicorn --workers N 이나 여러 컨테이너에서 스케줄러가 동시에 떠 있어도
+리더 한 곳에서만 예약 작업을 실행하고, 같은 작업은 동시에 한 번만 실행되도록 합니다.
+API 서버의 수동 실행 요청도 Redis에 기록만 하고, 실제 실행은 리더(워커)가 가져가서 처리합니다.
+"""
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+
+# 자신이 보유한 키만 연장/삭제하는 Lua 스크립트
+_RENEW_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("pexpire", KEYS[1], ARGV[2])
+else
+    return 0
+end
+"""
+
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+else
+    return 0
+end
+"""
+
+
+class SchedulerCoordinator:
+    """Redis 기반 스케줄러 리더 선출 + 작업 단일 실행(single-flight)"""
+
+    LEADER_KEY = "scheduler:leader"
+    TRIGGER_TTL = 60 * 60  # 수동 실행 요청 보관 (워커가 없으면 1시간 뒤 폐기)
+
+    def __init__(self, lease_ttl: Optional[int] = None, use_redis: bool = True):
+        self.node_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.lease_ttl = lease_ttl or int(os.getenv("SCHEDULER_LEASE_TTL", 30))
+        self.is_leader = False
+        self.redis_client = None
+        self.enabled = False
+
+        if use_redis:
+            redis_host = os.getenv("REDIS_HOST", "localhost")
+            redis_port = int(os.getenv("REDIS_PORT", 6379))
+            redis_db = int(os.getenv("REDIS_DB", 0))
+
+            try:
+                self.redis_client = redis.Redis(
+                    host=redis_host,
+                    port=redis_port,
+                    db=redis_db,
+                    decode_responses=True,
+                    socket_timeout=5,
+                    socket_connect_timeout=5
+                )
+                self.redis_client.ping()
+                self.enabled = True
+                logger.info(f"[SchedulerCoordinator] Redis 연결 성공: {redis_host}:{redis_port} (node={self.node_id})")
+            except Exception as e:
+                logger.warning(f"[SchedulerCoordinator] Redis 연결 실패 (단일 프로세스 모드): {e}")
+                self.redis_client = None
+
+        if not self.enabled:
+            # Redis 없으면 이 프로세스가 항상 리더
+            self._running_jobs: Dict[str, str] = {}
+            self._last_runs: Dict[str, Dict[str, Any]] = {}
+            self._triggers: Dict[str, str] = {}
+
+    # ------------------------------------------------------------------
+    # 리더 선출
+    # ------------------------------------------------------------------
+
+    def try_acquire_leadership(self) -> bool:
+        """리더 lease 획득 또는 연장. 현재 리더 여부를 반환합니다."""
+        if not self.enabled:
+            self.is_leader = True
+            return True
+
+        ttl_ms = self.lease_ttl * 1000
+        try:
+            if self.redis_client.set(self.LEADER_KEY, self.node_id, nx=True, px=ttl_ms):
+                leader = True
+            else:
+                leader = bool(self.redis_client.eval(_RENEW_SCRIPT, 1, self.LEADER_KEY, self.node_id, ttl_ms))
+        except Exception as e:
+            # Redis 장애 시 리더십 포기 (lease 만료 전 다른 노드와 중복 실행 방지)
+            logger.warning(f"[SchedulerCoordinator] 리더 lease 갱신 실패: {e}")
+            leader = False
+
+        if leader != self.is_leader:
+            logger.info(f"[SchedulerCoordinator] 리더 상태 변경: {self.is_leader} → {leader} (node={self.node_id})")
+        self.is_leader = leader
+        return leader
+
+    def release_leadership(self):
+        """리더 lease 반납 (종료 시)"""
+        if self.enabled and self.is_leader:
+            try:
+                self.redis_client.eval(_RELEASE_SCRIPT, 1, self.LEADER_KEY, self.node_id)
+            except Exception as e:
+                logger.warning(f"[SchedulerCoordinator] 리더 lease 반납 실패: {e}")
+        self.is_leader = False
+
+    def get_leader(self) -> Optional[str]:
+        """현재 리더 노드 ID"""
+        if not self.enabled:
+            return self.node_id
+        try:
+            return self.redis_client.get(self.LEADER_KEY)
+        except Exception:
+            return None
+
+    # ------------------------------------------------------------------
+    # 작업 단일 실행 (single-flight)
+    # ------------------------------------------------------------------
+
+    def _job_lock_key(self, job_id: str) -> str:
+        return f"scheduler:job:{job_id}:running"
+
+    def _last_run_key(self, job_id: str) -> str:
+        return f"scheduler:job:{job_id}:last_run"
+
+    def _acquire_job_lock(self, job_id: str, token: str) -> bool:
+        if not self.enabled:
+            if job_id in self._running_jobs:
+                return False
+            self._running_jobs[job_id] = token
+            return True
+        return bool(self.redis_client.set(self._job_lock_key(job_id), token, nx=True, ex=self.lease_ttl))
+
+    def _renew_job_lock(self, job_id: str, token: str):
+        if self.enabled:
+            self.redis_client.eval(_RENEW_SCRIPT, 1, self._job_lock_key(job_id), token, self.lease_ttl * 1000)
+
+    def _release_job_lock(self, job_id: str, token: str):
+        if not self.enabled:
+            if self._running_jobs.get(job_id) == token:
+                del self._running_jobs[job_id]
+            return
+        self.redis_client.eval(_RELEASE_SCRIPT, 1, self._job_lock_key(job_id), token)
+
+    def get_running_node(self, job_id: str) -> Optional[str]:
+        """작업을 실행 중인 노드 ID (실행 중이 아니면 None)"""
+        if not self.enabled:
+            token = self._running_jobs.get(job_id)
+            return token.rsplit("|", 1)[0] if token else None
+        try:
+            token = self.redis_client.get(self._job_lock_key(job_id))
+        except Exception:
+            return None
+        return token.rsplit("|", 1)[0] if token else None
+
+    def record_run(self, job_id: str, run: Dict[str, Any]):
+        """마지막 실행 기록 저장 (누락 실행 판단용)"""
+        if not self.enabled:
+            self._last_runs[job_id] = run
+            return
+        try:
+            self.redis_client.hset(self._last_run_key(job_id), mapping={k: str(v) for k, v in run.items()})
+        except Exception as e:
+            logger.warning(f"[SchedulerCoordinator] 실행 기록 저장 실패: {job_id}, {e}")
+
+    def get_last_run(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """마지막 실행 기록 조회"""
+        if not self.enabled:
+            return self._last_runs.get(job_id)
+        try:
+            return self.redis_client.hgetall(self._last_run_key(job_id)) or None
+        except Exception:
+            return None
+
+    # ------------------------------------------------------------------
+    # 수동 실행 요청 (API → 리더)
+    # ------------------------------------------------------------------
+
+    def _trigger_key(self, job_id: str) -> str:
+        return f"scheduler:job:{job_id}:trigger"
+
+    def request_trigger(self, job_id: str) -> bool:
+        """
+        작업 수동 실행 요청을 남깁니다 (리더가 다음 확인 주기에 실행).
+
+        Returns:
+            새로 요청했으면 True, 이미 대기 중인 요청이 있으면 False
+        """
+        requested_at = datetime.now().isoformat()
+        if not self.enabled:
+            if job_id in self._triggers:
+                return False
+            self._triggers[job_id] = requested_at
+            return True
+        return bool(self.redis_client.set(self._trigger_key(job_id), requested_at, nx=True, ex=self.TRIGGER_TTL))
+
+    def pop_trigger(self, job_id: str) -> Optional[str]:
+        """대기 중인 수동 실행 요청을 꺼냄 (요청 시각, 없으면 None)"""
+        if not self.enabled:
+            return self._triggers.pop(job_id, None)
+        try:
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.get(self._trigger_key(job_id))
+            pipe.delete(self._trigger_key(job_id))
+            return pipe.execute()[0]
+        except Exception as e:
+            logger.warning(f"[SchedulerCoordinator] 수동 실행 요청 조회 실패: {job_id}, {e}")
+            return None
+
+    def get_pending_trigger(self, job_id: str) -> Optional[str]:
+        """대기 중인 수동 실행 요청 시각 (꺼내지 않고 조회만)"""
+        if not self.enabled:
+            return self._triggers.get(job_id)
+        try:
+            return self.redis_client.get(self._trigger_key(job_id))
+        except Exception:
+            return None
+
+    async def run_single_flight(
+        self,
+        job_id: str,
+        func: Callable[[], Awaitable[Any]]
+    ) -> Dict[str, Any]:
+        """
+        작업을 클러스터 전체에서 동시에 한 번만 실행합니다.
+        실행 중에는 lease를 주기적으로 연장하고, 끝나면 실행 기록을 남깁니다.
+
+        Returns:
+            {"success", "skipped", "result", "started_at", "finished_at"}
+        """
+        token = f"{self.node_id}|{uuid.uuid4().hex[:8]}"
+        try:
+            acquired = self._acquire_job_lock(job_id, token)
+        except Exception as e:
+            logger.warning(f"[SchedulerCoordinator] 작업 락 획득 실패: {job_id}, {e}")
+            acquired = False
+
+        if not acquired:
+            running_on = self.get_running_node(job_id)
+            logger.info(f"[SchedulerCoordinator] '{job_id}' 이미 실행 중 → 스킵 (node={running_on})")
+            return {"success": False, "skipped": True, "reason": "already running", "running_on": running_on}
+
+        renew_task = asyncio.create_task(self._keep_job_lock(job_id, token))
+        started_at = datetime.now()
+        start = time.monotonic()
+        status = "failed"
+        result = None
+        try:
+            result = await func()
+            status = "completed"
+        finally:
+            renew_task.cancel()
+            self.record_run(job_id, {
+                "status": status,
+                "node": self.node_id,
+                "started_at": started_at.isoformat(),
+                "finished_at": datetime.now().isoformat(),
+                "duration_seconds": round(time.monotonic() - start, 1),
+                # 파이프라인 단계별 소요 시간 등 작업 결과 요약
+                "result": json.dumps(result, ensure_ascii=False, default=str) if isinstance(result, dict) else ""
+            })
+            try:
+                self._release_job_lock(job_id, token)
+            except Exception as e:
+                logger.warning(f"[SchedulerCoordinator] 작업 락 해제 실패: {job_id}, {e}")
+
+        return {
+            "success": True,
+            "skipped": False,
+            "result": result,
+            "started_at": started_at.isoformat(),
+            "finished_at": datetime.now().isoformat()
+        }
+
+    async def _keep_job_lock(self, job_id: str, token: str):
+        """장시간 작업 중 lease 만료 방지"""
+        while True:
+            await asyncio.sleep(self.lease_ttl / 3)
+            try:
+                self._renew_job_lock(job_id, token)
+            except Exception as e:
+                logger.warning(f"[SchedulerCoordinator] 작업 lease 연장 실패: {job_id}, {e}")
+
+
+# 싱글톤 인스턴스
+_coordinator: Optional[SchedulerCoordinator] = None
+
+
+def get_scheduler_coordinator() -> SchedulerCoordinator:
+    """스케줄러 조정자 싱글톤"""
+    global _coordinator
+    if _coordinator is None:
+        _coordinator = SchedulerCoordinator()
+    return _coordinator
@@ -2,6 +2,7 @@
 Selenium 기반 웹 크롤러 서비스
 JavaScript로 렌더링되는 페이지를 크롤링
 """
+import logging
 import re
 from typing import Optional
 from selenium import webdriver
@@ -11,6 +12,8 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+logger = logging.getLogger(__name__)
+
 
 class SeleniumCrawlerService:
     """Selenium을 사용한 동적 웹 페이지 크롤링"""
@@ -52,7 +55,7 @@ class SeleniumCrawlerService:
         job_url = f"https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx={rec_idx}"
 
         try:
-            print(f"[Selenium] 페이지 로딩: {job_url}")
+            logger.debug(f"[Selenium] 페이지 로딩: {job_url}")
             driver.get(job_url)
 
             # 페이지 로딩 대기 (최대 10초)
@@ -73,7 +76,7 @@ class SeleniumCrawlerService:
                         EC.presence_of_element_located((By.XPATH, selector))
                     )
                     if company_link:
-                        print(f"[Selenium] 회사 링크 발견: {selector}")
+                        logger.debug(f"[Selenium] 회사 링크 발견: {selector}")
                         break
                 except TimeoutException:
                     continue
@@ -81,31 +84,31 @@ class SeleniumCrawlerService:
             if company_link:
                 href = company_link.get_attribute('href')
                 company_name = company_link.text.strip()
-                print(f"[Selenium] 회사명: {company_name}, href: {href[:100]}")
+                logger.debug(f"[Selenium] 회사명: {company_name}, href: {href[:100]}")
 
                 # csn 추출
                 csn_match = re.search(r'[?&]csn=([^&]+)', href)
                 if csn_match:
                     csn = csn_match.group(1)
-                    print(f"[Selenium] CSN 추출 성공: {csn}")
+                    logger.debug(f"[Selenium] CSN 추출 성공: {csn}")
                     return csn
                 else:
-                    print(f"[Selenium] href에 csn 없음: {href}")
+                    logger.debug(f"[Selenium] href에 csn 없음: {href}")
             else:
-                print(f"[Selenium] 회사 링크를 찾을 수 없습니다")
+                logger.debug(f"[Selenium] 회사 링크를 찾을 수 없습니다")
 
                 # 디버깅: 페이지 소스 일부 출력
                 page_source = driver.page_source
                 if 'company-info' in page_source:
-                    print(f"[Selenium DEBUG] 페이지에 company-info 존재함")
+                    logger.debug(f"[Selenium DEBUG] 페이지에 company-info 존재함")
                     # company-info 주변 HTML 추출
                     import re
                     matches = re.findall(r'.{0,200}company-info.{0,200}', page_source)
                     for idx, match in enumerate(matches[:3]):
-                        print(f"[Selenium DEBUG] match {idx}: {match[:150]}")
+                        logger.debug(f"[Selenium DEBUG] match {idx}: {match[:150]}")
 
         except Exception as e:
-            print(f"[Selenium] 에러 발생: {type(e).__name__}: {str(e)}")
+            logger.warning(f"[Selenium] 에러 발생: {type(e).__name__}: {str(e)}")
 
         return None
 
@@ -0,0 +1,242 @@
+"""
+지연 초기화 서비스 레지스트리 / 시작 시간 프로파일
+import 시점에 DB 연결, 테이블 확인, Pinecone 인덱스 조회, 외부 클라이언트 생성을 하지 않도록
+서비스를 처음 사용할 때(또는 서버가 요청을 받기 시작한 뒤 백그라운드 워밍업에서) 생성합니다.
+
+- lazy_service(name, factory): 모듈 전역 싱글톤 자리에 두는 지연 프록시
+    (속성 접근 시 생성, 기존 호출 코드는 그대로 사용)
+- ServiceRegistry.warm_up(): 등록된 서비스를 백그라운드에서 미리 생성
+- ServiceRegistry.readiness(): 서비스별 준비 상태 (/ready)
+- StartupProfiler: 모듈별 import 시간 + 서비스별 초기화 시간 보고서
+"""
+import builtins
+import logging
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+STATUS_PENDING = "pending"
+STATUS_INITIALIZING = "initializing"
+STATUS_READY = "ready"
+STATUS_UNAVAILABLE = "unavailable"  # 팩토리가 None 반환 (필수 설정 누락 등)
+STATUS_FAILED = "failed"
+
+
+class _ServiceEntry:
+    def __init__(self, name: str, factory: Callable[[], Any], warm: bool, required: bool):
+        self.name = name
+        self.factory = factory
+        self.warm = warm
+        self.required = required
+        self.lock = threading.Lock()
+        self.instance: Any = None
+        self.status = STATUS_PENDING
+        self.error: Optional[str] = None
+        self.init_seconds: Optional[float] = None
+
+
+class ServiceRegistry:
+    """이름 → 서비스 팩토리 (처음 요청될 때 한 번만 생성, 스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _ServiceEntry] = {}
+        self._warmup_thread: Optional[threading.Thread] = None
+        self._warmup_done = threading.Event()
+
+    def register(self, name: str, factory: Callable[[], Any], warm: bool = True, required: bool = False):
+        """
+        Args:
+            name: 서비스 이름 (준비 상태 / 프로파일 보고서에 표시)
+            factory: 인스턴스 생성 함수
+            warm: 백그라운드 워밍업 대상 여부
+            required: 준비되지 않으면 /ready가 503을 반환할지 여부
+        """
+        with self._lock:
+            if name not in self._entries:
+                self._entries[name] = _ServiceEntry(name, factory, warm, required)
+
+    def get(self, name: str) -> Any:
+        entry = self._entries[name]
+        if entry.status in (STATUS_READY, STATUS_UNAVAILABLE):
+            return entry.instance
+
+        with entry.lock:
+            if entry.status in (STATUS_READY, STATUS_UNAVAILABLE):
+                return entry.instance
+            entry.status = STATUS_INITIALIZING
+            started = time.perf_counter()
+            try:
+                instance = entry.factory()
+            except Exception as e:
+                # 실패는 기록만 하고 다음 사용 시 다시 시도
+                entry.status = STATUS_FAILED
+                entry.error = str(e)
+                entry.init_seconds = round(time.perf_counter() - started, 3)
+                logger.error(f"[ServiceRegistry] {name} 초기화 실패: {e}")
+                raise
+            entry.instance = instance
+            entry.init_seconds = round(time.perf_counter() - started, 3)
+            entry.status = STATUS_READY if instance is not None else STATUS_UNAVAILABLE
+            entry.error = None
+            logger.info(f"[ServiceRegistry] {name} 초기화 ({entry.init_seconds}s, {entry.status})")
+            return instance
+
+    def is_initialized(self, name: str) -> bool:
+        return self._entries[name].status in (STATUS_READY, STATUS_UNAVAILABLE)
+
+    # ------------------------------------------------------------------
+    # 워밍업 / 준비 상태
+    # ------------------------------------------------------------------
+
+    def start_warm_up(self):
+        """워밍업 대상 서비스를 백그라운드 스레드에서 생성 (서버는 바로 요청 수신)"""
+        with self._lock:
+            if self._warmup_thread is not None:
+                return
+            self._warmup_thread = threading.Thread(target=self.warm_up, name="service-warmup", daemon=True)
+            self._warmup_thread.start()
+
+    def warm_up(self):
+        started = time.perf_counter()
+        for entry in list(self._entries.values()):
+            if not entry.warm:
+                continue
+            try:
+                self.get(entry.name)
+            except Exception:
+                pass  # get()에서 기록됨
+        self._warmup_done.set()
+        logger.info(f"[ServiceRegistry] 워밍업 완료 ({time.perf_counter() - started:.2f}s)")
+
+    def readiness(self) -> Dict[str, Any]:
+        """서비스별 상태 + 전체 준비 여부 (필수 서비스가 모두 ready이고 워밍업이 끝나야 ready)"""
+        services = {
+            name: {
+                "status": entry.status,
+                "required": entry.required,
+                **({"error": entry.error} if entry.error else {}),
+            }
+            for name, entry in self._entries.items()
+        }
+        ready = self._warmup_done.is_set() and all(
+            entry.status == STATUS_READY for entry in self._entries.values() if entry.required
+        )
+        return {"ready": ready, "warmup_done": self._warmup_done.is_set(), "services": services}
+
+    def init_report(self) -> List[Dict[str, Any]]:
+        """서비스별 초기화 시간 (느린 순)"""
+        rows = [
+            {"name": entry.name, "status": entry.status, "seconds": entry.init_seconds}
+            for entry in self._entries.values() if entry.init_seconds is not None
+        ]
+        return sorted(rows, key=lambda row: row["seconds"], reverse=True)
+
+
+class LazyService:
+    """모듈 전역 싱글톤 자리에 두는 지연 프록시 - 속성에 처음 접근할 때 서비스를 생성"""
+
+    def __init__(self, registry: ServiceRegistry, name: str):
+        object.__setattr__(self, "_registry", registry)
+        object.__setattr__(self, "_name", name)
+
+    def get(self) -> Any:
+        """실제 인스턴스 (생성 안 됐으면 생성)"""
+        return self._registry.get(self._name)
+
+    def __getattr__(self, item: str) -> Any:
+        instance = self.get()
+        if instance is None:
+            raise AttributeError(f"{self._name} 서비스를 사용할 수 없습니다 (초기화 결과 없음)")
+        return getattr(instance, item)
+
+    def __bool__(self) -> bool:
+        # 기존 `if not service:` 검사(설정 누락 시 None) 호환
+        return self.get() is not None
+
+    def __repr__(self) -> str:
+        return f"<LazyService {self._name}>"
+
+
+class StartupProfiler:
+    """
+    시작 시간 프로파일
+    install() 이후 처음 import되는 프로젝트 모듈의 import 시간(하위 import 포함)과
+    단계별 소요 시간을 기록합니다. 서버 시작이 끝나면 uninstall()로 훅을 제거합니다.
+    """
+
+    def __init__(self, prefixes=("routers", "services", "dependencies", "scheduler", "config", "models")):
+        self.prefixes = tuple(prefixes)
+        self._original_import = None
+        self._imports: Dict[str, float] = {}
+        self._phases: Dict[str, float] = {}
+        self._started = time.perf_counter()
+        self._local = threading.local()
+
+    def install(self):
+        if self._original_import is not None:
+            return
+        self._original_import = builtins.__import__
+        original = self._original_import
+        imports = self._imports
+        prefixes = self.prefixes
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            if level != 0 or name in sys.modules or not name.startswith(prefixes):
+                return original(name, globals, locals, fromlist, level)
+            started = time.perf_counter()
+            try:
+                return original(name, globals, locals, fromlist, level)
+            finally:
+                imports.setdefault(name, round(time.perf_counter() - started, 3))
+
+        builtins.__import__ = timed_import
+
+    def uninstall(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def mark(self, phase: str):
+        """시작 후 지금까지의 경과 시간 기록 (예: imports_done, app_ready)"""
+        self._phases[phase] = round(time.perf_counter() - self._started, 3)
+
+    def report(self, registry: Optional[ServiceRegistry] = None, top: int = 20) -> Dict[str, Any]:
+        """느린 import 상위 N개 + 단계별 경과 시간 + 서비스 초기화 시간"""
+        slow_imports = sorted(self._imports.items(), key=lambda item: item[1], reverse=True)[:top]
+        return {
+            "phases": dict(self._phases),
+            "imports": [{"module": name, "seconds": seconds} for name, seconds in slow_imports],
+            "services": (registry or get_service_registry()).init_report(),
+        }
+
+
+# 싱글톤 인스턴스
+_service_registry: Optional[ServiceRegistry] = None
+_startup_profiler: Optional[StartupProfiler] = None
+
+
+def get_service_registry() -> ServiceRegistry:
+    """서비스 레지스트리 싱글톤"""
+    global _service_registry
+    if _service_registry is None:
+        _service_registry = ServiceRegistry()
+    return _service_registry
+
+
+def get_startup_profiler() -> StartupProfiler:
+    """시작 시간 프로파일러 싱글톤"""
+    global _startup_profiler
+    if _startup_profiler is None:
+        _startup_profiler = StartupProfiler()
+    return _startup_profiler
+
+
+def lazy_service(name: str, factory: Callable[[], Any], warm: bool = True, required: bool = False) -> LazyService:
+    """레지스트리에 서비스를 등록하고 지연 프록시 반환"""
+    registry = get_service_registry()
+    registry.register(name, factory, warm=warm, required=required)
+    return LazyService(registry, name)
@@ -0,0 +1,153 @@
+"""
+LLM 응답 스트리밍 (SSE) 공통 유틸
+- sse_event: SSE 메시지 포맷
+- iterate_in_thread: 동기 OpenAI 스트림(제너레이터)을 스레드에서 돌려 비동기로 전달
+- StreamingMetrics: 엔드포인트별 첫 토큰까지 걸린 시간(TTFT) / 전체 생성 시간 집계
+"""
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterator, Optional
+
+from services.common.metrics import percentile
+
+_DONE = object()
+
+
+def sse_event(event: str, data: Any, event_id: Optional[int] = None) -> str:
+    """SSE 메시지 한 개 (event / id / data)"""
+    lines = [f"event: {event}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+async def iterate_in_thread(factory: Callable[[], Iterator[Any]], max_buffer: int = 256) -> AsyncIterator[Any]:
+    """
+    동기 제너레이터를 별도 스레드에서 실행하고 항목을 비동기로 전달합니다.
+    소비 측이 중간에 끊으면(클라이언트 연결 종료) 다음 항목에서 생성을 멈춥니다.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_buffer)
+    stopped = threading.Event()
+
+    def put(item):
+        asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+    def produce():
+        iterator = None
+        try:
+            iterator = factory()
+            for item in iterator:
+                if stopped.is_set():
+                    break
+                put(item)
+            put(_DONE)
+        except BaseException as e:  # 예외는 소비 측에서 다시 발생
+            if not stopped.is_set():
+                put(e)
+        finally:
+            close = getattr(iterator, "close", None)
+            if close:
+                close()
+
+    producer = loop.run_in_executor(None, produce)
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stopped.set()
+        # 생산 스레드가 큐에 막혀 있으면 풀어줌
+        while not queue.empty():
+            queue.get_nowait()
+        if not producer.done():
+            producer.cancel()
+
+
+class StreamingMetrics:
+    """엔드포인트별 TTFT / 전체 생성 시간 (최근 N건)"""
+
+    def __init__(self, window: int = 500):
+        self.window = window
+        self._lock = threading.Lock()
+        self._ttft: Dict[str, Deque[float]] = {}
+        self._total: Dict[str, Deque[float]] = {}
+        self._counts: Dict[str, Dict[str, int]] = {}
+
+    def start(self, endpoint: str) -> "StreamTimer":
+        return StreamTimer(self, endpoint)
+
+    def record(self, endpoint: str, ttft: Optional[float], total: float, completed: bool):
+        with self._lock:
+            counts = self._counts.setdefault(endpoint, {"streams": 0, "aborted": 0})
+            counts["streams"] += 1
+            if not completed:
+                counts["aborted"] += 1
+            if ttft is not None:
+                self._ttft.setdefault(endpoint, deque(maxlen=self.window)).append(ttft)
+            self._total.setdefault(endpoint, deque(maxlen=self.window)).append(total)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """엔드포인트별 지표 (초)"""
+        with self._lock:
+            result = {}
+            for endpoint, counts in self._counts.items():
+                ttft = sorted(self._ttft.get(endpoint, []))
+                total = sorted(self._total.get(endpoint, []))
+                result[endpoint] = {
+                    **counts,
+                    "ttft_p50": percentile(ttft, 0.5),
+                    "ttft_p95": percentile(ttft, 0.95),
+                    "total_p50": percentile(total, 0.5),
+                    "total_p95": percentile(total, 0.95),
+                }
+            return result
+
+
+class StreamTimer:
+    """스트림 하나의 시간 측정"""
+
+    def __init__(self, metrics: StreamingMetrics, endpoint: str):
+        self.metrics = metrics
+        self.endpoint = endpoint
+        self.started = time.monotonic()
+        self.ttft: Optional[float] = None
+        self._recorded = False
+
+    def first_token(self):
+        if self.ttft is None:
+            self.ttft = time.monotonic() - self.started
+
+    def finish(self, completed: bool = True) -> Dict[str, Optional[int]]:
+        """기록 후 응답용 요약 (밀리초)"""
+        total = time.monotonic() - self.started
+        if not self._recorded:
+            self._recorded = True
+            self.metrics.record(self.endpoint, self.ttft, total, completed)
+        return {
+            "ttftMs": round(self.ttft * 1000) if self.ttft is not None else None,
+            "totalMs": round(total * 1000),
+        }
+
+
+# 싱글톤 인스턴스
+_streaming_metrics: Optional[StreamingMetrics] = None
+
+
+def get_streaming_metrics() -> StreamingMetrics:
+    """스트리밍 지표 싱글톤"""
+    global _streaming_metrics
+    if _streaming_metrics is None:
+        _streaming_metrics = StreamingMetrics()
+    return _streaming_metrics
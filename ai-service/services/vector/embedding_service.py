@@ -1,10 +1,10 @@
 from typing import List
 import os
-from openai import OpenAI
+from services.common.llm_clients import get_openai_client
 
 from services.rag.pinecone_vector_service import PineconeVectorService
 
-_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY")) if os.getenv("OPENAI_API_KEY") else None
+_client = get_openai_client() if os.getenv("OPENAI_API_KEY") else None
 
 
 def create_embedding(document: str) -> List[float]:
@@ -1,8 +1,8 @@
 import os
-from openai import OpenAI
+from services.common.llm_clients import get_openai_client
 
 api_key = os.getenv("OPENAI_API_KEY")
-client = OpenAI(api_key=api_key) if api_key else None
+client = get_openai_client() if api_key else None
 
 def analyze_mbti(bigfive: dict, text: str):
     if client is None:
@@ -1,9 +1,12 @@
 # services/vector/pinecone_client.py
 import logging
 import os
+import threading
 from dotenv import load_dotenv
 from pinecone import Pinecone, ServerlessSpec
 
+from services.common.metrics import instrument
+
 load_dotenv()
 logger = logging.getLogger(__name__)
 
@@ -14,38 +17,64 @@ PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
 PINECONE_ENVIRONMENT = os.getenv("PINECONE_ENVIRONMENT", "us-west1-gcp")
 PINECONE_INDEX_NAME = os.getenv("PINECONE_INDEX_NAME") or os.getenv("PINECONE_INDEX")
 
-# 인덱스 객체
-index = None
-
-if PINECONE_API_KEY and PINECONE_INDEX_NAME:
-    try:
-        pc = Pinecone(api_key=PINECONE_API_KEY)
-
-        # 존재하는 인덱스 목록
-        existing_indexes = [i.name for i in pc.list_indexes()]
-
-        # 인덱스 없으면 생성
-        if PINECONE_INDEX_NAME not in existing_indexes:
-            logger.info(f"[Pinecone] 인덱스 '{PINECONE_INDEX_NAME}'가 없어 새로 생성합니다.")
-
-            # pc.create_index(
-            #     name=PINECONE_INDEX_NAME,
-            #     dimension=1536,
-            #     metric="cosine",
-            #     spec=ServerlessSpec(
-            #         cloud="aws",
-            #         region="us-east-1"  # dev 기준 유지
-            #     )
-            # )
-            pass
-
-        # 인덱스 연결
-        index = pc.Index(PINECONE_INDEX_NAME)
-        logger.info(f"[Pinecone] 인덱스 '{PINECONE_INDEX_NAME}' 연결 완료")
-
-    except Exception as exc:
-        logger.error(f"[Pinecone 초기화 실패] {exc}")
-        index = None
-
-else:
-    logger.warning(f"Pinecone 환경 변수 누락됨: API_KEY={PINECONE_API_KEY}, INDEX={PINECONE_INDEX_NAME}")
+# 조회 / 적재 호출은 pinecone span으로 /metrics에 기록
+TRACED_INDEX_METHODS = ("query", "upsert", "fetch", "delete", "update", "describe_index_stats")
+
+# 인덱스 객체 (처음 사용할 때 연결 - import 시점에 인덱스 목록을 조회하지 않음)
+_index = None
+_initialized = False
+_lock = threading.Lock()
+
+
+def traced_index(index):
+    """Pinecone 인덱스 호출(query / upsert 등)을 span으로 기록하는 프록시"""
+    return instrument(index, "pinecone", TRACED_INDEX_METHODS)
+
+
+def get_index():
+    """Pinecone 인덱스 반환 (환경 변수 누락 / 연결 실패 시 None)"""
+    global _index, _initialized
+    if _initialized:
+        return _index
+
+    with _lock:
+        if _initialized:
+            return _index
+
+        if PINECONE_API_KEY and PINECONE_INDEX_NAME:
+            try:
+                pc = Pinecone(api_key=PINECONE_API_KEY)
+
+                # 존재하는 인덱스 목록
+                existing_indexes = [i.name for i in pc.list_indexes()]
+
+                # 인덱스 없으면 생성
+                if PINECONE_INDEX_NAME not in existing_indexes:
+                    logger.info(f"[Pinecone] 인덱스 '{PINECONE_INDEX_NAME}'가 없어 새로 생성합니다.")
+
+                    # pc.create_index(
+                    #     name=PINECONE_INDEX_NAME,
+                    #     dimension=1536,
+                    #     metric="cosine",
+                    #     spec=ServerlessSpec(
+                    #         cloud="aws",
+                    #         region="us-east-1"  # dev 기준 유지
+                    #     )
+                    # )
+                    pass
+
+                # 인덱스 연결
+                _index = traced_index(pc.Index(PINECONE_INDEX_NAME))
+                logger.info(f"[Pinecone] 인덱스 '{PINECONE_INDEX_NAME}' 연결 완료")
+
+            except Exception as exc:
+                logger.error(f"[Pinecone 초기화 실패] {exc}")
+                _index = None
+                # 연결 실패는 다음 호출에서 다시 시도
+                return None
+
+        else:
+            logger.warning(f"Pinecone 환경 변수 누락됨: API_KEY={PINECONE_API_KEY}, INDEX={PINECONE_INDEX_NAME}")
+
+        _initialized = True
+        return _index
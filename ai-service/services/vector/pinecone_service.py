@@ -2,6 +2,8 @@ import os
 from pinecone import Pinecone
 from dotenv import load_dotenv
 
+from services.vector.pinecone_client import traced_index
+
 load_dotenv()
 
 
@@ -14,7 +16,7 @@ class PineconeVectorService:
             raise ValueError("PINECONE_API_KEY가 없습니다")
 
         self.pc = Pinecone(api_key=api_key)
-        self.index = self.pc.Index(index_name)
+        self.index = traced_index(self.pc.Index(index_name))
 
     def upsert_vector(self, vector_id: str, embedding: list, metadata: dict):
         self.index.upsert(
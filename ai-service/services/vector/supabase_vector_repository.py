@@ -2,6 +2,8 @@ import os
 import json
 from supabase import create_client, Client
 
+from services.common.metrics import traced
+
 
 class SupabaseVectorRepository:
     '''
@@ -13,6 +15,7 @@ class SupabaseVectorRepository:
         key = os.getenv('SUPABASE_SERVICE_KEY')
         self.supabase: Client = create_client(url, key)
 
+    @traced("supabase")
     def save_vector(self, table: str, record: dict):
         '''
         record 예시:
@@ -24,6 +27,7 @@ class SupabaseVectorRepository:
         '''
         return self.supabase.table(table).insert(record).execute()
 
+    @traced("supabase")
     def get_by_original_id(self, table: str, original_id: str):
         return (
             self.supabase.table(table)
@@ -32,6 +36,7 @@ class SupabaseVectorRepository:
             .execute()
         )
 
+    @traced("supabase")
     def get_vector_by_id(self, vector_id: str):
         """
         profile_vector 테이블에서 특정 vector_db_id에 해당하는 임베딩을 반환
@@ -46,6 +51,7 @@ class SupabaseVectorRepository:
             return response.data[0].get('vector_data')
         return None
 
+    @traced("supabase")
     def get_user_interests(self, user_id: int):
         """
         user_profiles 테이블에서 사용자의 관심사(interests) 조회
@@ -63,6 +69,7 @@ class SupabaseVectorRepository:
             print(f"Error fetching user interests: {e}")
         return None
 
+    @traced("supabase")
     def get_job_details_by_ids(self, job_ids: list):
         """
         Fetch job details for a list of job IDs
@@ -128,6 +135,7 @@ class SupabaseVectorRepository:
             print(f"Error fetching job details: {e}")
             return []
 
+    @traced("supabase")
     def get_major_details_by_ids(self, major_ids: list):
         """
         Fetch major details for a list of major IDs
@@ -173,6 +181,7 @@ class SupabaseVectorRepository:
             print(f"Error fetching major details: {e}")
             return []
 
+    @traced("supabase")
     def search_keyword(self, table: str, column: str, keyword: str, limit: int = 5):
         """
         Perform a simple text search (ilike) on a specific table and column.
@@ -9,6 +9,7 @@ import re
 import json
 import hashlib
 import asyncio
+import logging
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 from bs4 import BeautifulSoup
@@ -16,6 +17,17 @@ import httpx
 from urllib.parse import urljoin, urlencode, quote
 from services.database_service import DatabaseService
 from services.company_crawler_service import CompanyCrawlerService
+from services.common.metrics import TracedAsyncTransport
+
+logger = logging.getLogger(__name__)
+
+# httpx.AsyncClient 기본 연결 제한과 동일
+_DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+
+def _fetch_transport(site: str, limits: Optional[httpx.Limits] = None) -> TracedAsyncTransport:
+    """사이트별 HTTP 요청을 crawler span으로 기록하는 트랜스포트 (연결 제한은 클라이언트 대신 여기서 지정)"""
+    return TracedAsyncTransport(httpx.AsyncHTTPTransport(limits=limits or _DEFAULT_LIMITS), "crawler", site)
 
 
 class CacheEntry:
@@ -57,7 +69,7 @@ class WebCrawlerService:
             self.db_service = DatabaseService()
             self.company_service = CompanyCrawlerService()
         except Exception as e:
-            print(f"데이터베이스 서비스 초기화 실패: {str(e)}")
+            logger.error(f"데이터베이스 서비스 초기화 실패: {str(e)}")
             self.db_service = None
             self.company_service = None
     
@@ -108,7 +120,8 @@ class WebCrawlerService:
         self,
         search_keyword: Optional[str] = None,
         max_results: int = 10,
-        force_refresh: bool = False
+        force_refresh: bool = False,
+        enrich_companies: bool = True
     ) -> Dict:
         """
         원티드(https://www.wanted.co.kr) 사이트에서 채용 정보를 크롤링합니다.
@@ -118,6 +131,7 @@ class WebCrawlerService:
             search_keyword: 검색 키워드 (선택)
             max_results: 최대 결과 수
             force_refresh: 캐시를 무시하고 강제로 새로 크롤링할지 여부
+            enrich_companies: 기업정보까지 크롤링/저장할지 여부 (False면 호출자가 별도 처리)
         
         Returns:
             크롤링 결과 딕셔너리
@@ -125,26 +139,26 @@ class WebCrawlerService:
         # 캐시 키 생성
         cache_key = self._generate_cache_key("wanted", "https://www.wanted.co.kr", search_keyword, max_results)
         
-        print(f"[원티드] force_refresh: {force_refresh}, cache_key: {cache_key[:16]}...")
+        logger.debug(f"[원티드] force_refresh: {force_refresh}, cache_key: {cache_key[:16]}...")
         
         # 강제 새로고침이 아니고 캐시가 있으면 캐시 반환
         if not force_refresh:
             cached_data = self._get_cached_data(cache_key)
             if cached_data:
-                print(f"[원티드] 캐시에서 데이터 반환 (총 {cached_data.get('totalResults', 0)}개)")
+                logger.info(f"[원티드] 캐시에서 데이터 반환 (총 {cached_data.get('totalResults', 0)}개)")
                 cached_data["fromCache"] = True
                 cached_data["cachedAt"] = self.cache[cache_key].expires_at.isoformat()
                 return cached_data
             else:
-                print(f"[원티드] 캐시에 데이터 없음, 새로 크롤링 시작")
+                logger.debug(f"[원티드] 캐시에 데이터 없음, 새로 크롤링 시작")
         else:
-            print(f"[원티드] force_refresh=True, 캐시 무시하고 새로 크롤링")
+            logger.info(f"[원티드] force_refresh=True, 캐시 무시하고 새로 크롤링")
         
         try:
             base_url = "https://www.wanted.co.kr"
             search_url = f"{base_url}/wdlist" if not search_keyword else f"{base_url}/search?query={quote(search_keyword)}"
             
-            print(f"[원티드] 크롤링 시작, 키워드: {search_keyword}, max_results: {max_results}")
+            logger.info(f"[원티드] 크롤링 시작, 키워드: {search_keyword}, max_results: {max_results}")
             
             # 요청 간 딜레이 (IP 차단 방지)
             await self._wait_if_needed()
@@ -153,16 +167,16 @@ class WebCrawlerService:
                 timeout=30.0, 
                 headers=self.headers, 
                 follow_redirects=True,
-                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)  # 연결 제한
+                transport=_fetch_transport("wanted", httpx.Limits(max_keepalive_connections=5, max_connections=10))  # 연결 제한
             ) as client:
                 # 원티드는 React/Next.js 기반이므로 HTML 파싱 대신 바로 API 호출
-                print(f"[원티드] API 직접 호출 시도...")
+                logger.debug(f"[원티드] API 직접 호출 시도...")
                 job_listings = await self._crawl_wanted_api(client, search_keyword or "", max_results)
                 
                 if job_listings:
-                    print(f"[원티드] API에서 {len(job_listings)}개 공고 발견")
+                    logger.info(f"[원티드] API에서 {len(job_listings)}개 공고 발견")
                 else:
-                    print(f"[원티드] API 호출 결과 없음")
+                    logger.info(f"[원티드] API 호출 결과 없음")
                 result = {
                     "success": True,
                     "site": "wanted",
@@ -174,7 +188,7 @@ class WebCrawlerService:
                     "cachedAt": datetime.now().isoformat()
                 }
                 
-                print(f"[원티드] 총 {len(job_listings)}개 공고 크롤링 완료")
+                logger.info(f"[원티드] 총 {len(job_listings)}개 공고 크롤링 완료")
                 
                 # 데이터베이스에 저장
                 if self.db_service and job_listings:
@@ -183,13 +197,14 @@ class WebCrawlerService:
                             site_name="wanted",
                             site_url=base_url,
                             job_listings=job_listings,
-                            search_keyword=search_keyword
+                            search_keyword=search_keyword,
+                            inserted=result.setdefault("newJobListings", [])
                         )
                         result["savedToDatabase"] = saved_count
-                        print(f"[원티드] {saved_count}개의 채용 공고가 데이터베이스에 저장되었습니다.")
+                        logger.info(f"[원티드] {saved_count}개의 채용 공고가 데이터베이스에 저장되었습니다.")
 
                         # 기업정보도 저장
-                        if self.company_service:
+                        if self.company_service and enrich_companies:
                             try:
                                 company_count = await self.company_service.crawl_and_save_companies_from_jobs(
                                     site_name="wanted",
@@ -197,12 +212,12 @@ class WebCrawlerService:
                                 )
                                 result["savedCompanies"] = company_count
                             except Exception as e:
-                                print(f"[원티드] 기업정보 저장 실패: {str(e)}")
+                                logger.error(f"[원티드] 기업정보 저장 실패: {str(e)}")
                     except Exception as e:
-                        print(f"[원티드] 데이터베이스 저장 실패: {str(e)}")
+                        logger.error(f"[원티드] 데이터베이스 저장 실패: {str(e)}")
                         result["databaseError"] = str(e)
                 else:
-                    print(f"[원티드] 저장할 공고가 없거나 DB 서비스가 없습니다.")
+                    logger.info(f"[원티드] 저장할 공고가 없거나 DB 서비스가 없습니다.")
                 
                 # 결과를 캐시에 저장
                 self._set_cached_data(cache_key, result)
@@ -210,9 +225,7 @@ class WebCrawlerService:
                 return result
                 
         except Exception as e:
-            print(f"[원티드] 크롤링 중 오류 발생: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"[원티드] 크롤링 중 오류 발생: {str(e)}")
             return {
                 "success": False,
                 "error": str(e),
@@ -234,7 +247,7 @@ class WebCrawlerService:
             # 원티드의 실제 API 엔드포인트 시도
             api_url = "https://www.wanted.co.kr/api/v4/jobs"
             
-            print(f"[원티드 API] 크롤링 시작 - 키워드: '{keyword}', max_results: {max_results}")
+            logger.info(f"[원티드 API] 크롤링 시작 - 키워드: '{keyword}', max_results: {max_results}")
             
             all_job_listings = []
             offset = 0
@@ -258,24 +271,24 @@ class WebCrawlerService:
                 
                 # API 호출 시도
                 await self._wait_if_needed()  # IP 차단 방지
-                print(f"[원티드 API] 페이지 {page} 요청 - offset: {offset}, limit: {page_size}")
+                logger.debug(f"[원티드 API] 페이지 {page} 요청 - offset: {offset}, limit: {page_size}")
                 response = await client.get(api_url, params=params)
                 
                 if response.status_code != 200:
-                    print(f"[원티드 API] 페이지 {page} 호출 실패: HTTP {response.status_code}")
-                    print(f"[원티드 API] 응답 내용: {response.text[:200]}")
+                    logger.error(f"[원티드 API] 페이지 {page} 호출 실패: HTTP {response.status_code}")
+                    logger.warning(f"[원티드 API] 응답 내용: {response.text[:200]}")
                     break
                 
                 data = response.json()
-                print(f"[원티드 API] 페이지 {page} 응답 수신 완료")
+                logger.debug(f"[원티드 API] 페이지 {page} 응답 수신 완료")
                 
                 # 디버깅: 첫 페이지에서 응답 구조 확인
                 if page == 0:
-                    print(f"[DEBUG] 원티드 API 응답 구조: {list(data.keys()) if isinstance(data, dict) else '리스트'}")
+                    logger.debug(f"원티드 API 응답 구조: {list(data.keys()) if isinstance(data, dict) else '리스트'}")
                     if isinstance(data, dict):
                         for key in data.keys():
                             if isinstance(data[key], (list, dict)):
-                                print(f"[DEBUG] {key}: {type(data[key])}, 길이/크기: {len(data[key]) if isinstance(data[key], (list, dict)) else 'N/A'}")
+                                logger.debug(f"{key}: {type(data[key])}, 길이/크기: {len(data[key]) if isinstance(data[key], (list, dict)) else 'N/A'}")
                 
                 # 응답 구조에 따라 데이터 추출
                 jobs = []
@@ -298,10 +311,10 @@ class WebCrawlerService:
                 
                 # 이번 페이지에 공고가 없으면 종료
                 if not jobs:
-                    print(f"[DEBUG] 페이지 {page}: 공고가 없어 종료")
+                    logger.debug(f"페이지 {page}: 공고가 없어 종료")
                     break
                 
-                print(f"[DEBUG] 페이지 {page}: {len(jobs)}개 공고 발견 (offset: {offset})")
+                logger.debug(f"페이지 {page}: {len(jobs)}개 공고 발견 (offset: {offset})")
                 
                 # 공고 데이터 변환
                 page_job_listings = []
@@ -391,15 +404,15 @@ class WebCrawlerService:
                 
                 # 이번 페이지의 공고 수가 page_size보다 적으면 마지막 페이지
                 if len(jobs) < page_size:
-                    print(f"[DEBUG] 페이지 {page}: 공고 수({len(jobs)})가 page_size({page_size})보다 적어 종료")
+                    logger.debug(f"페이지 {page}: 공고 수({len(jobs)})가 page_size({page_size})보다 적어 종료")
                     break
             
             if all_job_listings:
-                print(f"원티드 API에서 총 {len(all_job_listings)}개 공고 발견 (페이지: {page})")
+                logger.info(f"원티드 API에서 총 {len(all_job_listings)}개 공고 발견 (페이지: {page})")
 
                 # 각 공고의 상세 정보 가져오기 (모든 공고)
                 total_jobs = len(all_job_listings)
-                print(f"[원티드] 전체 {total_jobs}개 공고의 상세 정보 가져오기...")
+                logger.info(f"[원티드] 전체 {total_jobs}개 공고의 상세 정보 가져오기...")
 
                 for i, job in enumerate(all_job_listings):
                     job_id = job.get("id", "")
@@ -426,16 +439,16 @@ class WebCrawlerService:
                                 job["preferred_majors"] = detail_info["preferred_majors"]
                             if detail_info.get("core_competencies"):
                                 job["core_competencies"] = detail_info["core_competencies"]
-                            print(f"[원티드] ({i+1}/{total_jobs}) {job.get('title', '')[:30]}... 상세 정보 추가 완료")
+                            logger.debug(f"[원티드] ({i+1}/{total_jobs}) {job.get('title', '')[:30]}... 상세 정보 추가 완료")
 
-                print(f"[원티드] 상세 정보 가져오기 완료")
+                logger.info(f"[원티드] 상세 정보 가져오기 완료")
                 return all_job_listings
             
             # API 호출 실패 시 빈 리스트 반환 (HTML 파싱으로 fallback)
             return []
             
         except Exception as e:
-            print(f"원티드 API 크롤링 실패: {str(e)}")
+            logger.error(f"원티드 API 크롤링 실패: {str(e)}")
             # API 실패 시 빈 리스트 반환 (HTML 파싱으로 fallback)
             return []
     
@@ -561,10 +574,10 @@ class WebCrawlerService:
 
                 return result
             else:
-                print(f"[원티드] 상세 API 호출 실패 (job_id: {job_id}): HTTP {response.status_code}")
+                logger.warning(f"[원티드] 상세 API 호출 실패 (job_id: {job_id}): HTTP {response.status_code}")
 
         except Exception as e:
-            print(f"[원티드] 상세 정보 크롤링 실패 (job_id: {job_id}): {str(e)}")
+            logger.warning(f"[원티드] 상세 정보 크롤링 실패 (job_id: {job_id}): {str(e)}")
 
         return None
 
@@ -700,9 +713,9 @@ class WebCrawlerService:
                                 if benefits:
                                     description_parts.append(f"[복리후생] {', '.join(benefits)}")
 
-                            print(f"[잡코리아] RSC JSON 파싱 성공: {title[:30]}...")
+                            logger.debug(f"[잡코리아] RSC JSON 파싱 성공: {title[:30]}...")
                     except Exception as e:
-                        print(f"[잡코리아] RSC JSON 파싱 실패: {str(e)}")
+                        logger.warning(f"[잡코리아] RSC JSON 파싱 실패: {str(e)}")
 
                 # 방법 2: og:description 메타태그 (fallback)
                 if not description_parts:
@@ -778,10 +791,10 @@ class WebCrawlerService:
 
                 return result
             else:
-                print(f"[잡코리아] 상세 페이지 호출 실패: HTTP {response.status_code}")
+                logger.warning(f"[잡코리아] 상세 페이지 호출 실패: HTTP {response.status_code}")
 
         except Exception as e:
-            print(f"[잡코리아] 상세 페이지 크롤링 실패: {str(e)}")
+            logger.warning(f"[잡코리아] 상세 페이지 크롤링 실패: {str(e)}")
 
         return None
 
@@ -827,7 +840,7 @@ class WebCrawlerService:
                     detail_text = jv_detail.get_text(separator="\n", strip=True)
                     if detail_text:
                         description_parts.append(detail_text[:1500])
-                        print(f"[사람인] jv_detail에서 {len(detail_text)}자 추출")
+                        logger.debug(f"[사람인] jv_detail에서 {len(detail_text)}자 추출")
 
                 # ===== 방법 2: wrap_jv_cont에서 핵심 정보 추출 =====
                 wrap_jv = soup.find("div", class_="wrap_jv_cont")
@@ -930,10 +943,10 @@ class WebCrawlerService:
 
                 return result
             else:
-                print(f"[사람인] 상세 페이지 호출 실패: HTTP {response.status_code}")
+                logger.warning(f"[사람인] 상세 페이지 호출 실패: HTTP {response.status_code}")
 
         except Exception as e:
-            print(f"[사람인] 상세 페이지 크롤링 실패: {str(e)}")
+            logger.warning(f"[사람인] 상세 페이지 크롤링 실패: {str(e)}")
 
         return None
 
@@ -943,7 +956,8 @@ class WebCrawlerService:
         site_url: str,
         search_keyword: Optional[str] = None,
         max_results: int = 10,
-        force_refresh: bool = False
+        force_refresh: bool = False,
+        enrich_companies: bool = True
     ) -> Dict:
         """
         지정된 취업 사이트에서 채용 정보를 크롤링합니다.
@@ -955,6 +969,7 @@ class WebCrawlerService:
             search_keyword: 검색 키워드
             max_results: 최대 결과 수
             force_refresh: 캐시를 무시하고 강제로 새로 크롤링할지 여부
+            enrich_companies: 기업정보까지 크롤링/저장할지 여부 (False면 호출자가 별도 처리)
         
         Returns:
             크롤링 결과 딕셔너리
@@ -973,11 +988,11 @@ class WebCrawlerService:
         site_name_lower = site_name.lower()
         
         if "원티드" in site_name_lower or "wanted" in site_name_lower:
-            result = await self.crawl_wanted(search_keyword, max_results, force_refresh)
+            result = await self.crawl_wanted(search_keyword, max_results, force_refresh, enrich_companies)
         elif "잡코리아" in site_name_lower or "jobkorea" in site_name_lower:
-            result = await self._crawl_jobkorea(site_url, search_keyword, max_results)
+            result = await self._crawl_jobkorea(site_url, search_keyword, max_results, enrich_companies)
         elif "사람인" in site_name_lower or "saramin" in site_name_lower:
-            result = await self._crawl_saramin(site_url, search_keyword, max_results)
+            result = await self._crawl_saramin(site_url, search_keyword, max_results, enrich_companies)
         else:
             result = {
                 "success": False,
@@ -995,11 +1010,12 @@ class WebCrawlerService:
                         site_name=site_name,
                         site_url=site_url,
                         job_listings=result.get("jobListings", []),
-                        search_keyword=search_keyword
+                        search_keyword=search_keyword,
+                        inserted=result.setdefault("newJobListings", [])
                     )
                     result["savedToDatabase"] = saved_count
                 except Exception as e:
-                    print(f"데이터베이스 저장 실패: {str(e)}")
+                    logger.error(f"데이터베이스 저장 실패: {str(e)}")
                     result["databaseError"] = str(e)
             
             self._set_cached_data(cache_key, result)
@@ -1011,7 +1027,8 @@ class WebCrawlerService:
         self,
         site_url: str,
         search_keyword: Optional[str],
-        max_results: int
+        max_results: int,
+        enrich_companies: bool = True
     ) -> Dict:
         """잡코리아 크롤링 - 페이지네이션 지원"""
         try:
@@ -1023,7 +1040,7 @@ class WebCrawlerService:
                 # 검색어 없으면 전체 채용 공고 페이지 (menucode=local 추가)
                 base_search_url = "https://www.jobkorea.co.kr/recruit/joblist?menucode=local"
             
-            print(f"[잡코리아] 크롤링 시작: {base_search_url}, 키워드: {search_keyword}, max_results: {max_results}")
+            logger.info(f"[잡코리아] 크롤링 시작: {base_search_url}, 키워드: {search_keyword}, max_results: {max_results}")
             
             all_job_listings = []
             page = 1
@@ -1032,7 +1049,9 @@ class WebCrawlerService:
             # 타임아웃을 더 길게 설정하고 재시도 로직 추가
             timeout = httpx.Timeout(60.0, connect=30.0)  # 전체 60초, 연결 30초
             
-            async with httpx.AsyncClient(timeout=timeout, headers=self.headers, follow_redirects=True) as client:
+            async with httpx.AsyncClient(
+                timeout=timeout, headers=self.headers, follow_redirects=True, transport=_fetch_transport("jobkorea")
+            ) as client:
                 while page <= max_pages:
                     # 페이지 URL 생성
                     if "?" in base_search_url:
@@ -1055,19 +1074,19 @@ class WebCrawlerService:
                             retry_count += 1
                             if retry_count < max_retries:
                                 wait_time = retry_count * 2  # 재시도마다 대기 시간 증가
-                                print(f"[잡코리아] 페이지 {page} 연결 실패 (재시도 {retry_count}/{max_retries}): {str(e)}")
+                                logger.warning(f"[잡코리아] 페이지 {page} 연결 실패 (재시도 {retry_count}/{max_retries}): {str(e)}")
                                 await asyncio.sleep(wait_time)
                             else:
-                                print(f"[잡코리아] 페이지 {page} 연결 최종 실패: {str(e)}")
+                                logger.error(f"[잡코리아] 페이지 {page} 연결 최종 실패: {str(e)}")
                                 raise e
                     
                     if not response:
                         break
                     
-                    print(f"[잡코리아] 페이지 {page} HTTP 응답 코드: {response.status_code}")
+                    logger.debug(f"[잡코리아] 페이지 {page} HTTP 응답 코드: {response.status_code}")
                     
                     if response.status_code != 200:
-                        print(f"[잡코리아] 페이지 {page} 접근 실패: HTTP {response.status_code}")
+                        logger.error(f"[잡코리아] 페이지 {page} 접근 실패: HTTP {response.status_code}")
                         break
                     
                     html = response.text
@@ -1096,7 +1115,7 @@ class WebCrawlerService:
                                 job_items.append(parent)
                                 seen_parents.add(id(parent))
                     
-                    print(f"[잡코리아] 페이지 {page} 발견된 공고 아이템 수: {len(job_items)}")
+                    logger.debug(f"[잡코리아] 페이지 {page} 발견된 공고 아이템 수: {len(job_items)}")
                     
                     if not job_items:
                         # 공고가 없으면 마지막 페이지
@@ -1106,7 +1125,7 @@ class WebCrawlerService:
                     if page == 1 and job_items:
                         for idx in range(min(3, len(job_items))):
                             item_html = str(job_items[idx])[:800]  # 첫 800자만
-                            print(f"[잡코리아 DEBUG {idx+1}] item HTML:\n{item_html}\n")
+                            logger.debug(f"[잡코리아 DEBUG {idx+1}] item HTML:\n{item_html}\n")
                     
                     item_count = 0
                     for item in job_items:
@@ -1274,7 +1293,7 @@ class WebCrawlerService:
                                 
                                 # job_id가 없으면 건너뛰기 (저장 불가)
                                 if not job_id:
-                                    print(f"[잡코리아] job_id 추출 실패 - data_info: {data_info}, URL: {final_url[:100]}")
+                                    logger.warning(f"[잡코리아] job_id 추출 실패 - data_info: {data_info}, URL: {final_url[:100]}")
                                     continue
                                 
                                 # 중복 체크 없이 모두 수집 (DB 저장 시에 중복 처리)
@@ -1290,12 +1309,12 @@ class WebCrawlerService:
                                 
                                 # 디버깅: URL 추출 확인
                                 if not job_url or job_url == search_url:
-                                    print(f"[잡코리아] URL 추출 실패 - 제목: {title[:30]}..., URL: {final_url}")
+                                    logger.warning(f"[잡코리아] URL 추출 실패 - 제목: {title[:30]}..., URL: {final_url}")
                         except Exception as e:
-                            print(f"[잡코리아] 페이지 {page} 공고 파싱 실패: {str(e)}")
+                            logger.warning(f"[잡코리아] 페이지 {page} 공고 파싱 실패: {str(e)}")
                             continue
                     
-                    print(f"[잡코리아] 페이지 {page} 파싱된 공고 수: {len(page_job_listings)} (누적 {len(all_job_listings) + len(page_job_listings)}개)")
+                    logger.debug(f"[잡코리아] 페이지 {page} 파싱된 공고 수: {len(page_job_listings)} (누적 {len(all_job_listings) + len(page_job_listings)}개)")
                     all_job_listings.extend(page_job_listings)
                     
                     # max_results 제한이 있으면 확인
@@ -1326,19 +1345,19 @@ class WebCrawlerService:
                                     has_next_page = False
                     
                     if not has_next_page:
-                        print(f"[잡코리아] 다음 페이지가 없어 종료 (현재 페이지: {page})")
+                        logger.info(f"[잡코리아] 다음 페이지가 없어 종료 (현재 페이지: {page})")
                         break
                     
                     page += 1
                 
-                print(f"[잡코리아] 총 파싱된 공고 수 (중복 포함): {len(all_job_listings)} (페이지: {page})")
+                logger.info(f"[잡코리아] 총 파싱된 공고 수 (중복 포함): {len(all_job_listings)} (페이지: {page})")
                 
                 # 디버깅: 첫 10개 공고의 제목+회사명 확인
                 if all_job_listings:
                     debug_sample = [(job.get("title", "")[:40], job.get("company", "")[:20]) for job in all_job_listings[:10]]
-                    print(f"[잡코리아 DEBUG] 첫 10개 공고 샘플:")
+                    logger.debug(f"[잡코리아 DEBUG] 첫 10개 공고 샘플:")
                     for i, (t, c) in enumerate(debug_sample):
-                        print(f"  {i+1}. 제목: '{t}' | 회사: '{c}'")
+                        logger.debug(f"  {i+1}. 제목: '{t}' | 회사: '{c}'")
                 
                 # 중복 제거: job_id 기반으로 체크 (회사명 없어도 문제없도록)
                 seen_keys = set()
@@ -1366,17 +1385,17 @@ class WebCrawlerService:
                         duplicate_count += 1
 
                 all_job_listings = unique_listings
-                print(f"[잡코리아] 중복 제거: {duplicate_count}개 중복, {len(all_job_listings)}개 고유")
+                logger.info(f"[잡코리아] 중복 제거: {duplicate_count}개 중복, {len(all_job_listings)}개 고유")
                 
                 # 디버깅: job_id 확인
                 if all_job_listings:
                     job_ids_sample = [(job.get("id", "NO_ID"), job.get("title", "NO_TITLE")[:30]) for job in all_job_listings[:5]]
-                    print(f"[잡코리아] 첫 5개 job_id 샘플: {job_ids_sample}")
+                    logger.debug(f"[잡코리아] 첫 5개 job_id 샘플: {job_ids_sample}")
                 
 
                     # 각 공고의 상세 정보 가져오기 (모든 공고)
                     total_jobs = len(all_job_listings)
-                    print(f"[잡코리아] 전체 {total_jobs}개 공고의 상세 정보 가져오기...")
+                    logger.info(f"[잡코리아] 전체 {total_jobs}개 공고의 상세 정보 가져오기...")
 
                     for i, job in enumerate(all_job_listings):
                         job_url = job.get("url", "")
@@ -1402,9 +1421,9 @@ class WebCrawlerService:
                                     job["preferred_majors"] = detail_info["preferred_majors"]
                                 if detail_info.get("core_competencies"):
                                     job["core_competencies"] = detail_info["core_competencies"]
-                                print(f"[잡코리아] ({i+1}/{total_jobs}) {job.get('title', '')[:30]}... 상세 정보 추가 완료")
+                                logger.debug(f"[잡코리아] ({i+1}/{total_jobs}) {job.get('title', '')[:30]}... 상세 정보 추가 완료")
 
-                    print(f"[잡코리아] 상세 정보 가져오기 완료")
+                    logger.info(f"[잡코리아] 상세 정보 가져오기 완료")
 
                 result = {
                     "success": True,
@@ -1424,13 +1443,14 @@ class WebCrawlerService:
                             site_name="jobkorea",
                             site_url="https://www.jobkorea.co.kr",
                             job_listings=all_job_listings,
-                            search_keyword=search_keyword
+                            search_keyword=search_keyword,
+                            inserted=result.setdefault("newJobListings", [])
                         )
-                        print(f"[잡코리아] {saved_count}개의 채용 공고가 데이터베이스에 저장되었습니다.")
+                        logger.info(f"[잡코리아] {saved_count}개의 채용 공고가 데이터베이스에 저장되었습니다.")
                         result["savedToDatabase"] = saved_count
 
                         # 기업정보도 저장
-                        if self.company_service:
+                        if self.company_service and enrich_companies:
                             try:
                                 company_count = await self.company_service.crawl_and_save_companies_from_jobs(
                                     site_name="jobkorea",
@@ -1438,17 +1458,15 @@ class WebCrawlerService:
                                 )
                                 result["savedCompanies"] = company_count
                             except Exception as e:
-                                print(f"[잡코리아] 기업정보 저장 실패: {str(e)}")
+                                logger.error(f"[잡코리아] 기업정보 저장 실패: {str(e)}")
                     except Exception as e:
-                        print(f"[잡코리아] 데이터베이스 저장 실패: {str(e)}")
+                        logger.error(f"[잡코리아] 데이터베이스 저장 실패: {str(e)}")
                         result["databaseError"] = str(e)
                 
                 return result
             
         except Exception as e:
-            import traceback
-            error_detail = f"{str(e)}\n{traceback.format_exc()}"
-            print(f"[잡코리아] 크롤링 실패: {error_detail}")
+            logger.exception(f"[잡코리아] 크롤링 실패: {str(e)}")
             return {
                 "success": False,
                 "error": str(e),
@@ -1459,7 +1477,8 @@ class WebCrawlerService:
         self,
         site_url: str,
         search_keyword: Optional[str],
-        max_results: int
+        max_results: int,
+        enrich_companies: bool = True
     ) -> Dict:
         """사람인 크롤링 - 채용공고 페이지 크롤링, 페이지네이션 지원"""
         try:
@@ -1471,7 +1490,7 @@ class WebCrawlerService:
                 # 검색어 없으면 전체 채용 공고 페이지
                 base_search_url = "https://www.saramin.co.kr/zf_user/jobs/list/domestic"
             
-            print(f"[사람인] 크롤링 시작: {base_search_url}, 키워드: {search_keyword}, max_results: {max_results}")
+            logger.info(f"[사람인] 크롤링 시작: {base_search_url}, 키워드: {search_keyword}, max_results: {max_results}")
             
             all_job_listings = []
             page = 1
@@ -1480,7 +1499,9 @@ class WebCrawlerService:
             # 타임아웃을 더 길게 설정하고 재시도 로직 추가
             timeout = httpx.Timeout(60.0, connect=30.0)  # 전체 60초, 연결 30초
             
-            async with httpx.AsyncClient(timeout=timeout, headers=self.headers, follow_redirects=True) as client:
+            async with httpx.AsyncClient(
+                timeout=timeout, headers=self.headers, follow_redirects=True, transport=_fetch_transport("saramin")
+            ) as client:
                 while page <= max_pages:
                     # 페이지 URL 생성
                     if "?" in base_search_url:
@@ -1503,19 +1524,19 @@ class WebCrawlerService:
                             retry_count += 1
                             if retry_count < max_retries:
                                 wait_time = retry_count * 2  # 재시도마다 대기 시간 증가
-                                print(f"[사람인] 페이지 {page} 연결 실패 (재시도 {retry_count}/{max_retries}): {str(e)}")
+                                logger.warning(f"[사람인] 페이지 {page} 연결 실패 (재시도 {retry_count}/{max_retries}): {str(e)}")
                                 await asyncio.sleep(wait_time)
                             else:
-                                print(f"[사람인] 페이지 {page} 연결 최종 실패: {str(e)}")
+                                logger.error(f"[사람인] 페이지 {page} 연결 최종 실패: {str(e)}")
                                 raise e
                     
                     if not response:
                         break
                     
-                    print(f"[사람인] 페이지 {page} HTTP 응답 코드: {response.status_code}")
+                    logger.debug(f"[사람인] 페이지 {page} HTTP 응답 코드: {response.status_code}")
                     
                     if response.status_code != 200:
-                        print(f"[사람인] 페이지 {page} 접근 실패: HTTP {response.status_code}")
+                        logger.error(f"[사람인] 페이지 {page} 접근 실패: HTTP {response.status_code}")
                         break
                     
                     html = response.text
@@ -1549,7 +1570,7 @@ class WebCrawlerService:
                             if parent and parent not in job_items:
                                 job_items.append(parent)
                     
-                    print(f"[사람인] 페이지 {page} 발견된 공고 아이템 수: {len(job_items)}")
+                    logger.debug(f"[사람인] 페이지 {page} 발견된 공고 아이템 수: {len(job_items)}")
                     
                     if not job_items:
                         # 공고가 없으면 마지막 페이지
@@ -1766,12 +1787,12 @@ class WebCrawlerService:
                                 
                                 # 디버깅: URL 추출 확인
                                 if not job_url or job_url == search_url:
-                                    print(f"[사람인] URL 추출 실패 - 제목: {title[:30]}..., URL: {final_url}")
+                                    logger.warning(f"[사람인] URL 추출 실패 - 제목: {title[:30]}..., URL: {final_url}")
                         except Exception as e:
-                            print(f"[사람인] 페이지 {page} 공고 파싱 실패: {str(e)}")
+                            logger.warning(f"[사람인] 페이지 {page} 공고 파싱 실패: {str(e)}")
                             continue
                     
-                    print(f"[사람인] 페이지 {page} 파싱된 공고 수: {len(page_job_listings)}")
+                    logger.debug(f"[사람인] 페이지 {page} 파싱된 공고 수: {len(page_job_listings)}")
                     all_job_listings.extend(page_job_listings)
                     
                     # max_results 제한이 있으면 확인
@@ -1781,7 +1802,7 @@ class WebCrawlerService:
                     
                     # 이번 페이지에 공고가 없으면 종료
                     if len(page_job_listings) == 0:
-                        print(f"[사람인] 페이지 {page}에 파싱된 공고가 없어 종료")
+                        logger.info(f"[사람인] 페이지 {page}에 파싱된 공고가 없어 종료")
                         break
                     
                     # 다음 페이지가 있는지 확인 (페이지네이션 링크 확인)
@@ -1810,17 +1831,17 @@ class WebCrawlerService:
                                     has_next_page = False
                     
                     if not has_next_page:
-                        print(f"[사람인] 다음 페이지가 없어 종료 (현재 페이지: {page})")
+                        logger.info(f"[사람인] 다음 페이지가 없어 종료 (현재 페이지: {page})")
                         break
                     
                     page += 1
                 
-                print(f"[사람인] 총 파싱된 공고 수: {len(all_job_listings)} (페이지: {page})")
+                logger.info(f"[사람인] 총 파싱된 공고 수: {len(all_job_listings)} (페이지: {page})")
                 
 
                 # 각 공고의 상세 정보 가져오기 (모든 공고)
                 total_jobs = len(all_job_listings)
-                print(f"[사람인] 전체 {total_jobs}개 공고의 상세 정보 가져오기...")
+                logger.info(f"[사람인] 전체 {total_jobs}개 공고의 상세 정보 가져오기...")
 
                 for i, job in enumerate(all_job_listings):
                     job_url = job.get("url", "")
@@ -1848,9 +1869,9 @@ class WebCrawlerService:
                                 job["preferred_majors"] = detail_info["preferred_majors"]
                             if detail_info.get("core_competencies"):
                                 job["core_competencies"] = detail_info["core_competencies"]
-                            print(f"[사람인] ({i+1}/{total_jobs}) {job.get('title', '')[:30]}... 상세 정보 추가 완료 (지원자: {detail_info.get('applicant_count', 0)}명)")
+                            logger.debug(f"[사람인] ({i+1}/{total_jobs}) {job.get('title', '')[:30]}... 상세 정보 추가 완료 (지원자: {detail_info.get('applicant_count', 0)}명)")
 
-                print(f"[사람인] 상세 정보 가져오기 완료")
+                logger.info(f"[사람인] 상세 정보 가져오기 완료")
 
                 result = {
                     "success": True,
@@ -1870,36 +1891,33 @@ class WebCrawlerService:
                             site_name="saramin",
                             site_url="https://www.saramin.co.kr",
                             job_listings=all_job_listings,
-                            search_keyword=search_keyword
+                            search_keyword=search_keyword,
+                            inserted=result.setdefault("newJobListings", [])
                         )
-                        print(f"[사람인] {saved_count}개의 채용 공고가 데이터베이스에 저장되었습니다.")
+                        logger.info(f"[사람인] {saved_count}개의 채용 공고가 데이터베이스에 저장되었습니다.")
                         result["savedToDatabase"] = saved_count
 
                         # 기업정보도 저장
-                        print(f"[사람인] company_service 존재 여부: {self.company_service is not None}")
-                        if self.company_service:
+                        logger.debug(f"[사람인] company_service 존재 여부: {self.company_service is not None}")
+                        if self.company_service and enrich_companies:
                             try:
-                                print(f"[사람인] 기업정보 추출 시작... (job_listings: {len(all_job_listings)}개)")
+                                logger.info(f"[사람인] 기업정보 추출 시작... (job_listings: {len(all_job_listings)}개)")
                                 company_count = await self.company_service.crawl_and_save_companies_from_jobs(
                                     site_name="saramin",
                                     job_listings=all_job_listings
                                 )
-                                print(f"[사람인] {company_count}개 기업 정보 저장 완료")
+                                logger.info(f"[사람인] {company_count}개 기업 정보 저장 완료")
                                 result["savedCompanies"] = company_count
                             except Exception as e:
-                                import traceback
-                                print(f"[사람인] 기업정보 저장 실패: {str(e)}")
-                                print(f"[사람인] Traceback: {traceback.format_exc()}")
+                                logger.exception(f"[사람인] 기업정보 저장 실패: {str(e)}")
                     except Exception as e:
-                        print(f"[사람인] 데이터베이스 저장 실패: {str(e)}")
+                        logger.error(f"[사람인] 데이터베이스 저장 실패: {str(e)}")
                         result["databaseError"] = str(e)
 
                 return result
             
         except Exception as e:
-            import traceback
-            error_detail = f"{str(e)}\n{traceback.format_exc()}"
-            print(f"[사람인] 크롤링 실패: {error_detail}")
+            logger.exception(f"[사람인] 크롤링 실패: {str(e)}")
             return {
                 "success": False,
                 "error": str(e),
@@ -0,0 +1,169 @@
+"""
+에이전트 실행기 테스트 (Redis 없이 인메모리 태스크 저장소 대역으로 실행)
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.agent_executor import AgentExecutor, OVERFLOW_REJECT
+
+
+class StubTaskStore:
+    """AgentTaskStore 대역"""
+
+    def __init__(self):
+        self.statuses = {}
+        self.errors = {}
+
+    def set_skipped(self, task_id, reason=None):
+        self.statuses[task_id] = "skipped"
+        self.errors[task_id] = reason
+
+    def set_failed(self, task_id, error):
+        self.statuses[task_id] = "failed"
+        self.errors[task_id] = error
+
+
+def wait_until(condition, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestAgentExecutor(unittest.TestCase):
+
+    def setUp(self):
+        self.store = StubTaskStore()
+        self.executors = []
+
+    def tearDown(self):
+        for executor in self.executors:
+            executor.stop()
+
+    def make_executor(self, **kwargs):
+        executor = AgentExecutor(task_store=self.store, **kwargs)
+        self.executors.append(executor)
+        return executor
+
+    def test_concurrency_is_bounded(self):
+        executor = self.make_executor(max_workers=2, max_queue=10)
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0, "done": 0}
+
+        async def job():
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            await asyncio.sleep(0.05)
+            with lock:
+                state["running"] -= 1
+                state["done"] += 1
+
+        for i in range(6):
+            self.assertEqual(executor.submit(f"t{i}", f"user{i}", job), "queued")
+
+        self.assertTrue(wait_until(lambda: state["done"] == 6))
+        self.assertEqual(state["peak"], 2)
+        self.assertEqual(executor.stats()["completed"], 6)
+
+    def test_newer_message_cancels_previous_task(self):
+        executor = self.make_executor(max_workers=1, max_queue=10)
+        started = threading.Event()
+        finished = []
+
+        async def slow():
+            started.set()
+            await asyncio.sleep(5)
+            finished.append("old")
+
+        async def fast():
+            finished.append("new")
+
+        executor.submit("old", "user1", slow)
+        self.assertTrue(started.wait(2))
+        executor.submit("new", "user1", fast)
+
+        self.assertTrue(wait_until(lambda: finished == ["new"]))
+        self.assertEqual(self.store.statuses.get("old"), "skipped")
+        self.assertNotIn("new", self.store.statuses)
+        self.assertEqual(executor.stats()["superseded"], 1)
+
+    def test_overflow_policies(self):
+        gate = threading.Event()
+
+        async def blocked():
+            while not gate.is_set():
+                await asyncio.sleep(0.01)
+
+        dropping = self.make_executor(max_workers=1, max_queue=1)
+        dropping.submit("running", "a", blocked)
+        self.assertTrue(wait_until(lambda: dropping.stats()["running"] == 1))
+        dropping.submit("queued", "b", blocked)
+        self.assertEqual(dropping.submit("newest", "c", blocked), "queued")
+        self.assertEqual(self.store.statuses.get("queued"), "skipped")
+
+        rejecting = self.make_executor(max_workers=1, max_queue=1, overflow_policy=OVERFLOW_REJECT)
+        rejecting.submit("r-running", "a", blocked)
+        self.assertTrue(wait_until(lambda: rejecting.stats()["running"] == 1))
+        rejecting.submit("r-queued", "b", blocked)
+        self.assertEqual(rejecting.submit("r-newest", "c", blocked), "rejected")
+        self.assertEqual(self.store.statuses.get("r-newest"), "skipped")
+        self.assertNotIn("r-queued", self.store.statuses)
+
+        gate.set()
+
+    def test_failures_and_timeouts_are_recorded(self):
+        executor = self.make_executor(max_workers=2, task_timeout=0.1)
+
+        async def boom():
+            raise RuntimeError("tool error")
+
+        async def hang():
+            await asyncio.sleep(5)
+
+        executor.submit("boom", "a", boom)
+        executor.submit("hang", "b", hang)
+
+        self.assertTrue(wait_until(lambda: len(self.store.statuses) == 2))
+        self.assertEqual(self.store.statuses["boom"], "failed")
+        self.assertIn("tool error", self.store.errors["boom"])
+        self.assertEqual(self.store.statuses["hang"], "failed")
+        self.assertEqual(executor.stats()["timed_out"], 1)
+
+    def test_slow_task_store_does_not_block_other_agents(self):
+        class SlowTaskStore(StubTaskStore):
+            def set_failed(self, task_id, error):
+                time.sleep(0.5)  # 느린 동기 Redis 쓰기
+                super().set_failed(task_id, error)
+
+        self.store = SlowTaskStore()
+        executor = self.make_executor(max_workers=2, max_queue=10)
+        elapsed = []
+
+        async def broken():
+            raise RuntimeError("boom")
+
+        async def ticking():
+            started = time.monotonic()
+            for _ in range(10):
+                await asyncio.sleep(0.02)
+            elapsed.append(time.monotonic() - started)
+
+        executor.submit("t1", "user1", ticking)
+        time.sleep(0.05)
+        executor.submit("t2", "user2", broken)
+
+        self.assertTrue(wait_until(lambda: elapsed and self.store.statuses.get("t2") == "failed"))
+        self.assertLess(elapsed[0], 0.45)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+공유 LLM 클라이언트 레지스트리 / 에이전트 노드 지표 테스트 (실제 API 호출 없음)
+"""
+import asyncio
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+
+from services.common.llm_clients import close_llm_clients, get_chat_model
+from services.agents import career_agent
+from services.agents.node_metrics import AgentNodeMetrics
+from services.agents.prompts import REACT_SYSTEM_PROMPT
+
+
+class FakeLLM:
+    """ChatOpenAI 대역 - 받은 메시지 기록"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def ainvoke(self, messages):
+        self.calls.append(messages)
+        return SimpleNamespace(
+            content='{"thought": "도구 불필요", "action": "FINISH"}',
+            response_metadata={"token_usage": {
+                "prompt_tokens": 1200,
+                "completion_tokens": 30,
+                "prompt_tokens_details": {"cached_tokens": 1024},
+            }},
+        )
+
+
+class TestAgentLLMRegistry(unittest.TestCase):
+
+    def tearDown(self):
+        close_llm_clients()
+
+    def test_models_are_shared_per_loop(self):
+        sync_llm = get_chat_model(temperature=0)
+        self.assertIs(get_chat_model(temperature=0), sync_llm)
+        self.assertIsNot(get_chat_model(temperature=0.7), sync_llm)
+
+        async def in_loop():
+            first = get_chat_model(temperature=0)
+            self.assertIs(get_chat_model(temperature=0), first)
+            return first
+
+        loop_a, loop_b = asyncio.run(in_loop()), asyncio.run(in_loop())
+        self.assertIsNot(loop_a, loop_b)
+        self.assertIsNot(loop_a.http_async_client, loop_b.http_async_client)
+        self.assertIs(loop_a.http_client, sync_llm.http_client)
+
+    def test_reason_node_uses_static_prefix_and_records_metrics(self):
+        fake = FakeLLM()
+        metrics = AgentNodeMetrics()
+        state = {
+            "messages": [{"role": "user", "content": "데이터 분석가가 되고 싶어"}],
+            "tool_history": [],
+            "current_step": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "total_tokens": 0,
+        }
+
+        with patch.object(career_agent, "get_llm", return_value=fake), \
+                patch.object(career_agent, "get_agent_node_metrics", return_value=metrics):
+            result = asyncio.run(career_agent.reason_node(state))
+            asyncio.run(career_agent.reason_node({**state, "current_step": 1}))
+
+        self.assertEqual(result["action"], "FINISH")
+        self.assertEqual(result["total_tokens"], 1230)
+
+        # 두 스텝 모두 같은 시스템 메시지로 시작 (동적 내용은 뒤쪽에만)
+        first, second = fake.calls
+        self.assertEqual(first[0].content, REACT_SYSTEM_PROMPT)
+        self.assertIs(first[0], second[0])
+        self.assertNotIn(REACT_SYSTEM_PROMPT, first[1].content)
+
+        snapshot = metrics.snapshot()["reason"]
+        self.assertEqual(snapshot["calls"], 2)
+        self.assertEqual(snapshot["prompt_tokens"], 2400)
+        self.assertAlmostEqual(snapshot["prompt_cache_ratio"], 0.853, places=3)
+
+
+if __name__ == "__main__":
+    unittest.main()
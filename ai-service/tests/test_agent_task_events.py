@@ -0,0 +1,79 @@
+"""
+에이전트 태스크 이벤트 스트림 테스트 (Redis 없이 인메모리 모드로 실행)
+"""
+import asyncio
+import os
+import sys
+import threading
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import services.agent_task_store as agent_task_store
+from services.agent_task_store import AgentTaskStore
+from services.agents.events import bind_agent_task, emit_step, unbind_agent_task
+
+
+class TestAgentTaskEvents(unittest.TestCase):
+
+    def setUp(self):
+        self.store = AgentTaskStore(use_redis=False)
+        # emit_step이 사용하는 싱글톤을 테스트 저장소로 교체
+        self._original_store = agent_task_store._agent_task_store
+        agent_task_store._agent_task_store = self.store
+        self.addCleanup(setattr, agent_task_store, "_agent_task_store", self._original_store)
+        self.task_id = self.store.create_task(session_id="s1", user_id=1)
+
+    async def collect(self, start=0):
+        events = []
+        async for item in self.store.stream_events(self.task_id, start=start, heartbeat_seconds=0.05, timeout_seconds=5):
+            if item is not None:
+                events.append(item)
+        return events
+
+    def test_streams_steps_and_transitions_from_another_thread(self):
+        def agent():
+            # 에이전트 실행기 스레드에서 발행되는 이벤트
+            self.store.set_running(self.task_id)
+            async def steps():
+                token = bind_agent_task(self.task_id)
+                try:
+                    await emit_step("analyze", "질문 분석", "in_progress")
+                    await emit_step("tool", "웹 검색", "completed", tool="web_search", hasData=True)
+                finally:
+                    unbind_agent_task(token)
+
+            asyncio.run(steps())
+            self.store.set_completed(self.task_id, {"used_agent": True})
+
+        async def scenario():
+            collector = asyncio.create_task(self.collect())
+            await asyncio.sleep(0.1)
+            threading.Thread(target=agent).start()
+            return await collector
+
+        events = asyncio.run(scenario())
+
+        self.assertEqual([seq for seq, _ in events], [1, 2, 3, 4, 5])
+        self.assertEqual(
+            [event.get("status") or event["step"]["step"] for _, event in events],
+            ["pending", "running", "analyze", "tool", "completed"],
+        )
+        self.assertEqual(events[3][1]["step"]["tool"], "web_search")
+
+    def test_replays_from_last_event_id(self):
+        self.store.set_running(self.task_id)
+        self.store.set_skipped(self.task_id, reason="새 메시지로 대체됨")
+
+        events = asyncio.run(self.collect(start=1))
+
+        self.assertEqual([seq for seq, _ in events], [2, 3])
+        self.assertEqual(events[-1][1]["error"], "새 메시지로 대체됨")
+
+    def test_emit_without_task_is_ignored(self):
+        asyncio.run(emit_step("analyze", "질문 분석", "in_progress"))
+        self.assertEqual(len(self.store.get_events(self.task_id)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+에이전트 태스크 저장소 인메모리 모드 테스트 (TTL 만료 / 최대 개수 / 필드 단위 갱신)
+"""
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.agent_task_store import AgentTaskStore, MemoryTTLStore
+
+
+class TestMemoryTTLStore(unittest.TestCase):
+
+    def test_entries_expire_after_ttl(self):
+        store = MemoryTTLStore(max_entries=10, ttl_seconds=0.05)
+        store.update("a", lambda data: data.update(status="pending"), create=dict)
+
+        self.assertEqual(store.get("a", copy=dict), {"status": "pending"})
+        time.sleep(0.08)
+        self.assertIsNone(store.get("a"))
+
+        # 만료된 키는 create 없이 되살아나지 않음
+        self.assertFalse(store.update("a", lambda data: data.update(status="running")))
+
+    def test_update_extends_ttl_and_size_is_bounded(self):
+        store = MemoryTTLStore(max_entries=3, ttl_seconds=0.1)
+        for key in ("a", "b", "c"):
+            store.update(key, lambda data: None, create=dict)
+        time.sleep(0.06)
+        store.update("a", lambda data: data.update(touched=True))
+        store.update("d", lambda data: None, create=dict)
+
+        # 가장 오래 갱신되지 않은 b가 제거됨
+        self.assertIsNone(store.get("b"))
+        self.assertEqual(len(store), 3)
+
+        time.sleep(0.06)
+        store.update("e", lambda data: None, create=dict)
+        # c는 만료되어 정리되고, 갱신된 a는 남음
+        self.assertIsNone(store.get("c"))
+        self.assertEqual(store.get("a"), {"touched": True})
+
+
+class TestAgentTaskStoreMemory(unittest.TestCase):
+
+    def setUp(self):
+        self.store = AgentTaskStore(use_redis=False)
+
+    def test_field_updates_keep_other_fields(self):
+        task_id = self.store.create_task(session_id="s1", user_id=7)
+        self.store.set_running(task_id)
+        self.store.set_completed(task_id, {"answer": "ok"})
+
+        task = self.store.get_task(task_id)
+        self.assertEqual(task["status"], "completed")
+        self.assertEqual(task["user_id"], 7)
+        self.assertEqual(task["result"], {"answer": "ok"})
+        self.assertIn("started_at", task)
+
+        # 반환값을 수정해도 저장된 태스크는 바뀌지 않음
+        task["status"] = "failed"
+        self.assertEqual(self.store.get_task(task_id)["status"], "completed")
+
+    def test_concurrent_updates_do_not_lose_fields(self):
+        task_id = self.store.create_task(session_id="s1")
+
+        def update(i):
+            self.store._update_task(task_id, {f"field_{i}": i})
+
+        threads = [threading.Thread(target=update, args=(i,)) for i in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        task = self.store.get_task(task_id)
+        self.assertTrue(all(task[f"field_{i}"] == i for i in range(20)))
+
+    def test_unknown_task_is_not_created_by_status_change(self):
+        self.store.set_failed("missing", "boom")
+
+        self.assertIsNone(self.store.get_task("missing"))
+        self.assertEqual(self.store.get_events("missing"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
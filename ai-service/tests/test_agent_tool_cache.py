@@ -0,0 +1,126 @@
+"""
+에이전트 외부 도구 결과 캐시 테스트 (로컬 스텁 서버로 Serper / 백엔드 API 대체)
+"""
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.agents import career_tools, tool_cache
+from services.agents.tool_cache import ToolResultCache
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serper 검색 / 멘토링 세션 API 스텁 (경로별 호출 수 기록)"""
+
+    hits = {}
+    delay = 0.1
+    fail_search = False
+
+    def _reply(self, status, body):
+        payload = json.dumps(body, ensure_ascii=False).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self):
+        StubHandler.hits[self.path] = StubHandler.hits.get(self.path, 0) + 1
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(StubHandler.delay)
+        if StubHandler.fail_search:
+            self._reply(500, {"error": "down"})
+            return
+        self._reply(200, {"organic": [{"title": "백엔드 연봉", "link": "https://example.com", "snippet": "평균 연봉"}]})
+
+    def do_GET(self):
+        StubHandler.hits[self.path] = StubHandler.hits.get(self.path, 0) + 1
+        time.sleep(StubHandler.delay)
+        self._reply(200, [
+            {"sessionId": 1, "title": "백엔드 커리어 상담", "mentorName": "김멘토", "mentorJob": "백엔드 개발자"},
+            {"sessionId": 2, "title": "디자인 포트폴리오", "mentorName": "이멘토", "mentorJob": "디자이너"},
+        ])
+
+    def log_message(self, *args):
+        pass
+
+
+class TestAgentToolCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        StubHandler.hits = {}
+        StubHandler.fail_search = False
+        self.patches = [
+            patch.object(tool_cache, "_tool_result_cache", ToolResultCache(use_redis=False)),
+            patch.object(career_tools, "SERPER_URL", f"{self.base_url}/search"),
+            patch.object(career_tools, "BACKEND_URL", self.base_url),
+            patch.dict(os.environ, {"SERPER_API_KEY": "test-key"}),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+
+    def test_concurrent_identical_searches_are_coalesced(self):
+        async def run():
+            first = await asyncio.gather(*[
+                career_tools.web_search.ainvoke({"query": "백엔드 개발자 연봉 2025"}) for _ in range(5)
+            ])
+            started = time.monotonic()
+            cached = await career_tools.web_search.ainvoke({"query": "백엔드 개발자 연봉 2025"})
+            return first, cached, time.monotonic() - started
+
+        first, cached, cached_latency = asyncio.run(run())
+
+        self.assertEqual(StubHandler.hits.get("/search"), 1)
+        self.assertTrue(all(r["success"] for r in first))
+        self.assertEqual(cached["results"], first[0]["results"])
+        self.assertEqual(cached["query"], "백엔드 개발자 연봉 2025")
+        self.assertLess(cached_latency, StubHandler.delay)
+        self.assertEqual(tool_cache.get_tool_result_cache().stats()["coalesced"], 4)
+
+    def test_failures_are_not_cached(self):
+        StubHandler.fail_search = True
+
+        async def run():
+            return [await career_tools.web_search.ainvoke({"query": "데이터 분석가 자격증"}) for _ in range(2)]
+
+        results = asyncio.run(run())
+        self.assertTrue(all(not r["success"] for r in results))
+        self.assertEqual(StubHandler.hits.get("/search"), 2)
+
+    def test_mentoring_session_list_shared_across_queries(self):
+        async def run():
+            backend = await career_tools.search_mentoring_sessions.ainvoke({"career_interest": "백엔드"})
+            design = await career_tools.search_mentoring_sessions.ainvoke({"career_interest": "디자이너"})
+            return backend, design
+
+        backend, design = asyncio.run(run())
+        self.assertEqual([s["sessionId"] for s in backend["sessions"]], [1])
+        self.assertEqual([s["sessionId"] for s in design["sessions"]], [2])
+        self.assertEqual(StubHandler.hits.get("/api/mentoring-sessions/available"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+답안 일괄 채점 테스트 (OpenAI 대역 사용)
+"""
+import asyncio
+import json
+import os
+import re
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+
+from services.learning.answer_evaluator import AnswerEvaluatorService, GradeCache, normalize_answer
+
+
+class FakeCompletions:
+    """chat.completions 대역 - 일괄 프롬프트면 답안 ID마다 7점, 단건이면 5점"""
+
+    def __init__(self, fail=False):
+        self.calls = 0
+        self.fail = fail
+
+    async def create(self, model, messages, **kwargs):
+        self.calls += 1
+        if self.fail:
+            raise Exception("rate limit")
+        prompt = messages[-1]["content"]
+        ids = re.findall(r"### 답안 ID: (\d+)", prompt)
+        if ids:
+            body = {"results": [{"id": int(i), "score": 7, "feedback": "좋아요"} for i in ids]}
+        else:
+            body = {"score": 5, "feedback": "보통"}
+        content = json.dumps(body, ensure_ascii=False)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def answer(question, user_answer, question_type="SCENARIO", correct="모범답안"):
+    return {
+        "question_type": question_type,
+        "question_text": question,
+        "user_answer": user_answer,
+        "correct_answer": correct,
+        "max_score": 10,
+    }
+
+
+class TestAnswerEvaluatorBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.completions = FakeCompletions()
+        self.service = AnswerEvaluatorService(grade_cache=GradeCache())
+        self.service.client = SimpleNamespace(chat=SimpleNamespace(completions=self.completions))
+
+    def test_quiz_graded_in_one_call_with_short_circuits(self):
+        quiz = [
+            answer("객관식", "B", question_type="MCQ", correct="b"),
+            answer("빈 답안", "   "),
+            answer("모범답안과 같음", "  REST API는 자원 중심 설계. ", correct="REST API는 자원 중심 설계"),
+            answer("시나리오 1", "캐시를 먼저 확인합니다"),
+            answer("시나리오 2", "인덱스를 추가합니다"),
+        ]
+
+        results = asyncio.run(self.service.evaluate_answers(quiz))
+
+        self.assertEqual(self.completions.calls, 1)
+        self.assertEqual([r["source"] for r in results], ["rule", "rule", "rule", "llm", "llm"])
+        self.assertEqual([r["score"] for r in results], [10, 0, 10, 7, 7])
+
+        # 같은 답안 재제출 (공백/대소문자 차이)은 캐시에서 채점
+        again = asyncio.run(self.service.evaluate_answers([answer("시나리오 1", "캐시를  먼저 확인합니다.")]))
+        self.assertEqual(self.completions.calls, 1)
+        self.assertEqual(again[0]["source"], "cache")
+        self.assertEqual(again[0]["score"], 7)
+
+    def test_single_answer_keeps_existing_response_shape(self):
+        result = asyncio.run(self.service.evaluate_answer("CODING", "정렬 구현", "퀵정렬 사용", "병합정렬", 10))
+        self.assertEqual(result, {"score": 5, "feedback": "보통"})
+
+    def test_failed_grades_are_not_cached(self):
+        self.completions.fail = True
+        quiz = [answer("시나리오 1", "답안 A"), answer("시나리오 2", "답안 B")]
+
+        first = asyncio.run(self.service.evaluate_answers(quiz))
+        self.assertEqual([r["source"] for r in first], ["error", "error"])
+
+        self.completions.fail = False
+        second = asyncio.run(self.service.evaluate_answers(quiz))
+        self.assertEqual([r["source"] for r in second], ["llm", "llm"])
+        self.assertEqual(self.completions.calls, 2)
+
+    def test_normalize_answer(self):
+        self.assertEqual(normalize_answer("  Ｈｅｌｌｏ   World! "), "hello world")
+
+
+class TestEvaluateAnswersEndpoint(unittest.TestCase):
+    """실제로 서비스되는 앱(main.app)의 POST /api/learning/evaluate-answers"""
+
+    def setUp(self):
+        import main
+        from fastapi.testclient import TestClient
+        from routers import learning
+
+        self.completions = FakeCompletions()
+        service = AnswerEvaluatorService(grade_cache=GradeCache())
+        service.client = SimpleNamespace(chat=SimpleNamespace(completions=self.completions))
+        patcher = mock.patch.object(learning, "answer_evaluator", service)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = TestClient(main.app)
+
+    def test_batch_endpoint_grades_quiz_in_one_call(self):
+        item = {"questionType": "SCENARIO", "correctAnswer": "모범답안", "maxScore": 10}
+        response = self.client.post("/api/learning/evaluate-answers", json={"answers": [
+            {**item, "questionType": "MCQ", "question": "객관식", "correctAnswer": "b", "userAnswer": "B"},
+            {**item, "question": "시나리오 1", "userAnswer": "캐시를 먼저 확인합니다"},
+            {**item, "question": "시나리오 2", "userAnswer": "인덱스를 추가합니다"},
+        ]})
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual([r["source"] for r in body["results"]], ["rule", "llm", "llm"])
+        self.assertEqual((body["totalScore"], body["maxScore"], body["llmGraded"]), (24, 30, 2))
+        self.assertEqual(self.completions.calls, 1)
+
+    def test_empty_batch_is_rejected(self):
+        response = self.client.post("/api/learning/evaluate-answers", json={"answers": []})
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+챗봇 비서 도구 실행기 테스트 (DB 없이 조회 횟수를 세는 대역으로 실행)
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.agents import career_tools
+from services.chatbot.assistant import tool_executor
+from services.chatbot.assistant.tool_executor import AssistantToolResultCache, ToolExecutor
+from services.chatbot.assistant.tools import career_analysis_tool, recommendation_tool, job_details_tool
+
+
+class CountingDB:
+    """DatabaseService 대역 - 쿼리별 호출 횟수 기록"""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.analysis_queries = 0
+
+    def execute_query(self, query, params=None):
+        if "FROM career_analyses" in query:
+            with self.lock:
+                self.analysis_queries += 1
+            time.sleep(self.delay)
+            return [{
+                "id": 1,
+                "interest_areas": '["IT"]',
+                "personality_type": "INTJ",
+                "recommended_careers": '[{"careerName": "데이터 분석가", "matchScore": 90}]',
+            }]
+        return []
+
+
+class TestAssistantToolExecutor(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = {
+            "get_career_analysis": career_analysis_tool,
+            "get_recommendations": recommendation_tool,
+            "get_job_details": job_details_tool,
+        }
+
+    def test_parallel_calls_share_career_analysis_lookup(self):
+        db = CountingDB()
+        executor = ToolExecutor(self.registry, cache=AssistantToolResultCache(ttl_seconds=0))
+
+        results = executor.execute_many([
+            ("get_career_analysis", {"user_id": 1}),
+            ("get_recommendations", {"user_id": 1}),
+            ("get_job_details", {"user_id": 1}),
+        ], db=db)
+
+        self.assertEqual(db.analysis_queries, 1)
+        self.assertEqual(results[0]["data"]["interest_areas"], ["IT"])
+        self.assertEqual(results[1]["data"]["personality_type"], "INTJ")
+        self.assertEqual(results[2]["data"][0]["job_name"], "데이터 분석가")
+
+    def test_independent_calls_run_concurrently(self):
+        gate = threading.Barrier(2, timeout=2)
+
+        def wait_for_peer(user_id, db=None, **kwargs):
+            gate.wait()  # 순차 실행이면 시간 초과
+            return {"success": True, "data": kwargs}
+
+        tool = SimpleNamespace(execute=wait_for_peer)
+        executor = ToolExecutor({"a": tool, "b": tool}, cache=AssistantToolResultCache(ttl_seconds=0))
+
+        results = executor.execute_many([("a", {"user_id": 1, "x": 1}), ("b", {"user_id": 1, "x": 2})])
+        self.assertEqual([r["data"]["x"] for r in results], [1, 2])
+
+    def test_results_cached_per_user_and_errors_isolated(self):
+        calls = []
+
+        def profile(user_id, db=None, **kwargs):
+            calls.append(user_id)
+            if user_id == 3:
+                raise RuntimeError("db down")
+            return {"success": True, "data": {"user_id": user_id}}
+
+        executor = ToolExecutor({"get_my_profile": SimpleNamespace(execute=profile)}, cache=AssistantToolResultCache())
+
+        executor.execute("get_my_profile", {"user_id": 1})
+        executor.execute("get_my_profile", {"user_id": 1})
+        executor.execute("get_my_profile", {"user_id": 2})
+        self.assertEqual(calls, [1, 2])
+
+        executor.cache.invalidate_user(1)
+        executor.execute("get_my_profile", {"user_id": 1})
+        self.assertEqual(calls, [1, 2, 1])
+
+        results = executor.execute_many([
+            ("get_my_profile", {"user_id": 3}),
+            ("unknown", {"user_id": 3}),
+        ])
+        self.assertIn("db down", results[0]["error"])
+        self.assertIn("Unknown function", results[1]["error"])
+
+    def test_agent_booking_invalidates_cached_bookings(self):
+        calls = []
+
+        def bookings(user_id, db=None, **kwargs):
+            calls.append(user_id)
+            return {"success": True, "data": []}
+
+        class BackendClient:
+            async def post(self, url, json=None):
+                return SimpleNamespace(raise_for_status=lambda: None, json=lambda: {"bookingId": 10})
+
+        with mock.patch.object(tool_executor, "_assistant_tool_cache", AssistantToolResultCache()), \
+                mock.patch.object(career_tools, "get_tool_http_client", BackendClient):
+            executor = ToolExecutor({"get_mentoring_bookings": SimpleNamespace(execute=bookings)})
+            executor.execute("get_mentoring_bookings", {"user_id": 1})
+            executor.execute("get_mentoring_bookings", {"user_id": 1})
+
+            booked = asyncio.run(career_tools.book_mentoring.ainvoke({"session_id": 5, "user_id": 1}))
+            executor.execute("get_mentoring_bookings", {"user_id": 1})
+
+        self.assertTrue(booked["success"])
+        self.assertEqual(calls, [1, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
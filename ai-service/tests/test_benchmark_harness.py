@@ -0,0 +1,134 @@
+"""
+오프라인 E2E 벤치마크 하네스 테스트 (가짜 외부 서비스 / 보고서 형식 / 회귀 비교)
+"""
+import asyncio
+import importlib.util
+import os
+import sys
+import unittest
+
+import httpx
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks import ExternalCalls, FakeLatency, OfflineEnvironment, compare_reports, percentile, run_benchmark
+from benchmarks.fakes import FakeSupabaseClient, FakeSupabaseStore, FakeWeb, bench_responder
+
+
+class FakeWebTest(unittest.TestCase):
+    def setUp(self):
+        self.calls = ExternalCalls()
+        self.web = FakeWeb(self.calls)
+        self.web.install()
+
+    def tearDown(self):
+        self.web.uninstall()
+
+    def test_routes_job_sites_and_blocks_unknown_hosts(self):
+        async def fetch():
+            async with httpx.AsyncClient() as client:
+                first = await client.get("https://www.wanted.co.kr/api/v4/jobs", params={"offset": 0})
+                last = await client.get("https://www.wanted.co.kr/api/v4/jobs", params={"offset": 20})
+                detail = await client.get("https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx=42")
+                unknown = await client.get("https://example.org/")
+                return first, last, detail, unknown
+
+        first, last, detail, unknown = asyncio.run(fetch())
+        self.assertEqual(len(first.json()["data"]), 10)
+        self.assertEqual(last.json()["data"], [])
+        self.assertIn("company-info/view?csn=1042", detail.text)
+        self.assertEqual(unknown.status_code, 503)
+        self.assertEqual(self.calls.snapshot(), {"site.wanted": 2, "site.saramin": 1, "unmocked:example.org": 1})
+
+    def test_sync_client_is_routed_too(self):
+        with httpx.Client() as client:
+            response = client.post("https://google.serper.dev/search", json={"q": "백엔드"})
+        self.assertTrue(response.json()["organic"])
+        self.assertEqual(self.calls.snapshot(), {"serper": 1})
+
+
+class FakeSupabaseTest(unittest.TestCase):
+    def test_query_builder_filters_and_counts_calls(self):
+        store = FakeSupabaseStore({"job_details": [{"job_id": i, "name": f"직업{i}"} for i in range(1, 6)]})
+        client = FakeSupabaseClient(store)
+
+        rows = client.table("job_details").select("job_id").in_("job_id", [2, 4, 9]).execute().data
+        self.assertEqual(rows, [{"job_id": 2}, {"job_id": 4}])
+
+        client.table("job_details").update({"name": "수정"}).eq("job_id", 1).execute()
+        first = client.table("job_details").select("*", count="exact").order("job_id").limit(1).execute()
+        self.assertEqual(first.data[0]["name"], "수정")
+        self.assertEqual(first.count, 5)
+        self.assertEqual(store.calls.snapshot(), {"supabase": 3})
+
+
+class ResponderTest(unittest.TestCase):
+    def test_json_schema_response_matches_schema(self):
+        body = {
+            "messages": [{"role": "user", "content": "분석해줘"}],
+            "response_format": {"type": "json_schema", "json_schema": {"schema": {
+                "type": "object",
+                "properties": {"score": {"type": "integer"}, "tags": {"type": "array"},
+                               "level": {"$ref": "#/$defs/Level"}},
+                "$defs": {"Level": {"enum": ["high", "low"]}},
+            }}},
+        }
+        self.assertEqual(bench_responder(body), '{"score": 50, "tags": [], "level": "high"}')
+
+
+class ReportTest(unittest.TestCase):
+    def test_percentile_nearest_rank(self):
+        values = [float(v) for v in range(1, 101)]
+        self.assertEqual(percentile(values, 0.5), 50.0)
+        self.assertEqual(percentile(values, 0.95), 95.0)
+        self.assertEqual(percentile([], 0.95), 0.0)
+
+    def test_compare_reports_flags_latency_and_call_regressions(self):
+        def report(p95, llm_calls, error_rate=0.0):
+            return {"flows": {"chat": {"latency_ms": {"p95": p95}, "error_rate": error_rate,
+                                       "external_calls_per_request": {"openai.chat": llm_calls}},
+                              "daily_crawl_job": {"skipped": "--no-db"}}}
+
+        self.assertEqual(compare_reports(report(100, 2.0), report(110, 2.0)), [])
+        regressions = compare_reports(report(100, 2.0), report(150, 3.0, error_rate=0.05))
+        self.assertEqual([r["metric"] for r in regressions],
+                         ["latency_ms.p95", "external_calls_per_request.openai.chat", "error_rate"])
+
+
+class RunBenchmarkTest(unittest.TestCase):
+    def test_offline_flows_report_external_calls(self):
+        report = run_benchmark(["chat", "recommendation_pipeline", "recommendations_fast"],
+                               requests=3, concurrency=2, latency=FakeLatency().scaled(0), use_db=False)
+
+        self.assertEqual(report["benchmark"], "e2e")
+        self.assertEqual(report["flows"]["recommendations_fast"], {"skipped": "--no-db"})
+
+        chat = report["flows"]["chat"]
+        self.assertEqual((chat["requests"], chat["errors"]), (3, 0), chat["errors_sample"])
+        self.assertGreaterEqual(chat["external_calls_per_request"]["openai.chat"], 1)
+        self.assertLessEqual(chat["latency_ms"]["p50"], chat["latency_ms"]["p95"])
+
+        pipeline = report["flows"]["recommendation_pipeline"]
+        self.assertEqual(pipeline["errors"], 0, pipeline["errors_sample"])
+        self.assertEqual(pipeline["external_calls_per_request"]["pinecone"], 2.0)
+        self.assertNotIn("unmocked", " ".join(pipeline["external_calls"]))
+
+    def test_environment_restores_patched_symbols(self):
+        import pinecone
+        original = pinecone.Pinecone
+        with OfflineEnvironment(FakeLatency().scaled(0)):
+            self.assertIsNot(pinecone.Pinecone, original)
+        self.assertIs(pinecone.Pinecone, original)
+
+    @unittest.skipUnless(importlib.util.find_spec("pgserver"), "pgserver 미설치")
+    def test_db_flow_with_disposable_postgres(self):
+        report = run_benchmark(["recommendations_fast"], requests=2, concurrency=1,
+                               latency=FakeLatency().scaled(0), users=2, listings=30)
+        result = report["flows"]["recommendations_fast"]
+        self.assertEqual(result["errors"], 0, result["errors_sample"])
+        self.assertEqual(report["database"]["seeded"]["users"], 2)
+        self.assertGreater(result["external_calls_per_request"]["postgres"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+진로 분석 단계 그래프 테스트 (OpenAI / DB 대역 사용)
+"""
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.career_analysis_service import CareerAnalysisService
+from services.openai_service import OpenAIService
+
+
+RESPONSES = {
+    "emotion": {"description": "안정적", "score": 70, "emotionalState": "긍정적"},
+    "personality": {"description": "분석적", "type": "내향적", "strengths": ["끈기"], "growthAreas": []},
+    "interest": {"description": "IT", "areas": [{"name": "개발", "level": 8, "description": "코딩"}]},
+    "comprehensive": "잘하고 있어요",
+    "career_recommendation": [{"careerName": "백엔드 개발자", "description": "", "matchScore": 90, "reasons": []}],
+}
+
+
+class FakeOpenAIService:
+    """OpenAIService 대역 - 분석 유형별 지연 / 실패 설정"""
+
+    extract_json = OpenAIService.extract_json
+
+    def __init__(self, delay=0.2, delays=None, errors=()):
+        self.delay = delay
+        self.delays = delays or {}
+        self.errors = set(errors)
+        self.lock = threading.Lock()
+        self.calls = []
+
+    def get_analysis(self, messages, analysis_type="general"):
+        with self.lock:
+            self.calls.append((analysis_type, time.monotonic()))
+        time.sleep(self.delays.get(analysis_type, self.delay))
+        if analysis_type in self.errors:
+            raise Exception("OpenAI API 호출 실패: rate limit")
+        response = RESPONSES[analysis_type]
+        return response if isinstance(response, str) else json.dumps(response, ensure_ascii=False)
+
+
+class StubDB:
+    def __init__(self):
+        self.saved = []
+
+    def save_career_analysis(self, session_identifier, user_id, analysis_data):
+        self.saved.append(analysis_data)
+        return True
+
+
+class TestCareerAnalysisStages(unittest.TestCase):
+
+    def test_independent_stages_run_concurrently(self):
+        openai = FakeOpenAIService(delay=0.2)
+        db = StubDB()
+        service = CareerAnalysisService(openai, db)
+
+        result = asyncio.run(service.analyze_session("s1", "학생: 코딩이 좋아요"))
+
+        # 순차 실행이면 5 x 0.2초, 그래프 실행이면 2단계 x 0.2초
+        self.assertLess(result["stageTimings"]["total"], 0.7)
+        self.assertFalse(result["partial"])
+        self.assertEqual(result["recommendedCareers"][0]["careerName"], "백엔드 개발자")
+        self.assertEqual(result["emotion"]["score"], 70)
+
+        # 2단계(종합/추천)는 1단계가 모두 끝난 뒤 시작
+        starts = dict(openai.calls)
+        first_level_end = max(starts[t] for t in ("emotion", "personality", "interest")) + 0.2
+        self.assertGreaterEqual(starts["comprehensive"], first_level_end - 0.05)
+
+        self.assertEqual(set(db.saved[0]["stageTimings"]),
+                         {"emotion", "personality", "interest", "comprehensive", "recommendations", "total"})
+
+    def test_failed_or_slow_stage_returns_partial_result(self):
+        openai = FakeOpenAIService(delay=0.05, delays={"interest": 1.0}, errors={"career_recommendation"})
+        db = StubDB()
+        service = CareerAnalysisService(openai, db, stage_timeout=0.3)
+
+        result = asyncio.run(service.analyze_session("s2", "학생: 잘 모르겠어요"))
+
+        self.assertTrue(result["partial"])
+        self.assertEqual(db.saved, [])  # 기본값이 섞인 결과는 실제 분석으로 저장하지 않음
+        self.assertEqual(set(result["failedStages"]), {"interest", "recommendations"})
+        self.assertEqual(result["interest"]["areas"], [])
+        self.assertEqual(result["recommendedCareers"], [])
+        self.assertEqual(result["personality"]["type"], "내향적")
+        self.assertLess(result["stageTimings"]["interest"], 0.5)
+
+    def test_all_stages_failing_raises(self):
+        errors = {"emotion", "personality", "interest", "comprehensive", "career_recommendation"}
+        service = CareerAnalysisService(FakeOpenAIService(delay=0, errors=errors), StubDB())
+
+        with self.assertRaises(Exception):
+            asyncio.run(service.analyze_session("s3", "학생: 안녕하세요"))
+
+
+if __name__ == "__main__":
+    unittest.main()
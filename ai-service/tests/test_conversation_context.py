@@ -0,0 +1,170 @@
+"""
+대화 컨텍스트 관리 테스트 (Redis/OpenAI 없이 인메모리 + 요약 대역으로 실행)
+"""
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.conversation_context import (
+    ConversationContextManager,
+    message_tokens,
+    parse_transcript,
+    select_recent,
+)
+
+
+class StubSummarizer:
+    """LLM 요약 대역: 밀려난 메시지 번호만 이어 붙임"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, summary, evicted):
+        self.calls.append([m["content"] for m in evicted])
+        numbers = [m["content"].split()[1] for m in evicted]
+        return ",".join(([summary] if summary else []) + numbers)
+
+
+def make_history(count):
+    return [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": f"메시지 {i} " + "내용 " * 20}
+        for i in range(count)
+    ]
+
+
+class TestConversationContext(unittest.TestCase):
+
+    def setUp(self):
+        self.summarizer = StubSummarizer()
+        self.manager = ConversationContextManager(summarizer=self.summarizer, use_redis=False)
+        self.budget = message_tokens(make_history(1)[0]) * 6
+
+    def test_short_history_is_sent_as_is(self):
+        history = make_history(4)
+        window = self.manager.build("test", "s1", history, self.budget)
+
+        self.assertEqual(window.messages, history)
+        self.assertEqual(window.summary, "")
+        self.assertEqual(self.summarizer.calls, [])
+
+    def test_long_history_is_windowed_and_summarized_incrementally(self):
+        history = make_history(10)
+        window = self.manager.build("test", "s1", history, self.budget)
+
+        self.assertLessEqual(window.tokens, self.budget)
+        self.assertEqual(window.messages, history[window.dropped:])
+        self.assertTrue(window.summary.startswith("0,1"))
+        self.assertEqual(len(self.summarizer.calls), 1)
+
+        # 다음 턴: 이미 요약한 구간은 다시 요약하지 않음
+        history += make_history(12)[10:]
+        window = self.manager.build("test", "s1", history, self.budget)
+        self.assertEqual(window.messages[-1], history[-1])
+        evicted = [content for call in self.summarizer.calls for content in call]
+        self.assertEqual(len(evicted), len(set(evicted)))
+        self.assertEqual(self.manager.get_summary("test", "s1"), window.summary)
+
+    def test_truncated_history_reuses_stored_summary(self):
+        history = make_history(12)
+        first = self.manager.build("test", "s1", history, self.budget)
+
+        # 라우터가 최근 N개만 조회해도 요약 경계를 찾아 이어서 사용
+        second = self.manager.build("test", "s1", history[4:], self.budget)
+        self.assertEqual(second.summary, first.summary)
+        self.assertEqual(second.messages, first.messages)
+        self.assertEqual(len(self.summarizer.calls), 1)
+
+    def test_boundary_older_than_fetched_window_uses_message_ids(self):
+        history = [dict(m, id=100 + i) for i, m in enumerate(make_history(12))]
+        first = self.manager.build("test", "s1", history, self.budget)
+        self.assertNotIn("id", first.messages[0])
+
+        # 조회 구간이 요약한 마지막 메시지부터 시작 → 해시로는 경계를 못 찾음
+        fetched = history[first.dropped - 1:]
+        second = self.manager.build("test", "s1", fetched, self.budget)
+        self.assertEqual(second.summary, first.summary)
+        self.assertEqual(second.messages, first.messages)
+        self.assertEqual(len(self.summarizer.calls), 1)
+
+        # 경계가 조회 구간보다 오래됨 → 조회한 메시지는 모두 미요약
+        self.assertEqual(self.manager._find_boundary(history[-2:], [110, 111], {"boundary_id": "105"}), 0)
+
+    def test_unknown_boundary_discards_stored_summary(self):
+        self.manager.build("test", "s1", make_history(12), self.budget)
+        self.assertTrue(self.manager.get_summary("test", "s1"))
+
+        # 같은 세션 키로 전혀 다른 대화가 들어옴 → 이전 요약을 붙이지 않음
+        other = [dict(m, content="다른 " + m["content"]) for m in make_history(4)]
+        window = self.manager.build("test", "s1", other, self.budget)
+        self.assertEqual(window.summary, "")
+        self.assertEqual(window.messages, other)
+
+    def test_non_numeric_message_ids_fall_back_to_fingerprint(self):
+        history = [dict(m, id=f"msg-{i:02d}-uuid") for i, m in enumerate(make_history(12))]
+        first = self.manager.build("test", "s1", history, self.budget)
+
+        second = self.manager.build("test", "s1", history[4:], self.budget)
+        self.assertEqual(second.summary, first.summary)
+        self.assertEqual(second.messages, first.messages)
+        self.assertEqual(len(self.summarizer.calls), 1)
+
+    def test_summarizer_failure_keeps_recent_window(self):
+        def failing(summary, evicted):
+            raise RuntimeError("LLM down")
+
+        manager = ConversationContextManager(summarizer=failing, use_redis=False)
+        window = manager.build("test", "s1", make_history(10), self.budget)
+
+        self.assertEqual(window.summary, "")
+        self.assertLessEqual(window.tokens, self.budget)
+        self.assertEqual(manager.get_summary("test", "s1"), "")
+
+    def test_transcript_round_trip(self):
+        messages = parse_transcript("학생: 안녕하세요\n\n상담사: 반가워요\n여러 줄 답변\n\n학생: 네")
+        self.assertEqual([m["role"] for m in messages], ["user", "assistant", "user"])
+        self.assertEqual(messages[1]["content"], "반가워요\n여러 줄 답변")
+
+        recent = select_recent(messages, max_tokens=0, min_messages=1)
+        self.assertEqual(recent, messages[-1:])
+
+
+class TestIdentityContextKeying(unittest.TestCase):
+    """정체성 분석 요약은 사용자가 아니라 상담 세션 단위로 유지되는지"""
+
+    def setUp(self):
+        os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+        import main
+        from dependencies import get_identity_service
+        from fastapi.testclient import TestClient
+
+        self.calls = []
+        calls = self.calls
+
+        class FakeIdentityService:
+            async def assess_clarity(self, conversation_history, session_id=None):
+                calls.append(session_id)
+                return {"clarity": 10, "reason": ""}
+
+            async def assess_stage_progress(self, conversation_history, current_stage, session_id=None):
+                calls.append(session_id)
+                return {"readyToProgress": False, "reason": "", "recommendation": ""}
+
+        main.app.dependency_overrides[get_identity_service] = lambda: FakeIdentityService()
+        self.addCleanup(main.app.dependency_overrides.pop, get_identity_service, None)
+        self.client = TestClient(main.app)
+
+    def test_context_is_keyed_by_session_not_user(self):
+        body = {"conversationHistory": "학생: 안녕하세요", "userId": "u1", "sessionId": "s-42"}
+        self.assertEqual(self.client.post("/api/identity/clarity", json=body).status_code, 200)
+        self.assertEqual(self.client.post("/api/identity/progress", json={**body, "currentStage": "PRESENT"}).status_code, 200)
+
+        body.pop("sessionId")
+        self.client.post("/api/identity/clarity", json=body)
+
+        self.assertEqual(self.calls, ["s-42", "s-42", None])
+
+
+if __name__ == "__main__":
+    unittest.main()
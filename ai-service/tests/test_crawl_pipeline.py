@@ -0,0 +1,153 @@
+"""
+일일 크롤링 파이프라인 테스트 (실제 사이트/DB 없이 가짜 크롤러로 실행)
+"""
+import asyncio
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.crawl_pipeline import CrawlPipeline, CrawlSite, SiteBudget
+
+
+class FakeCompanyService:
+    def __init__(self, events):
+        self.events = events
+
+    async def crawl_and_save_companies_from_jobs(self, site_name, job_listings):
+        self.events.append(("enrich", site_name))
+        return len(job_listings)
+
+
+class FakeCrawler:
+    def __init__(self, site, delay, events, fail=False, new_count=1):
+        self.site = site
+        self.delay = delay
+        self.events = events
+        self.fail = fail
+        self.new_count = new_count
+        self.company_service = FakeCompanyService(events)
+
+    async def crawl_job_site(self, site_name, site_url, search_keyword, max_results, force_refresh, enrich_companies):
+        assert enrich_companies is False
+        self.events.append(("crawl_start", self.site.key))
+        await asyncio.sleep(self.delay)
+        self.events.append(("crawl_end", self.site.key))
+        if self.fail:
+            return {"success": False, "error": "blocked"}
+        # 전체 수집 결과 중 앞의 new_count개만 DB에 새로 저장된 공고
+        listings = [
+            {"id": f"{self.site.key}-{i}", "title": f"{self.site.key} 백엔드 개발자 {i}", "description": ""}
+            for i in range(3)
+        ]
+        return {
+            "success": True,
+            "jobListings": listings,
+            "newJobListings": listings[:self.new_count],
+            "savedToDatabase": self.new_count
+        }
+
+
+class FakeCalculator:
+    def __init__(self, events):
+        self.events = events
+        self.listings = []
+
+    async def recalculate_for_new_jobs(self, job_listings, run_id=None):
+        self.events.append(("recommend", run_id))
+        self.listings.append([job["id"] for job in job_listings])
+        return {"processed_users": 2, "failed_users": 0, "total_recommendations": 10}
+
+
+class TestCrawlPipeline(unittest.TestCase):
+
+    def _sites(self):
+        budget = SiteBudget(request_delay_seconds=0, timeout_seconds=1)
+        return [
+            CrawlSite("fast", "fast", "https://fast.example", budget),
+            CrawlSite("slow", "slow", "https://slow.example", budget),
+            CrawlSite("broken", "broken", "https://broken.example", budget),
+        ]
+
+    def test_sites_run_concurrently_and_stream_downstream(self):
+        events = []
+        delays = {"fast": 0.01, "slow": 0.2, "broken": 0.01}
+        pipeline = CrawlPipeline(
+            sites=self._sites(),
+            crawler_factory=lambda site: FakeCrawler(site, delays[site.key], events, fail=site.key == "broken"),
+            calculator=FakeCalculator(events),
+            run_id="20251203"
+        )
+
+        report = asyncio.run(pipeline.run())
+
+        # 모든 사이트가 다른 사이트 종료를 기다리지 않고 시작
+        starts = [i for i, e in enumerate(events) if e[0] == "crawl_start"]
+        first_end = min(i for i, e in enumerate(events) if e[0] == "crawl_end")
+        self.assertTrue(all(i < first_end for i in starts))
+
+        # 빠른 사이트의 추천 계산은 느린 사이트 크롤링이 끝나기 전에 시작
+        self.assertLess(events.index(("recommend", "20251203-fast")), events.index(("crawl_end", "slow")))
+
+        self.assertFalse(report["sites"]["broken"]["success"])
+        self.assertEqual(report["sites"]["fast"]["savedCompanies"], 3)
+        self.assertEqual(report["recommendations"]["processed_users"], 4)
+        self.assertEqual(report["critical_path"][0], "crawl:slow")
+
+        stage_names = {stage["name"] for stage in report["stages"]}
+        self.assertTrue({"crawl:fast", "enrich:fast", "recommend:fast", "crawl:slow"} <= stage_names)
+
+    def test_only_newly_inserted_listings_are_recomputed(self):
+        events = []
+        calculator = FakeCalculator(events)
+        new_counts = {"fast": 1, "slow": 0}
+        pipeline = CrawlPipeline(
+            sites=self._sites()[:2],
+            crawler_factory=lambda site: FakeCrawler(site, 0, events, new_count=new_counts[site.key]),
+            calculator=calculator
+        )
+
+        report = asyncio.run(pipeline.run())
+
+        # 전체 3개 수집 중 신규 1개만 추천 재계산, 신규가 없는 사이트는 재계산하지 않음
+        self.assertEqual(calculator.listings, [["fast-0"]])
+        self.assertEqual(report["sites"]["fast"]["totalResults"], 3)
+        self.assertEqual(report["sites"]["fast"]["newResults"], 1)
+        self.assertNotIn("recommend:slow", {stage["name"] for stage in report["stages"]})
+
+    def test_site_budget_timeout(self):
+        events = []
+        pipeline = CrawlPipeline(
+            sites=[CrawlSite("hang", "hang", "https://hang.example", SiteBudget(0, timeout_seconds=0.05))],
+            crawler_factory=lambda site: FakeCrawler(site, 1.0, events),
+            calculator=FakeCalculator(events)
+        )
+
+        report = asyncio.run(pipeline.run())
+
+        self.assertFalse(report["sites"]["hang"]["success"])
+        self.assertFalse(report["stages"][0]["success"])
+
+    def test_each_run_gets_its_own_recommendation_run_id(self):
+        events = []
+
+        def run_once():
+            pipeline = CrawlPipeline(
+                sites=self._sites()[:1],
+                crawler_factory=lambda site: FakeCrawler(site, 0, events),
+                calculator=FakeCalculator(events)
+            )
+            asyncio.run(pipeline.run())
+
+        # 같은 날 두 번 실행 (수동 트리거 / 놓친 실행 보충) → 추천 큐가 재사용되지 않아야 함
+        run_once()
+        run_once()
+
+        run_ids = [run_id for kind, run_id in events if kind == "recommend"]
+        self.assertEqual(len(set(run_ids)), 2)
+        self.assertTrue(all(run_id.endswith("-fast") for run_id in run_ids))
+
+
+if __name__ == "__main__":
+    unittest.main()
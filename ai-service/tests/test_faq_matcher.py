@@ -0,0 +1,147 @@
+"""
+FAQ 인메모리 매처 테스트 (DB/OpenAI 없이 가짜 서비스로 실행)
+"""
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.chatbot.shared.faq_matcher import FaqMatcher
+
+
+FAQS = [
+    {"id": 1, "question": "회원가입은 어떻게 하나요?", "answer": "상단 버튼", "user_type": "guest", "priority": 10},
+    {"id": 2, "question": "결제 내역 확인", "answer": None, "user_type": "member", "priority": 5},
+    {"id": 3, "question": "내 멘토링 예약 보여줘", "user_type": "assistant", "priority": 0,
+     "function_name": "get_mentoring_bookings", "keywords": ["멘토링", "예약", "일정"]},
+    {"id": 4, "question": "내 결제 내역", "user_type": "assistant", "priority": 0,
+     "function_name": "get_payment_history", "keywords": ["결제", "환불"]},
+]
+
+
+class FakeDb:
+    def __init__(self, faqs):
+        self.faqs = faqs
+        self.queries = 0
+
+    def execute_query(self, query, params=None):
+        self.queries += 1
+        return list(self.faqs)
+
+
+class SlowDb(FakeDb):
+    def execute_query(self, query, params=None):
+        time.sleep(0.2)
+        return super().execute_query(query, params)
+
+
+class FakeEmbeddingService:
+    """질문에 포함된 단어로 만든 간단한 벡터"""
+    VOCAB = ["멘토링", "예약", "결제", "환불", "회원가입", "상담"]
+
+    def __init__(self):
+        self.embed_calls = 0
+        self.batch_calls = 0
+
+    def _vector(self, text):
+        return [1.0 if word in text else 0.0 for word in self.VOCAB] + [0.01]
+
+    def embed(self, text):
+        self.embed_calls += 1
+        return self._vector(text)
+
+    def embed_batch(self, texts):
+        self.batch_calls += 1
+        return [self._vector(text) for text in texts]
+
+
+class TestFaqMatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.db = FakeDb(FAQS)
+        self.embeddings = FakeEmbeddingService()
+        self.matcher = FaqMatcher(embedding_service=self.embeddings, ttl_seconds=3600)
+        self.matcher.ensure_loaded(self.db)
+
+    def test_text_match_without_db_round_trips(self):
+        for _ in range(5):
+            faq = self.matcher.match_text("회원가입은 어떻게 하나요", user_type="guest")
+            self.matcher.ensure_loaded(self.db)
+        self.assertEqual(faq["id"], 1)
+        self.assertEqual(self.db.queries, 1)
+
+        # user_type 범위 밖 FAQ는 매칭하지 않음
+        self.assertIsNone(self.matcher.match_text("결제 내역 확인", user_type="guest"))
+        self.assertEqual(self.matcher.match_text("결제 내역 확인해줘", user_type="member")["id"], 2)
+
+    def test_keyword_index(self):
+        faq, score = self.matcher.match_keywords("다음 멘토링 예약 언제야?")
+        self.assertEqual(faq["function_name"], "get_mentoring_bookings")
+        self.assertAlmostEqual(score, 2 / 3)
+
+        faq, score = self.matcher.match_keywords("안녕하세요")
+        self.assertIsNone(faq)
+
+    def test_semantic_match_caches_message_embedding(self):
+        for _ in range(3):
+            faq, score = self.matcher.match_semantic("환불 관련 문의", user_type="assistant", threshold=0.5)
+        self.assertEqual(faq["id"], 4)
+        self.assertEqual(self.embeddings.embed_calls, 1)
+
+    def test_refresh_only_embeds_changed_faqs(self):
+        self.assertEqual(self.embeddings.batch_calls, 1)
+        self.matcher.refresh(self.db)
+        self.assertEqual(self.embeddings.batch_calls, 1)
+
+        self.db.faqs = FAQS[:3] + [dict(FAQS[3], question="환불 신청")]
+        self.matcher.refresh(self.db)
+        self.assertEqual(self.embeddings.batch_calls, 2)
+        self.assertIsNotNone(self.matcher.match_text("환불 신청", user_type="assistant"))
+
+    def test_expired_index_is_reloaded_once_while_old_one_is_served(self):
+        db = SlowDb(FAQS)
+        matcher = FaqMatcher(embedding_service=FakeEmbeddingService(), ttl_seconds=0.05)
+        matcher.ensure_loaded(db)
+        time.sleep(0.1)
+
+        matches = []
+
+        def chat():
+            matcher.ensure_loaded(db)
+            matches.append(matcher.match_text("회원가입은 어떻게 하나요", user_type="guest"))
+
+        started = time.monotonic()
+        threads = [threading.Thread(target=chat) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 요청 스레드(이벤트 루프)는 느린 재로드(0.2초)를 기다리지 않고 기존 인덱스로 응답
+        self.assertLess(time.monotonic() - started, 0.15)
+        self.assertEqual([faq["id"] for faq in matches], [1] * 5)
+
+        # 재로드는 백그라운드에서 한 번만
+        deadline = time.monotonic() + 2
+        while matcher._load_lock.locked() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(db.queries, 2)
+
+    def test_concurrent_first_load_queries_once(self):
+        db = SlowDb(FAQS)
+        matcher = FaqMatcher(embedding_service=FakeEmbeddingService(), ttl_seconds=3600)
+
+        threads = [threading.Thread(target=matcher.ensure_loaded, args=(db,)) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(db.queries, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+채용 리서치 그래프 테스트 (DB / LLM 대역, 임시 리포트 디렉터리)
+"""
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.job_research import store
+from services.job_research.graph import run_job_research, run_job_research_sync
+from services.job_research.nodes import analyze_node, crawl_node
+
+
+def make_rows(count, crawled_at=datetime(2026, 1, 1, 9, 0)):
+    return [{
+        "id": i, "title": f"백엔드 개발자 {i}", "company": f"회사{i % 3}", "location": "서울",
+        "url": f"https://jobs.example.com/{i}", "description": "Python, Spring 경력 3년 이상",
+        "site_name": "wanted", "tech_stack": '["Python", "Spring"]', "required_skills": None,
+        "crawled_at": crawled_at,
+    } for i in range(count)]
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+
+
+class FakeChatModel:
+    def __init__(self):
+        self.calls = 0
+
+    async def ainvoke(self, prompt):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return FakeResponse('{"market_trend": "백엔드 수요가 꾸준합니다.", "essential_skills": ["Python"], "differentiators": [], "cautions": []}')
+
+
+class TestJobResearchGraph(unittest.TestCase):
+
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.output_dir, True)
+
+        self.rows = make_rows(5)
+        self.llm = FakeChatModel()
+        patches = [
+            patch.object(crawl_node, "_fetch_postings", lambda keyword: list(self.rows)),
+            patch.object(analyze_node, "get_chat_model", lambda **kwargs: self.llm),
+            patch.object(store, "_report_store", store.ReportStore(Path(self.output_dir))),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+        store.get_analysis_cache().clear()
+        store.get_report_cache().clear()
+
+    def report_files(self):
+        return list(Path(self.output_dir).glob("*.md"))
+
+    def test_same_postings_reuse_report(self):
+        first = asyncio.run(run_job_research("백엔드 개발자"))
+        second = asyncio.run(run_job_research("  백엔드   개발자 "))
+
+        self.assertTrue(first["success"], first.get("error"))
+        self.assertFalse(first["cached"])
+        self.assertTrue(second["cached"])
+        self.assertEqual(second["report_path"], first["report_path"])
+        self.assertEqual(second["report_markdown"], first["report_markdown"])
+        self.assertEqual(self.llm.calls, 1)
+        self.assertEqual(len(self.report_files()), 1)
+
+    def test_changed_postings_regenerate(self):
+        asyncio.run(run_job_research("백엔드 개발자"))
+        self.rows = make_rows(6)
+        result = asyncio.run(run_job_research("백엔드 개발자"))
+
+        self.assertFalse(result["cached"])
+        self.assertEqual(result["total_postings"], 6)
+        self.assertEqual(self.llm.calls, 2)
+
+    def test_deleted_report_file_is_regenerated(self):
+        first = asyncio.run(run_job_research("백엔드 개발자"))
+        os.remove(first["report_path"])
+
+        second = asyncio.run(run_job_research("백엔드 개발자"))
+
+        self.assertFalse(second["cached"])
+        self.assertTrue(os.path.exists(second["report_path"]))
+        # 공고가 그대로라 분석은 재사용
+        self.assertEqual(self.llm.calls, 1)
+
+    def test_sync_wrapper_inside_running_loop(self):
+        async def caller():
+            return run_job_research_sync("백엔드 개발자")
+
+        result = asyncio.run(caller())
+
+        self.assertTrue(result["success"], result.get("error"))
+        self.assertEqual(result["total_postings"], 5)
+
+
+class TestReportStore(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.directory, True)
+
+    def test_prunes_oldest_over_max_files(self):
+        report_store = store.ReportStore(self.directory, max_files=3)
+        for i in range(5):
+            path = self.directory / f"old_{i}.md"
+            path.write_text("x")
+            os.utime(path, (time.time() - 100 + i, time.time() - 100 + i))
+
+        saved = report_store.save("# 리포트", "백엔드")
+
+        names = sorted(p.name for p in self.directory.glob("*.md"))
+        self.assertEqual(len(names), 3)
+        self.assertIn(Path(saved).name, names)
+        self.assertEqual(names[:2], ["old_3.md", "old_4.md"])
+
+    def test_prunes_expired_files(self):
+        report_store = store.ReportStore(self.directory, max_age_seconds=60)
+        expired = self.directory / "expired.md"
+        expired.write_text("x")
+        os.utime(expired, (time.time() - 3600, time.time() - 3600))
+
+        report_store.save("# 리포트", "백엔드")
+
+        self.assertFalse(expired.exists())
+        self.assertEqual(report_store.stats()["files"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,201 @@
+"""
+LLM 게이트웨이 테스트 (가짜 백엔드, 실제 OpenAI SDK 클라이언트)
+"""
+import asyncio
+import gc
+import math
+import os
+import sys
+import time
+import unittest
+
+import httpx
+import openai
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.common.llm_gateway import (
+    LANE_BATCH, LANE_HEADER, LANE_INTERACTIVE, FakeLLMBackend, LaneConfig, LLMGateway, _Call,
+    llm_lane, parse_duration,
+)
+
+MESSAGES = [{"role": "user", "content": "백엔드 개발자 로드맵 알려줘"}]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def lanes(interactive_timeout=10.0, batch_timeout=10.0):
+    return {
+        LANE_INTERACTIVE: LaneConfig(max_concurrency=4, timeout_seconds=interactive_timeout),
+        LANE_BATCH: LaneConfig(max_concurrency=4, timeout_seconds=batch_timeout, budget_reserve=0.5, priority=1),
+    }
+
+
+class TestScheduling(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.gateway = LLMGateway(lanes=lanes(), default_rpm=6, clock=self.clock)
+
+    def call(self, lane):
+        return _Call(lane=lane, model="gpt-4o-mini", tokens=10, stream=False, deadline=math.inf)
+
+    def test_batch_leaves_reserve_for_interactive(self):
+        granted_batch = 0
+        while self.gateway._try_acquire(self.call(LANE_BATCH)) == 0:
+            granted_batch += 1
+        granted_interactive = 0
+        while self.gateway._try_acquire(self.call(LANE_INTERACTIVE)) == 0:
+            granted_interactive += 1
+
+        # 분당 6건 중 batch는 절반(예비분)을 남기고 멈춤
+        self.assertEqual((granted_batch, granted_interactive), (3, 3))
+
+    def test_batch_yields_to_waiting_interactive(self):
+        waiting = self.call(LANE_INTERACTIVE)
+        with self.gateway._cond:
+            self.gateway._enter_queue(waiting)
+
+        self.assertGreater(self.gateway._try_acquire(self.call(LANE_BATCH)), 0)
+        self.assertEqual(self.gateway._try_acquire(waiting), 0)
+
+        with self.gateway._cond:
+            self.gateway._leave_queue(waiting, self.clock(), True)
+        self.assertEqual(self.gateway._try_acquire(self.call(LANE_BATCH)), 0)
+
+    def test_bucket_refills_over_time(self):
+        self.gateway.lanes[LANE_INTERACTIVE].max_concurrency = 10
+        for _ in range(6):
+            self.assertEqual(self.gateway._try_acquire(self.call(LANE_INTERACTIVE)), 0)
+        wait = self.gateway._try_acquire(self.call(LANE_INTERACTIVE))
+        self.assertAlmostEqual(wait, 10.0, places=3)
+
+        self.clock.now += wait
+        self.assertEqual(self.gateway._try_acquire(self.call(LANE_INTERACTIVE)), 0)
+
+    def test_parse_duration(self):
+        self.assertEqual(parse_duration("20ms"), 0.02)
+        self.assertEqual(parse_duration("6m0s"), 360)
+        self.assertEqual(parse_duration("1.5"), 1.5)
+        self.assertIsNone(parse_duration("soon"))
+
+
+class TestGatewayWithClient(unittest.TestCase):
+
+    def make_client(self, gateway, lane=None):
+        return openai.OpenAI(
+            api_key="test",
+            http_client=httpx.Client(transport=gateway.sync_transport()),
+            max_retries=0,
+            default_headers={LANE_HEADER: lane} if lane else None,
+        )
+
+    def test_rate_limited_calls_back_off_and_retry(self):
+        backend = FakeLLMBackend()
+        backend.fail_next(2, retry_after=0.05)
+        gateway = LLMGateway(lanes=lanes(), backend=backend)
+        client = self.make_client(gateway)
+
+        started = time.monotonic()
+        response = client.chat.completions.create(model="gpt-4o-mini", messages=MESSAGES)
+        elapsed = time.monotonic() - started
+
+        self.assertTrue(response.choices[0].message.content.startswith("가짜 응답"))
+        self.assertEqual(len(backend.requests), 3)
+        # 서버 힌트(50ms)에서 시작해 연속 실패마다 2배: 50ms + 100ms 이상
+        self.assertGreaterEqual(elapsed, 0.15)
+        stats = gateway.stats()["lanes"][LANE_INTERACTIVE]
+        self.assertEqual((stats["rate_limited"], stats["retries"]), (2, 2))
+        self.assertEqual(gateway.stats()["models"]["gpt-4o-mini"]["consecutive_failures"], 0)
+
+    def test_response_headers_update_limits(self):
+        backend = FakeLLMBackend(rpm_limit=3)
+        gateway = LLMGateway(lanes=lanes(), default_rpm=100, backend=backend)
+        client = self.make_client(gateway)
+
+        client.chat.completions.create(model="gpt-4o-mini", messages=MESSAGES)
+
+        model = gateway.stats()["models"]["gpt-4o-mini"]
+        self.assertEqual(model["requests_per_minute"], 3)
+        self.assertLessEqual(model["requests_available"], 2)
+
+    def test_queue_wait_is_bounded_by_lane_timeout(self):
+        gateway = LLMGateway(lanes=lanes(interactive_timeout=0.2), default_rpm=1, backend=FakeLLMBackend())
+        client = self.make_client(gateway)
+        client.chat.completions.create(model="gpt-4o-mini", messages=MESSAGES)
+
+        started = time.monotonic()
+        with self.assertRaises(openai.APITimeoutError):
+            client.chat.completions.create(model="gpt-4o-mini", messages=MESSAGES)
+
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(gateway.stats()["lanes"][LANE_INTERACTIVE]["timeouts"], 1)
+
+    def test_lanes_and_token_usage_are_tracked(self):
+        backend = FakeLLMBackend()
+        gateway = LLMGateway(lanes=lanes(), backend=backend)
+        batch_client = self.make_client(gateway, lane=LANE_BATCH)
+        async_client = openai.AsyncOpenAI(
+            api_key="test",
+            http_client=httpx.AsyncClient(transport=gateway.async_transport()),
+            max_retries=0,
+        )
+
+        first = batch_client.chat.completions.create(model="gpt-4o-mini", messages=MESSAGES)
+
+        async def run():
+            with llm_lane(LANE_BATCH):
+                return await async_client.chat.completions.create(model="gpt-4o-mini", messages=MESSAGES)
+
+        second = asyncio.run(run())
+
+        stats = gateway.stats()["lanes"]
+        self.assertEqual(stats[LANE_BATCH]["requests"], 2)
+        self.assertEqual(stats[LANE_INTERACTIVE]["requests"], 0)
+        self.assertEqual(stats[LANE_BATCH]["tokens"]["total"], first.usage.total_tokens + second.usage.total_tokens)
+        self.assertEqual(stats[LANE_BATCH]["in_flight"], 0)
+        self.assertIsNotNone(stats[LANE_BATCH]["queue_wait_ms"]["p95"])
+
+    def test_streaming_releases_slot_when_consumed(self):
+        gateway = LLMGateway(lanes=lanes(), backend=FakeLLMBackend())
+        client = self.make_client(gateway)
+
+        chunks = list(client.chat.completions.create(model="gpt-4o-mini", messages=MESSAGES, stream=True))
+
+        self.assertIn("백엔드", chunks[0].choices[0].delta.content)
+        self.assertEqual(gateway.stats()["lanes"][LANE_INTERACTIVE]["in_flight"], 0)
+
+    def test_abandoned_stream_releases_slot_on_gc(self):
+        gateway = LLMGateway(lanes=lanes(), backend=FakeLLMBackend())
+        client = self.make_client(gateway)
+        async_client = openai.AsyncOpenAI(
+            api_key="test",
+            http_client=httpx.AsyncClient(transport=gateway.async_transport()),
+            max_retries=0,
+        )
+
+        # 읽지도 닫지도 않고 버린 스트림 (클라이언트 연결 끊김 등)
+        stream = client.chat.completions.create(model="gpt-4o-mini", messages=MESSAGES, stream=True)
+
+        async def open_async_stream():
+            return await async_client.chat.completions.create(model="gpt-4o-mini", messages=MESSAGES, stream=True)
+
+        async_stream = asyncio.run(open_async_stream())
+        self.assertEqual(gateway.stats()["lanes"][LANE_INTERACTIVE]["in_flight"], 2)
+
+        del stream, async_stream
+        gc.collect()
+
+        lane = gateway.stats()["lanes"][LANE_INTERACTIVE]
+        self.assertEqual(lane["in_flight"], 0)
+        self.assertEqual(gateway._budget("gpt-4o-mini").consecutive_failures, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
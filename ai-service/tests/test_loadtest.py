@@ -0,0 +1,75 @@
+"""
+부하 테스트 하네스 테스트 (포화 지점 판정 / 예산 / 오프라인 ramp 실행)
+"""
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks import FakeLatency, LoadBudget, evaluate_budget, find_saturation, run_loadtest
+
+
+def _stage(concurrency, rps, p95, error_rate=0.0, lag=5.0, threads=8, db=None):
+    return {"concurrency": concurrency, "requests": 100, "throughput_rps": rps, "error_rate": error_rate,
+            "latency_ms": {"p95": p95}, "event_loop_lag_ms": {"max": lag}, "threads_max": threads,
+            "db_connections_max": db}
+
+
+class SaturationTest(unittest.TestCase):
+    def test_plateau_with_latency_growth_is_saturation(self):
+        stages = [_stage(1, 5.0, 200), _stage(2, 9.5, 220), _stage(4, 10.0, 400), _stage(8, 10.2, 900)]
+        saturation = find_saturation(stages)
+        self.assertEqual((saturation["concurrency"], saturation["last_healthy_concurrency"]), (4, 2))
+
+    def test_error_rate_marks_saturation(self):
+        stages = [_stage(1, 5.0, 200), _stage(2, 10.0, 210, error_rate=0.2)]
+        self.assertEqual(find_saturation(stages)["concurrency"], 2)
+
+    def test_linear_scaling_is_not_saturated(self):
+        self.assertIsNone(find_saturation([_stage(1, 5.0, 200), _stage(2, 10.0, 200), _stage(4, 19.0, 230)]))
+
+
+class BudgetTest(unittest.TestCase):
+    def test_violations_per_stage_and_for_peaks(self):
+        report = {
+            "stages": [_stage(1, 5.0, 200, db=3), _stage(4, 12.0, 1500, lag=350.0, threads=40, db=9)],
+            "memory": {"growth_mb": 12.0},
+            "saturation": {"concurrency": 4},
+        }
+        budget = LoadBudget(max_p95_ms=1000, max_event_loop_lag_ms=200, max_threads=64, max_db_connections=5,
+                            max_memory_growth_mb=50, min_saturation_concurrency=8)
+        violations = evaluate_budget(report, budget)
+        self.assertEqual([(v["metric"], v["concurrency"]) for v in violations], [
+            ("latency_ms.p95", 4), ("event_loop_lag_ms.max", None), ("db_connections_max", None),
+            ("saturation_concurrency", 4),
+        ])
+
+    def test_unknown_budget_key_is_rejected(self):
+        self.assertEqual(LoadBudget.from_dict({"max_threads": 10}).max_threads, 10)
+        with self.assertRaises(ValueError):
+            LoadBudget.from_dict({"max_thread": 10})
+
+
+class RunLoadtestTest(unittest.TestCase):
+    def test_offline_ramp_reports_stages_and_resources(self):
+        report = run_loadtest(ramp=[1, 2], stage_seconds=0.6, latency=FakeLatency().scaled(0), use_db=False,
+                              budget=LoadBudget(max_threads=1))
+
+        self.assertEqual(report["benchmark"], "loadtest")
+        self.assertEqual(report["config"]["skipped_scripts"], {"recommendations": "--no-db"})
+        self.assertEqual([stage["concurrency"] for stage in report["stages"]], [1, 2])
+        for stage in report["stages"]:
+            self.assertGreater(stage["requests"], 0)
+            self.assertEqual(stage["errors"], 0, stage["errors_sample"])
+            self.assertGreater(stage["threads_max"], 1)
+            self.assertIsNone(stage["db_connections_max"])
+        self.assertTrue(report["timeline"])
+        self.assertIsNotNone(report["memory"]["growth_mb"])
+
+        self.assertFalse(report["budget"]["passed"])
+        self.assertEqual([v["metric"] for v in report["budget"]["violations"]], ["threads_max"])
+
+
+if __name__ == '__main__':
+    unittest.main()
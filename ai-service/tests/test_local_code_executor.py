@@ -0,0 +1,166 @@
+"""
+로컬 코드 실행기 테스트 (Judge0 없이 하위 프로세스로 실행)
+"""
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.learning.code_executor import CodeExecutorService
+from services.learning.local_executor import ExecutionLimits, LocalCodeExecutor
+
+# root로 테스트할 때는 실행 전용 사용자(nobody)로 내려서 실행
+RUN_AS_UID = 65534 if os.geteuid() == 0 else None
+
+ADD_CPP = """#include <iostream>
+int main() { long a, b; std::cin >> a >> b; std::cout << a + b << "\\n"; }
+"""
+
+
+class TestLocalCodeExecutor(unittest.TestCase):
+
+    def setUp(self):
+        self.work_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.work_root, True)
+        self.executor = LocalCodeExecutor(
+            max_workers=2,
+            max_queue=2,
+            limits=ExecutionLimits(cpu_seconds=1, wall_seconds=2, memory_mb=128),
+            work_root=self.work_root,
+            run_as_uid=RUN_AS_UID,
+        )
+        self.addCleanup(self.executor.shutdown)
+
+    def test_python_runs_with_stdin(self):
+        result = asyncio.run(self.executor.execute("print(input()[::-1])", "python", "abc"))
+
+        self.assertEqual(result["status"]["id"], 3)
+        self.assertEqual(result["stdout"], "cba\n")
+
+    def test_limits_are_enforced(self):
+        async def run():
+            return await asyncio.gather(
+                self.executor.execute("while True: pass", "python"),
+                self.executor.execute("import time\ntime.sleep(30)", "python"),
+                self.executor.execute("x = bytearray(512 * 1024 * 1024)", "python"),
+            )
+
+        cpu_bound, sleeper, memory_hog = asyncio.run(run())
+
+        self.assertEqual(cpu_bound["status"]["description"], "Time Limit Exceeded")
+        self.assertEqual(sleeper["status"]["description"], "Time Limit Exceeded")
+        self.assertLess(float(sleeper["wall_time"]), 3)
+        self.assertEqual(memory_hog["status"]["id"], 11)
+        self.assertIn("MemoryError", memory_hog["stderr"])
+
+    def test_queue_limit_rejects_overflow(self):
+        async def run():
+            return await asyncio.gather(*[
+                self.executor.execute("import time\ntime.sleep(0.3)", "python") for _ in range(6)
+            ])
+
+        results = asyncio.run(run())
+
+        rejected = [r for r in results if "대기열" in r.get("stderr", "")]
+        self.assertEqual(len(rejected), 2)
+        self.assertEqual(self.executor.stats["rejected"], 2)
+
+    @unittest.skipUnless(shutil.which("g++"), "g++ 없음")
+    def test_batched_tests_compile_once_and_reuse_cache(self):
+        cases = [
+            {"stdin": "1 2", "expected_output": "3"},
+            {"stdin": "10 20", "expected_output": "30\n"},
+            {"stdin": "2 2", "expected_output": "5"},
+        ]
+
+        first = asyncio.run(self.executor.run_tests(ADD_CPP, "cpp", cases))
+        second = asyncio.run(self.executor.run_tests(ADD_CPP, "cpp", cases[:1]))
+
+        self.assertEqual((first["passed"], first["total"]), (2, 3))
+        self.assertEqual(first["results"][2]["status"]["description"], "Wrong Answer")
+        self.assertEqual(second["passed"], 1)
+        self.assertEqual(self.executor.stats["compiles"], 1)
+        self.assertEqual(self.executor.compile_cache.hits, 1)
+
+    @unittest.skipUnless(shutil.which("g++"), "g++ 없음")
+    def test_compile_error_is_reported(self):
+        result = asyncio.run(self.executor.execute("int main() { return 0 }", "cpp"))
+
+        self.assertEqual(result["status"]["id"], 6)
+        self.assertIn("main.cpp", result["compile_output"])
+        self.assertNotIn(self.work_root, result["compile_output"])
+
+    def test_unsupported_language(self):
+        result = asyncio.run(self.executor.execute("puts 1", "ruby"))
+        self.assertEqual(result["status"]["id"], 13)
+
+    @unittest.skipUnless(RUN_AS_UID is not None, "root 권한 필요")
+    def test_drops_privileges_and_cannot_read_parent_environ(self):
+        code = (
+            "import os\n"
+            "print(os.getuid(), os.getgid(), os.getgroups())\n"
+            "try:\n"
+            "    open(f'/proc/{os.getppid()}/environ').read()\n"
+            "    print('leaked')\n"
+            "except OSError:\n"
+            "    print('denied')\n"
+        )
+        result = asyncio.run(self.executor.execute(code, "python"))
+
+        ids, access = result["stdout"].splitlines()
+        self.assertEqual(ids, f"{RUN_AS_UID} {self.executor.run_as_gid} []")
+        self.assertEqual(access, "denied")
+
+    @unittest.skipUnless(RUN_AS_UID is not None and shutil.which("g++"), "root 권한 / g++ 필요")
+    def test_compile_cannot_include_server_only_files(self):
+        secret_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, secret_dir, True)
+        secret = os.path.join(secret_dir, ".env")
+        with open(secret, "w") as f:
+            f.write("OPENAI_API_KEY=sk-server-secret\n")
+        os.chmod(secret, 0o600)
+
+        result = asyncio.run(self.executor.execute(f'#include "{secret}"\nint main() {{}}', "cpp"))
+
+        self.assertEqual(result["status"]["id"], 6)
+        self.assertIn("Permission denied", result["compile_output"])
+        self.assertNotIn("sk-server-secret", result["compile_output"])
+
+    @unittest.skipUnless(RUN_AS_UID is not None and shutil.which("g++"), "root 권한 / g++ 필요")
+    def test_compiled_artifacts_are_not_writable_by_submissions(self):
+        asyncio.run(self.executor.execute(ADD_CPP, "cpp", "1 2"))
+        code = (
+            "import glob\n"
+            f"paths = glob.glob('{self.work_root}/compiled/*/main')\n"
+            "try:\n"
+            "    open(paths[0], 'ab').close()\n"
+            "    print('writable')\n"
+            "except OSError:\n"
+            "    print('read-only')\n"
+        )
+        result = asyncio.run(self.executor.execute(code, "python"))
+        self.assertEqual(result["stdout"].strip(), "read-only")
+
+    @unittest.skipUnless(os.geteuid() == 0, "root 권한 필요")
+    def test_refuses_root_without_run_as_uid(self):
+        with self.assertRaises(RuntimeError):
+            LocalCodeExecutor(max_workers=1, work_root=self.work_root)
+
+
+class TestCodeExecutorBackend(unittest.TestCase):
+
+    def test_local_backend_is_opt_in(self):
+        with mock.patch.dict(os.environ, {"RAPIDAPI_KEY": "", "CODE_EXECUTOR_BACKEND": ""}):
+            self.assertEqual(CodeExecutorService().backend, "judge0")
+        with mock.patch.dict(os.environ, {"RAPIDAPI_KEY": "", "CODE_EXECUTOR_BACKEND": "local"}):
+            service = CodeExecutorService(local_executor=mock.Mock())
+            self.assertEqual(service.backend, "local")
+
+
+if __name__ == "__main__":
+    unittest.main()
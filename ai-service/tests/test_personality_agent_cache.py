@@ -0,0 +1,96 @@
+"""
+성향 분석 에이전트 단계 캐시 / 누적 요약 테스트 (LLM 대역, 인메모리 캐시)
+"""
+import asyncio
+import json
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+
+from services.agents.personality_agent import PersonalityAgent, PersonalityAgentInput
+from services.agents.tool_cache import ToolResultCache
+
+SUMMARY = {"summary": "디자인에 관심이 많은 학생", "strengths": ["창의성"], "risks": [], "goals": ["UX 디자이너"], "values": ["성장"]}
+BIG_FIVE = {trait: {"score": 60, "reason": "대화 근거"} for trait in
+            ("openness", "conscientiousness", "extraversion", "agreeableness", "neuroticism")}
+
+
+class FakeCompletions:
+    """요약 / Big Five 프롬프트에 맞는 JSON을 돌려주는 대역"""
+
+    def __init__(self):
+        self.prompts = []
+
+    async def create(self, model, messages, **kwargs):
+        prompt = messages[-1]["content"]
+        self.prompts.append(prompt)
+        await asyncio.sleep(0)
+        if "Big Five" in messages[0]["content"]:
+            content = BIG_FIVE
+        else:
+            # 요약은 호출마다 달라짐 → 다음 단계 입력도 바뀜
+            content = {**SUMMARY, "summary": f"{SUMMARY['summary']} ({len(self.prompts)})"}
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps(content, ensure_ascii=False)))])
+
+
+def make_history(count):
+    return [{"role": "user" if i % 2 == 0 else "assistant", "content": f"메시지 {i}"} for i in range(count)]
+
+
+class TestPersonalityAgentCache(unittest.TestCase):
+
+    def setUp(self):
+        self.completions = FakeCompletions()
+        self.agent = PersonalityAgent(cache=ToolResultCache(use_redis=False))
+        fake_client = SimpleNamespace(chat=SimpleNamespace(completions=self.completions))
+        self.agent.summarizer_tool.client = fake_client
+        self.agent.bigfive.client = fake_client
+
+    def run_agent(self, history, survey=None, session_id="s1"):
+        bundle = PersonalityAgentInput(conversation_history=history, survey_data=survey or {"q1": "A"}, session_id=session_id)
+        return asyncio.run(self.agent.run(bundle))
+
+    def test_unchanged_inputs_make_no_llm_calls(self):
+        first = self.run_agent(make_history(12))
+        calls = len(self.completions.prompts)
+        second = self.run_agent(make_history(12))
+
+        self.assertEqual(calls, 2)
+        self.assertEqual(len(self.completions.prompts), calls)
+        self.assertEqual(second, first)
+        self.assertEqual(first["mbti"], "ENFJ")
+
+    def test_appended_messages_update_running_summary(self):
+        self.run_agent(make_history(12))
+        self.run_agent(make_history(16))
+
+        self.assertEqual(self.agent.stats, {"summary_full": 1, "summary_incremental": 1, "bigfive_calls": 2})
+        incremental_prompt = self.completions.prompts[2]
+        self.assertIn("기존 요약", incremental_prompt)
+        self.assertIn("메시지 15", incremental_prompt)
+        self.assertNotIn("메시지 11", incremental_prompt)
+
+    def test_edited_history_is_summarized_from_scratch(self):
+        self.run_agent(make_history(12))
+        edited = make_history(14)
+        edited[3]["content"] = "수정된 메시지"
+        self.run_agent(edited)
+
+        self.assertEqual(self.agent.stats["summary_full"], 2)
+        self.assertEqual(self.agent.stats["summary_incremental"], 0)
+
+    def test_survey_change_reruns_stages(self):
+        self.run_agent(make_history(12))
+        self.run_agent(make_history(12), survey={"q1": "B"})
+
+        self.assertEqual(self.agent.stats["bigfive_calls"], 2)
+        # 대화는 그대로라 새 메시지 없이 기존 요약만 갱신
+        self.assertEqual(self.agent.stats["summary_incremental"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+ProfileRAGService 배치 추천 이유 생성 / 캐시 테스트 (OpenAI 대역 사용)
+"""
+import asyncio
+import json
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+
+from services.rag.profile_rag_service import ProfileRAGService, ReasonCache
+
+
+class FakeCompletions:
+    """chat.completions 대역 - 프롬프트에 나온 직업마다 이유 생성"""
+
+    def __init__(self, job_names):
+        self.job_names = job_names
+        self.calls = 0
+
+    def create(self, model, messages, **kwargs):
+        self.calls += 1
+        prompt = messages[0]["content"]
+        results = [
+            {"jobName": name, "reasons": [f"{name} 이유"]}
+            for name in self.job_names if f"직업명: {name}" in prompt
+        ]
+        content = json.dumps({"results": results}, ensure_ascii=False)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class TestProfileRAGService(unittest.TestCase):
+
+    def setUp(self):
+        self.jobs = ["데이터 분석가", "백엔드 개발자", "UX 디자이너"]
+        self.completions = FakeCompletions(self.jobs)
+        openai = SimpleNamespace(client=SimpleNamespace(chat=SimpleNamespace(completions=self.completions)))
+        self.service = ProfileRAGService(openai, reason_cache=ReasonCache())
+
+    def test_single_batched_call_then_cached(self):
+        matches = [{"jobName": name, "score": 0.9 - i * 0.1} for i, name in enumerate(self.jobs)]
+
+        first = asyncio.run(self.service.enrich_with_rag(matches, "분석적이고 꼼꼼함"))
+        self.assertEqual(self.completions.calls, 1)
+        self.assertEqual([r["reasons"] for r in first], [[f"{n} 이유"] for n in self.jobs])
+        self.assertEqual(first[0]["score"], 0.9)
+
+        again = asyncio.run(self.service.enrich_with_rag(matches, "분석적이고 꼼꼼함"))
+        self.assertEqual(self.completions.calls, 1)
+        self.assertEqual(again, first)
+
+        # 다른 사용자 문서는 캐시를 공유하지 않음
+        asyncio.run(self.service.enrich_with_rag(matches[:1], "외향적이고 활발함"))
+        self.assertEqual(self.completions.calls, 2)
+
+    def test_unknown_job_in_response_is_not_cached(self):
+        matches = [{"jobName": "우주 비행사", "score": 0.5}]
+
+        result = asyncio.run(self.service.enrich_with_rag(matches, "호기심 많음"))
+        asyncio.run(self.service.enrich_with_rag(matches, "호기심 많음"))
+
+        self.assertEqual(result[0]["reasons"], ["추출 실패"])
+        self.assertEqual(self.completions.calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+"""
+학습 문제 은행 테스트 (문제 생성기 대역, 인메모리 모드)
+"""
+import asyncio
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.learning.question_bank import QuestionBank, _shingles, _ShingleIndex, similarity
+from services.learning.question_generator import QuestionGeneratorService
+
+TOPICS = ["변수", "반복문", "조건문", "함수", "클래스", "예외 처리", "모듈", "리스트", "딕셔너리", "파일 입출력",
+          "제너레이터", "데코레이터", "정규식", "스레드", "비동기", "테스트", "타입 힌트", "패키징", "로깅", "람다"]
+
+
+class FakeGenerator:
+    """문제 생성기 대역 - 호출마다 다른 주제로 문제 생성 (duplicate=True면 이미 낸 문제를 살짝 바꿔 다시 냄)"""
+
+    _get_difficulty = QuestionGeneratorService._get_difficulty
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self.next_topic = 0
+        self.duplicate = False
+
+    async def generate_questions(self, domain, week_number, count=5):
+        self.calls.append(count)
+        await asyncio.sleep(self.delay)
+        questions = []
+        for _ in range(count):
+            if self.duplicate:
+                topic = TOPICS[0] + "0"
+                text = f"{domain}에서 {topic}의 개념을 설명하세요!!"
+            else:
+                topic = TOPICS[self.next_topic % len(TOPICS)] + str(self.next_topic // len(TOPICS))
+                self.next_topic += 1
+                text = f"{domain}에서 {topic}의 개념을 설명하세요."
+            questions.append({
+                "type": "SCENARIO", "difficulty": "EASY", "question": text,
+                "answer": topic, "explanation": "", "maxScore": 10,
+            })
+        return questions
+
+
+class TestQuestionBank(unittest.TestCase):
+
+    def setUp(self):
+        self.generator = FakeGenerator()
+        self.bank = QuestionBank(self.generator, low_watermark=4, refill_batch=10, use_redis=False)
+
+    def run_async(self, coro):
+        async def wrapper():
+            result = await coro
+            await self.bank.wait_for_refills()
+            return result
+        return asyncio.run(wrapper())
+
+    def test_first_request_generates_then_serves_from_stock(self):
+        first = self.run_async(self.bank.get_questions("파이썬", 1, count=3, user_id="u1"))
+        self.assertEqual(len(first), 3)
+        # 즉시 생성 3개 + 백그라운드 보충 10개
+        self.assertEqual(self.generator.calls, [3, 10])
+
+        second = self.run_async(self.bank.get_questions("파이썬", 1, count=3, user_id="u2"))
+        self.assertEqual(len(second), 3)
+        self.assertEqual(self.generator.calls, [3, 10])
+
+        stats = self.bank.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+        self.assertEqual(stats["refills"], 1)
+        self.assertIsNotNone(stats["refill_lag_seconds"]["p50"])
+        self.assertEqual(stats["stock"], {"question_bank:1:EASY:파이썬": 13})
+
+    def test_user_never_sees_same_question_twice(self):
+        self.run_async(self.bank.prefill("파이썬", 1))
+        served = []
+        for _ in range(6):
+            served += [q["question"] for q in self.run_async(self.bank.get_questions("파이썬", 1, count=3, user_id="u1"))]
+
+        self.assertEqual(len(served), len(set(served)))
+        # 다른 사용자는 같은 재고를 다시 받을 수 있음
+        other = self.run_async(self.bank.get_questions("파이썬", 1, count=3, user_id="u2"))
+        self.assertEqual(len(other), 3)
+
+    def test_near_duplicates_are_not_stocked(self):
+        self.run_async(self.bank.prefill("파이썬", 1))
+        size = self.bank.stats()["stock"]["question_bank:1:EASY:파이썬"]
+
+        self.generator.duplicate = True
+        self.run_async(self.bank._refill(self.bank.bank_key("파이썬", 1), "파이썬", 1, 0))
+
+        self.assertEqual(self.bank.stats()["stock"]["question_bank:1:EASY:파이썬"], size)
+        self.assertGreaterEqual(self.bank.stats()["duplicates_dropped"], 10)
+
+    def test_miss_generates_only_missing_questions(self):
+        self.run_async(self.bank.prefill("파이썬", 1))
+        stock = self.bank.stats()["stock"]["question_bank:1:EASY:파이썬"]
+        self.generator.calls.clear()
+
+        served = self.run_async(self.bank.get_questions("파이썬", 1, count=stock + 2, user_id="u1"))
+
+        self.assertEqual(len(served), stock + 2)
+        # 즉시 생성은 모자란 2개만 (이후 백그라운드 보충은 별도)
+        self.assertEqual(self.generator.calls[0], 2)
+
+    def test_shingle_index_matches_pairwise_similarity(self):
+        texts = ["REST API란 무엇인가요?", "인덱스는 언제 쓰나요?", "트랜잭션 격리 수준을 설명하세요."]
+        index = _ShingleIndex()
+        for text in texts:
+            index.add(frozenset(_shingles(text)))
+
+        for query in ["rest api란 무엇인가요", "인덱스는 언제 쓰나요", "가비지 컬렉션이란?"]:
+            expected = max(similarity(query, text) for text in texts)
+            self.assertAlmostEqual(index.max_similarity(frozenset(_shingles(query))), expected)
+
+    def test_concurrent_requests_trigger_single_refill(self):
+        self.generator.delay = 0.05
+
+        async def scenario():
+            await self.bank.prefill("파이썬", 2)
+            calls_before = len(self.generator.calls)
+            await asyncio.gather(*[self.bank.get_questions("파이썬", 2, count=4, user_id=f"u{i}") for i in range(5)])
+            await asyncio.gather(*[self.bank.get_questions("파이썬", 2, count=4, user_id=f"u{i}") for i in range(5)])
+            await self.bank.wait_for_refills()
+            return len(self.generator.calls) - calls_before
+
+        self.assertEqual(asyncio.run(scenario()), 1)
+
+    def test_similarity(self):
+        self.assertGreater(similarity("REST API란 무엇인가요?", "rest api란 무엇인가요"), 0.99)
+        self.assertLess(similarity("REST API란 무엇인가요?", "인덱스는 언제 쓰나요?"), 0.3)
+
+
+class TestQuestionBankEndpoint(unittest.TestCase):
+    """실제로 서비스되는 앱(main.app)에서 문제 생성 요청이 문제 은행을 거치는지"""
+
+    def setUp(self):
+        os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+        import main
+        from fastapi.testclient import TestClient
+        from routers import learning
+
+        self.generator = FakeGenerator()
+        self.bank = QuestionBank(self.generator, low_watermark=4, refill_batch=10, use_redis=False)
+        asyncio.run(self.bank.prefill("파이썬", 1))
+        patcher = mock.patch.object(learning, "question_bank", self.bank)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = TestClient(main.app)
+
+    def test_generate_questions_is_served_from_bank(self):
+        calls_before = list(self.generator.calls)
+        body = {"domain": "파이썬", "weekNumber": 1, "count": 3, "userId": "u1"}
+
+        first = self.client.post("/api/learning/generate-questions", json=body).json()
+        second = self.client.post("/api/learning/generate-questions", json=body).json()
+
+        self.assertTrue(first["success"])
+        self.assertEqual(first["count"], 3)
+        self.assertFalse({q["question"] for q in first["questions"]} & {q["question"] for q in second["questions"]})
+        self.assertEqual(self.generator.calls, calls_before)
+
+        stats = self.client.get("/api/learning/question-bank/stats").json()
+        self.assertEqual(stats["hits"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
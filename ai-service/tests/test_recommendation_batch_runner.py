@@ -0,0 +1,149 @@
+"""
+채용공고 추천 분산 배치 러너 테스트 (Redis/DB 없이 인메모리 큐로 실행)
+"""
+import asyncio
+import importlib.util
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.recommendation_batch_runner import (
+    AdaptiveConcurrency,
+    RecommendationBatchRunner,
+    RecommendationWorkQueue,
+)
+
+
+class StubCalculator:
+    """JobRecommendationCalculator 대역"""
+
+    def __init__(self, user_ids, fail_ids=(), skip_ids=()):
+        self.user_ids = user_ids
+        self.fail_ids = set(fail_ids)
+        self.skip_ids = set(skip_ids)
+        self.calls = []
+
+    def _get_active_users_with_career_analysis(self):
+        return [{"user_id": uid} for uid in self.user_ids]
+
+    def calculate_user_recommendations_blocking(self, user_id, max_recommendations=50):
+        self.calls.append(user_id)
+        if user_id in self.fail_ids:
+            return {"success": False, "error": "No profile analysis"}
+        if user_id in self.skip_ids:
+            return {"success": False, "error": "Already in progress", "skipped": True}
+        return {"success": True, "user_id": user_id, "saved_count": 3}
+
+
+class TestRecommendationBatchRunner(unittest.TestCase):
+
+    def test_processes_all_users_once(self):
+        calculator = StubCalculator([1, 2, 3, 3, 4, 5], fail_ids=[4], skip_ids=[5])
+        queue = RecommendationWorkQueue("test", use_redis=False)
+        runner = RecommendationBatchRunner(calculator=calculator, queue=queue, worker_id="w1")
+
+        result = asyncio.run(runner.run())
+
+        self.assertEqual(sorted(calculator.calls), [1, 2, 3, 4, 5])
+        self.assertEqual(result["processed_users"], 3)
+        self.assertEqual(result["failed_users"], 1)
+        self.assertEqual(result["skipped_users"], 1)
+        self.assertEqual(result["total_recommendations"], 9)
+        self.assertEqual(result["progress"], {"total": 5, "pending": 0, "done": 4, "failed": 1})
+        self.assertGreater(result["metrics"]["throughput_per_min"], 0)
+
+    def test_resume_skips_checkpointed_users(self):
+        queue = RecommendationWorkQueue("test", use_redis=False)
+        queue._done.update({1, 2})
+        calculator = StubCalculator([1, 2, 3])
+        runner = RecommendationBatchRunner(calculator=calculator, queue=queue, worker_id="w1")
+
+        asyncio.run(runner.run())
+
+        self.assertEqual(calculator.calls, [3])
+
+    def test_recovers_claimed_users_of_dead_worker(self):
+        queue = RecommendationWorkQueue("test", use_redis=False)
+        queue.seed(lambda: [1, 2, 3])
+        queue.claim("dead-worker")
+        calculator = StubCalculator([1, 2, 3])
+        runner = RecommendationBatchRunner(calculator=calculator, queue=queue, worker_id="w2")
+
+        asyncio.run(runner.run())
+
+        self.assertEqual(sorted(calculator.calls), [1, 2, 3])
+
+    @unittest.skipUnless(importlib.util.find_spec("fakeredis"), "fakeredis 미설치")
+    def test_concurrent_workers_wait_for_seed_before_claiming(self):
+        import fakeredis
+
+        server = fakeredis.FakeServer()
+        with mock.patch("services.recommendation_batch_runner.redis.Redis",
+                        lambda **kwargs: fakeredis.FakeRedis(server=server, decode_responses=True)):
+            seeder = RecommendationWorkQueue("seed-race")
+            latecomer = RecommendationWorkQueue("seed-race")
+        self.assertTrue(seeder.enabled and latecomer.enabled)
+
+        loading, release = threading.Event(), threading.Event()
+
+        def slow_loader():
+            loading.set()
+            release.wait(5)
+            return [1, 2, 3]
+
+        seeding = threading.Thread(target=seeder.seed, args=(slow_loader,))
+        seeding.start()
+        loading.wait(5)
+        late_result = []
+        waiting = threading.Thread(target=lambda: late_result.append(latecomer.seed(lambda: [9])))
+        waiting.start()
+        time.sleep(0.3)
+        self.assertTrue(waiting.is_alive())  # 빈 pending을 보고 끝나지 않고 기다림
+
+        release.set()
+        seeding.join(5)
+        waiting.join(5)
+
+        self.assertEqual(late_result, [0])
+        self.assertEqual([latecomer.claim("w2") for _ in range(4)], [1, 2, 3, None])
+
+    @unittest.skipUnless(importlib.util.find_spec("fakeredis"), "fakeredis 미설치")
+    def test_rerun_without_run_id_recomputes_everyone(self):
+        import fakeredis
+
+        server = fakeredis.FakeServer()
+        calculator = StubCalculator([1, 2, 3])
+        with mock.patch("services.recommendation_batch_runner.redis.Redis",
+                        lambda **kwargs: fakeredis.FakeRedis(server=server, decode_responses=True)):
+            first = RecommendationBatchRunner(calculator=calculator, worker_id="w1")
+            asyncio.run(first.run())
+            # 같은 날 다시 전체 재계산 → 이전 실행의 체크포인트에 막히지 않음
+            second = RecommendationBatchRunner(calculator=calculator, worker_id="w1")
+            asyncio.run(second.run())
+            # run_id를 지정하면 이어서 처리 → 이미 끝난 실행은 다시 계산하지 않음
+            resumed = RecommendationBatchRunner(calculator=calculator, run_id=first.run_id, worker_id="w1")
+            asyncio.run(resumed.run())
+
+        self.assertNotEqual(first.run_id, second.run_id)
+        self.assertEqual(sorted(calculator.calls), [1, 1, 2, 2, 3, 3])
+
+    def test_adaptive_concurrency(self):
+        concurrency = AdaptiveConcurrency(initial=2, maximum=4, target_latency=1.0)
+        for _ in range(10):
+            concurrency.record(0.1)
+        self.assertEqual(concurrency.limit, 4)
+
+        concurrency.record(10.0)
+        self.assertEqual(concurrency.limit, 2)
+
+        concurrency.record(0.1, success=False)
+        self.assertGreaterEqual(concurrency.limit, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+스케줄러 리더 선출 / 단일 실행 / 누락 실행 판단 테스트 (Redis 없이 실행)
+"""
+import asyncio
+import importlib.util
+import os
+import sys
+import unittest
+from datetime import datetime
+from unittest import mock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import scheduler
+from scheduler import SCHEDULER_TIMEZONE, is_daily_crawl_missed
+from services.scheduler_coordinator import SchedulerCoordinator
+
+
+class TestSchedulerCoordinator(unittest.TestCase):
+
+    def test_single_flight_skips_concurrent_run(self):
+        coordinator = SchedulerCoordinator(lease_ttl=3, use_redis=False)
+        calls = []
+
+        async def job():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "done"
+
+        async def main():
+            return await asyncio.gather(
+                coordinator.run_single_flight("daily_crawl", job),
+                coordinator.run_single_flight("daily_crawl", job),
+            )
+
+        first, second = asyncio.run(main())
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(first["result"], "done")
+        self.assertTrue(second["skipped"])
+        self.assertEqual(coordinator.get_last_run("daily_crawl")["status"], "completed")
+        self.assertIsNone(coordinator.get_running_node("daily_crawl"))
+
+    def test_failed_job_releases_lock(self):
+        coordinator = SchedulerCoordinator(lease_ttl=3, use_redis=False)
+
+        async def job():
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(coordinator.run_single_flight("daily_crawl", job))
+
+        self.assertEqual(coordinator.get_last_run("daily_crawl")["status"], "failed")
+        self.assertIsNone(coordinator.get_running_node("daily_crawl"))
+
+    def test_missed_run_detection(self):
+        now = datetime(2025, 12, 3, 5, 0, tzinfo=SCHEDULER_TIMEZONE)
+
+        self.assertTrue(is_daily_crawl_missed(None, now))
+        self.assertTrue(is_daily_crawl_missed({"started_at": "2025-12-02T03:00:00+09:00"}, now))
+        self.assertFalse(is_daily_crawl_missed({"started_at": "2025-12-03T03:00:01+09:00"}, now))
+
+        # 허용 지연 시간(기본 6시간)이 지나면 다음 예약 실행을 기다림
+        late = datetime(2025, 12, 3, 15, 0, tzinfo=SCHEDULER_TIMEZONE)
+        self.assertFalse(is_daily_crawl_missed(None, late))
+
+    def test_worker_schedules_weekly_full_recommendation(self):
+        coordinator = SchedulerCoordinator(lease_ttl=3, use_redis=False)
+
+        async def main():
+            with mock.patch("services.scheduler_coordinator.get_scheduler_coordinator", return_value=coordinator), \
+                    mock.patch.dict(os.environ, {"SCHEDULER_ENABLED": "true"}):
+                scheduler.start_scheduler()
+                try:
+                    return scheduler.scheduler.get_job(scheduler.FULL_RECOMMENDATION_JOB_ID)
+                finally:
+                    scheduler.stop_scheduler()
+
+        job = asyncio.run(main())
+
+        self.assertIsNotNone(job)
+        self.assertEqual(job.next_run_time.weekday(), 6)  # 일요일
+
+
+@unittest.skipUnless(importlib.util.find_spec("fakeredis"), "fakeredis 미설치")
+class TestManualTrigger(unittest.TestCase):
+    """API 프로세스의 수동 실행 요청은 워커(리더)가 실행하고, 상태는 Redis 기록으로 보고"""
+
+    def setUp(self):
+        import fakeredis
+
+        server = fakeredis.FakeServer()
+        with mock.patch("services.scheduler_coordinator.redis.Redis",
+                        lambda **kwargs: fakeredis.FakeRedis(server=server, decode_responses=True)):
+            self.api = SchedulerCoordinator(lease_ttl=3)
+            self.worker = SchedulerCoordinator(lease_ttl=3)
+        self.assertTrue(self.api.enabled and self.worker.enabled)
+
+    def test_trigger_is_queued_for_the_leader_worker(self):
+        crawls = []
+
+        async def fake_crawl():
+            crawls.append(1)
+            return {"total_seconds": 0.0}
+
+        with mock.patch("services.scheduler_coordinator.get_scheduler_coordinator", return_value=self.api):
+            first = asyncio.run(scheduler.trigger_crawl_now())
+            second = asyncio.run(scheduler.trigger_crawl_now())
+        # API 프로세스에서는 실행하지 않고 요청만 남김 (중복 요청은 하나로)
+        self.assertTrue(first["queued"] and second["queued"])
+        self.assertEqual(crawls, [])
+
+        async def worker_main():
+            with mock.patch("services.scheduler_coordinator.get_scheduler_coordinator", return_value=self.worker), \
+                    mock.patch.object(scheduler, "daily_crawl_job", fake_crawl), \
+                    mock.patch.object(scheduler, "scheduler", mock.Mock()) as local_scheduler:
+                self.worker.try_acquire_leadership()
+                await scheduler.poll_manual_triggers()
+                await scheduler.poll_manual_triggers()
+                for call in local_scheduler.add_job.call_args_list:
+                    await call.args[0]()
+
+        asyncio.run(worker_main())
+        self.assertEqual(crawls, [1])
+
+        with mock.patch("services.scheduler_coordinator.get_scheduler_coordinator", return_value=self.api):
+            status = scheduler.get_scheduler_status()
+        self.assertTrue(status["running"])
+        self.assertEqual(status["leader"], self.worker.node_id)
+        self.assertFalse(status["is_leader"])
+        self.assertEqual(status["last_run"]["status"], "completed")
+        self.assertIsNone(status["trigger_pending_since"])
+        self.assertIsNotNone(status["next_run"])
+
+
+if __name__ == "__main__":
+    unittest.main()
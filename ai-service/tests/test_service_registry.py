@@ -0,0 +1,109 @@
+"""
+지연 초기화 서비스 레지스트리 / 시작 시간 프로파일 테스트
+"""
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.service_registry import LazyService, ServiceRegistry, StartupProfiler
+
+
+class SlowService:
+    instances = 0
+
+    def __init__(self):
+        SlowService.instances += 1
+        time.sleep(0.1)
+
+    def ping(self):
+        return "pong"
+
+
+class TestServiceRegistry(unittest.TestCase):
+
+    def setUp(self):
+        SlowService.instances = 0
+        self.registry = ServiceRegistry()
+
+    def test_lazy_init_runs_once_under_concurrency(self):
+        self.registry.register("slow", SlowService)
+        proxy = LazyService(self.registry, "slow")
+        self.assertFalse(self.registry.is_initialized("slow"))
+        self.assertEqual(SlowService.instances, 0)
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(proxy.ping())) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(results, ["pong"] * 8)
+        self.assertEqual(SlowService.instances, 1)
+        self.assertEqual(self.registry.init_report()[0]["name"], "slow")
+
+    def test_readiness_after_warm_up(self):
+        self.registry.register("slow", SlowService, required=True)
+        self.registry.register("cold", SlowService, warm=False)
+        self.assertFalse(self.registry.readiness()["ready"])
+
+        self.registry.start_warm_up()
+        self.registry._warmup_thread.join(timeout=2)
+
+        readiness = self.registry.readiness()
+        self.assertTrue(readiness["ready"])
+        self.assertEqual(readiness["services"]["slow"]["status"], "ready")
+        self.assertEqual(readiness["services"]["cold"]["status"], "pending")
+
+    def test_failed_required_service_is_not_ready_and_retries(self):
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ConnectionError("db down")
+            return SlowService()
+
+        self.registry.register("db", flaky, required=True)
+        self.registry.warm_up()
+
+        readiness = self.registry.readiness()
+        self.assertFalse(readiness["ready"])
+        self.assertEqual(readiness["services"]["db"]["error"], "db down")
+
+        self.assertEqual(LazyService(self.registry, "db").ping(), "pong")
+        self.assertTrue(self.registry.readiness()["ready"])
+
+    def test_unavailable_service_is_falsy(self):
+        self.registry.register("missing_key", lambda: None)
+        proxy = LazyService(self.registry, "missing_key")
+
+        self.assertFalse(proxy)
+        with self.assertRaises(AttributeError):
+            proxy.ping()
+
+
+class TestStartupProfiler(unittest.TestCase):
+
+    def test_records_first_import_of_project_modules(self):
+        sys.modules.pop("json.tool", None)
+        profiler = StartupProfiler(prefixes=("json",))
+        profiler.install()
+        try:
+            import json.tool  # noqa: F401
+        finally:
+            profiler.uninstall()
+        profiler.mark("imports_done")
+
+        report = profiler.report(ServiceRegistry())
+        self.assertIn("json.tool", [row["module"] for row in report["imports"]])
+        self.assertIn("imports_done", report["phases"])
+        self.assertEqual(report["services"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+"""
+스트리밍 공통 유틸 테스트 (동기 제너레이터 → 비동기 전달, TTFT 지표)
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.streaming import StreamingMetrics, iterate_in_thread, sse_event
+
+
+class TestStreaming(unittest.TestCase):
+
+    def test_iterate_in_thread_preserves_order_and_errors(self):
+        def tokens():
+            yield "안녕"
+            yield "하세요"
+            raise RuntimeError("stream broken")
+
+        async def consume():
+            received = []
+            with self.assertRaises(RuntimeError):
+                async for text in iterate_in_thread(tokens):
+                    received.append(text)
+            return received
+
+        self.assertEqual(asyncio.run(consume()), ["안녕", "하세요"])
+
+    def test_consumer_disconnect_stops_producer(self):
+        produced = []
+        closed = threading.Event()
+
+        def tokens():
+            try:
+                for i in range(1000):
+                    produced.append(i)
+                    time.sleep(0.001)
+                    yield i
+            finally:
+                closed.set()
+
+        async def consume():
+            async for i in iterate_in_thread(tokens, max_buffer=2):
+                if i == 3:
+                    break
+
+        asyncio.run(consume())
+        self.assertTrue(closed.wait(2))
+        self.assertLess(len(produced), 20)
+
+    def test_metrics_record_ttft(self):
+        metrics = StreamingMetrics()
+        timer = metrics.start("rag_chat")
+        time.sleep(0.01)
+        timer.first_token()
+        summary = timer.finish()
+        timer.finish(completed=False)  # 중복 기록 안 됨
+
+        aborted = metrics.start("rag_chat")
+        aborted.finish(completed=False)
+
+        snapshot = metrics.snapshot()["rag_chat"]
+        self.assertEqual(snapshot["streams"], 2)
+        self.assertEqual(snapshot["aborted"], 1)
+        self.assertGreaterEqual(snapshot["ttft_p50"], 0.01)
+        self.assertGreaterEqual(summary["ttftMs"], 10)
+
+    def test_sse_event_format(self):
+        self.assertEqual(
+            sse_event("token", {"text": "안녕"}, event_id=1),
+            'event: token\nid: 1\ndata: {"text": "안녕"}\n\n'
+        )
+
+
+class FakeChatDb:
+    """DatabaseService 대역 - 조회는 사용자 한 명 / 빈 히스토리, 저장은 기록만"""
+
+    def __init__(self):
+        self.saved = []
+
+    def execute_query(self, query, params=None):
+        return [{"user_id": 1}] if "FROM users" in query else []
+
+    def execute_update(self, query, params=None):
+        if "chatbot_messages" in query:
+            self.saved.append((params[2], params[3]))
+        return 1
+
+
+class TestAssistantStreamPersistence(unittest.TestCase):
+    """회원 챗봇 /chat/stream - 스트리밍 도중 연결이 끊겨도 질문과 받은 만큼의 답변이 저장되는지"""
+
+    def test_disconnect_saves_partial_answer(self):
+        os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+        from models.chatbotassistant import AssistantChatRequest
+        from routers import assistant_router
+
+        disconnected = threading.Event()
+
+        def chat_stream(**kwargs):
+            yield "첫 번째 "
+            yield "두 번째"
+            disconnected.wait(2)  # 클라이언트가 먼저 끊음
+            yield "끝"
+
+        db = FakeChatDb()
+        dto = AssistantChatRequest(userId=1, message="일정 알려줘")
+
+        async def run():
+            with mock.patch.object(assistant_router, "assistant_service", SimpleNamespace(chat_stream=chat_stream)):
+                response = await assistant_router.chat_stream(dto, db)
+                events = response.body_iterator
+                received = [await events.__anext__() for _ in range(3)]  # session, token, token
+                await events.aclose()
+                disconnected.set()
+                return received
+
+        received = asyncio.run(run())
+
+        self.assertIn("두 번째", received[-1])
+        self.assertEqual(db.saved, [("user", "일정 알려줘"), ("assistant", "첫 번째 두 번째")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+"""
+구조화 로깅 테스트 (JSON 레코드, 컨텍스트 필드, 큐 기반 비차단 출력, DEBUG 샘플링)
+"""
+import asyncio
+import io
+import json
+import logging
+import os
+import queue
+import sys
+import runpy
+import time
+import unittest
+from logging.handlers import QueueListener
+from unittest import mock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.common.logging_config import (
+    ContextFilter, JsonFormatter, NonBlockingQueueHandler, SamplingFilter, _match_prefix, log_context,
+    parse_module_settings,
+)
+from services.common.metrics import get_metrics_registry, span
+
+
+class SlowStream(io.StringIO):
+    """느린 stdout 대역 (쓰기마다 지연)"""
+
+    def write(self, text):
+        time.sleep(0.05)
+        return super().write(text)
+
+
+class TestStructuredLogging(unittest.TestCase):
+
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.handler = NonBlockingQueueHandler(queue.Queue(maxsize=100))
+        self.handler.addFilter(ContextFilter())
+        output = logging.StreamHandler(self.stream)
+        output.setFormatter(JsonFormatter())
+        self.listener = QueueListener(self.handler.queue, output)
+        self.listener.start()
+
+        self.logger = logging.getLogger(f"tests.structured.{self._testMethodName}")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.addHandler(self.handler)
+
+    def tearDown(self):
+        self.logger.removeHandler(self.handler)
+        self.listener.stop()
+
+    def records(self):
+        self.listener.stop()
+        self.listener.start()  # stop이 큐를 비울 때까지 기다림
+        return [json.loads(line) for line in self.stream.getvalue().splitlines()]
+
+    def test_records_carry_trace_and_task_context(self):
+        async def agent_task():
+            with span("test", "request") as active:
+                with log_context(task_id="task-1"):
+                    self.logger.info("추천 %d건 저장", 3, extra={"saved": 3})
+                return active.trace_id
+
+        trace_id = asyncio.run(agent_task())
+        self.logger.warning("컨텍스트 밖")
+
+        first, second = self.records()
+        self.assertEqual(first["message"], "추천 3건 저장")
+        self.assertEqual(first["level"], "INFO")
+        self.assertEqual((first["trace_id"], first["task_id"], first["saved"]), (trace_id, "task-1", 3))
+        self.assertNotIn("task_id", second)
+        self.assertNotIn("trace_id", second)
+
+    def test_exceptions_are_serialized(self):
+        try:
+            raise ValueError("잘못된 값")
+        except ValueError:
+            self.logger.exception("처리 실패")
+
+        record = self.records()[0]
+        self.assertEqual(record["level"], "ERROR")
+        self.assertIn("ValueError: 잘못된 값", record["exc_info"])
+
+    def test_caller_does_not_wait_for_output(self):
+        self.listener.stop()
+        output = logging.StreamHandler(SlowStream())
+        output.setFormatter(JsonFormatter())
+        self.listener = QueueListener(self.handler.queue, output)
+        self.listener.start()
+
+        started = time.perf_counter()
+        for i in range(10):
+            self.logger.info("공고 %d 처리", i)
+        # 출력은 10 × 50ms가 걸리지만 호출 쪽은 큐에 넣기만 함
+        self.assertLess(time.perf_counter() - started, 0.1)
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        self.listener.stop()
+        dropped = get_metrics_registry().counter("log_records_dropped", "", ("logger",))
+        before = dropped.value(logger=self.logger.name)
+
+        for i in range(150):
+            self.logger.info("공고 %d 처리", i)
+
+        self.assertEqual(dropped.value(logger=self.logger.name) - before, 50)
+        self.listener.start()
+
+
+class TestFiltersAndSettings(unittest.TestCase):
+
+    def make_record(self, name, level, **extra):
+        record = logging.LogRecord(name, level, __file__, 1, "msg", None, None)
+        record.__dict__.update(extra)
+        return record
+
+    def test_debug_sampling_per_module_and_per_call(self):
+        sampling = SamplingFilter({"services.web_crawler_service": 0.0})
+
+        self.assertFalse(sampling.filter(self.make_record("services.web_crawler_service", logging.DEBUG)))
+        self.assertTrue(sampling.filter(self.make_record("services.web_crawler_service", logging.INFO)))
+        self.assertTrue(sampling.filter(self.make_record("services.database_service", logging.DEBUG)))
+        self.assertFalse(sampling.filter(self.make_record("services.database_service", logging.DEBUG, sample_rate=0.0)))
+        self.assertTrue(sampling.filter(self.make_record("services.web_crawler_service", logging.DEBUG, sample_rate=1.0)))
+
+    def test_module_settings(self):
+        levels = parse_module_settings("services.agents=DEBUG, services.web_crawler_service = WARNING,broken")
+        self.assertEqual(levels, {"services.agents": "DEBUG", "services.web_crawler_service": "WARNING"})
+        self.assertEqual(_match_prefix("services.agents.career_agent", levels), "DEBUG")
+        self.assertIsNone(_match_prefix("routers.chat", levels))
+
+
+class TestWorkerLogging(unittest.TestCase):
+    """스케줄러 워커(python scheduler.py)도 API 서버와 같은 로깅 구성을 쓰는지"""
+
+    def test_worker_entry_point_configures_logging(self):
+        def stop_worker(coro):
+            coro.close()
+            raise KeyboardInterrupt
+
+        with mock.patch("services.common.logging_config.configure_logging") as configure, \
+                mock.patch("services.common.logging_config.shutdown_logging") as shutdown, \
+                mock.patch("asyncio.run", side_effect=stop_worker):
+            runpy.run_path(os.path.join(os.path.dirname(__file__), "..", "scheduler.py"), run_name="__main__")
+
+        configure.assert_called_once()
+        shutdown.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
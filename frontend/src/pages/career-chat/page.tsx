@@ -673,6 +673,86 @@ export default function CareerChatPage() {
     }
   };
 
+  // 에이전트 태스크 결과 반영 (종료 상태면 true)
+  const applyAgentTask = (task: any): boolean => {
+    if (task.status === 'completed' && task.agentAction) {
+      setIsSearching(false);
+      const actionType = task.agentAction.type as string;
+      const results = task.agentAction.data?.results || [];
+
+      let summary = task.agentAction.summary;
+      if (!summary || summary.trim().length === 0) {
+        summary = results
+          .slice(0, 3)
+          .map((r: any) => r.snippet?.replace(/\.{3}$/, '') || '')
+          .filter((s: string) => s.length > 0)
+          .join(' ')
+          .slice(0, 300);
+      }
+
+      const panelType = actionType === 'web_search_results' ? 'web_search' :
+            actionType === 'mentoring_suggestion' ? 'mentoring' :
+            actionType === 'learning_path_suggestion' ? 'learning_path' : 'web_search';
+
+      const newResearchPanel: ResearchPanel = {
+        id: `research-${Date.now()}`,
+        type: panelType,
+        title: task.agentAction.reason || '리서치 결과',
+        summary: summary || '검색 결과를 확인하세요.',
+        sources: results.map((r: any) => ({
+          title: r.title,
+          url: r.url,
+          snippet: r.snippet,
+        })),
+        timestamp: new Date(),
+        mentoringData: panelType === 'mentoring' && task.agentAction.data?.sessions ? {
+          sessions: task.agentAction.data.sessions,
+          total: task.agentAction.data.sessions.length,
+        } : undefined,
+        learningPathData: panelType === 'learning_path' && task.agentAction.data?.path ? {
+          path: task.agentAction.data.path,
+          exists: task.agentAction.data.exists,
+          canCreate: task.agentAction.data.canCreate,
+          createUrl: task.agentAction.data.createUrl,
+        } : undefined,
+      };
+      setResearchPanels(prev => [newResearchPanel, ...prev]);
+      return true;
+    }
+
+    if (task.status === 'skipped' || task.status === 'failed') {
+      setIsSearching(false);
+      return true;
+    }
+    return false;
+  };
+
+  // SSE로 에이전트 결과 수신 (연결이 안 되면 폴링으로 폴백)
+  const watchAgentResult = (taskId: string) => {
+    if (typeof EventSource === 'undefined') {
+      pollAgentResult(taskId);
+      return;
+    }
+
+    const source = new EventSource(`${PYTHON_AI_SERVICE_URL}/api/chat/agent-events/${taskId}`);
+    let errors = 0;
+
+    source.addEventListener('result', (event) => {
+      source.close();
+      if (!applyAgentTask(JSON.parse((event as MessageEvent).data))) {
+        setIsSearching(false);
+      }
+    });
+
+    source.onerror = () => {
+      errors++;
+      if (source.readyState === EventSource.CLOSED || errors >= 3) {
+        source.close();
+        pollAgentResult(taskId);
+      }
+    };
+  };
+
   const pollAgentResult = async (taskId: string) => {
     const maxAttempts = 60;
     let attempts = 0;
@@ -682,53 +762,7 @@ export default function CareerChatPage() {
         const response = await authFetch(`${PYTHON_AI_SERVICE_URL}/api/chat/agent-result/${taskId}`);
         const task = await response.json();
 
-        if (task.status === 'completed' && task.agentAction) {
-          setIsSearching(false);
-          const actionType = task.agentAction.type as string;
-          const results = task.agentAction.data?.results || [];
-
-          let summary = task.agentAction.summary;
-          if (!summary || summary.trim().length === 0) {
-            summary = results
-              .slice(0, 3)
-              .map((r: any) => r.snippet?.replace(/\.{3}$/, '') || '')
-              .filter((s: string) => s.length > 0)
-              .join(' ')
-              .slice(0, 300);
-          }
-
-          const panelType = actionType === 'web_search_results' ? 'web_search' :
-                actionType === 'mentoring_suggestion' ? 'mentoring' :
-                actionType === 'learning_path_suggestion' ? 'learning_path' : 'web_search';
-
-          const newResearchPanel: ResearchPanel = {
-            id: `research-${Date.now()}`,
-            type: panelType,
-            title: task.agentAction.reason || '리서치 결과',
-            summary: summary || '검색 결과를 확인하세요.',
-            sources: results.map((r: any) => ({
-              title: r.title,
-              url: r.url,
-              snippet: r.snippet,
-            })),
-            timestamp: new Date(),
-            mentoringData: panelType === 'mentoring' && task.agentAction.data?.sessions ? {
-              sessions: task.agentAction.data.sessions,
-              total: task.agentAction.data.sessions.length,
-            } : undefined,
-            learningPathData: panelType === 'learning_path' && task.agentAction.data?.path ? {
-              path: task.agentAction.data.path,
-              exists: task.agentAction.data.exists,
-              canCreate: task.agentAction.data.canCreate,
-              createUrl: task.agentAction.data.createUrl,
-            } : undefined,
-          };
-          setResearchPanels(prev => [newResearchPanel, ...prev]);
-          return;
-        }
-
-        if (task.status === 'skipped' || task.status === 'failed') {
-          setIsSearching(false);
+        if (applyAgentTask(task)) {
           return;
         }
 
@@ -800,7 +834,7 @@ export default function CareerChatPage() {
       setIsLoading(false);
 
       if (data.taskId) {
-        pollAgentResult(data.taskId);
+        watchAgentResult(data.taskId);
       } else {
         setIsSearching(false);
       }